@@ -17,6 +17,7 @@
 # client for ryu.app.ofctl.service
 
 from ryu.base import app_manager
+from ryu.ofproto import ofproto_v1_4
 from . import event
 
 
@@ -89,4 +90,59 @@ def send_msg(app, msg, reply_cls=None, reply_multi=False):
                                                  reply_multi=reply_multi))()
 
 
+def install_flows(app, msgs, batch_size=100, window=4, bundle=False):
+    """
+    Install flow entries in bulk, pipelining the flow-mods.
+
+    :param app: Client RyuApp instance
+    :param msgs: A list of OpenFlow flow-mod messages to the same datapath
+    :param batch_size: Number of the flow-mods followed by a barrier.
+        The default is 100.
+    :param window: Number of the batches sent before waiting for the
+        barrier reply of the oldest one.  The default is 4.
+    :param bundle: True to install each batch atomically as a bundle.
+        Requires OpenFlow 1.4 or later.  The default is False.
+
+    Unlike send_msg, which waits for a barrier after each message, this
+    sends a barrier after each batch and keeps up to window batches in
+    flight.  The errors do not stop the installation; the error replied
+    for a flow-mod is reported with its index in msgs, and, with bundle,
+    the bundles which failed to be committed with their range of msgs.
+
+    Returns an instance of ryu.app.ofctl.event.InstallResult.
+
+    Raise an exception if the datapath is invalid or disconnects.
+
+    Example::
+
+        # ...(snip)...
+        import ryu.app.ofctl.api as ofctl_api
+
+
+        class MyApp(app_manager.RyuApp):
+
+            def _my_handler(self, ev):
+                # ...(snip)...
+                msgs = [parser.OFPFlowMod(datapath, match=match,
+                                          instructions=inst)
+                        for match, inst in rules]
+                result = ofctl_api.install_flows(self, msgs, bundle=True)
+                for index, error in result.errors.items():
+                    self.logger.error('rule %s failed: %s',
+                                      rules[index], error)
+    """
+    if batch_size < 1 or window < 1:
+        raise ValueError('batch_size and window must be positive')
+    msgs = list(msgs)
+    if not msgs:
+        return event.InstallResult()
+    datapath = msgs[0].datapath
+    if any(msg.datapath is not datapath for msg in msgs):
+        raise ValueError('flow-mods to different datapaths')
+    if bundle and datapath.ofproto.OFP_VERSION < ofproto_v1_4.OFP_VERSION:
+        raise ValueError('bundles require OpenFlow 1.4 or later')
+    return app.send_request(event.InstallFlowsRequest(
+        msgs, batch_size=batch_size, window=window, bundle=bundle))()
+
+
 app_manager.require_app('ryu.app.ofctl.service', api_style=True)
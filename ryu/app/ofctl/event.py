@@ -49,6 +49,68 @@ class SendMsgRequest(_RequestBase):
         self.reply_multi = reply_multi
 
 
+# install flows
+
+class InstallFlowsRequest(_RequestBase):
+    def __init__(self, msgs, batch_size, window, bundle=False):
+        super(InstallFlowsRequest, self).__init__()
+        assert msgs
+        self.msgs = msgs
+        self.datapath = msgs[0].datapath
+        self.batch_size = batch_size
+        self.window = window
+        self.bundle = bundle
+
+
+class InstallResult(object):
+    """
+    Result of ryu.app.ofctl.api.install_flows.
+
+    ============== ============================================================
+    Attribute      Description
+    ============== ============================================================
+    rules          Number of the flow-mods sent
+    batches        Number of the batches sent
+    errors         A dict of the OFPErrorMsg replied for a flow-mod, keyed
+                   by the index of the flow-mod in the given list
+    failed_batches A list of (start, stop, OFPErrorMsg) of the bundles which
+                   failed to be opened or committed, that is, none of the
+                   flow-mods msgs[start:stop] were installed
+    elapsed        Seconds from the first flow-mod sent to the last barrier
+                   reply received
+    ============== ============================================================
+    """
+
+    def __init__(self):
+        self.rules = 0
+        self.batches = 0
+        self.errors = {}
+        self.failed_batches = []
+        self.elapsed = 0.0
+
+    @property
+    def ok(self):
+        """
+        True if neither a flow-mod nor a bundle failed.
+        """
+        return not self.errors and not self.failed_batches
+
+    @property
+    def rules_per_sec(self):
+        """
+        The rate of the flow-mods sent and acknowledged by the barriers.
+        """
+        if self.elapsed <= 0:
+            return 0.0
+        return self.rules / self.elapsed
+
+    def __str__(self):
+        return ('InstallResult<%d rules in %d batches, %d errors, '
+                '%d failed batches, %.0f rules/sec>' % (
+                    self.rules, self.batches, len(self.errors),
+                    len(self.failed_batches), self.rules_per_sec))
+
+
 # generic reply
 
 class Reply(_ReplyBase):
@@ -0,0 +1,571 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Flow table mirror service.
+
+Keeps a controller-side copy of the flow tables of the datapaths, so that
+the applications can look up the flow entries without dumping them from
+the switches.  The flow-mods sent with Datapath.send_msg are applied to
+the mirror as they are queued, and are reverted if the switch replies an
+error for them.  Flow-removed messages remove the entries.  The entries
+are indexed by table ID and cookie, and by (table ID, priority, match)
+for the exact lookups.
+
+With ``--flow-mirror-reconcile-interval``, the mirror is periodically
+reconciled with the switch state.  Rather than dumping the whole tables,
+each round compares the number of the flow entries (an aggregate stats
+request) and dumps only the entries of the cookies whose number differs.
+A round also dumps the entries of one cookie in turn, so that the changes
+which keep the number of the entries (e.g., an entry expired and added
+by another controller) are eventually found.  The switch state wins: the
+entries found on the switch are adopted and the others are removed,
+except the entries changed by the flow-mods sent during the round.
+
+Only the flow-mod messages of OpenFlow 1.3 or later are mirrored.  The
+messages built from a MsgTemplate are not.
+"""
+
+import collections
+import itertools
+
+from ryu import flags as cfg_flags  # For loading the flow mirror options
+from ryu.base import app_manager
+from ryu.controller import ofp_event
+from ryu.controller.handler import CONFIG_DISPATCHER
+from ryu.controller.handler import DEAD_DISPATCHER
+from ryu.controller.handler import HANDSHAKE_DISPATCHER
+from ryu.controller.handler import MAIN_DISPATCHER
+from ryu.controller.handler import set_ev_cls
+from ryu.lib import hub
+from ryu.ofproto import ofproto_v1_3
+from ryu.ofproto import ofproto_v1_5
+
+from . import api as ofctl_api
+from . import exception
+
+
+# Number of the flow-mods kept to revert them on the error replies.
+_PENDING_FLOW_MODS = 4096
+
+_COOKIE_MASK_EXACT = 0xffffffffffffffff
+
+
+def match_key(match):
+    """
+    Returns the hashable form of an OFPMatch, the tuple of its fields
+    sorted by the name.
+    """
+    return tuple(sorted(match.items(), key=lambda field: field[0]))
+
+
+def _instructions_bytes(instructions):
+    buf = bytearray()
+    for inst in instructions:
+        inst.serialize(buf, len(buf))
+    return bytes(buf)
+
+
+class FlowEntry(object):
+    """
+    A mirrored flow entry.
+
+    ============ ==============================================================
+    Attribute    Description
+    ============ ==============================================================
+    key          (table_id, priority, match_key(match)), which identifies
+                 the entry in the flow tables
+    table_id     Table ID
+    priority     Priority
+    match        Instance of ``OFPMatch``
+    cookie       Cookie
+    instructions List of ``OFPInstruction*`` instances
+    idle_timeout Idle timeout
+    hard_timeout Hard timeout
+    flags        Bitmap of OFPFF_* flags
+    ============ ==============================================================
+    """
+
+    __slots__ = ('key', 'table_id', 'priority', 'match', 'cookie',
+                 'instructions', 'idle_timeout', 'hard_timeout', 'flags')
+
+    def __init__(self, table_id, priority, match, cookie=0,
+                 instructions=None, idle_timeout=0, hard_timeout=0,
+                 flags=0):
+        self.key = (table_id, priority, match_key(match))
+        self.table_id = table_id
+        self.priority = priority
+        self.match = match
+        self.cookie = cookie
+        self.instructions = instructions or []
+        self.idle_timeout = idle_timeout
+        self.hard_timeout = hard_timeout
+        self.flags = flags
+
+    @classmethod
+    def from_msg(cls, msg):
+        """
+        Creates an entry from an OFPFlowMod, OFPFlowStats or OFPFlowDesc.
+        """
+        return cls(msg.table_id, msg.priority, msg.match, msg.cookie,
+                   msg.instructions, msg.idle_timeout, msg.hard_timeout,
+                   msg.flags)
+
+    def outputs(self):
+        """
+        Returns the sets of the output ports and groups of the actions.
+        """
+        ports = set()
+        groups = set()
+        for inst in self.instructions:
+            for action in getattr(inst, 'actions', None) or []:
+                if hasattr(action, 'port'):
+                    ports.add(action.port)
+                elif hasattr(action, 'group_id'):
+                    groups.add(action.group_id)
+        return ports, groups
+
+    def __repr__(self):
+        return 'FlowEntry<table_id=%s, priority=%s, cookie=%#x, match=%s>' % (
+            self.table_id, self.priority, self.cookie, dict(self.key[2]))
+
+
+class FlowTable(object):
+    """
+    The mirrored flow tables of a datapath.
+    """
+
+    def __init__(self, dpid):
+        self.dpid = dpid
+        self._entries = {}  # key -> FlowEntry
+        self._tables = {}  # table_id -> {key: FlowEntry}
+        self._cookies = {}  # cookie -> {key: FlowEntry}
+        # xid -> [(key, entry before the flow-mod, entry after it)]
+        self._pending = collections.OrderedDict()
+        self._dirty = None  # keys changed during a sync
+        self._cookie_cycle = None
+        self.errors_reverted = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(list(self._entries.values()))
+
+    def get(self, table_id, priority, match):
+        """
+        Returns the entry exactly identified by the given table ID,
+        priority and match, or None.
+        """
+        return self._entries.get((table_id, priority, match_key(match)))
+
+    def cookies(self):
+        """
+        Returns the list of the distinct cookies of the entries.
+        """
+        return list(self._cookies)
+
+    def count(self, cookie):
+        """
+        Returns the number of the entries of the given cookie.
+        """
+        return len(self._cookies.get(cookie, ()))
+
+    def lookup(self, table_id=None, priority=None, cookie=None,
+               cookie_mask=None, match=None):
+        """
+        Returns the list of the entries which satisfy all the given
+        conditions.
+
+        cookie selects the entries of the cookie, or of the cookies equal
+        to it in the bits of cookie_mask if given.  match selects the
+        entries which match at least the fields of the given OFPMatch
+        (or a dict of the fields) with the same values, as the non-strict
+        flow-mods do.
+        """
+        if cookie is not None:
+            if cookie_mask is None:
+                buckets = [self._cookies.get(cookie, {})]
+            else:
+                buckets = [entries
+                           for c, entries in self._cookies.items()
+                           if c & cookie_mask == cookie & cookie_mask]
+        elif table_id is not None:
+            buckets = [self._tables.get(table_id, {})]
+        else:
+            buckets = [self._entries]
+        if match is not None and not isinstance(match, dict):
+            match = dict(match.items())
+        entries = itertools.chain.from_iterable(
+            bucket.values() for bucket in buckets)
+        return [entry for entry in entries
+                if (table_id is None or entry.table_id == table_id) and
+                (priority is None or entry.priority == priority) and
+                (not match or self._covers(match, entry))]
+
+    @staticmethod
+    def _covers(fields, entry):
+        entry_fields = dict(entry.key[2])
+        for name, value in fields.items():
+            if entry_fields.get(name, None) != value:
+                return False
+        return True
+
+    def _put(self, entry):
+        key = entry.key
+        self._remove(key)
+        self._entries[key] = entry
+        self._tables.setdefault(entry.table_id, {})[key] = entry
+        self._cookies.setdefault(entry.cookie, {})[key] = entry
+        if self._dirty is not None:
+            self._dirty.add(key)
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+        for index, name in ((self._tables, entry.table_id),
+                            (self._cookies, entry.cookie)):
+            bucket = index[name]
+            del bucket[key]
+            if not bucket:
+                del index[name]
+        if self._dirty is not None:
+            self._dirty.add(key)
+        return entry
+
+    def _select(self, msg, ofp, strict):
+        # the entries which the given modify or delete flow-mod applies to
+        if msg.table_id == ofp.OFPTT_ALL:
+            table_ids = list(self._tables)
+        else:
+            table_ids = [msg.table_id]
+        if strict:
+            entries = [self._entries.get((table_id, msg.priority,
+                                          match_key(msg.match)))
+                       for table_id in table_ids]
+            entries = [entry for entry in entries if entry is not None]
+        else:
+            fields = dict(msg.match.items())
+            entries = itertools.chain.from_iterable(
+                self._tables.get(table_id, {}).values()
+                for table_id in table_ids)
+            entries = [entry for entry in entries
+                       if not fields or self._covers(fields, entry)]
+        if msg.cookie_mask:
+            entries = [entry for entry in entries
+                       if entry.cookie & msg.cookie_mask ==
+                       msg.cookie & msg.cookie_mask]
+        if msg.command in (ofp.OFPFC_DELETE, ofp.OFPFC_DELETE_STRICT) and \
+                (msg.out_port != ofp.OFPP_ANY or
+                 msg.out_group != ofp.OFPG_ANY):
+            selected = []
+            for entry in entries:
+                ports, groups = entry.outputs()
+                if msg.out_port != ofp.OFPP_ANY and \
+                        msg.out_port not in ports:
+                    continue
+                if msg.out_group != ofp.OFPG_ANY and \
+                        msg.out_group not in groups:
+                    continue
+                selected.append(entry)
+            entries = selected
+        return entries
+
+    def apply_flow_mod(self, msg):
+        """
+        Applies an OFPFlowMod to the mirror.
+        """
+        ofp = msg.datapath.ofproto
+        changes = []
+        if msg.command == ofp.OFPFC_ADD:
+            entry = FlowEntry.from_msg(msg)
+            changes.append((entry.key, self._entries.get(entry.key), entry))
+            self._put(entry)
+        elif msg.command in (ofp.OFPFC_MODIFY, ofp.OFPFC_MODIFY_STRICT):
+            strict = msg.command == ofp.OFPFC_MODIFY_STRICT
+            for old in self._select(msg, ofp, strict):
+                entry = FlowEntry(old.table_id, old.priority, old.match,
+                                  old.cookie, msg.instructions,
+                                  old.idle_timeout, old.hard_timeout,
+                                  old.flags)
+                changes.append((old.key, old, entry))
+                self._put(entry)
+        elif msg.command in (ofp.OFPFC_DELETE, ofp.OFPFC_DELETE_STRICT):
+            strict = msg.command == ofp.OFPFC_DELETE_STRICT
+            for old in self._select(msg, ofp, strict):
+                changes.append((old.key, old, None))
+                self._remove(old.key)
+        if changes:
+            self._pending[msg.xid] = changes
+            if len(self._pending) > _PENDING_FLOW_MODS:
+                self._pending.popitem(last=False)
+
+    def apply_flow_removed(self, msg):
+        """
+        Applies an OFPFlowRemoved to the mirror.
+        """
+        self._remove((msg.table_id, msg.priority, match_key(msg.match)))
+
+    def apply_error(self, msg):
+        """
+        Reverts the flow-mod which the given OFPErrorMsg replies to.
+
+        The entries changed again by the later flow-mods are kept.
+        Returns True if the error replied to a mirrored flow-mod.
+        """
+        changes = self._pending.pop(msg.xid, None)
+        if changes is None:
+            return False
+        for key, old, new in reversed(changes):
+            if self._entries.get(key) is not new:
+                continue
+            if old is None:
+                self._remove(key)
+            else:
+                self._put(old)
+        self.errors_reverted += 1
+        return True
+
+    def begin_sync(self):
+        """
+        Starts recording the keys changed until end_sync(), which sync()
+        leaves as they are.
+        """
+        self._dirty = set()
+
+    def end_sync(self):
+        self._dirty = None
+
+    def sync(self, entries, cookie=None):
+        """
+        Replaces the mirrored entries of the given cookie, or all the
+        entries if None, with the given entries dumped from the switch.
+
+        Returns the number of the entries added, changed or removed.
+        """
+        # the fixes themselves are not changes to leave as they are
+        dirty, self._dirty = self._dirty, None
+        try:
+            return self._sync(entries, cookie, dirty or set())
+        finally:
+            self._dirty = dirty
+
+    def _sync(self, entries, cookie, dirty):
+        if cookie is None:
+            mirrored = dict(self._entries)
+        else:
+            mirrored = dict(self._cookies.get(cookie, {}))
+        fixed = 0
+        for entry in entries:
+            key = entry.key
+            current = mirrored.pop(key, None)
+            if key in dirty:
+                continue
+            if current is None:
+                current = self._entries.get(key)
+            if (current is not None and current.cookie == entry.cookie and
+                    _instructions_bytes(current.instructions) ==
+                    _instructions_bytes(entry.instructions)):
+                continue
+            self._put(entry)
+            fixed += 1
+        for key in mirrored:
+            if key in dirty:
+                continue
+            self._remove(key)
+            fixed += 1
+        return fixed
+
+    def next_cookie(self):
+        """
+        Returns the cookies of the entries in turn, or None if no entry.
+        """
+        if not self._cookies:
+            return None
+        if self._cookie_cycle is None:
+            self._cookie_cycle = collections.deque(self._cookies)
+        while self._cookie_cycle:
+            cookie = self._cookie_cycle.popleft()
+            if cookie in self._cookies:
+                return cookie
+        self._cookie_cycle = None
+        return self.next_cookie()
+
+
+def _aggregate_request(dp, cookie, cookie_mask):
+    ofp = dp.ofproto
+    parser = dp.ofproto_parser
+    return parser.OFPAggregateStatsRequest(
+        dp, 0, ofp.OFPTT_ALL, ofp.OFPP_ANY, ofp.OFPG_ANY, cookie,
+        cookie_mask, parser.OFPMatch())
+
+
+def _flow_count(msg):
+    if msg.datapath.ofproto.OFP_VERSION >= ofproto_v1_5.OFP_VERSION:
+        return msg.body.stats.get('flow_count', 0)
+    return msg.body.flow_count
+
+
+def _flow_dump_request(dp, cookie, cookie_mask):
+    ofp = dp.ofproto
+    parser = dp.ofproto_parser
+    if dp.ofproto.OFP_VERSION >= ofproto_v1_5.OFP_VERSION:
+        # OFPFlowStats of OpenFlow 1.5 has no cookie and instructions
+        req_cls = parser.OFPFlowDescStatsRequest
+        reply_cls = parser.OFPFlowDescStatsReply
+    else:
+        req_cls = parser.OFPFlowStatsRequest
+        reply_cls = parser.OFPFlowStatsReply
+    req = req_cls(dp, 0, ofp.OFPTT_ALL, ofp.OFPP_ANY, ofp.OFPG_ANY,
+                  cookie, cookie_mask, parser.OFPMatch())
+    return req, reply_cls
+
+
+class FlowMirror(app_manager.RyuApp):
+    def __init__(self, *args, **kwargs):
+        super(FlowMirror, self).__init__(*args, **kwargs)
+        self.name = 'flow_mirror'
+        self.interval = self.CONF.flow_mirror_reconcile_interval
+        self.timeout = self.CONF.flow_mirror_timeout
+        self.tables = {}  # dpid -> FlowTable
+        self.reconcile_rounds = 0
+        self.reconcile_dumps = 0
+        self.reconcile_fixes = 0
+
+    def start(self):
+        super(FlowMirror, self).start()
+        if self.interval > 0:
+            self.threads.append(hub.spawn(self._reconcile_loop))
+
+    def get_table(self, dpid):
+        """
+        Returns the FlowTable of the datapath, or None if not mirrored.
+        """
+        return self.tables.get(dpid)
+
+    def lookup(self, dpid, **kwargs):
+        """
+        Returns the list of the mirrored entries of the datapath which
+        satisfy the conditions given as FlowTable.lookup().
+        """
+        table = self.tables.get(dpid)
+        if table is None:
+            return []
+        return table.lookup(**kwargs)
+
+    def _msg_sent(self, msg):
+        dp = msg.datapath
+        if dp.id is None or \
+                dp.ofproto.OFP_VERSION < ofproto_v1_3.OFP_VERSION or \
+                not isinstance(msg, dp.ofproto_parser.OFPFlowMod):
+            return
+        table = self.tables.get(dp.id)
+        if table is None:
+            table = self.tables[dp.id] = FlowTable(dp.id)
+        table.apply_flow_mod(msg)
+
+    @set_ev_cls(ofp_event.EventOFPStateChange,
+                [HANDSHAKE_DISPATCHER, DEAD_DISPATCHER])
+    def _state_change_handler(self, ev):
+        dp = ev.datapath
+        if ev.state == HANDSHAKE_DISPATCHER:
+            dp.send_msg_observers.append(self._msg_sent)
+        elif dp.id is not None:
+            self.tables.pop(dp.id, None)
+
+    @set_ev_cls(ofp_event.EventOFPFlowRemoved, MAIN_DISPATCHER)
+    def _flow_removed_handler(self, ev):
+        table = self.tables.get(ev.msg.datapath.id)
+        if table is not None:
+            table.apply_flow_removed(ev.msg)
+
+    @set_ev_cls(ofp_event.EventOFPErrorMsg,
+                [CONFIG_DISPATCHER, MAIN_DISPATCHER])
+    def _error_msg_handler(self, ev):
+        table = self.tables.get(ev.msg.datapath.id)
+        if table is not None and table.apply_error(ev.msg):
+            self.logger.debug('flow mirror: reverted flow-mod xid=%#x of '
+                              'dpid %s', ev.msg.xid, table.dpid)
+
+    def _reconcile_loop(self):
+        while True:
+            hub.sleep(self.interval)
+            threads = [hub.spawn(self.reconcile, dp)
+                       for dp in ofctl_api.get_datapath(self)
+                       if dp.ofproto.OFP_VERSION >=
+                       ofproto_v1_3.OFP_VERSION]
+            hub.joinall(threads)
+
+    def _request(self, req, reply_cls):
+        with hub.Timeout(self.timeout):
+            return ofctl_api.send_msg(self, req, reply_cls=reply_cls,
+                                      reply_multi=True)
+
+    def _count(self, dp, cookie=0, cookie_mask=0):
+        msgs = self._request(_aggregate_request(dp, cookie, cookie_mask),
+                             dp.ofproto_parser.OFPAggregateStatsReply)
+        return sum(_flow_count(msg) for msg in msgs)
+
+    def _dump(self, dp, table, cookie=None):
+        if cookie is None:
+            req, reply_cls = _flow_dump_request(dp, 0, 0)
+        else:
+            req, reply_cls = _flow_dump_request(dp, cookie,
+                                                _COOKIE_MASK_EXACT)
+        msgs = self._request(req, reply_cls)
+        self.reconcile_dumps += 1
+        return table.sync((FlowEntry.from_msg(stats)
+                           for msg in msgs for stats in msg.body), cookie)
+
+    def reconcile(self, dp):
+        """
+        Reconciles the mirrored flow tables of the datapath with the
+        switch state, and returns the number of the entries fixed.
+        """
+        table = self.tables.get(dp.id)
+        if table is None:
+            table = self.tables[dp.id] = FlowTable(dp.id)
+        fixed = 0
+        table.begin_sync()
+        try:
+            total = self._count(dp)
+            if total != len(table):
+                counted = 0
+                for cookie in table.cookies():
+                    count = self._count(dp, cookie, _COOKIE_MASK_EXACT)
+                    counted += count
+                    if count != table.count(cookie):
+                        fixed += self._dump(dp, table, cookie)
+                if counted != total:
+                    # entries of the cookies unknown to the mirror
+                    fixed += self._dump(dp, table)
+            cookie = table.next_cookie()
+            if cookie is not None:
+                fixed += self._dump(dp, table, cookie)
+        except hub.Timeout:
+            self.logger.warning('flow mirror: reconciling dpid %s timed out',
+                                dp.id)
+        except exception._ExceptionBase as e:
+            self.logger.warning('flow mirror: reconciling dpid %s failed: %s',
+                                dp.id, e)
+        finally:
+            table.end_sync()
+        self.reconcile_rounds += 1
+        self.reconcile_fixes += fixed
+        if fixed:
+            self.logger.info('flow mirror: fixed %d entries of dpid %s',
+                             fixed, dp.id)
+        return fixed
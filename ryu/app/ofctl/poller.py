@@ -0,0 +1,354 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Stats poller service.
+
+Polls the flow, port, table and meter stats of the datapaths through
+ryu.app.ofctl.service.  The request of a kind of stats is sent to all the
+datapaths at once and the replies are waited for concurrently, so that
+a slow or unresponsive switch delays only its own result.  Concurrent
+polls of the same stats of a datapath share a single request.
+
+The results are cached and published to the other applications as
+:py:class:`EventStatsReply`.  With ``--stats-poll-interval``, the stats
+of ``--stats-poll-kinds`` are polled periodically; otherwise they are
+polled on demand by :py:meth:`StatsPoller.get_stats`, which returns the
+cached stats if they are not older than the given maximum age.
+
+The counters of the polled port and flow stats are recorded in
+:py:class:`ryu.lib.counter_store.CounterStore` (``port_counters`` keyed
+by (dpid, port_no) and ``flow_counters`` keyed by (dpid, table_id,
+priority, cookie, match fields)) to compute their rates.
+
+Only OpenFlow 1.3 or later datapaths are polled.
+"""
+
+import itertools
+import time
+
+from ryu import flags as cfg_flags  # For loading the stats poller options
+from ryu.base import app_manager
+from ryu.controller import event
+from ryu.controller import handler
+from ryu.controller import ofp_event
+from ryu.controller.handler import DEAD_DISPATCHER
+from ryu.controller.handler import set_ev_cls
+from ryu.lib import counter_store
+from ryu.lib import hub
+from ryu.ofproto import ofproto_v1_3
+from ryu.ofproto import ofproto_v1_5_parser
+
+from . import api as ofctl_api
+from . import exception
+
+
+def _flow_stats_request(dp):
+    return (dp.ofproto_parser.OFPFlowStatsRequest(dp),
+            dp.ofproto_parser.OFPFlowStatsReply)
+
+
+def _port_stats_request(dp):
+    return (dp.ofproto_parser.OFPPortStatsRequest(
+        dp, 0, dp.ofproto.OFPP_ANY),
+        dp.ofproto_parser.OFPPortStatsReply)
+
+
+def _table_stats_request(dp):
+    return (dp.ofproto_parser.OFPTableStatsRequest(dp, 0),
+            dp.ofproto_parser.OFPTableStatsReply)
+
+
+def _meter_stats_request(dp):
+    return (dp.ofproto_parser.OFPMeterStatsRequest(
+        dp, 0, dp.ofproto.OFPM_ALL),
+        dp.ofproto_parser.OFPMeterStatsReply)
+
+
+STATS_REQUESTS = {
+    'flow': _flow_stats_request,
+    'port': _port_stats_request,
+    'table': _table_stats_request,
+    'meter': _meter_stats_request,
+}
+
+
+PORT_COUNTERS = ('rx_packets', 'tx_packets', 'rx_bytes', 'tx_bytes',
+                 'rx_dropped', 'tx_dropped', 'rx_errors', 'tx_errors')
+
+FLOW_COUNTERS = ('packet_count', 'byte_count')
+
+# Counters whose rates are ranked for top-N queries.  The first one is
+# the default.
+RANKED_COUNTERS = {
+    'port': ('tx_bytes', 'rx_bytes'),
+    'flow': ('byte_count',),
+}
+
+
+def counter_key_to_dict(kind, key):
+    """
+    Returns a dict of the fields of the key of port_counters or
+    flow_counters.
+    """
+    if kind == 'port':
+        dpid, port_no = key
+        return {'dpid': dpid, 'port_no': port_no}
+    dpid, table_id, priority, cookie, match = key
+    return {'dpid': dpid, 'table_id': table_id, 'priority': priority,
+            'cookie': cookie, 'match': dict(match)}
+
+
+def _port_counters(dpid, stats):
+    return ((dpid, stats.port_no),
+            [getattr(stats, name) for name in PORT_COUNTERS])
+
+
+def _flow_counters(dpid, stats):
+    key = (dpid, stats.table_id, stats.priority, stats.cookie,
+           tuple(stats.match.items()))
+    if isinstance(stats, ofproto_v1_5_parser.OFPFlowStats):
+        return key, [stats.stats.get(name, 0) for name in FLOW_COUNTERS]
+    return key, [getattr(stats, name) for name in FLOW_COUNTERS]
+
+
+COUNTERS = {
+    'port': _port_counters,
+    'flow': _flow_counters,
+}
+
+
+class EventStatsReply(event.EventBase):
+    """
+    An event class to notify the polled stats of a datapath.
+
+    ========= =================================================================
+    Attribute Description
+    ========= =================================================================
+    dpid      Datapath ID
+    kind      Kind of the stats ('flow', 'port', 'table' or 'meter')
+    stats     A list of the stats entries in the reply, e.g., OFPFlowStats
+    timestamp Time when the reply was received
+    ========= =================================================================
+    """
+
+    def __init__(self, dpid, kind, stats, timestamp):
+        super(EventStatsReply, self).__init__()
+        self.dpid = dpid
+        self.kind = kind
+        self.stats = stats
+        self.timestamp = timestamp
+
+    def __str__(self):
+        return 'EventStatsReply<dpid=%s, kind=%s, %d entries>' % (
+            self.dpid, self.kind, len(self.stats))
+
+
+class _Poll(object):
+    # A stats request in flight, shared by the concurrent polls of the
+    # same stats of a datapath.
+    def __init__(self, dpid, kind):
+        self.dpid = dpid
+        self.kind = kind
+        self.stats = None
+        self._event = hub.Event()
+
+    def set(self, stats):
+        self.stats = stats
+        self._event.set()
+
+    def wait(self):
+        self._event.wait()
+        return self.stats
+
+
+class StatsPoller(app_manager.RyuApp):
+    _EVENTS = [EventStatsReply]
+
+    def __init__(self, *args, **kwargs):
+        super(StatsPoller, self).__init__(*args, **kwargs)
+        self.name = 'stats_poller'
+        self.interval = self.CONF.stats_poll_interval
+        self.kinds = self.CONF.stats_poll_kinds
+        self.timeout = self.CONF.stats_poll_timeout
+        self.max_age = self.CONF.stats_max_age
+        for kind in self.kinds:
+            if kind not in STATS_REQUESTS:
+                raise ValueError('unknown kind of stats: %s' % kind)
+        self._cache = {}  # (dpid, kind) -> (timestamp, stats)
+        self._polls = {}  # (dpid, kind) -> _Poll
+        self.port_counters = counter_store.CounterStore(
+            PORT_COUNTERS, ranked=RANKED_COUNTERS['port'])
+        self.flow_counters = counter_store.CounterStore(
+            FLOW_COUNTERS, ranked=RANKED_COUNTERS['flow'])
+        self._counter_keys = {}  # (dpid, kind) -> set of counter keys
+        self.requests_sent = 0
+        self.requests_shared = 0
+
+    def start(self):
+        super(StatsPoller, self).start()
+        if self.interval > 0:
+            self.threads.append(hub.spawn(self._poll_loop))
+
+    def _poll_loop(self):
+        while True:
+            polls = []
+            for dp in self._get_datapaths():
+                polls.extend(self._start_poll(dp, kind)
+                             for kind in self.kinds)
+            for poll in polls:
+                poll.wait()
+            hub.sleep(self.interval)
+
+    def _get_datapaths(self, dpids=None):
+        datapaths = ofctl_api.get_datapath(self)
+        if dpids is not None:
+            dpids = set(dpids)
+            datapaths = [dp for dp in datapaths if dp.id in dpids]
+        return [dp for dp in datapaths
+                if dp.ofproto.OFP_VERSION >= ofproto_v1_3.OFP_VERSION]
+
+    def _start_poll(self, dp, kind):
+        key = (dp.id, kind)
+        poll = self._polls.get(key)
+        if poll is not None:
+            self.requests_shared += 1
+            return poll
+        poll = _Poll(dp.id, kind)
+        self._polls[key] = poll
+        self.requests_sent += 1
+        hub.spawn(self._request_stats, dp, poll)
+        return poll
+
+    def _request_stats(self, dp, poll):
+        stats = None
+        try:
+            req, reply_cls = STATS_REQUESTS[poll.kind](dp)
+            with hub.Timeout(self.timeout):
+                msgs = ofctl_api.send_msg(self, req, reply_cls=reply_cls,
+                                          reply_multi=True)
+            stats = list(itertools.chain.from_iterable(
+                msg.body for msg in msgs))
+        except hub.Timeout:
+            self.logger.warning('stats poller: %s stats of dpid %s '
+                                'timed out', poll.kind, dp.id)
+        except exception._ExceptionBase as e:
+            self.logger.warning('stats poller: %s stats of dpid %s '
+                                'failed: %s', poll.kind, dp.id, e)
+        finally:
+            del self._polls[(dp.id, poll.kind)]
+            if stats is not None:
+                timestamp = time.time()
+                self._cache[(dp.id, poll.kind)] = (timestamp, stats)
+                self._record_counters(dp.id, poll.kind, stats, timestamp)
+                self.send_event_to_observers(
+                    EventStatsReply(dp.id, poll.kind, stats, timestamp))
+            poll.set(stats)
+
+    def get_counters(self, kind):
+        """
+        Returns the CounterStore of the kind of stats, 'port' or 'flow'.
+        """
+        if kind == 'port':
+            return self.port_counters
+        elif kind == 'flow':
+            return self.flow_counters
+        raise ValueError('no counters of stats: %s' % kind)
+
+    def get_ranked_counters(self, kind):
+        """
+        Returns the names of the counters of the kind of stats whose rates
+        are ranked.  The first one is the default.
+        """
+        self.get_counters(kind)
+        return RANKED_COUNTERS[kind]
+
+    def counter_key_to_dict(self, kind, key):
+        """
+        Returns a dict of the fields of the key of the CounterStore of the
+        kind of stats.
+        """
+        return counter_key_to_dict(kind, key)
+
+    def _record_counters(self, dpid, kind, stats, timestamp):
+        if kind not in COUNTERS:
+            return
+        store = self.get_counters(kind)
+        keys = set()
+        for s in stats:
+            key, values = COUNTERS[kind](dpid, s)
+            store.add(key, timestamp, values)
+            keys.add(key)
+        # forget the ports and flows which have gone
+        for key in self._counter_keys.get((dpid, kind), set()) - keys:
+            store.discard(key)
+        self._counter_keys[(dpid, kind)] = keys
+
+    def _wait_polls(self, polls):
+        results = {}
+        for poll in polls:
+            stats = poll.wait()
+            if stats is not None:
+                results[poll.dpid] = stats
+        return results
+
+    def poll(self, kind, dpids=None):
+        """
+        Requests the stats of the given kind to the datapaths of dpids, or
+        all the datapaths if None, and waits for the replies.
+
+        Returns a dict of the list of the stats entries keyed by the
+        datapath ID.  The datapaths which failed to reply in time are
+        omitted.
+        """
+        if kind not in STATS_REQUESTS:
+            raise ValueError('unknown kind of stats: %s' % kind)
+        return self._wait_polls([self._start_poll(dp, kind)
+                                 for dp in self._get_datapaths(dpids)])
+
+    def get_stats(self, kind, dpids=None, max_age=None):
+        """
+        Same as poll(), but returns the cached stats of the datapaths
+        which were polled within max_age seconds, or --stats-max-age if
+        None, and polls only the others.
+        """
+        if kind not in STATS_REQUESTS:
+            raise ValueError('unknown kind of stats: %s' % kind)
+        if max_age is None:
+            max_age = self.max_age
+        now = time.time()
+        results = {}
+        polls = []
+        for dp in self._get_datapaths(dpids):
+            cached = self._cache.get((dp.id, kind))
+            if cached is not None and now - cached[0] <= max_age:
+                results[dp.id] = cached[1]
+            else:
+                polls.append(self._start_poll(dp, kind))
+        results.update(self._wait_polls(polls))
+        return results
+
+    @set_ev_cls(ofp_event.EventOFPStateChange, DEAD_DISPATCHER)
+    def _state_change_handler(self, ev):
+        dpid = ev.datapath.id
+        for kind in STATS_REQUESTS:
+            self._cache.pop((dpid, kind), None)
+        for kind in COUNTERS:
+            store = self.get_counters(kind)
+            for key in self._counter_keys.pop((dpid, kind), ()):
+                store.discard(key)
+
+
+handler.register_service('ryu.app.ofctl.poller')
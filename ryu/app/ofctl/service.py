@@ -16,7 +16,10 @@
 
 # ofctl service
 
+import collections
+import itertools
 import numbers
+import time
 
 from ryu.base import app_manager
 
@@ -24,6 +27,7 @@ from ryu.controller import ofp_event
 from ryu.controller.handler import CONFIG_DISPATCHER, MAIN_DISPATCHER,\
     DEAD_DISPATCHER
 from ryu.controller.handler import set_ev_cls
+from ryu.lib import hub
 
 from . import event
 from . import exception
@@ -35,6 +39,43 @@ class _SwitchInfo(object):
         self.xids = {}
         self.barriers = {}
         self.results = {}
+        self.installs = set()  # _FlowInstall
+        self.install_xids = {}  # xid -> _FlowInstall
+
+
+class _Batch(object):
+    # flow-mods of a bulk installation followed by a barrier
+    def __init__(self, start, stop):
+        self.start = start
+        self.stop = stop
+        self.xids = {}  # xid -> index of the flow-mod, None for bundle ctrl
+        self.barrier = None
+        self.replied = hub.Event()
+
+
+class _FlowInstall(object):
+    # a bulk installation in progress
+    def __init__(self, req):
+        self.req = req
+        self.result = event.InstallResult()
+        self.batches = {}  # xid -> _Batch
+        self.exception = None
+
+    def error(self, msg):
+        batch = self.batches.get(msg.xid)
+        if batch is None:
+            return
+        index = batch.xids.get(msg.xid)
+        if index is not None:
+            self.result.errors.setdefault(index, msg)
+        elif not any(start == batch.start
+                     for start, _, _ in self.result.failed_batches):
+            self.result.failed_batches.append((batch.start, batch.stop, msg))
+
+    def cancel(self, exception):
+        self.exception = exception
+        for batch in self.batches.values():
+            batch.replied.set()
 
 
 class OfctlService(app_manager.RyuApp):
@@ -43,6 +84,7 @@ class OfctlService(app_manager.RyuApp):
         self.name = 'ofctl_service'
         self._switches = {}
         self._observing_events = {}
+        self._bundle_ids = itertools.count(1)
 
     def _observe_msg(self, msg_cls):
         assert msg_cls is not None
@@ -100,6 +142,8 @@ class OfctlService(app_manager.RyuApp):
             for xid in list(old_info.barriers):
                 self._cancel(
                     old_info, xid, exception.InvalidDatapath(result=id))
+            for install in list(old_info.installs):
+                install.cancel(exception.InvalidDatapath(result=id))
 
     @set_ev_cls(ofp_event.EventOFPStateChange, DEAD_DISPATCHER)
     def _handle_dead(self, ev):
@@ -117,6 +161,8 @@ class OfctlService(app_manager.RyuApp):
             self._switches.pop(id)
             for xid in list(info.barriers):
                 self._cancel(info, xid, exception.InvalidDatapath(result=id))
+            for install in list(info.installs):
+                install.cancel(exception.InvalidDatapath(result=id))
 
     @set_ev_cls(event.GetDatapathRequest, MAIN_DISPATCHER)
     def _handle_get_datapath(self, req):
@@ -173,6 +219,93 @@ class OfctlService(app_manager.RyuApp):
                 si, barrier.xid,
                 exception.InvalidDatapath(result=datapath.id))
 
+    @set_ev_cls(event.InstallFlowsRequest, MAIN_DISPATCHER)
+    def _handle_install_flows(self, req):
+        datapath = req.datapath
+        try:
+            si = self._switches[datapath.id]
+        except KeyError:
+            self.logger.error('unknown dpid %s' % (datapath.id,))
+            rep = event.Reply(exception=exception.
+                              InvalidDatapath(result=datapath.id))
+            self.reply_to_request(req, rep)
+            return
+        # waits for the barrier replies, which this thread handles
+        hub.spawn(self._install_flows, si, req)
+
+    def _install_flows(self, si, req):
+        install = _FlowInstall(req)
+        si.installs.add(install)
+        try:
+            self._send_batches(si, install)
+            rep = event.Reply(result=install.result)
+        except Exception as e:
+            # e.g., a flow-mod which fails to serialize; the requester
+            # must not be left waiting
+            rep = event.Reply(exception=e)
+        finally:
+            si.installs.discard(install)
+            for xid in install.batches:
+                si.install_xids.pop(xid, None)
+        self.reply_to_request(req, rep)
+
+    def _send_batches(self, si, install):
+        req = install.req
+        result = install.result
+        pending = collections.deque()
+        start = time.time()
+        for first in range(0, len(req.msgs), req.batch_size):
+            if len(pending) >= req.window:
+                self._wait_batch(si, install, pending.popleft())
+            stop = min(first + req.batch_size, len(req.msgs))
+            pending.append(self._send_batch(si, install, first, stop))
+            result.rules = stop
+            result.batches += 1
+        while pending:
+            self._wait_batch(si, install, pending.popleft())
+        result.elapsed = time.time() - start
+
+    def _send_batch(self, si, install, start, stop):
+        req = install.req
+        datapath = req.datapath
+        ofp = datapath.ofproto
+        parser = datapath.ofproto_parser
+        batch = _Batch(start, stop)
+
+        def _send(msg, index=None):
+            datapath.set_xid(msg)
+            batch.xids[msg.xid] = index
+            install.batches[msg.xid] = batch
+            si.install_xids[msg.xid] = install
+            if not datapath.send_msg(msg):
+                raise exception.InvalidDatapath(result=datapath.id)
+
+        if req.bundle:
+            bundle_id = next(self._bundle_ids) & 0xffffffff
+            flags = ofp.OFPBF_ATOMIC | ofp.OFPBF_ORDERED
+            _send(parser.OFPBundleCtrlMsg(
+                datapath, bundle_id, ofp.OFPBCT_OPEN_REQUEST, flags, []))
+            for index in range(start, stop):
+                _send(parser.OFPBundleAddMsg(
+                    datapath, bundle_id, flags, req.msgs[index], []),
+                    index)
+            _send(parser.OFPBundleCtrlMsg(
+                datapath, bundle_id, ofp.OFPBCT_COMMIT_REQUEST, flags, []))
+        else:
+            for index in range(start, stop):
+                _send(req.msgs[index], index)
+        batch.barrier = parser.OFPBarrierRequest(datapath)
+        _send(batch.barrier)
+        return batch
+
+    def _wait_batch(self, si, install, batch):
+        batch.replied.wait()
+        if install.exception is not None:
+            raise install.exception
+        for xid in batch.xids:
+            install.batches.pop(xid, None)
+            si.install_xids.pop(xid, None)
+
     @set_ev_cls(ofp_event.EventOFPBarrierReply, MAIN_DISPATCHER)
     def _handle_barrier(self, ev):
         msg = ev.msg
@@ -183,6 +316,12 @@ class OfctlService(app_manager.RyuApp):
         except KeyError:
             self.logger.error('unknown dpid %s', datapath.id)
             return
+        install = si.install_xids.get(msg.xid)
+        if install is not None:
+            batch = install.batches.get(msg.xid)
+            if batch is not None and batch.barrier.xid == msg.xid:
+                batch.replied.set()
+            return
         try:
             xid = si.barriers.pop(msg.xid)
         except KeyError:
@@ -217,6 +356,10 @@ class OfctlService(app_manager.RyuApp):
         except KeyError:
             self.logger.error('unknown dpid %s', datapath.id)
             return
+        install = si.install_xids.get(msg.xid)
+        if install is not None:
+            install.error(msg)
+            return
         try:
             req = si.xids[msg.xid]
         except KeyError:
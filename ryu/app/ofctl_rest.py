@@ -16,6 +16,7 @@
 import logging
 import json
 import ast
+import itertools
 
 from ryu.base import app_manager
 from ryu.controller import ofp_event
@@ -56,6 +57,20 @@ supported_ofctl = {
 # get the list of all switches
 # GET /stats/switches
 #
+# get the flow, port, table or meter stats of all the switches
+# or the switch, served from the cache of ryu.app.ofctl.poller
+# if they are not older than max_age seconds
+# GET /stats/cached/<kind>[?max_age=<seconds>]
+# GET /stats/cached/<kind>/<dpid>[?max_age=<seconds>]
+#
+# get the rates per second of the port or flow counters of all the
+# switches or the switch, computed by ryu.app.ofctl.poller
+# GET /stats/rate/<kind>
+# GET /stats/rate/<kind>/<dpid>
+#
+# get the ports or flows with the top N rates of the counter
+# GET /stats/rate/<kind>[/<dpid>]?top=<N>[&counter=<counter>]
+#
 # get the desc stats of the switch
 # GET /stats/desc/<dpid>
 #
@@ -68,6 +83,9 @@ supported_ofctl = {
 # get flows stats of the switch
 # GET /stats/flow/<dpid>
 #
+# get a page of flows stats of the switch
+# GET /stats/flow/<dpid>?limit=<limit>[&cursor=<cursor>]
+#
 # get flows stats of the switch filtered by the fields
 # POST /stats/flow/<dpid>
 #
@@ -184,6 +202,13 @@ supported_ofctl = {
 # POST /stats/experimenter/<dpid>
 
 
+# Approximate size in bytes of the chunks of a streamed stats response.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Response header which carries the cursor of the next page of stats.
+NEXT_CURSOR_HEADER = 'X-Next-Cursor'
+
+
 class CommandNotFoundError(RyuException):
     message = 'No such command : %(cmd)s'
 
@@ -215,6 +240,8 @@ def stats_method(method):
         # Invoke StatsController method
         try:
             ret = method(self, req, dp, ofctl, *args, **kwargs)
+            if isinstance(ret, Response):
+                return ret
             return Response(content_type='application/json',
                             body=json.dumps(ret))
         except ValueError:
@@ -292,6 +319,78 @@ def command_method(method):
     return wrapper
 
 
+def _close_entries(entries):
+    close = getattr(entries, 'close', None)
+    if close is not None:
+        close()
+
+
+def _stream_chunks(dpid, first, entries):
+    try:
+        buf = ['{%s: [' % json.dumps(dpid), json.dumps(first)]
+        size = 0
+        for entry in entries:
+            data = json.dumps(entry)
+            buf.append(', ')
+            buf.append(data)
+            size += len(data)
+            if size >= STREAM_CHUNK_SIZE:
+                yield ''.join(buf).encode('utf-8')
+                buf = []
+                size = 0
+        buf.append(']}')
+        yield ''.join(buf).encode('utf-8')
+    finally:
+        _close_entries(entries)
+
+
+def stream_response(dp, entries):
+    """
+    Returns a response which encodes the stats entries of the datapath as
+    {"<dpid>": [<entry>, ...]}, written in chunks as the entries are
+    yielded instead of being encoded at once.
+
+    The first entry is taken before returning, so that the errors of the
+    request are raised to the caller rather than in the middle of the
+    response.
+    """
+    dpid = str(dp.id)
+    entries = iter(entries)
+    first = next(entries, None)
+    if first is None:
+        return Response(content_type='application/json',
+                        body=json.dumps({dpid: []}))
+    return Response(content_type='application/json',
+                    app_iter=_stream_chunks(dpid, first, entries))
+
+
+def paginated_response(dp, entries, limit, cursor=None):
+    """
+    Returns a response which encodes at most limit stats entries of the
+    datapath from the position of the given cursor.
+
+    If there are more entries, the cursor of the next page is set in the
+    X-Next-Cursor header.  OpenFlow does not provide a way to resume a
+    multipart request, so the entries before the cursor are read from the
+    switch and discarded, and the rest of the reply is dropped.
+    """
+    limit = int(limit)
+    offset = int(cursor) if cursor else 0
+    if limit <= 0 or offset < 0:
+        raise ValueError('invalid limit or cursor: %s, %s' % (limit, cursor))
+
+    try:
+        page = list(itertools.islice(entries, offset, offset + limit + 1))
+    finally:
+        _close_entries(entries)
+
+    res = Response(content_type='application/json',
+                   body=json.dumps({str(dp.id): page[:limit]}))
+    if len(page) > limit:
+        res.headers[NEXT_CURSOR_HEADER] = str(offset + limit)
+    return res
+
+
 class StatsController(ControllerBase):
     def __init__(self, req, link, data, **config):
         super(StatsController, self).__init__(req, link, data, **config)
@@ -303,6 +402,71 @@ class StatsController(ControllerBase):
         body = json.dumps(dps)
         return Response(content_type='application/json', body=body)
 
+    def get_cached_stats(self, req, kind, dpid=None, **_kwargs):
+        poller = app_manager.lookup_service_brick('stats_poller')
+        if poller is None:
+            LOG.error('ryu.app.ofctl.poller is not running')
+            return Response(status=501)
+
+        try:
+            dpids = None if dpid is None else [int(str(dpid), 0)]
+            max_age = req.GET.get('max_age')
+            if max_age is not None:
+                max_age = float(max_age)
+            results = poller.get_stats(kind, dpids, max_age)
+        except ValueError:
+            LOG.exception('Invalid request: %s %s', kind, req.query_string)
+            return Response(status=400)
+        if dpid is not None and not results:
+            LOG.error('No stats of Datapath: %s', dpid)
+            return Response(status=404)
+
+        body = {}
+        for stats_dpid, stats in results.items():
+            body[str(stats_dpid)] = [s.to_jsondict()[s.__class__.__name__]
+                                     for s in stats]
+        return Response(content_type='application/json',
+                        body=json.dumps(body))
+
+    def get_counter_rates(self, req, kind, dpid=None, **_kwargs):
+        poller = app_manager.lookup_service_brick('stats_poller')
+        if poller is None:
+            LOG.error('ryu.app.ofctl.poller is not running')
+            return Response(status=501)
+
+        def _match(key):
+            return key[0] == dpid
+
+        try:
+            store = poller.get_counters(kind)
+            if dpid is not None:
+                dpid = int(str(dpid), 0)
+            match = None if dpid is None else _match
+            if 'top' in req.GET:
+                ranked = poller.get_ranked_counters(kind)
+                counter = req.GET.get('counter', ranked[0])
+                if counter not in ranked:
+                    raise ValueError('counter is not ranked: %s' % counter)
+                entries = store.top(counter, int(req.GET['top']), match)
+                keys = [key for key, _rate in entries]
+            else:
+                keys = [key for key in store.keys()
+                        if match is None or match(key)]
+        except ValueError:
+            LOG.exception('Invalid request: %s %s', kind, req.query_string)
+            return Response(status=400)
+
+        body = []
+        for key in keys:
+            rates = store.rates(key)
+            if rates is None:
+                continue
+            entry = poller.counter_key_to_dict(kind, key)
+            entry.update(rates)
+            body.append(entry)
+        return Response(content_type='application/json',
+                        body=json.dumps(body))
+
     @stats_method
     def get_desc_stats(self, req, dp, ofctl, **kwargs):
         return ofctl.get_desc_stats(dp, self.waiters)
@@ -315,7 +479,15 @@ class StatsController(ControllerBase):
     @stats_method
     def get_flow_stats(self, req, dp, ofctl, **kwargs):
         flow = req.json if req.body else {}
-        return ofctl.get_flow_stats(dp, self.waiters, flow)
+        if hasattr(ofctl, 'iter_flow_stats'):
+            flows = ofctl.iter_flow_stats(dp, self.waiters, flow)
+        else:
+            flows = ofctl.get_flow_stats(dp, self.waiters, flow)[str(dp.id)]
+
+        if 'limit' in req.GET:
+            return paginated_response(dp, flows, req.GET['limit'],
+                                      req.GET.get('cursor'))
+        return stream_response(dp, flows)
 
     @stats_method
     def get_aggregate_flow_stats(self, req, dp, ofctl, **kwargs):
@@ -335,6 +507,9 @@ class StatsController(ControllerBase):
         if port == "ALL":
             port = None
 
+        if hasattr(ofctl, 'iter_port_stats'):
+            return stream_response(
+                dp, ofctl.iter_port_stats(dp, self.waiters, port))
         return ofctl.get_port_stats(dp, self.waiters, port)
 
     @stats_method
@@ -407,6 +582,9 @@ class StatsController(ControllerBase):
         if group_id == "ALL":
             group_id = None
 
+        if hasattr(ofctl, 'iter_group_stats'):
+            return stream_response(
+                dp, ofctl.iter_group_stats(dp, self.waiters, group_id))
         return ofctl.get_group_stats(dp, self.waiters, group_id)
 
     @stats_method
@@ -527,6 +705,28 @@ class RestStatsApi(app_manager.RyuApp):
                        controller=StatsController, action='get_dpids',
                        conditions=dict(method=['GET']))
 
+        uri = path + '/cached/{kind}'
+        mapper.connect('stats', uri,
+                       controller=StatsController, action='get_cached_stats',
+                       conditions=dict(method=['GET']))
+
+        uri = path + '/cached/{kind}/{dpid}'
+        mapper.connect('stats', uri,
+                       controller=StatsController, action='get_cached_stats',
+                       conditions=dict(method=['GET']))
+
+        uri = path + '/rate/{kind}'
+        mapper.connect('stats', uri,
+                       controller=StatsController,
+                       action='get_counter_rates',
+                       conditions=dict(method=['GET']))
+
+        uri = path + '/rate/{kind}/{dpid}'
+        mapper.connect('stats', uri,
+                       controller=StatsController,
+                       action='get_counter_rates',
+                       conditions=dict(method=['GET']))
+
         uri = path + '/desc/{dpid}'
         mapper.connect('stats', uri,
                        controller=StatsController, action='get_desc_stats',
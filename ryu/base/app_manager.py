@@ -23,17 +23,20 @@ The central management of Ryu applications.
 
 """
 
+import collections
 import inspect
 import itertools
 import logging
 import sys
 import os
 import gc
+import time
 
 from ryu import cfg
 from ryu import utils
 from ryu.app import wsgi
 from ryu.controller.handler import register_instance, get_dependent_services
+from ryu.controller.handler import get_ev_batch
 from ryu.controller.controller import Datapath
 from ryu.controller import event
 from ryu.controller.event import EventRequestBase, EventReplyBase
@@ -42,6 +45,44 @@ from ryu.ofproto import ofproto_protocol
 
 LOG = logging.getLogger('ryu.base.app_manager')
 
+DEFAULT_EVENT_QUEUE_SIZE = 128
+
+# Overflow policies of the event queues
+EVENT_QUEUE_BLOCK = 'block'
+EVENT_QUEUE_DROP_OLDEST = 'drop-oldest'
+EVENT_QUEUE_DROP_NEWEST = 'drop-newest'
+EVENT_QUEUE_COALESCE = 'coalesce'
+EVENT_QUEUE_POLICIES = [EVENT_QUEUE_BLOCK, EVENT_QUEUE_DROP_OLDEST,
+                        EVENT_QUEUE_DROP_NEWEST, EVENT_QUEUE_COALESCE]
+
+CONF = cfg.CONF
+CONF.register_opts([
+    cfg.IntOpt('event-queue-size',
+               default=DEFAULT_EVENT_QUEUE_SIZE,
+               min=1,
+               help='Capacity of the event queue of each application '
+                    '(default %d).' % DEFAULT_EVENT_QUEUE_SIZE),
+    cfg.StrOpt('event-queue-policy',
+               default=EVENT_QUEUE_BLOCK,
+               choices=EVENT_QUEUE_POLICIES,
+               help='What to do with an event sent to a full event queue: '
+                    'block the sender, drop the oldest queued event, drop '
+                    'the new event, or coalesce it with a queued event of '
+                    'the same key (dropping the oldest if none) '
+                    '(default %s).' % EVENT_QUEUE_BLOCK),
+    cfg.DictOpt('event-queue-sizes',
+                default={},
+                help='Capacities per application or per event class of an '
+                     'application, e.g. '
+                     '"RestStatsApi:1024,Switches.EventOFPPacketIn:256".'),
+    cfg.DictOpt('event-queue-policies',
+                default={},
+                help='Overflow policies per application or per event class '
+                     'of an application, e.g. '
+                     '"RestStatsApi:drop-oldest,'
+                     'Switches.EventOFPPacketIn:drop-newest".'),
+])
+
 SERVICE_BRICKS = {}
 
 
@@ -68,6 +109,48 @@ def unregister_app(app):
     SERVICE_BRICKS.pop(app.name)
 
 
+class _EventQueueConf(object):
+    """Capacity and overflow policy of an event queue.
+    """
+
+    def __init__(self, size, policy):
+        if policy not in EVENT_QUEUE_POLICIES:
+            raise ValueError('Invalid event queue policy: "%s"' % policy)
+        self.size = size
+        self.policy = policy
+        self.sem = None
+        if policy == EVENT_QUEUE_BLOCK:
+            self.sem = hub.BoundedSemaphore(size)
+
+
+class _QueuedEvent(object):
+    """An event in the event queue of an application.
+
+    ev is updated in place when a new event is coalesced with it, and set
+    to None when the event is dropped by the overflow policy.
+    """
+    __slots__ = ('ev', 'state', 'key')
+
+    def __init__(self, ev, state, key=None):
+        self.ev = ev
+        self.state = state
+        self.key = key  # coalesce key
+
+
+def _event_queue_conf(name):
+    """
+    Returns the _EventQueueConf for the given application or
+    "application.event class" name, or None if not configured.
+    """
+    size = CONF.event_queue_sizes.get(name)
+    policy = CONF.event_queue_policies.get(name)
+    if size is None and policy is None:
+        return None
+    if size is None:
+        size = CONF.event_queue_size
+    return _EventQueueConf(int(size), policy or CONF.event_queue_policy)
+
+
 def require_app(app_name, api_style=False):
     """
     Request the application to be automatically loaded.
@@ -155,10 +238,32 @@ class RyuApp(object):
         self.name = self.__class__.__name__
         self.event_handlers = {}        # ev_cls -> handlers:list
         self.observers = {}     # ev_cls -> observer-name -> states:set
+        # Dispatch indexes built lazily from event_handlers and observers,
+        # and invalidated whenever those change.
+        self._handlers_index = {}   # (ev_cls, state) -> handlers:tuple
+        self._observers_index = {}  # (ev_cls, state) -> observer-names:tuple
         self.threads = []
         self.main_thread = None
-        self.events = hub.Queue(128)
+        self._events_conf = (_event_queue_conf(self.name) or
+                             _EventQueueConf(CONF.event_queue_size,
+                                             CONF.event_queue_policy))
+        self.events = hub.Queue(self._events_conf.size)
         self._events_sem = hub.BoundedSemaphore(self.events.maxsize)
+        # Event class name -> _EventQueueConf limiting the queued events
+        # of the class
+        self._ev_cls_queue_conf = {}
+        for key in itertools.chain(CONF.event_queue_sizes,
+                                   CONF.event_queue_policies):
+            app_name, _sep, ev_cls_name = key.partition('.')
+            if (app_name == self.name and ev_cls_name and
+                    ev_cls_name not in self._ev_cls_queue_conf):
+                self._ev_cls_queue_conf[ev_cls_name] = _event_queue_conf(key)
+        self._events_queued = {}     # ev_cls -> _QueuedEvent:deque
+        self._events_coalesced = {}  # coalesce key -> _QueuedEvent
+        self.events_dropped = {}     # ev_cls -> number of dropped events
+        # (ev_cls, handler) -> (deadline, events:list) for the handlers
+        # decorated with set_ev_batch
+        self._ev_batches = {}
         if hasattr(self.__class__, 'LOGGER_NAME'):
             self.logger = logging.getLogger(self.__class__.LOGGER_NAME)
         else:
@@ -196,25 +301,30 @@ class RyuApp(object):
         assert callable(handler)
         self.event_handlers.setdefault(ev_cls, [])
         self.event_handlers[ev_cls].append(handler)
+        self._handlers_index.clear()
 
     def unregister_handler(self, ev_cls, handler):
         assert callable(handler)
         self.event_handlers[ev_cls].remove(handler)
         if not self.event_handlers[ev_cls]:
             del self.event_handlers[ev_cls]
+        self._handlers_index.clear()
 
     def register_observer(self, ev_cls, name, states=None):
         states = states or set()
         ev_cls_observers = self.observers.setdefault(ev_cls, {})
         ev_cls_observers.setdefault(name, set()).update(states)
+        self._observers_index.clear()
 
     def unregister_observer(self, ev_cls, name):
         observers = self.observers.get(ev_cls, {})
         observers.pop(name)
+        self._observers_index.clear()
 
     def unregister_observer_all_event(self, name):
         for observers in self.observers.values():
             observers.pop(name, None)
+        self._observers_index.clear()
 
     def observe_event(self, ev_cls, states=None):
         brick = _lookup_service_brick_by_ev_cls(ev_cls)
@@ -237,9 +347,14 @@ class RyuApp(object):
                       The default is None.
         """
         ev_cls = ev.__class__
-        handlers = self.event_handlers.get(ev_cls, [])
         if state is None:
-            return handlers
+            return self.event_handlers.get(ev_cls, [])
+
+        key = (ev_cls, state)
+        try:
+            return self._handlers_index[key]
+        except KeyError:
+            pass
 
         def test(h):
             if not hasattr(h, 'callers') or ev_cls not in h.callers:
@@ -252,14 +367,24 @@ class RyuApp(object):
                 return True
             return state in states
 
-        return filter(test, handlers)
+        handlers = tuple(filter(test, self.event_handlers.get(ev_cls, [])))
+        self._handlers_index[key] = handlers
+        return handlers
 
     def get_observers(self, ev, state):
+        key = (ev.__class__, state)
+        try:
+            return self._observers_index[key]
+        except KeyError:
+            pass
+
         observers = []
         for k, v in self.observers.get(ev.__class__, {}).items():
             if not state or not v or state in v:
                 observers.append(k)
 
+        observers = tuple(observers)
+        self._observers_index[key] = observers
         return observers
 
     def send_request(self, req):
@@ -278,29 +403,166 @@ class RyuApp(object):
         # going to sleep for the reply
         return req.reply_q.get()
 
+    def _call_handler(self, handler, ev, ev_cls):
+        try:
+            handler(ev)
+        except hub.TaskExit:
+            # Normal exit.
+            # Propagate upwards, so we leave the event loop.
+            raise
+        except:
+            LOG.exception('%s: Exception occurred during handler processing. '
+                          'Backtrace from offending handler '
+                          '[%s] servicing event [%s] follows.',
+                          self.name, handler.__name__, ev_cls.__name__)
+
+    def _batch_event(self, handler, batch, ev):
+        key = (ev.__class__, handler)
+        pending = self._ev_batches.get(key)
+        if pending is None:
+            pending = (time.time() + batch.max_latency, [])
+            self._ev_batches[key] = pending
+        pending[1].append(ev)
+        if len(pending[1]) >= batch.max_size:
+            del self._ev_batches[key]
+            self._call_handler(handler, pending[1], ev.__class__)
+
+    def _flush_ev_batches(self, now=None):
+        for key, (deadline, evs) in list(self._ev_batches.items()):
+            if now is not None and deadline > now:
+                continue
+            del self._ev_batches[key]
+            ev_cls, handler = key
+            self._call_handler(handler, evs, ev_cls)
+
+    def _get_event(self):
+        if not self._ev_batches:
+            return self.events.get()
+
+        while True:
+            now = time.time()
+            self._flush_ev_batches(now)
+            if not self._ev_batches:
+                return self.events.get()
+            timeout = min(deadline for deadline, _evs
+                          in self._ev_batches.values()) - now
+            try:
+                return self.events.get(timeout=max(timeout, 0))
+            except hub.QueueEmpty:
+                pass
+
     def _event_loop(self):
         while self.is_active or not self.events.empty():
-            ev, state = self.events.get()
+            item = self._get_event()
             self._events_sem.release()
+            ev, state = item.ev, item.state
+            if ev is None:
+                # dropped by the overflow policy
+                continue
+            self._event_dequeued(ev.__class__, item)
             if ev == self._event_stop:
                 continue
             handlers = self.get_handlers(ev, state)
             for handler in handlers:
-                try:
-                    handler(ev)
-                except hub.TaskExit:
-                    # Normal exit.
-                    # Propagate upwards, so we leave the event loop.
-                    raise
-                except:
-                    LOG.exception('%s: Exception occurred during handler processing. '
-                                  'Backtrace from offending handler '
-                                  '[%s] servicing event [%s] follows.',
-                                  self.name, handler.__name__, ev.__class__.__name__)
+                batch = get_ev_batch(handler)
+                if batch is None:
+                    self._call_handler(handler, ev, ev.__class__)
+                else:
+                    self._batch_event(handler, batch, ev)
+        self._flush_ev_batches()
+
+    def _event_dequeued(self, ev_cls, item):
+        queued = self._events_queued[ev_cls]
+        queued.popleft()
+        if not queued:
+            del self._events_queued[ev_cls]
+        conf = self._ev_cls_queue_conf.get(ev_cls.__name__)
+        if conf is not None and conf.sem is not None:
+            conf.sem.release()
+        # A later event of another class may have taken over the key.
+        if (item.key is not None and
+                self._events_coalesced.get(item.key) is item):
+            del self._events_coalesced[item.key]
+
+    def _drop_event(self, ev_cls, item=None):
+        self.events_dropped[ev_cls] = self.events_dropped.get(ev_cls, 0) + 1
+        if item is None:
+            return
+        self._event_dequeued(ev_cls, item)
+        item.ev = item.state = None
+
+    def _drop_oldest_event(self):
+        item = self.events.get(block=False)
+        self._events_sem.release()
+        if item.ev is not None:
+            self._drop_event(item.ev.__class__, item)
+
+    def get_coalesce_key(self, ev):
+        """
+        Returns the key to coalesce the given event, sent to a full event
+        queue, with a queued event under the "coalesce" overflow policy.
+
+        The default key is the event class, and the datapath ID as well
+        for the events of OpenFlow messages.  Override this to coalesce
+        by other attributes.
+        """
+        datapath = getattr(getattr(ev, 'msg', None), 'datapath', None)
+        if datapath is not None:
+            return ev.__class__, datapath.id
+        return ev.__class__
+
+    def _coalesce_event(self, key, ev, state):
+        # Replaces the queued event of the key with ev if any
+        if key is None:
+            return False
+        item = self._events_coalesced.get(key)
+        if item is None or item.ev.__class__ is not ev.__class__:
+            return False
+        item.ev = ev
+        item.state = state
+        self._drop_event(ev.__class__)
+        return True
 
     def _send_event(self, ev, state):
-        self._events_sem.acquire()
-        self.events.put((ev, state))
+        ev_cls = ev.__class__
+        conf = self._ev_cls_queue_conf.get(ev_cls.__name__)
+        policy = (conf or self._events_conf).policy
+        if ev is self._event_stop:
+            policy = EVENT_QUEUE_BLOCK
+
+        key = None
+        if policy == EVENT_QUEUE_COALESCE:
+            key = self.get_coalesce_key(ev)
+
+        queued = self._events_queued.get(ev_cls)
+        if conf is not None:
+            if conf.sem is not None:
+                conf.sem.acquire()
+            elif queued and len(queued) >= conf.size:
+                if self._coalesce_event(key, ev, state):
+                    return
+                if policy == EVENT_QUEUE_DROP_NEWEST:
+                    self._drop_event(ev_cls)
+                    return
+                self._drop_event(ev_cls, queued[0])
+
+        if policy == EVENT_QUEUE_BLOCK:
+            self._events_sem.acquire()
+        elif not self._events_sem.acquire(blocking=False):
+            if self._coalesce_event(key, ev, state):
+                return
+            if policy == EVENT_QUEUE_DROP_NEWEST:
+                self._drop_event(ev_cls)
+                return
+            self._drop_oldest_event()
+            self._events_sem.acquire()
+
+        item = _QueuedEvent(ev, state, key)
+        self._events_queued.setdefault(ev_cls, collections.deque()).append(
+            item)
+        if key is not None:
+            self._events_coalesced[key] = item
+        self.events.put(item)
 
     def send_event(self, name, ev, state=None):
         """
@@ -535,6 +797,9 @@ class AppManager(object):
         events = app.events
         if not events.empty():
             app.logger.debug('%s events remains %d', app.name, events.qsize())
+        for ev_cls, dropped in app.events_dropped.items():
+            app.logger.debug('%s events %s dropped %d',
+                             app.name, ev_cls.__name__, dropped)
 
     def close(self):
         def close_all(close_dict):
@@ -38,6 +38,7 @@ from oslo_config.cfg import ConfigOpts
 
 from oslo_config.cfg import Opt
 from oslo_config.cfg import BoolOpt
+from oslo_config.cfg import DictOpt
 from oslo_config.cfg import IntOpt
 from oslo_config.cfg import ListOpt
 from oslo_config.cfg import MultiStrOpt
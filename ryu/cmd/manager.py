@@ -33,6 +33,7 @@ from ryu import version
 from ryu.app import wsgi
 from ryu.base.app_manager import AppManager
 from ryu.controller import controller
+from ryu.controller import worker
 from ryu.topology import switches
 
 
@@ -89,6 +90,10 @@ def main(args=None, prog=None):
         with open(CONF.pid_file, 'w') as pid_file:
             pid_file.write(str(os.getpid()))
 
+    if CONF.ofp_workers > 1:
+        # Only the workers return from here.
+        worker.start_workers(CONF.ofp_workers)
+
     app_lists = CONF.app_lists + CONF.app
     # keep old behavior, run ofp if no application is specified.
     if not app_lists:
@@ -100,7 +105,13 @@ def main(args=None, prog=None):
     services = []
     services.extend(app_mgr.instantiate_apps(**contexts))
 
-    webapp = wsgi.start_service(app_mgr)
+    if worker.worker_id() is not None:
+        services.append(hub.spawn(worker.channel_loop))
+
+    webapp = None
+    if not worker.worker_id():
+        # The REST API is served only by the first worker.
+        webapp = wsgi.start_service(app_mgr)
     if webapp:
         thr = hub.spawn(webapp)
         services.append(thr)
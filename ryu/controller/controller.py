@@ -43,7 +43,9 @@ from ryu.ofproto import ofproto_protocol
 from ryu.ofproto import ofproto_v1_0
 from ryu.ofproto import nx_match
 
+from ryu.controller import flowmod_coalescer
 from ryu.controller import ofp_event
+from ryu.controller import worker
 from ryu.controller.handler import HANDSHAKE_DISPATCHER, DEAD_DISPATCHER
 
 from ryu.lib.dpid import dpid_to_str
@@ -53,6 +55,8 @@ LOG = logging.getLogger('ryu.controller.controller')
 
 DEFAULT_OFP_HOST = '0.0.0.0'
 DEFAULT_OFP_SW_CON_INTERVAL = 1
+DEFAULT_OFP_RECV_BUFFER_SIZE = 64 * 1024
+DEFAULT_OFP_SEND_QUEUE_SIZE = 16
 
 CONF = cfg.CONF
 CONF.register_cli_opts([
@@ -75,6 +79,13 @@ CONF.register_cli_opts([
                default=DEFAULT_OFP_SW_CON_INTERVAL,
                help='interval in seconds to connect to switches '
                     '(default %d)' % DEFAULT_OFP_SW_CON_INTERVAL),
+    cfg.BoolOpt('ofp-lazy-parsing', default=False,
+                help='defer decoding of the body of packet-in, '
+                     'flow-removed and multipart reply messages until '
+                     'accessed'),
+    cfg.IntOpt('ofp-workers', default=1, min=1,
+               help='number of worker processes sharing the switch '
+                    'connections (default 1)'),
 ])
 CONF.register_opts([
     cfg.FloatOpt('socket-timeout',
@@ -86,7 +97,35 @@ CONF.register_opts([
     cfg.IntOpt('maximum-unreplied-echo-requests',
                default=0,
                min=0,
-               help='Maximum number of unreplied echo requests before datapath is disconnected.')
+               help='Maximum number of unreplied echo requests before datapath is disconnected.'),
+    cfg.IntOpt('ofp-recv-buffer-size',
+               default=DEFAULT_OFP_RECV_BUFFER_SIZE,
+               min=ofproto_common.OFP_HEADER_SIZE,
+               help='Initial size, in bytes, of the per-datapath receive '
+                    'buffer (default %d).' % DEFAULT_OFP_RECV_BUFFER_SIZE),
+    cfg.IntOpt('ofp-send-queue-size',
+               default=DEFAULT_OFP_SEND_QUEUE_SIZE,
+               min=1,
+               help='Maximum number of messages queued for sending to a '
+                    'datapath (default %d).' % DEFAULT_OFP_SEND_QUEUE_SIZE),
+    cfg.IntOpt('ofp-send-batch-bytes',
+               default=0,
+               min=0,
+               help='If non-zero, pending messages are coalesced and flushed '
+                    'to the datapath with a single write of up to this many '
+                    'bytes (default 0, one write per message).'),
+    cfg.FloatOpt('ofp-flow-mod-dedup-window',
+                 default=0.0,
+                 min=0.0,
+                 help='If non-zero, a flow-mod identical to the one sent for '
+                      'the same flow entry within this many seconds is '
+                      'suppressed (default 0, disabled).'),
+    cfg.FloatOpt('ofp-flow-mod-coalesce-delay',
+                 default=0.0,
+                 min=0.0,
+                 help='If non-zero, flow-mods are held for this many seconds '
+                      'and the add/modify/delete of the same flow entry are '
+                      'collapsed before sending (default 0, disabled).'),
 ])
 
 
@@ -137,6 +176,8 @@ class OpenFlowController(object):
             self.ofp_tcp_listen_port = CONF.ofp_tcp_listen_port
             self.ofp_ssl_listen_port = CONF.ofp_ssl_listen_port
 
+        ofproto_parser.set_lazy_parsing(CONF.ofp_lazy_parsing)
+
         # Example:
         # self._clients = {
         #     ('127.0.0.1', 6653): <instance of StreamClient>,
@@ -146,7 +187,11 @@ class OpenFlowController(object):
     # entry point
     def __call__(self):
         # LOG.debug('call')
-        for address in CONF.ofp_switch_address_list:
+        worker_id = worker.worker_id()
+        for i, address in enumerate(CONF.ofp_switch_address_list):
+            if worker_id is not None and i % CONF.ofp_workers != worker_id:
+                # connected by another worker
+                continue
             addr = tuple(_split_addr(address))
             self.spawn_client_loop(addr)
 
@@ -165,6 +210,11 @@ class OpenFlowController(object):
             client.stop()
 
     def server_loop(self, ofp_tcp_listen_port, ofp_ssl_listen_port):
+        reuse_port = None
+        if worker.worker_id() is not None:
+            # The listening ports are shared among the worker processes.
+            reuse_port = True
+
         if CONF.ctl_privkey is not None and CONF.ctl_cert is not None:
             if not hasattr(ssl, 'SSLContext'):
                 # anything less than python 2.7.9 supports only TLSv1
@@ -193,17 +243,20 @@ class OpenFlowController(object):
                                       keyfile=CONF.ctl_privkey,
                                       certfile=CONF.ctl_cert,
                                       cert_reqs=ssl.CERT_REQUIRED,
-                                      ca_certs=CONF.ca_certs, **ssl_args)
+                                      ca_certs=CONF.ca_certs,
+                                      reuse_port=reuse_port, **ssl_args)
             else:
                 server = StreamServer((CONF.ofp_listen_host,
                                        ofp_ssl_listen_port),
                                       datapath_connection_factory,
                                       keyfile=CONF.ctl_privkey,
-                                      certfile=CONF.ctl_cert, **ssl_args)
+                                      certfile=CONF.ctl_cert,
+                                      reuse_port=reuse_port, **ssl_args)
         else:
             server = StreamServer((CONF.ofp_listen_host,
                                    ofp_tcp_listen_port),
-                                  datapath_connection_factory)
+                                  datapath_connection_factory,
+                                  reuse_port=reuse_port)
 
         # LOG.debug('loop')
         server.serve_forever()
@@ -222,6 +275,85 @@ def _deactivate(method):
     return deactivate
 
 
+class _RecvBuffer(object):
+    """
+    Preallocated receive buffer for the OpenFlow stream.
+
+    Data is read from the socket directly into the free tail of the buffer
+    with ``recv_into()`` and framed through ``memoryview`` slices, so
+    neither appending nor framing copies the received bytes.  Consumed
+    bytes are reclaimed by moving the pending (partial) message back to
+    the head of the buffer, and the buffer grows when a single message
+    does not fit.
+
+    ``copied_bytes`` counts every byte copied after reception: the partial
+    messages moved on compaction or growth and the message buffers handed
+    to the parser.
+    """
+
+    def __init__(self, size):
+        self._buf = bytearray(size)
+        self._view = memoryview(self._buf)
+        self._head = 0  # start of the unconsumed data
+        self._tail = 0  # end of the received data
+        self.copied_bytes = 0
+
+    def __len__(self):
+        return self._tail - self._head
+
+    def reserve(self, size):
+        """
+        Returns a writable view of the free space, at least size bytes.
+        """
+        if len(self._buf) - self._tail < size:
+            pending = self._tail - self._head
+            if pending + size > len(self._buf):
+                buf = bytearray(max(len(self._buf) * 2, pending + size))
+                buf[:pending] = self._view[self._head:self._tail]
+                self._view.release()
+                self._buf = buf
+                self._view = memoryview(buf)
+            elif pending:
+                self._view[:pending] = self._view[self._head:self._tail]
+            self.copied_bytes += pending
+            self._head = 0
+            self._tail = pending
+        return self._view[self._tail:]
+
+    def commit(self, size):
+        """
+        Marks size bytes written into the view from reserve() as received.
+        """
+        self._tail += size
+
+    def peek(self):
+        """
+        Returns a view of the unconsumed data.
+        """
+        return self._view[self._head:self._tail]
+
+    def consume(self, size):
+        """
+        Discards the first size bytes of the unconsumed data.
+        """
+        self._head += size
+        if self._head >= self._tail:
+            self._head = self._tail = 0
+
+    def take(self, size):
+        """
+        Consumes the first size bytes and returns them as a bytes object.
+
+        Parsed messages are handed over to the applications and may
+        outlive the receive loop, so they must not refer to the memory
+        which will be reused for the following messages.
+        """
+        buf = self._view[self._head:self._head + size].tobytes()
+        self.copied_bytes += size
+        self.consume(size)
+        return buf
+
+
 class Datapath(ofproto_protocol.ProtocolDesc):
     """
     A class to describe an OpenFlow switch connected to this controller.
@@ -270,6 +402,27 @@ class Datapath(ofproto_protocol.ProtocolDesc):
                                          send to the switch.
     send_nxt_set_flow_format             deprecated
     is_reserved_port                     deprecated
+    recv_bytes                           Number of bytes received from the
+                                         switch.
+    recv_copied_bytes                    Number of received bytes copied
+                                         while framing the messages.
+    send_bytes                           Number of bytes sent to the switch.
+    send_msgs                            Number of messages sent to the
+                                         switch.
+    send_flushes                         Number of socket writes issued to
+                                         send the messages.  Lower than
+                                         send_msgs when ofp-send-batch-bytes
+                                         coalesces the queued messages.
+    send_msg_observers                   A list of callables called with each
+                                         message queued by send_msg, e.g., to
+                                         mirror the flow-mods sent to the
+                                         switch.  Empty by default.
+    flow_mod_coalescer                   A FlowModCoalescer which suppresses
+                                         and collapses the flow-mods sent by
+                                         send_msg, and counts them.  None
+                                         unless enabled by
+                                         ofp-flow-mod-dedup-window or
+                                         ofp-flow-mod-coalesce-delay.
     ==================================== ======================================
     """
 
@@ -282,14 +435,28 @@ class Datapath(ofproto_protocol.ProtocolDesc):
         self.address = address
         self.is_active = True
 
+        self._recv_buf = None
+        self.recv_bytes = 0
+
         # The limit is arbitrary. We need to limit queue size to
         # prevent it from eating memory up.
-        self.send_q = hub.Queue(16)
+        self.send_q = hub.Queue(CONF.ofp_send_queue_size)
         self._send_q_sem = hub.BoundedSemaphore(self.send_q.maxsize)
+        self.send_batch_bytes = CONF.ofp_send_batch_bytes
+        self.send_bytes = 0
+        self.send_msgs = 0
+        self.send_flushes = 0
+        self.send_msg_observers = []
+        self.flow_mod_coalescer = None
+        if CONF.ofp_flow_mod_dedup_window or CONF.ofp_flow_mod_coalesce_delay:
+            self.flow_mod_coalescer = flowmod_coalescer.FlowModCoalescer(
+                self, CONF.ofp_flow_mod_dedup_window,
+                CONF.ofp_flow_mod_coalesce_delay)
 
         self.echo_request_interval = CONF.echo_request_interval
         self.max_unreplied_echo_requests = CONF.maximum_unreplied_echo_requests
         self.unreplied_echo_requests = []
+        self._echo_timer = None
 
         self.xid = random.randint(0, self.ofproto.MAX_XID)
         self.id = None  # datapath_id is unknown yet
@@ -323,7 +490,8 @@ class Datapath(ofproto_protocol.ProtocolDesc):
     # Low level socket handling layer
     @_deactivate
     def _recv_loop(self):
-        buf = bytearray()
+        buf = _RecvBuffer(CONF.ofp_recv_buffer_size)
+        self._recv_buf = buf
         count = 0
         min_read_len = remaining_read_len = ofproto_common.OFP_HEADER_SIZE
 
@@ -332,7 +500,7 @@ class Datapath(ofproto_protocol.ProtocolDesc):
                 read_len = min_read_len
                 if remaining_read_len > min_read_len:
                     read_len = remaining_read_len
-                ret = self.socket.recv(read_len)
+                ret = self.socket.recv_into(buf.reserve(read_len))
             except SocketTimeout:
                 continue
             except ssl.SSLError:
@@ -345,10 +513,12 @@ class Datapath(ofproto_protocol.ProtocolDesc):
             if not ret:
                 break
 
-            buf += ret
+            buf.commit(ret)
+            self.recv_bytes += ret
             buf_len = len(buf)
             while buf_len >= min_read_len:
-                (version, msg_type, msg_len, xid) = ofproto_parser.header(buf)
+                (version, msg_type, msg_len, xid) = ofproto_parser.header(
+                    buf.peek())
                 if msg_len < min_read_len:
                     # Someone isn't playing nicely; log it, and try something sane.
                     LOG.debug("Message with invalid length %s received from switch at address %s",
@@ -359,23 +529,17 @@ class Datapath(ofproto_protocol.ProtocolDesc):
                     break
 
                 msg = ofproto_parser.msg(
-                    self, version, msg_type, msg_len, xid, buf[:msg_len])
+                    self, version, msg_type, msg_len, xid, buf.take(msg_len))
                 # LOG.debug('queue msg %s cls %s', msg, msg.__class__)
                 if msg:
                     ev = ofp_event.ofp_msg_to_ev(msg)
                     if self.ofp_brick is not None:
                         self.ofp_brick.send_event_to_observers(ev, self.state)
 
-                        def dispatchers(x):
-                            return x.callers[ev.__class__].dispatchers
-
-                        handlers = [handler for handler in
-                                    self.ofp_brick.get_handlers(ev) if
-                                    self.state in dispatchers(handler)]
-                        for handler in handlers:
+                        for handler in self.ofp_brick.get_handlers(
+                                ev, self.state):
                             handler(ev)
 
-                buf = buf[msg_len:]
                 buf_len = len(buf)
                 remaining_read_len = min_read_len
 
@@ -388,12 +552,46 @@ class Datapath(ofproto_protocol.ProtocolDesc):
                     count = 0
                     hub.sleep(0)
 
+    @property
+    def recv_copied_bytes(self):
+        """
+        The number of received bytes copied by the receive loop.
+        """
+        if self._recv_buf is None:
+            return 0
+        return self._recv_buf.copied_bytes
+
+    def _send_batch(self):
+        # Blocks for the first message, then drains whatever is already
+        # queued up to send_batch_bytes without blocking.
+        buf, close_socket = self.send_q.get()
+        self._send_q_sem.release()
+        bufs = [buf]
+        buf_len = len(buf)
+        while not close_socket and buf_len < self.send_batch_bytes:
+            try:
+                buf, close_socket = self.send_q.get(block=False)
+            except hub.QueueEmpty:
+                break
+            self._send_q_sem.release()
+            bufs.append(buf)
+            buf_len += len(buf)
+        return bufs, close_socket
+
     def _send_loop(self):
         try:
             while self.state != DEAD_DISPATCHER:
-                buf, close_socket = self.send_q.get()
-                self._send_q_sem.release()
+                if self.send_batch_bytes:
+                    bufs, close_socket = self._send_batch()
+                    buf = b''.join(bufs)
+                    self.send_msgs += len(bufs)
+                else:
+                    buf, close_socket = self.send_q.get()
+                    self._send_q_sem.release()
+                    self.send_msgs += 1
                 self.socket.sendall(buf)
+                self.send_bytes += len(buf)
+                self.send_flushes += 1
                 if close_socket:
                     break
         except SocketTimeout:
@@ -441,20 +639,28 @@ class Datapath(ofproto_protocol.ProtocolDesc):
         assert isinstance(msg, self.ofproto_parser.MsgBase)
         if msg.xid is None:
             self.set_xid(msg)
+        if self.flow_mod_coalescer is not None:
+            return self.flow_mod_coalescer.send_msg(msg, close_socket)
         msg.serialize()
-        # LOG.debug('send_msg %s', msg)
-        return self.send(msg.buf, close_socket=close_socket)
+        return self._send_serialized(msg, close_socket)
 
-    def _echo_request_loop(self):
-        if not self.max_unreplied_echo_requests:
+    def _send_serialized(self, msg, close_socket=False):
+        # LOG.debug('send_msg %s', msg)
+        if not self.send(msg.buf, close_socket=close_socket):
+            return False
+        for observer in self.send_msg_observers:
+            observer(msg)
+        return True
+
+    def _echo_request(self):
+        if not (self.send_q and
+                (len(self.unreplied_echo_requests) <= self.max_unreplied_echo_requests)):
+            self.close()
             return
-        while (self.send_q and
-               (len(self.unreplied_echo_requests) <= self.max_unreplied_echo_requests)):
-            echo_req = self.ofproto_parser.OFPEchoRequest(self)
-            self.unreplied_echo_requests.append(self.set_xid(echo_req))
-            self.send_msg(echo_req)
-            hub.sleep(self.echo_request_interval)
-        self.close()
+        self._echo_timer.reschedule(self.echo_request_interval)
+        echo_req = self.ofproto_parser.OFPEchoRequest(self)
+        self.unreplied_echo_requests.append(self.set_xid(echo_req))
+        self.send_msg(echo_req)
 
     def acknowledge_echo_reply(self, xid):
         try:
@@ -469,14 +675,19 @@ class Datapath(ofproto_protocol.ProtocolDesc):
         hello = self.ofproto_parser.OFPHello(self)
         self.send_msg(hello)
 
-        echo_thr = hub.spawn(self._echo_request_loop)
+        if self.max_unreplied_echo_requests:
+            # Sending may block on a full send queue, so that the echo
+            # requests are sent in their own threads.
+            self._echo_timer = hub.get_timer_wheel().schedule_spawn(
+                0, self._echo_request)
 
         try:
             self._recv_loop()
         finally:
+            if self._echo_timer is not None:
+                self._echo_timer.cancel()
             hub.kill(send_thr)
-            hub.kill(echo_thr)
-            hub.joinall([send_thr, echo_thr])
+            hub.joinall([send_thr])
             self.is_active = False
 
     #
@@ -0,0 +1,241 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Deduplication and coalescing of the flow-mods sent to a datapath.
+
+Applications often send the same flow-mod again and again, e.g., a
+learning switch installs a flow entry for every packet-in which races
+ahead of the installation, or send a flow-mod and then modify or delete
+the same flow entry within milliseconds.  When enabled with
+``--ofp-flow-mod-dedup-window`` or ``--ofp-flow-mod-coalesce-delay``,
+Datapath.send_msg passes the flow-mods through a
+:py:class:`FlowModCoalescer`, which:
+
+- suppresses a flow-mod identical (except the xid) to the last flow-mod
+  sent for the same (table ID, priority, match) with the same command
+  within the dedup window, and
+- holds the flow-mods for the coalesce delay and collapses the sequences
+  of add, modify-strict and delete-strict for the same (table ID,
+  priority, match) into the last effective one before sending them.
+  A collapsed flow-mod carries the xid of the last message collapsed
+  into it, so that an error for it is reported against that request.
+
+Any other message, a non-strict modify or delete, or a flow-mod with a
+cookie mask or out port/group filter, flushes the held flow-mods first,
+so that the order of the messages which may depend on each other is
+kept.  The flushes are serialized, i.e., a message sent while the held
+flow-mods are being sent by another thread waits for them.  A flow entry
+which expires or is removed by the switch within the dedup window is not
+known to the coalescer; the window is meant to be short, in the order of
+the flow installation latency.
+
+Only the flow-mods of OpenFlow 1.3 or later are coalesced.
+"""
+
+import collections
+import copy
+import time
+
+from ryu.lib import hub
+from ryu.ofproto import ofproto_v1_3
+
+# Number of the held (table ID, priority, match) which triggers a flush.
+MAX_PENDING_FLOW_MODS = 1024
+
+
+def _match_key(match):
+    return tuple(sorted(match.items(), key=lambda field: field[0]))
+
+
+def _flow_key(msg):
+    return (msg.table_id, msg.priority, _match_key(msg.match))
+
+
+def _body(msg):
+    # the serialized message except the xid
+    return bytes(msg.buf[:4]) + bytes(msg.buf[8:])
+
+
+class FlowModCoalescer(object):
+    """
+    Flow-mod deduplication and coalescing layer of a Datapath.
+
+    ================= =========================================================
+    Attribute         Description
+    ================= =========================================================
+    flow_mods         Number of the flow-mods given to send_msg
+    suppressed        Number of the flow-mods suppressed as duplicates
+    collapsed         Number of the flow-mods collapsed into a later one
+    flushes           Number of the flushes of the held flow-mods
+    ================= =========================================================
+    """
+
+    def __init__(self, datapath, dedup_window=0.0, coalesce_delay=0.0):
+        self.datapath = datapath
+        self.dedup_window = dedup_window
+        self.coalesce_delay = coalesce_delay
+        # (table_id, priority, match) -> list of the held flow-mods
+        self._pending = collections.OrderedDict()
+        self._timer = None
+        # held until the held flow-mods and the message which flushes
+        # them are queued to the datapath
+        self._lock = hub.Semaphore()
+        # (table_id, priority, match) -> (command, body, time sent)
+        self._recent = collections.OrderedDict()
+        self.flow_mods = 0
+        self.suppressed = 0
+        self.collapsed = 0
+        self.flushes = 0
+
+    def _is_flow_mod(self, msg):
+        dp = self.datapath
+        return (dp.ofproto.OFP_VERSION >= ofproto_v1_3.OFP_VERSION and
+                isinstance(msg, dp.ofproto_parser.OFPFlowMod))
+
+    def _is_strict(self, msg):
+        # True if the flow-mod affects only the flow entry of its key
+        ofp = self.datapath.ofproto
+        if msg.command == ofp.OFPFC_ADD:
+            return True
+        if msg.command == ofp.OFPFC_MODIFY_STRICT:
+            return not msg.cookie_mask
+        if msg.command == ofp.OFPFC_DELETE_STRICT:
+            return (not msg.cookie_mask and msg.table_id != ofp.OFPTT_ALL and
+                    msg.out_port == ofp.OFPP_ANY and
+                    msg.out_group == ofp.OFPG_ANY)
+        return False
+
+    def send_msg(self, msg, close_socket=False):
+        """
+        Sends the message through the layer.  msg.xid must be set.
+
+        Returns False if the datapath is terminating.
+        """
+        if not self._is_flow_mod(msg):
+            with self._lock:
+                return self._flush() and self._send(msg, close_socket)
+        self.flow_mods += 1
+        if close_socket or not self._is_strict(msg):
+            # may affect the other flow entries
+            with self._lock:
+                ret = self._flush()
+                self._recent.clear()
+                return ret and self._send(msg, close_socket)
+        if self.coalesce_delay <= 0:
+            return self._send_flow_mod(msg)
+        self._hold(msg)
+        if len(self._pending) >= MAX_PENDING_FLOW_MODS:
+            return self.flush()
+        if self._timer is None:
+            self._timer = hub.get_timer_wheel().schedule_spawn(
+                self.coalesce_delay, self._flush_timer)
+        return True
+
+    def _hold(self, msg):
+        key = _flow_key(msg)
+        held = self._pending.get(key)
+        if held is None:
+            self._pending[key] = [msg]
+            return
+        prev = held[-1]
+        merged = self._collapse(prev, msg)
+        if merged is None:
+            held.append(msg)
+            return
+        held[-1] = merged
+        self.collapsed += 1
+
+    def _collapse(self, prev, msg):
+        # Returns the flow-mod which has the effect of prev followed by
+        # msg on the flow entry of their key, or None if they can not be
+        # collapsed.
+        ofp = self.datapath.ofproto
+        if msg.command == ofp.OFPFC_ADD:
+            if prev.command in (ofp.OFPFC_ADD, ofp.OFPFC_MODIFY_STRICT):
+                return msg
+        elif msg.command == ofp.OFPFC_MODIFY_STRICT:
+            if prev.command == ofp.OFPFC_ADD:
+                merged = copy.copy(prev)
+                merged.instructions = msg.instructions
+                merged.xid = msg.xid
+                return merged
+            elif prev.command == ofp.OFPFC_MODIFY_STRICT:
+                return msg
+            elif prev.command == ofp.OFPFC_DELETE_STRICT:
+                # modifies no entry
+                return prev
+        elif msg.command == ofp.OFPFC_DELETE_STRICT:
+            if prev.command == ofp.OFPFC_DELETE_STRICT:
+                return prev
+            if prev.command in (ofp.OFPFC_ADD, ofp.OFPFC_MODIFY_STRICT) and \
+                    not prev.flags & ofp.OFPFF_SEND_FLOW_REM:
+                return msg
+        return None
+
+    def _flush_timer(self):
+        self._timer = None
+        self.flush()
+
+    def flush(self):
+        """
+        Sends the held flow-mods.
+
+        Returns False if the datapath is terminating.
+        """
+        with self._lock:
+            return self._flush()
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return True
+        pending, self._pending = self._pending, collections.OrderedDict()
+        self.flushes += 1
+        ret = True
+        for held in pending.values():
+            for msg in held:
+                ret = self._send_flow_mod(msg) and ret
+        return ret
+
+    def _send_flow_mod(self, msg):
+        msg.serialize()
+        if self.dedup_window > 0:
+            key = _flow_key(msg)
+            body = _body(msg)
+            now = time.time()
+            recent = self._recent.get(key)
+            if recent is not None and recent[0] == msg.command and \
+                    recent[1] == body and now - recent[2] < self.dedup_window:
+                self.suppressed += 1
+                return True
+            # keeps the order of the time sent
+            self._recent.pop(key, None)
+            self._recent[key] = (msg.command, body, now)
+            self._expire(now)
+        return self.datapath._send_serialized(msg)
+
+    def _expire(self, now):
+        while self._recent:
+            key, recent = next(iter(self._recent.items()))
+            if now - recent[2] < self.dedup_window:
+                break
+            del self._recent[key]
+
+    def _send(self, msg, close_socket=False):
+        msg.serialize()
+        return self.datapath._send_serialized(msg, close_socket)
@@ -93,6 +93,56 @@ def set_ev_handler(ev_cls, dispatchers=None):
     return _set_ev_cls_dec
 
 
+class _Batch(object):
+    """Describe how to batch events delivered to a handler.
+    """
+
+    def __init__(self, max_size, max_latency):
+        """Initialize _Batch.
+
+        :param max_size: The maximum number of events in a batch.
+        :param max_latency: The maximum time in seconds an event is held
+                            before its batch is delivered.
+        """
+        self.max_size = max_size
+        self.max_latency = max_latency
+
+
+def set_ev_batch(max_size=64, max_latency=0.1):
+    """
+    A decorator for Ryu application to receive events in batches.
+
+    Decorated event handler (see set_ev_cls) is called with a list of
+    events of the same class instead of a single event.  The list is
+    delivered when max_size events are collected, or when the oldest
+    event in the list has been held for max_latency seconds, or when the
+    application stops.
+
+    Batches are delivered from the event loop of the application, so
+    the other handlers of the application may see the later events
+    before the batch is delivered.
+
+    Example::
+
+        @set_ev_cls(ofp_event.EventOFPPortStatsReply, MAIN_DISPATCHER)
+        @set_ev_batch(max_size=128, max_latency=0.5)
+        def _port_stats_reply_handler(self, evs):
+            for ev in evs:
+                ...
+    """
+    assert max_size > 0
+    assert max_latency >= 0
+
+    def _set_ev_batch_dec(handler):
+        handler.ev_batch = _Batch(max_size, max_latency)
+        return handler
+    return _set_ev_batch_dec
+
+
+def get_ev_batch(handler):
+    return getattr(handler, 'ev_batch', None)
+
+
 def _has_caller(meth):
     return hasattr(meth, 'callers')
 
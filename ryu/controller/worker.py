@@ -0,0 +1,197 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Multi-process mode of the OpenFlow controller.
+
+With ``--ofp-workers N`` (N > 1), ryu-manager forks N worker processes
+before loading the applications.  Each worker runs its own AppManager and
+application instances, and listens on the OpenFlow ports with SO_REUSEPORT
+so that the kernel distributes the switch connections among the workers.
+Switches in ``--ofp-switch-address-list`` are distributed among the
+workers in a round-robin manner.  The parent process only relays the
+inter-process channel and waits for the workers to exit.
+
+Each worker sees only the datapaths connected to it.  Only the worker 0
+serves the WSGI (REST) applications.
+
+Global events
+=============
+
+Events which must be seen by every worker (e.g., topology or dpset
+changes consumed by a global application) are published to the other
+workers with :py:func:`publish`::
+
+    from ryu.controller import worker
+
+    class EventLinkUp(event.EventBase):
+        def __init__(self, src_dpid, src_port_no, dst_dpid, dst_port_no):
+            ...
+
+    worker.publish(EventLinkUp(...))
+
+The event is pickled, relayed by the parent process and delivered, in
+each of the other workers, to the applications which have a handler for
+the event class.  Events must be picklable, so they should carry plain
+data (e.g., datapath IDs or the ``to_dict()`` of topology objects) rather
+than Datapath instances.  In the single process mode, ``publish`` does
+nothing, as every application already sees every event.
+"""
+
+import logging
+import os
+import pickle
+import socket
+import struct
+
+from ryu import cfg
+from ryu.lib import hub
+
+import ryu.base.app_manager
+
+LOG = logging.getLogger('ryu.controller.worker')
+
+CONF = cfg.CONF
+
+# Frames on the channel are prefixed with the length of the data.
+_FRAME_HEADER = struct.Struct('!I')
+
+_worker_id = None  # None in the single process mode
+_channel = None  # socket connected to the parent process
+_channel_lock = None
+
+
+def worker_id():
+    """
+    Returns the index of this worker process, or None in the single
+    process mode.
+    """
+    return _worker_id
+
+
+def _send_frame(sock, data):
+    sock.sendall(_FRAME_HEADER.pack(len(data)) + data)
+
+
+def _recv_exact(sock, size):
+    buf = bytearray()
+    while len(buf) < size:
+        ret = sock.recv(size - len(buf))
+        if not ret:
+            return None
+        buf += ret
+    return bytes(buf)
+
+
+def _recv_frame(sock):
+    header = _recv_exact(sock, _FRAME_HEADER.size)
+    if header is None:
+        return None
+    (size,) = _FRAME_HEADER.unpack(header)
+    return _recv_exact(sock, size)
+
+
+def _relay_loop(sock, channels):
+    while True:
+        data = _recv_frame(sock)
+        if data is None:
+            break
+        for other in list(channels.values()):
+            if other is sock:
+                continue
+            try:
+                _send_frame(other, data)
+            except IOError as e:
+                LOG.debug('failed to relay to a worker: %s', e)
+
+
+def _relay(channels):
+    threads = [hub.spawn(_relay_loop, sock, channels)
+               for sock in channels.values()]
+    hub.joinall(threads)
+    for pid in channels:
+        try:
+            os.waitpid(pid, 0)
+        except OSError:
+            pass
+
+
+def start_workers(num):
+    """
+    Forks num worker processes.
+
+    Returns the worker index in each worker.  In the parent process, this
+    relays the inter-process channel until all workers exit, then exits.
+    """
+    global _worker_id, _channel, _channel_lock
+
+    channels = {}  # pid -> socket connected to the worker
+    for i in range(num):
+        parent_sock, child_sock = socket.socketpair()
+        pid = os.fork()
+        if pid == 0:
+            parent_sock.close()
+            for sock in channels.values():
+                sock.close()
+            _worker_id = i
+            _channel = child_sock
+            _channel_lock = hub.Semaphore()
+            LOG.info('worker %d started (pid %d)', i, os.getpid())
+            return i
+        child_sock.close()
+        channels[pid] = parent_sock
+
+    try:
+        _relay(channels)
+    finally:
+        os._exit(0)
+
+
+def publish(ev):
+    """
+    Sends the given event to the applications of the other workers.
+    """
+    if _channel is None:
+        return
+    data = pickle.dumps(ev, pickle.HIGHEST_PROTOCOL)
+    with _channel_lock:
+        _send_frame(_channel, data)
+
+
+def _deliver(ev):
+    bricks = ryu.base.app_manager.SERVICE_BRICKS
+    for app in list(bricks.values()):
+        if ev.__class__ in app.event_handlers:
+            app._send_event(ev, None)
+
+
+def channel_loop():
+    """
+    Delivers the events published by the other workers to the
+    applications of this worker.
+    """
+    if _channel is None:
+        return
+    while True:
+        data = _recv_frame(_channel)
+        if data is None:
+            LOG.info('worker %s: channel closed', _worker_id)
+            break
+        try:
+            ev = pickle.loads(data)
+        except Exception:
+            LOG.exception('worker %s: failed to decode an event', _worker_id)
+            continue
+        _deliver(ev)
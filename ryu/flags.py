@@ -127,3 +127,32 @@ CONF.register_cli_opts([
         'frr-version', LooseVersion, default=DEFAULT_ZSERV_FRR_VERSION,
         help='FRRouting version when integrated with FRRouting (e.g., 3.0)'),
 ], group='zapi')
+
+
+CONF.register_cli_opts([
+    # app/ofctl/poller
+    cfg.FloatOpt('stats-poll-interval', default=0,
+                 help='stats poller: interval in seconds to poll the stats '
+                      'of all the datapaths (0 to poll on demand only)'),
+    cfg.ListOpt('stats-poll-kinds', default=['flow', 'port'],
+                help='stats poller: kinds of stats to poll periodically '
+                     '(flow, port, table or meter)'),
+    cfg.FloatOpt('stats-poll-timeout', default=5.0,
+                 help='stats poller: seconds to wait for the reply of '
+                      'a datapath'),
+    cfg.FloatOpt('stats-max-age', default=10.0,
+                 help='stats poller: seconds for which the polled stats '
+                      'are served from the cache'),
+])
+
+
+CONF.register_cli_opts([
+    # app/ofctl/flow_mirror
+    cfg.FloatOpt('flow-mirror-reconcile-interval', default=0,
+                 help='flow mirror: interval in seconds to reconcile the '
+                      'mirrored flow tables with the datapaths (0 to '
+                      'disable)'),
+    cfg.FloatOpt('flow-mirror-timeout', default=5.0,
+                 help='flow mirror: seconds to wait for the stats reply '
+                      'of a datapath while reconciling'),
+])
@@ -14,7 +14,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import binascii
+import socket
+
 import netaddr
+import six
 
 
 class AddressConverter(object):
@@ -41,8 +45,33 @@ class AddressConverter(object):
                               **self._addr_kwargs))
 
 
-ipv4 = AddressConverter(netaddr.IPAddress, netaddr.strategy.ipv4,
-                        fallback=netaddr.IPNetwork, version=4)
+class IPv4AddressConverter(AddressConverter):
+    # Formats binaries without netaddr, which is much slower.
+    def bin_to_text(self, bin):
+        if len(bin) == 4:
+            return socket.inet_ntoa(bin)
+        return super(IPv4AddressConverter, self).bin_to_text(bin)
+
+
+class MacAddressConverter(AddressConverter):
+    # Converts the usual 'xx:xx:xx:xx:xx:xx' notation without netaddr,
+    # which is much slower.
+    def text_to_bin(self, text):
+        try:
+            if len(text) == 17 and text[2::3] == ':::::':
+                return binascii.unhexlify(text.replace(':', ''))
+        except (TypeError, ValueError):
+            pass
+        return super(MacAddressConverter, self).text_to_bin(text)
+
+    def bin_to_text(self, bin):
+        if len(bin) == 6:
+            return ':'.join('%02x' % b for b in six.iterbytes(bin))
+        return super(MacAddressConverter, self).bin_to_text(bin)
+
+
+ipv4 = IPv4AddressConverter(netaddr.IPAddress, netaddr.strategy.ipv4,
+                            fallback=netaddr.IPNetwork, version=4)
 ipv6 = AddressConverter(netaddr.IPAddress, netaddr.strategy.ipv6,
                         fallback=netaddr.IPNetwork, version=6)
 
@@ -51,5 +80,5 @@ class mac_mydialect(netaddr.mac_unix):
     word_fmt = '%.2x'
 
 
-mac = AddressConverter(netaddr.EUI, netaddr.strategy.eui48, version=48,
-                       dialect=mac_mydialect)
+mac = MacAddressConverter(netaddr.EUI, netaddr.strategy.eui48, version=48,
+                          dialect=mac_mydialect)
@@ -172,7 +172,8 @@ class BFDSession(object):
         # _enable_send indicates the switch of the periodic transmission of
         # BFD Control packets.
         self._enable_send = True
-        self._lock = None
+        self._detect_timer = None
+        self._last_wait = None
 
         # L2/L3/L4 Header fields
         self.src_mac = src_mac
@@ -193,8 +194,10 @@ class BFDSession(object):
         self.datapath = None
         self.ofport = ofport
 
-        # Spawn a periodic transmission loop for BFD Control packets.
-        hub.spawn(self._send_loop)
+        # Schedule a periodic transmission of BFD Control packets.
+        # The timers spawn threads as the timeouts send packets and events.
+        self._send_timer = hub.get_timer_wheel().schedule_spawn(
+            self._xmit_period, self._send_timeout)
 
         LOG.info("[BFD][%s][INIT] BFD Session initialized.",
                  hex(self._local_discr))
@@ -282,14 +285,16 @@ class BFDSession(object):
                 self._remote_session_state != bfd.BFD_STATE_UP:
             if not self._enable_send:
                 self._enable_send = True
-                hub.spawn(self._send_loop)
+                self._send_timer.reschedule(self._xmit_period)
 
         # Update the detection time (RFC5880 Section 6.8.4.)
         if self._detect_time == 0:
             self._detect_time = bfd_pkt.desired_min_tx_interval * \
                 bfd_pkt.detect_mult / 1000000.0
-            # Start the timeout loop.
-            hub.spawn(self._recv_timeout_loop)
+            # Start the detection timer.
+            self._last_wait = time.time()
+            self._detect_timer = hub.get_timer_wheel().schedule_spawn(
+                self._detect_time, self._recv_timeout)
 
         if bfd_pkt.flags & bfd.BFD_FLAG_POLL:
             self._pending_final = True
@@ -304,9 +309,15 @@ class BFDSession(object):
             self._rcv_auth_seq = bfd_pkt.auth_cls.seq
             self._auth_seq_known = 1
 
-        # Set the lock.
-        if self._lock is not None:
-            self._lock.set()
+        # Restart the detection timer.
+        if self._detect_timer is not None:
+            # Authentication variable check (RFC5880 Section 6.8.1.)
+            if getattr(self, "_auth_seq_known", 0):
+                if self._last_wait > time.time() + 2 * self._detect_time:
+                    self._auth_seq_known = 0
+
+            self._last_wait = time.time()
+            self._detect_timer.reschedule(self._detect_time)
 
     def _set_state(self, new_state, diag=None):
         """
@@ -334,34 +345,24 @@ class BFDSession(object):
         self.app.send_event_to_observers(
             EventBFDSessionStateChanged(self, old_state, new_state))
 
-    def _recv_timeout_loop(self):
+    def _recv_timeout(self):
         """
-        A loop to check timeout of receiving remote BFD packet.
+        Called when no remote BFD packet is received in the Detection Time.
         """
-        while self._detect_time:
-            last_wait = time.time()
-            self._lock = hub.Event()
-
-            self._lock.wait(timeout=self._detect_time)
+        self._last_wait = time.time()
+        self._detect_timer.reschedule(self._detect_time)
 
-            if self._lock.is_set():
-                # Authentication variable check (RFC5880 Section 6.8.1.)
-                if getattr(self, "_auth_seq_known", 0):
-                    if last_wait > time.time() + 2 * self._detect_time:
-                        self._auth_seq_known = 0
-
-            else:
-                # Check Detection Time expiration (RFC5880 section 6.8.4.)
-                LOG.info("[BFD][%s][RECV] BFD Session timed out.",
-                         hex(self._local_discr))
-                if self._session_state not in [bfd.BFD_STATE_DOWN,
-                                               bfd.BFD_STATE_ADMIN_DOWN]:
-                    self._set_state(bfd.BFD_STATE_DOWN,
-                                    bfd.BFD_DIAG_CTRL_DETECT_TIME_EXPIRED)
+        # Check Detection Time expiration (RFC5880 section 6.8.4.)
+        LOG.info("[BFD][%s][RECV] BFD Session timed out.",
+                 hex(self._local_discr))
+        if self._session_state not in [bfd.BFD_STATE_DOWN,
+                                       bfd.BFD_STATE_ADMIN_DOWN]:
+            self._set_state(bfd.BFD_STATE_DOWN,
+                            bfd.BFD_DIAG_CTRL_DETECT_TIME_EXPIRED)
 
-                # Authentication variable check (RFC5880 Section 6.8.1.)
-                if getattr(self, "_auth_seq_known", 0):
-                    self._auth_seq_known = 0
+        # Authentication variable check (RFC5880 Section 6.8.1.)
+        if getattr(self, "_auth_seq_known", 0):
+            self._auth_seq_known = 0
 
     def _update_xmit_period(self):
         """
@@ -384,28 +385,29 @@ class BFDSession(object):
         LOG.info("[BFD][%s][XMIT] Transmission period changed to %f",
                  hex(self._local_discr), self._xmit_period)
 
-    def _send_loop(self):
+    def _send_timeout(self):
         """
-        A loop to proceed periodic BFD packet transmission.
+        Proceeds periodic BFD packet transmission.
         """
-        while self._enable_send:
-            hub.sleep(self._xmit_period)
+        if not self._enable_send:
+            return
+        self._send_timer.reschedule(self._xmit_period)
 
-            # Send BFD packet. (RFC5880 Section 6.8.7.)
+        # Send BFD packet. (RFC5880 Section 6.8.7.)
 
-            if self._remote_discr == 0 and not self._active_role:
-                continue
+        if self._remote_discr == 0 and not self._active_role:
+            return
 
-            if self._remote_min_rx_interval == 0:
-                continue
+        if self._remote_min_rx_interval == 0:
+            return
 
-            if self._remote_demand_mode and \
-                    self._session_state == bfd.BFD_STATE_UP and \
-                    self._remote_session_state == bfd.BFD_STATE_UP and \
-                    not self._is_polling:
-                continue
+        if self._remote_demand_mode and \
+                self._session_state == bfd.BFD_STATE_UP and \
+                self._remote_session_state == bfd.BFD_STATE_UP and \
+                not self._is_polling:
+            return
 
-            self._send()
+        self._send()
 
     def _send(self):
         """
@@ -0,0 +1,205 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+In-memory store of the samples of monotonic counters, e.g., the byte and
+packet counts of ports and flow entries.
+
+Each series of samples, identified by a hashable key such as
+(dpid, port_no), keeps the deltas between its last samples in a ring
+buffer backed by arrays, together with their running sums, so that the
+rate of a counter over the buffered samples is computed in constant time
+per sample.  A decrease of a counter is handled as a wrap around if the
+previous value is in the last quarter of the counter range, and as a
+reset of the counter otherwise.
+
+The series are ranked by the rate of each counter for top-N queries.
+"""
+
+import array
+import bisect
+import itertools
+
+# Number of the deltas kept per series
+DEFAULT_SAMPLES = 8
+
+# Width of the counters.  OpenFlow counters are 64 bits.
+DEFAULT_COUNTER_BITS = 64
+
+
+class _Series(object):
+    __slots__ = ('seq', 'time', 'values', 'dts', 'deltas', 'pos', 'count',
+                 'dt_sum', 'sums', 'rates')
+
+    def __init__(self, seq, timestamp, values, samples):
+        n = len(values)
+        self.seq = seq
+        self.time = timestamp
+        self.values = list(values)
+        self.dts = array.array('d', [0.0] * samples)
+        self.deltas = array.array('Q', [0] * (samples * n))
+        self.pos = 0
+        self.count = 0
+        self.dt_sum = 0.0
+        self.sums = [0] * n
+        self.rates = None  # rate of each counter; None until 2 samples
+
+
+class CounterStore(object):
+    """
+    Store of the counter samples.
+
+    counters is the names of the counters of each sample, and ranked is
+    the names of the counters whose rates are ranked, all of them if
+    None.
+    """
+
+    def __init__(self, counters, ranked=None, samples=DEFAULT_SAMPLES,
+                 counter_bits=DEFAULT_COUNTER_BITS):
+        self.counters = tuple(counters)
+        self._index = dict((name, i) for i, name in enumerate(self.counters))
+        self.samples = samples
+        self._range = 1 << counter_bits
+        self._series = {}  # key -> _Series
+        self._keys = {}  # seq -> key
+        self._seq = itertools.count()
+        if ranked is None:
+            ranked = self.counters
+        # counter index -> list of (rate, seq) sorted by the rate
+        self._ranks = dict((self._index[name], []) for name in ranked)
+        self.wraps = 0
+        self.resets = 0
+
+    def __len__(self):
+        return len(self._series)
+
+    def __contains__(self, key):
+        return key in self._series
+
+    def keys(self):
+        return self._series.keys()
+
+    def _delta(self, old, new):
+        if new >= old:
+            return new - old
+        if old >= self._range - (self._range >> 2):
+            self.wraps += 1
+            return new + self._range - old
+        self.resets += 1
+        return new
+
+    def _unrank(self, series):
+        if series.rates is None:
+            return
+        for i, ranks in self._ranks.items():
+            del ranks[bisect.bisect_left(ranks, (series.rates[i],
+                                                 series.seq))]
+
+    def add(self, key, timestamp, values):
+        """
+        Adds the sample of the counters at timestamp (in seconds) to the
+        series of key.
+
+        The samples which are not newer than the last one are ignored.
+        """
+        series = self._series.get(key)
+        if series is None:
+            series = _Series(next(self._seq), timestamp, values,
+                             self.samples)
+            self._series[key] = series
+            self._keys[series.seq] = key
+            return
+        dt = timestamp - series.time
+        if dt <= 0:
+            return
+
+        n = len(self.counters)
+        pos = series.pos
+        base = pos * n
+        if series.count == self.samples:
+            for i in range(n):
+                series.sums[i] -= series.deltas[base + i]
+        else:
+            series.count += 1
+        series.dts[pos] = dt
+        series.dt_sum = sum(series.dts)
+        for i in range(n):
+            delta = self._delta(series.values[i], values[i])
+            series.deltas[base + i] = delta
+            series.sums[i] += delta
+        series.values = list(values)
+        series.time = timestamp
+        series.pos = (pos + 1) % self.samples
+
+        self._unrank(series)
+        series.rates = [s / series.dt_sum for s in series.sums]
+        for i, ranks in self._ranks.items():
+            bisect.insort(ranks, (series.rates[i], series.seq))
+
+    def discard(self, key):
+        """
+        Removes the series of key if any.
+        """
+        series = self._series.pop(key, None)
+        if series is None:
+            return
+        del self._keys[series.seq]
+        self._unrank(series)
+
+    def values(self, key):
+        """
+        Returns a dict of the last values of the counters of key.
+        """
+        return dict(zip(self.counters, self._series[key].values))
+
+    def deltas(self, key):
+        """
+        Returns a dict of the deltas of the counters of key between the
+        last two samples, or None if key has only one sample.
+        """
+        series = self._series[key]
+        if series.count == 0:
+            return None
+        n = len(self.counters)
+        base = (series.pos - 1) % self.samples * n
+        return dict(zip(self.counters, series.deltas[base:base + n]))
+
+    def rates(self, key):
+        """
+        Returns a dict of the rates per second of the counters of key over
+        the samples kept, or None if key has only one sample.
+        """
+        series = self._series[key]
+        if series.rates is None:
+            return None
+        return dict(zip(self.counters, series.rates))
+
+    def top(self, counter, n, match=None):
+        """
+        Returns a list of (key, rate) of the n series with the highest rate
+        of counter, in descending order of the rate.
+
+        If match is given, only the keys for which match(key) returns True
+        are taken.
+        """
+        ranks = self._ranks[self._index[counter]]
+        result = []
+        for rate, seq in reversed(ranks):
+            if len(result) >= n:
+                break
+            key = self._keys[seq]
+            if match is None or match(key):
+                result.append((key, rate))
+        return result
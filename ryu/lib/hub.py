@@ -26,6 +26,10 @@ HUB_TYPE = os.getenv('RYU_HUB_TYPE', 'eventlet')
 
 LOG = logging.getLogger('ryu.lib.hub')
 
+# The resolution (in seconds) and the number of slots of TimerWheel.
+DEFAULT_TIMER_TICK = 0.01
+DEFAULT_TIMER_WHEEL_SIZE = 1024
+
 if HUB_TYPE == 'eventlet':
     import eventlet
     # HACK:
@@ -39,8 +43,10 @@ if HUB_TYPE == 'eventlet':
     import eventlet.wsgi
     from eventlet import websocket
     import greenlet
+    import math
     import ssl
     import socket
+    import time
     import traceback
     import sys
 
@@ -112,19 +118,21 @@ if HUB_TYPE == 'eventlet':
 
     class StreamServer(object):
         def __init__(self, listen_info, handle=None, backlog=None,
-                     spawn='default', **ssl_args):
+                     spawn='default', reuse_port=None, **ssl_args):
             assert backlog is None
             assert spawn == 'default'
 
             if ip.valid_ipv6(listen_info[0]):
                 self.server = eventlet.listen(listen_info,
-                                              family=socket.AF_INET6)
+                                              family=socket.AF_INET6,
+                                              reuse_port=reuse_port)
             elif os.path.isdir(os.path.dirname(listen_info[0])):
                 # Case for Unix domain socket
                 self.server = eventlet.listen(listen_info[0],
                                               family=socket.AF_UNIX)
             else:
-                self.server = eventlet.listen(listen_info)
+                self.server = eventlet.listen(listen_info,
+                                              reuse_port=reuse_port)
 
             if ssl_args:
                 ssl_args.setdefault('server_side', True)
@@ -237,3 +245,180 @@ if HUB_TYPE == 'eventlet':
                     pass
 
             return self._cond
+
+    class WheelTimer(object):
+        """
+        A timer scheduled on a :py:class:`TimerWheel`.
+
+        Instances are returned by :py:meth:`TimerWheel.schedule` and
+        :py:meth:`TimerWheel.schedule_spawn` and should not be created
+        directly.
+        """
+        __slots__ = ('wheel', 'func', 'args', 'kwargs', 'expires', 'slot',
+                     'generation')
+
+        def __init__(self, wheel, func, args, kwargs):
+            self.wheel = wheel
+            self.func = func
+            self.args = args
+            self.kwargs = kwargs
+            self.expires = None  # the wheel tick on which this timer fires
+            self.slot = None  # the wheel slot, or None if not scheduled
+            # incremented when cancelled or rescheduled
+            self.generation = 0
+
+        @property
+        def active(self):
+            """True if this timer is scheduled and has not fired yet."""
+            return self.slot is not None
+
+        def cancel(self):
+            """
+            Cancels this timer.  Does nothing if it is not scheduled,
+            except that the function of a timer of
+            :py:meth:`TimerWheel.schedule_spawn` which has fired but whose
+            thread has not run yet is not called.
+            """
+            self.wheel.cancel(self)
+
+        def reschedule(self, delay):
+            """
+            Schedules this timer to fire after delay seconds, whether it
+            is scheduled, has already fired or has been cancelled.
+            """
+            self.wheel.reschedule(self, delay)
+
+    class TimerWheel(object):
+        """
+        A hashed timer wheel which runs many timers on a single thread.
+
+        The wheel advances one slot every tick seconds.  A timer is stored
+        in the slot of the tick on which it expires, so that scheduling,
+        cancelling and rescheduling a timer take constant time regardless
+        of the number of timers.  A timer fires up to one tick later than
+        requested.
+
+        Callbacks are called in the thread of the wheel, so they should
+        not block; a blocking callback delays all the other timers of the
+        wheel.  Callbacks which may block, e.g., by sending messages,
+        should be run in their own threads with
+        :py:meth:`schedule_spawn`::
+
+            wheel.schedule_spawn(delay, func, *args)
+
+        The thread of the wheel runs only while some timer is scheduled.
+        """
+
+        def __init__(self, tick=DEFAULT_TIMER_TICK,
+                     size=DEFAULT_TIMER_WHEEL_SIZE):
+            super(TimerWheel, self).__init__()
+            self.tick = tick
+            self._slots = [{} for _ in range(size)]
+            self._start = time.time()
+            self._current = 0  # the last tick processed
+            self._count = 0
+            self._thread = None
+
+        def __len__(self):
+            return self._count
+
+        def schedule(self, delay, func, *args, **kwargs):
+            """
+            Calls func with the given arguments after delay seconds.
+
+            Returns a :py:class:`WheelTimer`.
+            """
+            timer = WheelTimer(self, func, args, kwargs)
+            self._add(timer, delay)
+            return timer
+
+        def schedule_spawn(self, delay, func, *args, **kwargs):
+            """
+            Like :py:meth:`schedule`, but calls func in its own thread so
+            that func may block.
+
+            func is not called if the timer is cancelled or rescheduled
+            after it fires but before the thread runs.
+            """
+            timer = WheelTimer(self, self._spawn, (), {})
+            timer.args = (timer, func, args, kwargs)
+            self._add(timer, delay)
+            return timer
+
+        def cancel(self, timer):
+            timer.generation += 1
+            if timer.slot is None:
+                return
+            del self._slots[timer.slot][timer]
+            timer.slot = None
+            self._count -= 1
+
+        def reschedule(self, timer, delay):
+            self.cancel(timer)
+            self._add(timer, delay)
+
+        def _spawn(self, timer, func, args, kwargs):
+            spawn(self._call_spawned, timer, timer.generation, func, args,
+                  kwargs)
+
+        @staticmethod
+        def _call_spawned(timer, generation, func, args, kwargs):
+            # Skip the call if the timer has been cancelled or rescheduled
+            # since it fired.
+            if timer.generation == generation:
+                func(*args, **kwargs)
+
+        def _now(self):
+            return int((time.time() - self._start) / self.tick)
+
+        def _add(self, timer, delay):
+            if self._thread is None:
+                # No timer is scheduled; catch up with the current time.
+                self._current = self._now()
+                self._thread = spawn(self._run)
+            expires = int(math.ceil((time.time() - self._start + delay) /
+                                    self.tick))
+            timer.expires = max(expires, self._current + 1)
+            timer.slot = timer.expires % len(self._slots)
+            self._slots[timer.slot][timer] = None
+            self._count += 1
+
+        def _expire(self, slot):
+            current = self._current
+            for timer in list(slot):
+                # Skip the timers which have been cancelled by a callback
+                # and the ones which expire on a later round of the wheel.
+                if timer.slot is None or timer.expires > current:
+                    continue
+                del slot[timer]
+                timer.slot = None
+                self._count -= 1
+                try:
+                    timer.func(*timer.args, **timer.kwargs)
+                except Exception:
+                    LOG.error('hub: uncaught exception in timer: %s',
+                              traceback.format_exc())
+
+        def _run(self):
+            try:
+                while self._count:
+                    next_tick = self._start + (self._current + 1) * self.tick
+                    sleep(max(0, next_tick - time.time()))
+                    now = self._now()
+                    while self._current < now and self._count:
+                        self._current += 1
+                        self._expire(
+                            self._slots[self._current % len(self._slots)])
+            finally:
+                self._thread = None
+
+    _timer_wheel = None
+
+    def get_timer_wheel():
+        """
+        Returns the timer wheel shared in this process.
+        """
+        global _timer_wheel
+        if _timer_wheel is None:
+            _timer_wheel = TimerWheel()
+        return _timer_wheel
@@ -262,6 +262,45 @@ def send_stats_request(dp, stats, waiters, msgs, logger=None):
         del waiters_per_dp[stats.xid]
 
 
+class _StatsReplyQueue(object):
+    # Registered in the waiters in place of the list of messages, so that
+    # each part of a multipart reply is handed to the consumer as soon as
+    # the reply handler appends it.
+    def __init__(self):
+        self.queue = hub.Queue()
+
+    def append(self, msg):
+        self.queue.put(msg)
+
+
+def iter_stats_reply(dp, stats, waiters, logger=None):
+    """
+    Sends the stats request and yields each part of the reply as it
+    arrives, instead of collecting all of them as send_stats_request()
+    does.
+
+    The waiters protocol is the same as send_stats_request(); as with
+    it, each part is waited for up to DEFAULT_TIMEOUT seconds.  If the
+    iteration is stopped before the last part, the rest of the reply is
+    discarded by the reply handler.
+    """
+    dp.set_xid(stats)
+    waiters_per_dp = waiters.setdefault(dp.id, {})
+    lock = hub.Event()
+    msgs = _StatsReplyQueue()
+    waiters_per_dp[stats.xid] = (lock, msgs)
+    try:
+        send_msg(dp, stats, logger)
+        while not (lock.is_set() and msgs.queue.empty()):
+            try:
+                msg = msgs.queue.get(timeout=DEFAULT_TIMEOUT)
+            except hub.QueueEmpty:
+                break
+            yield msg
+    finally:
+        waiters_per_dp.pop(stats.xid, None)
+
+
 def str_to_int(str_num):
     return int(str(str_num), 0)
 
@@ -437,7 +437,7 @@ def get_queue_config(dp, waiters, port=None, to_user=True):
     return wrap_dpid_dict(dp, configs, to_user)
 
 
-def get_flow_stats(dp, waiters, flow=None, to_user=True):
+def _flow_stats_request(dp, flow):
     flow = flow if flow else {}
     table_id = UTIL.ofp_table_from_user(
         flow.get('table_id', dp.ofproto.OFPTT_ALL))
@@ -457,6 +457,38 @@ def get_flow_stats(dp, waiters, flow=None, to_user=True):
         dp, flags, table_id, out_port, out_group, cookie, cookie_mask,
         match)
 
+    return stats, priority
+
+
+def _flow_stats_to_dict(stats, to_user):
+    s = {'priority': stats.priority,
+         'cookie': stats.cookie,
+         'idle_timeout': stats.idle_timeout,
+         'hard_timeout': stats.hard_timeout,
+         'byte_count': stats.byte_count,
+         'duration_sec': stats.duration_sec,
+         'duration_nsec': stats.duration_nsec,
+         'packet_count': stats.packet_count,
+         'length': stats.length,
+         'flags': stats.flags}
+
+    if to_user:
+        s['actions'] = actions_to_str(stats.instructions)
+        s['match'] = match_to_str(stats.match)
+        s['table_id'] = UTIL.ofp_table_to_user(stats.table_id)
+
+    else:
+        s['actions'] = stats.instructions
+        s['instructions'] = stats.instructions
+        s['match'] = stats.match
+        s['table_id'] = stats.table_id
+
+    return s
+
+
+def get_flow_stats(dp, waiters, flow=None, to_user=True):
+    stats, priority = _flow_stats_request(dp, flow)
+
     msgs = []
     ofctl_utils.send_stats_request(dp, stats, waiters, msgs, LOG)
 
@@ -466,31 +498,22 @@ def get_flow_stats(dp, waiters, flow=None, to_user=True):
             if 0 <= priority != stats.priority:
                 continue
 
-            s = {'priority': stats.priority,
-                 'cookie': stats.cookie,
-                 'idle_timeout': stats.idle_timeout,
-                 'hard_timeout': stats.hard_timeout,
-                 'byte_count': stats.byte_count,
-                 'duration_sec': stats.duration_sec,
-                 'duration_nsec': stats.duration_nsec,
-                 'packet_count': stats.packet_count,
-                 'length': stats.length,
-                 'flags': stats.flags}
+            flows.append(_flow_stats_to_dict(stats, to_user))
 
-            if to_user:
-                s['actions'] = actions_to_str(stats.instructions)
-                s['match'] = match_to_str(stats.match)
-                s['table_id'] = UTIL.ofp_table_to_user(stats.table_id)
+    return wrap_dpid_dict(dp, flows, to_user)
 
-            else:
-                s['actions'] = stats.instructions
-                s['instructions'] = stats.instructions
-                s['match'] = stats.match
-                s['table_id'] = stats.table_id
 
-            flows.append(s)
+def iter_flow_stats(dp, waiters, flow=None, to_user=True):
+    # Same as get_flow_stats(), but yields each entry as the part of
+    # the multipart reply which contains it arrives.
+    stats, priority = _flow_stats_request(dp, flow)
 
-    return wrap_dpid_dict(dp, flows, to_user)
+    for msg in ofctl_utils.iter_stats_reply(dp, stats, waiters, LOG):
+        for stats in msg.body:
+            if 0 <= priority != stats.priority:
+                continue
+
+            yield _flow_stats_to_dict(stats, to_user)
 
 
 def get_aggregate_flow_stats(dp, waiters, flow=None, to_user=True):
@@ -652,44 +675,59 @@ def get_table_features(dp, waiters, to_user=True):
     return wrap_dpid_dict(dp, tables, to_user)
 
 
-def get_port_stats(dp, waiters, port=None, to_user=True):
+def _port_stats_request(dp, port):
     if port is None:
         port = dp.ofproto.OFPP_ANY
     else:
         port = str_to_int(port)
 
-    stats = dp.ofproto_parser.OFPPortStatsRequest(
+    return dp.ofproto_parser.OFPPortStatsRequest(
         dp, 0, port)
+
+
+def _port_stats_to_dict(stats, to_user):
+    s = {'rx_packets': stats.rx_packets,
+         'tx_packets': stats.tx_packets,
+         'rx_bytes': stats.rx_bytes,
+         'tx_bytes': stats.tx_bytes,
+         'rx_dropped': stats.rx_dropped,
+         'tx_dropped': stats.tx_dropped,
+         'rx_errors': stats.rx_errors,
+         'tx_errors': stats.tx_errors,
+         'rx_frame_err': stats.rx_frame_err,
+         'rx_over_err': stats.rx_over_err,
+         'rx_crc_err': stats.rx_crc_err,
+         'collisions': stats.collisions,
+         'duration_sec': stats.duration_sec,
+         'duration_nsec': stats.duration_nsec}
+
+    if to_user:
+        s['port_no'] = UTIL.ofp_port_to_user(stats.port_no)
+
+    else:
+        s['port_no'] = stats.port_no
+
+    return s
+
+
+def get_port_stats(dp, waiters, port=None, to_user=True):
+    stats = _port_stats_request(dp, port)
     msgs = []
     ofctl_utils.send_stats_request(dp, stats, waiters, msgs, LOG)
 
     ports = []
     for msg in msgs:
         for stats in msg.body:
-            s = {'rx_packets': stats.rx_packets,
-                 'tx_packets': stats.tx_packets,
-                 'rx_bytes': stats.rx_bytes,
-                 'tx_bytes': stats.tx_bytes,
-                 'rx_dropped': stats.rx_dropped,
-                 'tx_dropped': stats.tx_dropped,
-                 'rx_errors': stats.rx_errors,
-                 'tx_errors': stats.tx_errors,
-                 'rx_frame_err': stats.rx_frame_err,
-                 'rx_over_err': stats.rx_over_err,
-                 'rx_crc_err': stats.rx_crc_err,
-                 'collisions': stats.collisions,
-                 'duration_sec': stats.duration_sec,
-                 'duration_nsec': stats.duration_nsec}
+            ports.append(_port_stats_to_dict(stats, to_user))
 
-            if to_user:
-                s['port_no'] = UTIL.ofp_port_to_user(stats.port_no)
-
-            else:
-                s['port_no'] = stats.port_no
+    return wrap_dpid_dict(dp, ports, to_user)
 
-            ports.append(s)
 
-    return wrap_dpid_dict(dp, ports, to_user)
+def iter_port_stats(dp, waiters, port=None, to_user=True):
+    stats = _port_stats_request(dp, port)
+    for msg in ofctl_utils.iter_stats_reply(dp, stats, waiters, LOG):
+        for stats in msg.body:
+            yield _port_stats_to_dict(stats, to_user)
 
 
 def get_meter_stats(dp, waiters, meter_id=None, to_user=True):
@@ -840,42 +878,57 @@ def get_meter_config(dp, waiters, meter_id=None, to_user=True):
     return wrap_dpid_dict(dp, configs, to_user)
 
 
-def get_group_stats(dp, waiters, group_id=None, to_user=True):
+def _group_stats_request(dp, group_id):
     if group_id is None:
         group_id = dp.ofproto.OFPG_ALL
     else:
         group_id = str_to_int(group_id)
 
-    stats = dp.ofproto_parser.OFPGroupStatsRequest(
+    return dp.ofproto_parser.OFPGroupStatsRequest(
         dp, 0, group_id)
+
+
+def _group_stats_to_dict(stats, to_user):
+    bucket_stats = []
+    for bucket_stat in stats.bucket_stats:
+        c = {'packet_count': bucket_stat.packet_count,
+             'byte_count': bucket_stat.byte_count}
+        bucket_stats.append(c)
+    g = {'length': stats.length,
+         'ref_count': stats.ref_count,
+         'packet_count': stats.packet_count,
+         'byte_count': stats.byte_count,
+         'duration_sec': stats.duration_sec,
+         'duration_nsec': stats.duration_nsec,
+         'bucket_stats': bucket_stats}
+
+    if to_user:
+        g['group_id'] = UTIL.ofp_group_to_user(stats.group_id)
+
+    else:
+        g['group_id'] = stats.group_id
+
+    return g
+
+
+def get_group_stats(dp, waiters, group_id=None, to_user=True):
+    stats = _group_stats_request(dp, group_id)
     msgs = []
     ofctl_utils.send_stats_request(dp, stats, waiters, msgs, LOG)
 
     groups = []
     for msg in msgs:
         for stats in msg.body:
-            bucket_stats = []
-            for bucket_stat in stats.bucket_stats:
-                c = {'packet_count': bucket_stat.packet_count,
-                     'byte_count': bucket_stat.byte_count}
-                bucket_stats.append(c)
-            g = {'length': stats.length,
-                 'ref_count': stats.ref_count,
-                 'packet_count': stats.packet_count,
-                 'byte_count': stats.byte_count,
-                 'duration_sec': stats.duration_sec,
-                 'duration_nsec': stats.duration_nsec,
-                 'bucket_stats': bucket_stats}
-
-            if to_user:
-                g['group_id'] = UTIL.ofp_group_to_user(stats.group_id)
+            groups.append(_group_stats_to_dict(stats, to_user))
 
-            else:
-                g['group_id'] = stats.group_id
+    return wrap_dpid_dict(dp, groups, to_user)
 
-            groups.append(g)
 
-    return wrap_dpid_dict(dp, groups, to_user)
+def iter_group_stats(dp, waiters, group_id=None, to_user=True):
+    stats = _group_stats_request(dp, group_id)
+    for msg in ofctl_utils.iter_stats_reply(dp, stats, waiters, LOG):
+        for stats in msg.body:
+            yield _group_stats_to_dict(stats, to_user)
 
 
 def get_group_features(dp, waiters, to_user=True):
@@ -315,7 +315,7 @@ def get_queue_desc(dp, waiters, port_no=None, queue_id=None, to_user=True):
     return wrap_dpid_dict(dp, configs, to_user)
 
 
-def get_flow_stats(dp, waiters, flow=None, to_user=True):
+def _flow_stats_request(dp, flow):
     flow = flow if flow else {}
     table_id = UTIL.ofp_table_from_user(
         flow.get('table_id', dp.ofproto.OFPTT_ALL))
@@ -335,6 +335,19 @@ def get_flow_stats(dp, waiters, flow=None, to_user=True):
         dp, flags, table_id, out_port, out_group, cookie, cookie_mask,
         match)
 
+    return stats, priority
+
+
+def _flow_stats_to_dict(stats, to_user):
+    s = stats.to_jsondict()[stats.__class__.__name__]
+    s['instructions'] = instructions_to_str(stats.instructions)
+    s['match'] = match_to_str(stats.match)
+    return s
+
+
+def get_flow_stats(dp, waiters, flow=None, to_user=True):
+    stats, priority = _flow_stats_request(dp, flow)
+
     msgs = []
     ofctl_utils.send_stats_request(dp, stats, waiters, msgs, LOG)
 
@@ -344,14 +357,24 @@ def get_flow_stats(dp, waiters, flow=None, to_user=True):
             if 0 <= priority != stats.priority:
                 continue
 
-            s = stats.to_jsondict()[stats.__class__.__name__]
-            s['instructions'] = instructions_to_str(stats.instructions)
-            s['match'] = match_to_str(stats.match)
-            flows.append(s)
+            flows.append(_flow_stats_to_dict(stats, to_user))
 
     return wrap_dpid_dict(dp, flows, to_user)
 
 
+def iter_flow_stats(dp, waiters, flow=None, to_user=True):
+    # Same as get_flow_stats(), but yields each entry as the part of
+    # the multipart reply which contains it arrives.
+    stats, priority = _flow_stats_request(dp, flow)
+
+    for msg in ofctl_utils.iter_stats_reply(dp, stats, waiters, LOG):
+        for stats in msg.body:
+            if 0 <= priority != stats.priority:
+                continue
+
+            yield _flow_stats_to_dict(stats, to_user)
+
+
 def get_aggregate_flow_stats(dp, waiters, flow=None, to_user=True):
     flow = flow if flow else {}
     table_id = UTIL.ofp_table_from_user(
@@ -476,34 +499,49 @@ def get_table_features(dp, waiters, to_user=True):
     return wrap_dpid_dict(dp, tables, to_user)
 
 
-def get_port_stats(dp, waiters, port_no=None, to_user=True):
+def _port_stats_request(dp, port_no):
     if port_no is None:
         port_no = dp.ofproto.OFPP_ANY
     else:
         port_no = UTIL.ofp_port_from_user(port_no)
 
-    stats = dp.ofproto_parser.OFPPortStatsRequest(dp, 0, port_no)
+    return dp.ofproto_parser.OFPPortStatsRequest(dp, 0, port_no)
+
+
+def _port_stats_to_dict(stats, to_user):
+    s = stats.to_jsondict()[stats.__class__.__name__]
+    properties = []
+    for prop in stats.properties:
+        p = prop.to_jsondict()[prop.__class__.__name__]
+        t = UTIL.ofp_port_stats_prop_type_to_user(prop.type)
+        p['type'] = t if t != prop.type else 'UNKNOWN'
+        properties.append(p)
+    s['properties'] = properties
+
+    if to_user:
+        s['port_no'] = UTIL.ofp_port_to_user(stats.port_no)
+
+    return s
+
+
+def get_port_stats(dp, waiters, port_no=None, to_user=True):
+    stats = _port_stats_request(dp, port_no)
     msgs = []
     ofctl_utils.send_stats_request(dp, stats, waiters, msgs, LOG)
 
     ports = []
     for msg in msgs:
         for stats in msg.body:
-            s = stats.to_jsondict()[stats.__class__.__name__]
-            properties = []
-            for prop in stats.properties:
-                p = prop.to_jsondict()[prop.__class__.__name__]
-                t = UTIL.ofp_port_stats_prop_type_to_user(prop.type)
-                p['type'] = t if t != prop.type else 'UNKNOWN'
-                properties.append(p)
-            s['properties'] = properties
+            ports.append(_port_stats_to_dict(stats, to_user))
 
-            if to_user:
-                s['port_no'] = UTIL.ofp_port_to_user(stats.port_no)
+    return wrap_dpid_dict(dp, ports, to_user)
 
-            ports.append(s)
 
-    return wrap_dpid_dict(dp, ports, to_user)
+def iter_port_stats(dp, waiters, port_no=None, to_user=True):
+    stats = _port_stats_request(dp, port_no)
+    for msg in ofctl_utils.iter_stats_reply(dp, stats, waiters, LOG):
+        for stats in msg.body:
+            yield _port_stats_to_dict(stats, to_user)
 
 
 def get_meter_stats(dp, waiters, meter_id=None, to_user=True):
@@ -631,33 +669,48 @@ def get_meter_config(dp, waiters, meter_id=None, to_user=True):
     return wrap_dpid_dict(dp, configs, to_user)
 
 
-def get_group_stats(dp, waiters, group_id=None, to_user=True):
+def _group_stats_request(dp, group_id):
     if group_id is None:
         group_id = dp.ofproto.OFPG_ALL
     else:
         group_id = UTIL.ofp_group_from_user(group_id)
 
-    stats = dp.ofproto_parser.OFPGroupStatsRequest(
+    return dp.ofproto_parser.OFPGroupStatsRequest(
         dp, 0, group_id)
+
+
+def _group_stats_to_dict(stats, to_user):
+    g = stats.to_jsondict()[stats.__class__.__name__]
+    bucket_stats = []
+    for bucket_stat in stats.bucket_stats:
+        c = bucket_stat.to_jsondict()[bucket_stat.__class__.__name__]
+        bucket_stats.append(c)
+    g['bucket_stats'] = bucket_stats
+
+    if to_user:
+        g['group_id'] = UTIL.ofp_group_to_user(stats.group_id)
+
+    return g
+
+
+def get_group_stats(dp, waiters, group_id=None, to_user=True):
+    stats = _group_stats_request(dp, group_id)
     msgs = []
     ofctl_utils.send_stats_request(dp, stats, waiters, msgs, LOG)
 
     groups = []
     for msg in msgs:
         for stats in msg.body:
-            g = stats.to_jsondict()[stats.__class__.__name__]
-            bucket_stats = []
-            for bucket_stat in stats.bucket_stats:
-                c = bucket_stat.to_jsondict()[bucket_stat.__class__.__name__]
-                bucket_stats.append(c)
-            g['bucket_stats'] = bucket_stats
+            groups.append(_group_stats_to_dict(stats, to_user))
 
-            if to_user:
-                g['group_id'] = UTIL.ofp_group_to_user(stats.group_id)
+    return wrap_dpid_dict(dp, groups, to_user)
 
-            groups.append(g)
 
-    return wrap_dpid_dict(dp, groups, to_user)
+def iter_group_stats(dp, waiters, group_id=None, to_user=True):
+    stats = _group_stats_request(dp, group_id)
+    for msg in ofctl_utils.iter_stats_reply(dp, stats, waiters, LOG):
+        for stats in msg.body:
+            yield _group_stats_to_dict(stats, to_user)
 
 
 def get_group_features(dp, waiters, to_user=True):
@@ -39,24 +39,71 @@ for _, m in mod:
 PKT_CLS_DICT = dict(cls_list)
 
 
+def _is_padding(data):
+    # Returns True if data is empty or all zeros.  As data rarely begins
+    # with zero, this seldom needs to copy data to check the whole.
+    if not len(data):
+        return True
+    if six.indexbytes(data, 0):
+        return False
+    return not six.binary_type(data).strip(b'\x00')
+
+
+_VIEW_HOLDERS = (memoryview, StringifyMixin, list, tuple)
+
+
+def _release_views(obj):
+    # Replaces memoryview slices which the protocol parsers left in obj
+    # with bytes, so that the decoded headers do not refer to the buffer.
+    attrs = obj.__dict__
+    for k, v in attrs.items():
+        if not isinstance(v, _VIEW_HOLDERS):
+            continue
+        if isinstance(v, memoryview):
+            attrs[k] = v.tobytes()
+        elif isinstance(v, StringifyMixin):
+            _release_views(v)
+        elif isinstance(v, (list, tuple)):
+            attrs[k] = v.__class__(_release_view(i) for i in v)
+
+
+def _release_view(v):
+    if isinstance(v, memoryview):
+        return v.tobytes()
+    if isinstance(v, StringifyMixin):
+        _release_views(v)
+    return v
+
+
 class Packet(StringifyMixin):
     """A packet decoder/encoder class.
 
     An instance is used to either decode or encode a single packet.
 
     *data* is a bytearray to describe a raw datagram to decode.
+    It can also be a memoryview, in which case the protocol parsers slice
+    it without copying.
     When decoding, a Packet object is iteratable.
     Iterated values are protocol (ethernet, ipv4, ...) headers and the payload.
     Protocol headers are instances of subclass of packet_base.PacketBase.
     The payload is a bytearray.  They are iterated in on-wire order.
 
+    *parse_until* is a protocol class or a tuple of protocol classes.
+    If specified, decoding stops after the first protocol header which is
+    an instance of them, and the rest of *data* is left undecoded as the
+    payload.  This saves the time to decode the upper layers when an
+    application needs only, e.g., ethernet, vlan and ipv4 or arp::
+
+        pkt = packet.Packet(msg.data, parse_until=(ipv4.ipv4, arp.arp))
+
     *data* should be omitted when encoding a packet.
     """
 
     # Ignore data field when outputting json representation.
     _base_attributes = ['data']
 
-    def __init__(self, data=None, protocols=None, parse_cls=ethernet.ethernet):
+    def __init__(self, data=None, protocols=None, parse_cls=ethernet.ethernet,
+                 parse_until=None):
         super(Packet, self).__init__()
         self.data = data
         if protocols is None:
@@ -64,22 +111,30 @@ class Packet(StringifyMixin):
         else:
             self.protocols = protocols
         if self.data:
-            self._parser(parse_cls)
+            self._parser(parse_cls, parse_until)
 
-    def _parser(self, cls):
+    def _parser(self, cls, parse_until=None):
         rest_data = self.data
+        is_view = isinstance(rest_data, memoryview)
         while cls:
             # Ignores an empty buffer
-            if not six.binary_type(rest_data).strip(b'\x00'):
+            if _is_padding(rest_data):
                 break
             try:
                 proto, cls, rest_data = cls.parser(rest_data)
             except struct.error:
                 break
             if proto:
+                if is_view:
+                    _release_views(proto)
                 self.protocols.append(proto)
+                if parse_until is not None and isinstance(proto,
+                                                          parse_until):
+                    break
         # If rest_data is all padding, we ignore rest_data
-        if rest_data and six.binary_type(rest_data).strip(b'\x00'):
+        if rest_data and not _is_padding(rest_data):
+            if is_view:
+                rest_data = six.binary_type(rest_data)
             self.protocols.append(rest_data)
 
     def serialize(self):
@@ -22,7 +22,6 @@ from ryu.controller import event
 from ryu.controller import handler
 from ryu.controller import ofp_event
 from ryu.controller.handler import set_ev_cls
-from ryu.exception import RyuException
 from ryu.exception import OFPUnknownVersion
 from ryu.lib import hub
 from ryu.lib import mac
@@ -745,36 +744,30 @@ class Port(object):
         # Receive BPDU data
         self.designated_priority = None
         self.designated_times = None
-        # BPDU handling threads
-        self.send_bpdu_thread = PortThread(self._transmit_bpdu)
-        self.wait_bpdu_thread = PortThread(self._wait_bpdu_timer)
+        # BPDU handling timers
+        self.send_bpdu_timer = PortTimer(self._transmit_bpdu)
+        self.wait_bpdu_timer = PortTimer(self._wait_bpdu_timeout)
         self.send_tc_flg = None
         self.send_tc_timer = None
         self.send_tcn_flg = None
-        self.wait_timer_event = None
-        # State machine thread
-        self.state_machine = PortThread(self._state_machine)
-        self.state_event = None
+        # State machine timer
+        self.state_timer = PortTimer(self._state_timeout)
+        self.state_machine_started = False
 
         self.up(DESIGNATED_PORT,
                 Priority(bridge_id, 0, None, None),
                 bridge_times)
 
-        self.state_machine.start()
+        self._start_state_machine()
         self.logger.debug('[port=%d] Start port state machine.',
                           self.ofport.port_no, extra=self.dpid_str)
 
     def delete(self):
-        self.state_machine.stop()
-        self.send_bpdu_thread.stop()
-        self.wait_bpdu_thread.stop()
-        if self.state_event is not None:
-            self.state_event.set()
-            self.state_event = None
-        if self.wait_timer_event is not None:
-            self.wait_timer_event.set()
-            self.wait_timer_event = None
-        self.logger.debug('[port=%d] Stop port threads.',
+        self.state_machine_started = False
+        self.state_timer.stop()
+        self.send_bpdu_timer.stop()
+        self.wait_bpdu_timer.stop()
+        self.logger.debug('[port=%d] Stop port timers.',
                           self.ofport.port_no, extra=self.dpid_str)
 
     def up(self, role, root_priority, root_times):
@@ -802,6 +795,12 @@ class Port(object):
         self._change_role(DESIGNATED_PORT)
         self._change_status(state)
 
+    def _start_state_machine(self):
+        if self.state is PORT_STATE_DISABLE:
+            self.ofctl.set_port_status(self.ofport, self.state)
+        self.state_machine_started = True
+        self._state_machine()
+
     def _state_machine(self):
         """ Port state machine.
              Change next status when timer is exceeded
@@ -815,32 +814,19 @@ class Port(object):
                      PORT_STATE_LEARN: 'LEARN',
                      PORT_STATE_FORWARD: 'FORWARD'}
 
-        if self.state is PORT_STATE_DISABLE:
-            self.ofctl.set_port_status(self.ofport, self.state)
+        self.logger.info('[port=%d] %s / %s', self.ofport.port_no,
+                         role_str[self.role], state_str[self.state],
+                         extra=self.dpid_str)
 
-        while True:
-            self.logger.info('[port=%d] %s / %s', self.ofport.port_no,
-                             role_str[self.role], state_str[self.state],
-                             extra=self.dpid_str)
-
-            self.state_event = hub.Event()
-            timer = self._get_timer()
-            if timer:
-                timeout = hub.Timeout(timer)
-                try:
-                    self.state_event.wait()
-                except hub.Timeout as t:
-                    if t is not timeout:
-                        err_msg = 'Internal error. Not my timeout.'
-                        raise RyuException(msg=err_msg)
-                    new_state = self._get_next_state()
-                    self._change_status(new_state, thread_switch=False)
-                finally:
-                    timeout.cancel()
-            else:
-                self.state_event.wait()
+        timer = self._get_timer()
+        if timer:
+            self.state_timer.start(timer)
+        else:
+            self.state_timer.stop()
 
-            self.state_event = None
+    def _state_timeout(self):
+        new_state = self._get_next_state()
+        self._change_status(new_state, thread_switch=False)
 
     def _get_timer(self):
         timer = {PORT_STATE_DISABLE: None,
@@ -876,16 +862,15 @@ class Port(object):
             self.send_tc_flg = False
             self.send_tc_timer = None
             self.send_tcn_flg = False
-            self.send_bpdu_thread.stop()
+            self.send_bpdu_timer.stop()
         elif new_state is PORT_STATE_LISTEN:
-            self.send_bpdu_thread.start()
+            self.send_bpdu_timer.start(0)
 
         self.state = new_state
         self.send_event(EventPortStateChange(self.dp, self))
 
-        if self.state_event is not None:
-            self.state_event.set()
-            self.state_event = None
+        if self.state_machine_started:
+            self._state_machine()
         if thread_switch:
             hub.sleep(0)  # For thread switching.
 
@@ -895,10 +880,10 @@ class Port(object):
         self.role = new_role
         if (new_role is ROOT_PORT
                 or new_role is NON_DESIGNATED_PORT):
-            self.wait_bpdu_thread.start()
+            self._start_wait_bpdu_timer()
         else:
             assert new_role is DESIGNATED_PORT
-            self.wait_bpdu_thread.stop()
+            self.wait_bpdu_timer.stop()
 
     def rcv_config_bpdu(self, bpdu_pkt):
         # Check received BPDU is superior to currently held BPDU.
@@ -954,69 +939,50 @@ class Port(object):
         return rcv_info, rcv_tc
 
     def _update_wait_bpdu_timer(self):
-        if self.wait_timer_event is not None:
-            self.wait_timer_event.set()
-            self.wait_timer_event = None
+        if self.wait_bpdu_timer.is_running():
+            self._start_wait_bpdu_timer()
             self.logger.debug('[port=%d] Wait BPDU timer is updated.',
                               self.ofport.port_no, extra=self.dpid_str)
         hub.sleep(0)  # For thread switching.
 
-    def _wait_bpdu_timer(self):
-        time_exceed = False
-
-        while True:
-            self.wait_timer_event = hub.Event()
-            message_age = (self.designated_times.message_age
-                           if self.designated_times else 0)
-            timer = self.port_times.max_age - message_age
-            timeout = hub.Timeout(timer)
-            try:
-                self.wait_timer_event.wait()
-            except hub.Timeout as t:
-                if t is not timeout:
-                    err_msg = 'Internal error. Not my timeout.'
-                    raise RyuException(msg=err_msg)
-                self.logger.info('[port=%d] Wait BPDU timer is exceeded.',
-                                 self.ofport.port_no, extra=self.dpid_str)
-                time_exceed = True
-            finally:
-                timeout.cancel()
-                self.wait_timer_event = None
-
-            if time_exceed:
-                break
+    def _start_wait_bpdu_timer(self):
+        message_age = (self.designated_times.message_age
+                       if self.designated_times else 0)
+        self.wait_bpdu_timer.start(self.port_times.max_age - message_age)
 
-        if time_exceed:  # Bridge.recalculate_spanning_tree
-            hub.spawn(self.wait_bpdu_timeout)
+    def _wait_bpdu_timeout(self):
+        self.logger.info('[port=%d] Wait BPDU timer is exceeded.',
+                         self.ofport.port_no, extra=self.dpid_str)
+        # Bridge.recalculate_spanning_tree
+        hub.spawn(self.wait_bpdu_timeout)
 
     def _transmit_bpdu(self):
-        while True:
-            # Send config BPDU packet if port role is DESIGNATED_PORT.
-            if self.role == DESIGNATED_PORT:
-                now = datetime.datetime.today()
-                if self.send_tc_timer and self.send_tc_timer < now:
-                    self.send_tc_timer = None
-                    self.send_tc_flg = False
-
-                if not self.send_tc_flg:
-                    flags = 0b00000000
-                    log_msg = '[port=%d] Send Config BPDU.'
-                else:
-                    flags = 0b00000001
-                    log_msg = '[port=%d] Send TopologyChange BPDU.'
-                bpdu_data = self._generate_config_bpdu(flags)
-                self.ofctl.send_packet_out(self.ofport.port_no, bpdu_data)
-                self.logger.debug(log_msg, self.ofport.port_no,
-                                  extra=self.dpid_str)
-
-            # Send Topology Change Notification BPDU until receive Ack.
-            if self.send_tcn_flg:
-                bpdu_data = self._generate_tcn_bpdu()
-                self.ofctl.send_packet_out(self.ofport.port_no, bpdu_data)
-                self.logger.debug('[port=%d] Send TopologyChangeNotify BPDU.',
-                                  self.ofport.port_no, extra=self.dpid_str)
-
-            hub.sleep(self.port_times.hello_time)
+        self.send_bpdu_timer.start(self.port_times.hello_time)
+
+        # Send config BPDU packet if port role is DESIGNATED_PORT.
+        if self.role == DESIGNATED_PORT:
+            now = datetime.datetime.today()
+            if self.send_tc_timer and self.send_tc_timer < now:
+                self.send_tc_timer = None
+                self.send_tc_flg = False
+
+            if not self.send_tc_flg:
+                flags = 0b00000000
+                log_msg = '[port=%d] Send Config BPDU.'
+            else:
+                flags = 0b00000001
+                log_msg = '[port=%d] Send TopologyChange BPDU.'
+            bpdu_data = self._generate_config_bpdu(flags)
+            self.ofctl.send_packet_out(self.ofport.port_no, bpdu_data)
+            self.logger.debug(log_msg, self.ofport.port_no,
+                              extra=self.dpid_str)
+
+        # Send Topology Change Notification BPDU until receive Ack.
+        if self.send_tcn_flg:
+            bpdu_data = self._generate_tcn_bpdu()
+            self.ofctl.send_packet_out(self.ofport.port_no, bpdu_data)
+            self.logger.debug('[port=%d] Send TopologyChangeNotify BPDU.',
+                              self.ofport.port_no, extra=self.dpid_str)
 
     def transmit_tc_bpdu(self):
         """ Set send_tc_flg to send Topology Change BPDU. """
@@ -1085,21 +1051,28 @@ class Port(object):
         return pkt.data
 
 
-class PortThread(object):
+class PortTimer(object):
     def __init__(self, function):
-        super(PortThread, self).__init__()
+        super(PortTimer, self).__init__()
         self.function = function
-        self.thread = None
+        self.timer = None
 
-    def start(self):
-        self.stop()
-        self.thread = hub.spawn(self.function)
+    def start(self, delay):
+        if self.timer is None:
+            # The function sends packets, so it runs in its own thread.
+            self.timer = hub.get_timer_wheel().schedule_spawn(
+                delay, self.function)
+        else:
+            self.timer.reschedule(delay)
 
     def stop(self):
-        if self.thread is not None:
-            hub.kill(self.thread)
-            hub.joinall([self.thread])
-            self.thread = None
+        # Also skips the function if the timer has fired but the thread
+        # has not run yet, so that it does not start the timer again.
+        if self.timer is not None:
+            self.timer.cancel()
+
+    def is_running(self):
+        return self.timer is not None and self.timer.active
 
 
 class BridgeId(object):
@@ -38,8 +38,7 @@ if six.PY3:
 def header(buf):
     assert len(buf) >= ofproto_common.OFP_HEADER_SIZE
     # LOG.debug('len %d bufsize %d', len(buf), ofproto.OFP_HEADER_SIZE)
-    return struct.unpack_from(ofproto_common.OFP_HEADER_PACK_STR,
-                              six.binary_type(buf))
+    return struct.unpack_from(ofproto_common.OFP_HEADER_PACK_STR, buf)
 
 
 _MSG_PARSERS = {}
@@ -270,6 +269,197 @@ class MsgBase(StringifyMixin):
         self._serialize_body()
         self._serialize_header()
 
+    def _template_fields(self):
+        # Returns the fields which MsgTemplate can patch in the serialized
+        # buf as {name: (pack_str, offset)}.  'data' is the trailing data
+        # of which pack_str is None.
+        return {}
+
+
+def oxm_value_offset(buf, offset, oxm_header):
+    """
+    Returns the offset of the value of the OXM TLV with the given header in
+    the serialized ofp_match at offset of buf, or None if not found.
+    """
+    (_type, length) = struct.unpack_from('!HH', buf, offset)
+    end = offset + length
+    offset += 4
+    while offset < end:
+        (header,) = struct.unpack_from('!I', buf, offset)
+        if header == oxm_header:
+            return offset + 4
+        offset += 4 + (header & 0xff)
+    return None
+
+
+class MsgTemplate(object):
+    """
+    A pre-serialized message whose variable fields are patched on each use.
+
+    Serializing a message encodes its match, actions and instructions every
+    time.  When an application sends many messages which differ only in a
+    few fields (e.g., Packet-Out of LLDP or Flow-Mod of a learning switch),
+    it can serialize the message once as a template, and then build each
+    message by patching those fields into a copy of the template.
+
+    The following fields can be patched in OFPPacketOut and OFPFlowMod of
+    OpenFlow 1.3 or later, in addition to xid which is set by
+    ``Datapath.send_msg()``.
+
+    =========== ========================================================
+    Field       Description
+    =========== ========================================================
+    buffer_id   buffer_id of the message
+    in_port     in_port of Packet-Out, or in_port field of the match
+    output_port port of the first OFPActionOutput
+    data        Packet data of Packet-Out, bytes or packet.Packet
+    =========== ========================================================
+
+    The template message must contain the fields to patch, e.g., the match
+    of a Flow-Mod must have in_port to patch in_port.  The other fields
+    keep the values of the template message.
+
+    Example::
+
+        actions = [parser.OFPActionOutput(ofp.OFPP_FLOOD)]
+        req = parser.OFPPacketOut(datapath, ofp.OFP_NO_BUFFER,
+                                  ofp.OFPP_CONTROLLER, actions, data=b'')
+        template = parser.MsgTemplate(req)
+
+        # for each packet
+        datapath.send_msg(template.build(output_port=port_no, data=data))
+    """
+
+    def __init__(self, msg):
+        msg.serialize()
+        self.datapath = msg.datapath
+        self.msg_type = msg.msg_type
+        self.fields = msg._template_fields()
+        (_pack_str, data_offset) = self.fields.pop('data', (None, None))
+        self.data_offset = data_offset
+        self.buf = six.binary_type(msg.buf[:data_offset])
+        if data_offset is None:
+            self.data = b''
+        else:
+            self.data = six.binary_type(msg.buf[data_offset:])
+
+    def serialize(self, xid=0, **values):
+        """
+        Returns a bytearray of the message patched with the given values.
+        """
+        buf = bytearray(self.buf)
+        data = values.pop('data', None)
+        if data is None:
+            buf += self.data
+        elif self.data_offset is None:
+            raise ValueError('data cannot be patched in this template')
+        elif isinstance(data, (bytes, bytearray)):
+            buf += data
+        else:
+            # packet.Packet
+            data.serialize()
+            buf += data.data
+
+        for name, value in values.items():
+            try:
+                (pack_str, offset) = self.fields[name]
+            except KeyError:
+                raise ValueError('%s cannot be patched in this template' %
+                                 name)
+            struct.pack_into(pack_str, buf, offset, value)
+
+        # msg_len and xid of ofp_header
+        struct.pack_into('!HI', buf, 2, len(buf), xid)
+        return buf
+
+    def build(self, **values):
+        """
+        Returns a message patched with the given values, which can be sent
+        with ``Datapath.send_msg()``.
+        """
+        return TemplateMsg(self, values)
+
+
+class TemplateMsg(MsgBase):
+    """
+    A message built by MsgTemplate.build().
+    """
+
+    def __init__(self, template, values):
+        super(TemplateMsg, self).__init__(template.datapath)
+        self.cls_msg_type = template.msg_type
+        self.template = template
+        self.values = values
+
+    def serialize(self):
+        self.version = self.datapath.ofproto.OFP_VERSION
+        self.msg_type = self.cls_msg_type
+        if self.xid is None:
+            self.xid = 0
+        self.buf = self.template.serialize(self.xid, **self.values)
+        self.msg_len = len(self.buf)
+
+    def stringify_attrs(self):
+        return iter(sorted(self.values.items()))
+
+
+_lazy_parsing = False
+
+
+def set_lazy_parsing(enabled):
+    """
+    Enables or disables the lazy parsing of the messages which support it.
+
+    When enabled, the parsers of such messages (e.g., OFPPacketIn,
+    OFPFlowRemoved and OFPMultipartReply of OpenFlow 1.3 or later) decode
+    only the fixed part of the message, and the rest (e.g., match, data or
+    body) is decoded on the first access to any of those attributes.
+    Note that errors in the deferred part are raised on that access.
+    """
+    global _lazy_parsing
+    _lazy_parsing = enabled
+
+
+class LazyParseMixin(object):
+    """
+    A mixin for message classes which can defer decoding of the body.
+
+    A subclass lists the attributes decoded from the body in
+    _LAZY_ATTRIBUTES and implements _parse_body() which sets all of them.
+    Its parser() calls _parse_lazy() after decoding the fixed part.
+    """
+
+    _LAZY_ATTRIBUTES = ()
+
+    def _parse_lazy(self):
+        if not _lazy_parsing:
+            self._parse_body()
+            return
+        # Removes the attributes initialized by __init__ so that
+        # __getattr__ is called on the first access.
+        for name in self._LAZY_ATTRIBUTES:
+            self.__dict__.pop(name, None)
+        self.__dict__['_body_pending'] = True
+
+    def _parse_body(self):
+        raise NotImplementedError()
+
+    def _parse_pending_body(self):
+        if self.__dict__.pop('_body_pending', False):
+            self._parse_body()
+            return True
+        return False
+
+    def __getattr__(self, name):
+        if name in self._LAZY_ATTRIBUTES and self._parse_pending_body():
+            return getattr(self, name)
+        raise AttributeError("'%s' object has no attribute '%s'" %
+                             (self.__class__.__name__, name))
+
+    def stringify_attrs(self):
+        self._parse_pending_body()
+        return super(LazyParseMixin, self).stringify_attrs()
+
 
 class MsgInMsgBase(MsgBase):
     @classmethod
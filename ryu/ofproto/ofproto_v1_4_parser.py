@@ -28,6 +28,7 @@ from ryu.lib.pack_utils import msg_pack_into
 from ryu.lib.packet import packet
 from ryu import utils
 from ryu.ofproto.ofproto_parser import StringifyMixin, MsgBase, MsgInMsgBase
+from ryu.ofproto.ofproto_parser import MsgTemplate
 from ryu.ofproto import ether
 from ryu.ofproto import nx_actions
 from ryu.ofproto import ofproto_parser
@@ -784,8 +785,7 @@ class OFPMatch(StringifyMixin):
 
         fields = []
         while length > 0:
-            n, value, mask, field_len = ofproto.oxm_parse(buf, offset)
-            k, uv = ofproto.oxm_to_user(n, value, mask)
+            k, uv, field_len = ofproto.oxm_parse_user(buf, offset)
             fields.append((k, uv))
             offset += field_len
             length -= field_len
@@ -798,14 +798,11 @@ class OFPMatch(StringifyMixin):
         the buf.
         Returns the output length.
         """
-        fields = [ofproto.oxm_from_user(k, uv) for (k, uv)
-                  in self._fields2]
-
         hdr_pack_str = '!HH'
         field_offset = offset + struct.calcsize(hdr_pack_str)
-        for (n, value, mask) in fields:
-            field_offset += ofproto.oxm_serialize(n, value, mask, buf,
-                                                  field_offset)
+        for (k, uv) in self._fields2:
+            field_offset += ofproto.oxm_serialize_user(k, uv, buf,
+                                                       field_offset)
 
         length = field_offset - offset
         msg_pack_into(hdr_pack_str, buf, offset, ofproto.OFPMT_OXM, length)
@@ -1158,7 +1155,7 @@ class OFPBundlePropExperimenter(OFPPropCommonExperimenter4ByteData):
 
 @_register_parser
 @_set_msg_type(ofproto.OFPT_PACKET_IN)
-class OFPPacketIn(MsgBase):
+class OFPPacketIn(ofproto_parser.LazyParseMixin, MsgBase):
     """
     Packet-In message
 
@@ -1215,6 +1212,8 @@ class OFPPacketIn(MsgBase):
                               utils.hex_array(msg.data))
     """
 
+    _LAZY_ATTRIBUTES = ('match', 'data')
+
     def __init__(self, datapath, buffer_id=None, total_len=None, reason=None,
                  table_id=None, cookie=None, match=None, data=None):
         super(OFPPacketIn, self).__init__(datapath)
@@ -1234,24 +1233,25 @@ class OFPPacketIn(MsgBase):
          msg.table_id, msg.cookie) = struct.unpack_from(
             ofproto.OFP_PACKET_IN_PACK_STR,
             msg.buf, ofproto.OFP_HEADER_SIZE)
+        msg._parse_lazy()
+        return msg
 
-        msg.match = OFPMatch.parser(msg.buf, ofproto.OFP_PACKET_IN_SIZE -
-                                    ofproto.OFP_MATCH_SIZE)
+    def _parse_body(self):
+        self.match = OFPMatch.parser(self.buf, ofproto.OFP_PACKET_IN_SIZE -
+                                     ofproto.OFP_MATCH_SIZE)
 
-        match_len = utils.round_up(msg.match.length, 8)
-        msg.data = msg.buf[(ofproto.OFP_PACKET_IN_SIZE -
-                            ofproto.OFP_MATCH_SIZE + match_len + 2):]
+        match_len = utils.round_up(self.match.length, 8)
+        self.data = self.buf[(ofproto.OFP_PACKET_IN_SIZE -
+                              ofproto.OFP_MATCH_SIZE + match_len + 2):]
 
-        if msg.total_len < len(msg.data):
+        if self.total_len < len(self.data):
             # discard padding for 8-byte alignment of OFP packet
-            msg.data = msg.data[:msg.total_len]
-
-        return msg
+            self.data = self.data[:self.total_len]
 
 
 @_register_parser
 @_set_msg_type(ofproto.OFPT_FLOW_REMOVED)
-class OFPFlowRemoved(MsgBase):
+class OFPFlowRemoved(ofproto_parser.LazyParseMixin, MsgBase):
     """
     Flow removed message
 
@@ -1311,6 +1311,8 @@ class OFPFlowRemoved(MsgBase):
                               msg.packet_count, msg.byte_count, msg.match)
     """
 
+    _LAZY_ATTRIBUTES = ('match',)
+
     def __init__(self, datapath, cookie=None, priority=None, reason=None,
                  table_id=None, duration_sec=None, duration_nsec=None,
                  idle_timeout=None, hard_timeout=None, packet_count=None,
@@ -1340,12 +1342,13 @@ class OFPFlowRemoved(MsgBase):
             ofproto.OFP_FLOW_REMOVED_PACK_STR0,
             msg.buf, ofproto.OFP_HEADER_SIZE)
 
-        offset = (ofproto.OFP_FLOW_REMOVED_SIZE - ofproto.OFP_MATCH_SIZE)
-
-        msg.match = OFPMatch.parser(msg.buf, offset)
-
+        msg._parse_lazy()
         return msg
 
+    def _parse_body(self):
+        offset = (ofproto.OFP_FLOW_REMOVED_SIZE - ofproto.OFP_MATCH_SIZE)
+        self.match = OFPMatch.parser(self.buf, offset)
+
 
 class OFPPort(StringifyMixin):
 
@@ -1601,9 +1604,11 @@ class OFPTableMod(MsgBase):
 
 @_register_parser
 @_set_msg_type(ofproto.OFPT_MULTIPART_REPLY)
-class OFPMultipartReply(MsgBase):
+class OFPMultipartReply(ofproto_parser.LazyParseMixin, MsgBase):
     _STATS_MSG_TYPES = {}
 
+    _LAZY_ATTRIBUTES = ('body',)
+
     @staticmethod
     def register_stats_type(body_single_struct=False):
         def _register_stats_type(cls):
@@ -1644,7 +1649,7 @@ class OFPMultipartReply(MsgBase):
     @classmethod
     def parser(cls, datapath, version, msg_type, msg_len, xid, buf):
         type_, flags = struct.unpack_from(
-            ofproto.OFP_MULTIPART_REPLY_PACK_STR, six.binary_type(buf),
+            ofproto.OFP_MULTIPART_REPLY_PACK_STR, buf,
             ofproto.OFP_HEADER_SIZE)
         stats_type_cls = cls._STATS_MSG_TYPES.get(type_)
         msg = super(OFPMultipartReply, stats_type_cls).parser(
@@ -1652,18 +1657,21 @@ class OFPMultipartReply(MsgBase):
         msg.type = type_
         msg.flags = flags
 
+        msg._parse_lazy()
+        return msg
+
+    def _parse_body(self):
         offset = ofproto.OFP_MULTIPART_REPLY_SIZE
         body = []
-        while offset < msg_len:
-            b = stats_type_cls.cls_stats_body_cls.parser(msg.buf, offset)
+        while offset < self.msg_len:
+            b = self.cls_stats_body_cls.parser(self.buf, offset)
             body.append(b)
             offset += b.length if hasattr(b, 'length') else b.len
 
-        if stats_type_cls.cls_body_single_struct:
-            msg.body = body[0]
+        if self.cls_body_single_struct:
+            self.body = body[0]
         else:
-            msg.body = body
-        return msg
+            self.body = body
 
 
 class OFPDescStats(ofproto_parser.namedtuple('OFPDescStats', (
@@ -4236,6 +4244,16 @@ class OFPRequestForward(MsgInMsgBase):
         self.buf += self.request.buf
 
 
+def _output_port_offset(actions, offset):
+    # Returns the offset of the port of the first OFPActionOutput in the
+    # actions serialized at offset, or None.
+    for a in actions:
+        if isinstance(a, OFPActionOutput):
+            return offset + 4
+        offset += a.len
+    return None
+
+
 @_set_msg_type(ofproto.OFPT_PACKET_OUT)
 class OFPPacketOut(MsgBase):
     """
@@ -4297,6 +4315,18 @@ class OFPPacketOut(MsgBase):
                       self.buf, ofproto.OFP_HEADER_SIZE,
                       self.buffer_id, self.in_port, self.actions_len)
 
+    def _template_fields(self):
+        offset = ofproto.OFP_PACKET_OUT_SIZE
+        fields = {
+            'buffer_id': ('!I', ofproto.OFP_HEADER_SIZE),
+            'in_port': ('!I', ofproto.OFP_HEADER_SIZE + 4),
+            'data': (None, offset + self.actions_len),
+        }
+        port_offset = _output_port_offset(self.actions, offset)
+        if port_offset is not None:
+            fields['output_port'] = ('!I', port_offset)
+        return fields
+
     @classmethod
     def from_jsondict(cls, dict_, decode_string=base64.b64decode,
                       **additional_args):
@@ -4433,6 +4463,29 @@ class OFPFlowMod(MsgBase):
             inst.serialize(self.buf, offset)
             offset += inst.len
 
+    def _template_fields(self):
+        # buffer_id follows cookie, cookie_mask, table_id, command,
+        # idle_timeout, hard_timeout and priority.
+        fields = {
+            'buffer_id': ('!I', ofproto.OFP_HEADER_SIZE + 24),
+        }
+        offset = ofproto.OFP_FLOW_MOD_SIZE - ofproto.OFP_MATCH_SIZE
+        in_port_offset = ofproto_parser.oxm_value_offset(
+            self.buf, offset, ofproto.OXM_OF_IN_PORT)
+        if in_port_offset is not None:
+            fields['in_port'] = ('!I', in_port_offset)
+        offset += utils.round_up(self.match.length, 8)
+        for inst in self.instructions:
+            if isinstance(inst, OFPInstructionActions):
+                port_offset = _output_port_offset(
+                    inst.actions,
+                    offset + ofproto.OFP_INSTRUCTION_ACTIONS_SIZE)
+                if port_offset is not None:
+                    fields['output_port'] = ('!I', port_offset)
+                    break
+            offset += inst.len
+        return fields
+
     @classmethod
     def parser(cls, datapath, version, msg_type, msg_len, xid, buf):
         msg = super(OFPFlowMod, cls).parser(
@@ -5041,15 +5094,14 @@ class OFPActionSetField(OFPAction):
     def parser(cls, buf, offset):
         (type_, len_) = struct.unpack_from(
             ofproto.OFP_ACTION_SET_FIELD_PACK_STR, buf, offset)
-        (n, value, mask, _len) = ofproto.oxm_parse(buf, offset + 4)
-        k, uv = ofproto.oxm_to_user(n, value, mask)
+        (k, uv, _len) = ofproto.oxm_parse_user(buf, offset + 4)
         action = cls(**{k: uv})
         action.len = len_
         return action
 
     def serialize(self, buf, offset):
-        n, value, mask = ofproto.oxm_from_user(self.key, self.value)
-        len_ = ofproto.oxm_serialize(n, value, mask, buf, offset + 4)
+        len_ = ofproto.oxm_serialize_user(self.key, self.value, buf,
+                                          offset + 4)
         self.len = utils.round_up(4 + len_, 8)
         msg_pack_into('!HH', buf, offset, self.type, self.len)
         pad_len = self.len - (4 + len_)
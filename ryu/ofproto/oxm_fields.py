@@ -64,6 +64,9 @@
 # | reserved, should be zero      | pbb_uca       |
 # +-------------------------------+---------------+
 
+import struct
+
+from ryu.lib import type_desc
 from ryu.ofproto.oxx_fields import (
     _get_field_info_by_name,
     _from_user,
@@ -154,6 +157,120 @@ class NiciraExtended1(_OxmClass):
     _class = OFPXMC_NXM_1
 
 
+# struct format characters of IntDescr which can be packed as integers
+_INT_FORMATS = {1: 'B', 2: 'H', 4: 'I', 8: 'Q'}
+
+_OXM_HEADER = struct.Struct('!I')
+
+
+class _OxmCodec(object):
+    """
+    Compiled codec of an OXM TLV with a fixed 32-bit header, i.e., a
+    non-experimenter field either with or without mask.
+
+    The header, the value and the mask are packed and unpacked with a
+    single precomputed struct.Struct.  Integer fields are converted by
+    struct itself, and the other fields by the to_user/from_user of their
+    type_desc.
+    """
+
+    def __init__(self, field, hasmask):
+        type_ = field.type
+        self.name = field.name
+        self.hasmask = hasmask
+        value_len = type_.size * 2 if hasmask else type_.size
+        self.header = (field.oxm_type << 9) | (int(hasmask) << 8) | value_len
+        fmt = None
+        if isinstance(type_, type_desc.IntDescr):
+            fmt = _INT_FORMATS.get(type_.size)
+        if fmt is None:
+            fmt = '%ds' % type_.size
+            self.to_user = type_.to_user
+            self.from_user = type_.from_user
+        else:
+            self.to_user = None
+            self.from_user = None
+        if hasmask:
+            fmt *= 2
+        self.struct = struct.Struct('!I' + fmt)
+        self.size = self.struct.size
+
+    def parse(self, buf, offset):
+        to_user = self.to_user
+        if self.hasmask:
+            (_header, value, mask) = self.struct.unpack_from(buf, offset)
+            if to_user is not None:
+                value = to_user(value)
+                mask = to_user(mask)
+            return self.name, (value, mask)
+        (_header, value) = self.struct.unpack_from(buf, offset)
+        if to_user is not None:
+            value = to_user(value)
+        return self.name, value
+
+    def serialize(self, value, mask, buf, offset):
+        from_user = self.from_user
+        if from_user is not None:
+            value = from_user(value)
+            if mask is not None:
+                mask = from_user(mask)
+        needed_len = offset + self.size
+        if len(buf) < needed_len:
+            buf += bytearray(needed_len - len(buf))
+        if self.hasmask:
+            self.struct.pack_into(buf, offset, self.header, value, mask)
+        else:
+            self.struct.pack_into(buf, offset, self.header, value)
+        return self.size
+
+
+def _compile(mod, name_to_field, num_to_field):
+    header_to_codec = {}
+    name_to_codec = {}
+    for f in mod.oxm_types:
+        if isinstance(f.num, tuple):
+            # experimenter OXMs have 64-bit header
+            continue
+        for hasmask in (False, True):
+            codec = _OxmCodec(f, hasmask)
+            if num_to_field[f.num] is f:
+                header_to_codec[codec.header] = codec
+            if name_to_field[f.name] is f:
+                name_to_codec[(f.name, hasmask)] = codec
+    return header_to_codec, name_to_codec
+
+
+def _parse_user(mod, header_to_codec, buf, offset):
+    (header,) = _OXM_HEADER.unpack_from(buf, offset)
+    codec = header_to_codec.get(header)
+    if codec is None:
+        (n, value, mask, field_len) = mod.oxm_parse(buf, offset)
+        (k, uv) = mod.oxm_to_user(n, value, mask)
+        return k, uv, field_len
+    (k, uv) = codec.parse(buf, offset)
+    return k, uv, codec.size
+
+
+def _serialize_user(mod, name_to_codec, k, uv, buf, offset):
+    # the 'list' case below is a bit hack; json.dumps silently maps
+    # python tuples into json lists.
+    if isinstance(uv, (tuple, list)):
+        (value, mask) = uv
+    else:
+        value = uv
+        mask = None
+    codec = name_to_codec.get((k, mask is not None))
+    if codec is not None:
+        try:
+            return codec.serialize(value, mask, buf, offset)
+        except struct.error:
+            # e.g., CIDR notations or out of range integers, which the
+            # generic path below accepts.
+            pass
+    (n, value, mask) = mod.oxm_from_user(k, uv)
+    return mod.oxm_serialize(n, value, mask, buf, offset)
+
+
 def generate(modname):
     import sys
     import functools
@@ -205,6 +322,16 @@ def generate(modname):
     add_attr('oxm_serialize_header',
              functools.partial(_serialize_header, oxx, mod))
 
+    # compiled codecs of the fixed header fields, which are used by
+    # oxm_parse_user and oxm_serialize_user before the generic ones above.
+    (header_to_codec, name_to_codec) = _compile(mod, name_to_field,
+                                                num_to_field)
+    add_attr('oxm_codecs', header_to_codec)
+    add_attr('oxm_parse_user',
+             functools.partial(_parse_user, mod, header_to_codec))
+    add_attr('oxm_serialize_user',
+             functools.partial(_serialize_user, mod, name_to_codec))
+
     add_attr('oxm_to_jsondict', _to_jsondict)
     add_attr('oxm_from_jsondict', _from_jsondict)
 
@@ -4,6 +4,7 @@ import netaddr
 from ryu.services.protocols.bgp.base import SUPPORTED_GLOBAL_RF
 from ryu.services.protocols.bgp.model import OutgoingRoute
 from ryu.services.protocols.bgp.peer import Peer
+from ryu.services.protocols.bgp.update_group import UpdateGroup
 from ryu.lib.packet.bgp import BGPPathAttributeCommunities
 from ryu.lib.packet.bgp import BGP_ATTR_TYPE_MULTI_EXIT_DISC
 from ryu.lib.packet.bgp import BGP_ATTR_TYPE_COMMUNITIES
@@ -30,6 +31,11 @@ class PeerManager(object):
         self._peer_to_rtfilter_map = {}
         self._neighbors_conf = neighbors_conf
 
+        # Update groups
+        # Key: update group key, see Peer._update_group_key()
+        # Value: UpdateGroup instance
+        self._update_groups = {}
+
     @property
     def iterpeers(self):
         return iter(self._peers.values())
@@ -47,9 +53,36 @@ class PeerManager(object):
         neigh_ip_address = neigh_conf.ip_address
         peer = self._peers.get(neigh_ip_address)
         peer.stop()
+        self.leave_update_group(peer)
         del self._peers[neigh_ip_address]
         self._core_service.on_peer_removed(peer)
 
+    @property
+    def update_groups(self):
+        return list(self._update_groups.values())
+
+    def join_update_group(self, peer, key):
+        """Moves given `peer` into the update group of given `key`.
+
+        Returns the update group.
+        """
+        self.leave_update_group(peer)
+        group = self._update_groups.get(key)
+        if group is None:
+            group = UpdateGroup(key)
+            self._update_groups[key] = group
+        group.members.add(peer)
+        LOG.debug('%s joined %s', peer, group)
+        return group
+
+    def leave_update_group(self, peer):
+        group = peer.update_group
+        if group is None:
+            return
+        group.members.discard(peer)
+        if not group.members:
+            self._update_groups.pop(group.key, None)
+
     def get_by_addr(self, addr):
         return self._peers.get(str(netaddr.IPAddress(addr)))
 
@@ -21,11 +21,11 @@
 import abc
 from abc import ABCMeta
 from abc import abstractmethod
-from copy import copy
 import logging
 import functools
 import netaddr
 import six
+import weakref
 
 from ryu.lib.packet.bgp import RF_IPv4_UC
 from ryu.lib.packet.bgp import RouteTargetMembershipNLRI
@@ -62,6 +62,11 @@ class Table(object):
         self._scope_id = scope_id
         self._signal_bus = signal_bus
         self._core_service = core_service
+        # Reverse indexes of the destinations holding paths learned from,
+        # and routes sent to, each peer (key/value: peer/{id(dest): dest}).
+        # These let a peer-down cleanup visit only that peer's prefixes.
+        self._source_dests = {}
+        self._sent_peer_dests = {}
 
     @property
     def route_family(self):
@@ -126,7 +131,7 @@ class Table(object):
         version number. Also removes sent paths to this peer.
         """
         LOG.debug('Cleaning paths from table %s for peer %s', self, peer)
-        for dest in self.values():
+        for dest in self._peer_dests(peer):
             # Remove paths learned from this source
             paths_deleted = dest.remove_old_paths_from_source(peer)
             # Remove sent paths to this peer
@@ -138,6 +143,41 @@ class Table(object):
             if paths_deleted:
                 self._signal_bus.dest_changed(dest)
 
+    def _peer_dests(self, peer):
+        """Returns the destinations holding paths learned from, or routes
+        sent to, `peer`.
+        """
+        dests = dict(self._source_dests.get(peer, {}))
+        dests.update(self._sent_peer_dests.get(peer, {}))
+        return list(dests.values())
+
+    @staticmethod
+    def _index_dest(index, peer, dest):
+        dests = index.get(peer)
+        if dests is None:
+            dests = index[peer] = {}
+        dests[id(dest)] = dest
+
+    @staticmethod
+    def _unindex_dest(index, peer, dest):
+        dests = index.get(peer)
+        if dests is not None:
+            dests.pop(id(dest), None)
+            if not dests:
+                del index[peer]
+
+    def index_path_source(self, source, dest):
+        self._index_dest(self._source_dests, source, dest)
+
+    def unindex_path_source(self, source, dest):
+        self._unindex_dest(self._source_dests, source, dest)
+
+    def index_sent_peer(self, peer, dest):
+        self._index_dest(self._sent_peer_dests, peer, dest)
+
+    def unindex_sent_peer(self, peer, dest):
+        self._unindex_dest(self._sent_peer_dests, peer, dest)
+
     def clean_uninteresting_paths(self, interested_rts):
         """Cleans table of any path that do not have any RT in common
          with `interested_rts`.
@@ -226,7 +266,7 @@ class NonVrfPathProcessingMixin(object):
 
     def __init__(self):
         self._core_service = None  # not assigned yet
-        self._known_path_list = []
+        self._known_path_map = OrderedDict()
 
     def _best_path_lost(self):
         self._best_path = None
@@ -244,7 +284,7 @@ class NonVrfPathProcessingMixin(object):
 
             # Have to clear sent_route list for this destination as
             # best path is removed.
-            self._sent_routes = {}
+            self._clear_sent_routes()
 
     def _new_best_path(self, new_best_path):
         old_best_path = self._best_path
@@ -253,11 +293,12 @@ class NonVrfPathProcessingMixin(object):
 
         # If old best path was withdrawn
         if (old_best_path and
-                old_best_path not in self._known_path_list and
+                self._known_path_map.get(self._path_key(old_best_path)) is not
+                old_best_path and
                 self._sent_routes):
             # Have to clear sent_route list for this destination as
             # best path is removed.
-            self._sent_routes = {}
+            self._clear_sent_routes()
 
         # Communicate that we have new best path to all qualifying
         # bgp-peers.
@@ -273,7 +314,7 @@ class NonVrfPathProcessingMixin(object):
                 sent_route.sent_peer.enque_outgoing_msg(outgoing_route)
                 LOG.debug('Sending withdrawal to %s for %s',
                           sent_route.sent_peer, outgoing_route)
-                self._sent_routes = {}
+                self._clear_sent_routes()
 
 
 @six.add_metaclass(ABCMeta)
@@ -299,8 +340,13 @@ class Destination(object):
 
         self._nlri = nlri
 
-        # List of all known processed paths,
-        self._known_path_list = []
+        # All known processed paths by the key of _path_key(), in the order
+        # they are learned. At most one known path per key, so that
+        # withdrawals match in constant time.
+        self._known_path_map = OrderedDict()
+
+        # Number of known paths per source (key/value: source/count).
+        self._source_path_counts = {}
 
         # List of new un-processed paths.
         self._new_path_list = []
@@ -350,7 +396,7 @@ class Destination(object):
 
     @property
     def known_path_list(self):
-        return self._known_path_list[:]
+        return list(self._known_path_map.values())
 
     @property
     def sent_routes(self):
@@ -366,13 +412,20 @@ class Destination(object):
 
     def add_sent_route(self, sent_route):
         self._sent_routes[sent_route.sent_peer] = sent_route
+        self._table.index_sent_peer(sent_route.sent_peer, self)
 
     def remove_sent_route(self, peer):
         if self.was_sent_to(peer):
             del self._sent_routes[peer]
+            self._table.unindex_sent_peer(peer, self)
             return True
         return False
 
+    def _clear_sent_routes(self):
+        for peer in self._sent_routes:
+            self._table.unindex_sent_peer(peer, self)
+        self._sent_routes = {}
+
     def was_sent_to(self, peer):
         if peer in self._sent_routes.keys():
             return True
@@ -396,7 +449,7 @@ class Destination(object):
 
         if new_best_path is None:
             # we lost best path
-            assert not self._known_path_list, repr(self._known_path_list)
+            assert not self._known_path_map, repr(self._known_path_map)
             return self._best_path_lost()
         else:
             return self._new_best_path(new_best_path)
@@ -419,12 +472,40 @@ class Destination(object):
 
     def process(self):
         self._process()
-        if not self._known_path_list and not self._best_path:
+        if not self._known_path_map and not self._best_path:
             self._remove_dest_from_table()
 
     def _remove_dest_from_table(self):
         self._table.delete_dest(self)
 
+    def _path_key(self, path):
+        """Returns the key identifying the paths which replace or withdraw
+        each other in this destination.
+        """
+        return path.source
+
+    def _add_known_path(self, path):
+        # The caller removes the known path of the same key first.
+        self._known_path_map[self._path_key(path)] = path
+        source = path.source
+        if source is None:
+            return
+        count = self._source_path_counts.get(source, 0)
+        self._source_path_counts[source] = count + 1
+        if not count:
+            self._table.index_path_source(source, self)
+
+    def _remove_known_path(self, path):
+        del self._known_path_map[self._path_key(path)]
+        source = path.source
+        if source is None:
+            return
+        count = self._source_path_counts.pop(source) - 1
+        if count:
+            self._source_path_counts[source] = count
+        else:
+            self._table.unindex_path_source(source, self)
+
     def remove_old_paths_from_source(self, source):
         """Removes known old paths from *source*.
 
@@ -432,17 +513,14 @@ class Destination(object):
         removed/deleted.
         """
         assert(source and hasattr(source, 'version_num'))
-        removed_paths = []
-        # Iterate over the paths in reverse order as we want to delete paths
-        # whose source is this peer.
         source_ver_num = source.version_num
-        for path_idx in range(len(self._known_path_list) - 1, -1, -1):
-            path = self._known_path_list[path_idx]
-            if (path.source == source and
-                    path.source_version_num < source_ver_num):
-                # If this peer is source of any paths, remove those path.
-                del(self._known_path_list[path_idx])
-                removed_paths.append(path)
+        if source not in self._source_path_counts:
+            return []
+        removed_paths = [path for path in self._known_path_map.values()
+                         if (path.source == source and
+                             path.source_version_num < source_ver_num)]
+        for path in removed_paths:
+            self._remove_known_path(path)
         return removed_paths
 
     def withdraw_if_sent_to(self, peer):
@@ -461,6 +539,7 @@ class Destination(object):
         sent_route = self._sent_routes.pop(peer, None)
         if not sent_route:
             return False
+        self._table.unindex_sent_peer(peer, self)
 
         sent_path = sent_route.path
         withdraw_clone = sent_path.clone(for_withdrawal=True)
@@ -484,31 +563,34 @@ class Destination(object):
 
         # Have to select best-path from available paths and new paths.
         # If we do not have any paths, then we no longer have best path.
-        if not self._known_path_list and len(self._new_path_list) == 1:
+        if not self._known_path_map and len(self._new_path_list) == 1:
             # If we do not have any old but one new path
             # it becomes best path.
-            self._known_path_list.append(self._new_path_list[0])
-            del(self._new_path_list[0])
-            return self._known_path_list[0], BPR_ONLY_PATH
+            new_path = self._new_path_list.pop()
+            self._add_known_path(new_path)
+            return new_path, BPR_ONLY_PATH
 
-        # If we have a new version of old/known path we use it and delete old
-        # one.
-        self._remove_old_paths()
-
-        # Collect all new paths into known paths.
-        self._known_path_list.extend(self._new_path_list)
-
-        # Clear new paths as we copied them.
-        del(self._new_path_list[:])
+        # Collect all new paths into known paths. If we have a new version of
+        # old/known path we use it and delete old one.
+        new_paths = self._add_new_paths()
 
         # If we do not have any paths to this destination, then we do not have
         # new best path.
-        if not self._known_path_list:
+        if not self._known_path_map:
             return None, BPR_UNKNOWN
-
-        # Compute new best path
-        current_best_path, reason = self._compute_best_known_path()
-        return current_best_path, reason
+        if len(self._known_path_map) == 1:
+            return next(iter(self._known_path_map.values())), BPR_ONLY_PATH
+
+        # If the current best path is still known, the new best path is
+        # either the current one or one of the new paths. Otherwise, the
+        # current best path was withdrawn or replaced, so we compute new best
+        # path among all known paths.
+        best_path = self._best_path
+        if (best_path is None or
+                self._known_path_map.get(self._path_key(best_path)) is not
+                best_path):
+            return self._compute_best_known_path()
+        return self._compute_best_new_path(best_path, new_paths)
 
     def _remove_withdrawals(self):
         """Removes withdrawn paths.
@@ -528,74 +610,70 @@ class Destination(object):
 
         # If we have some withdrawals and no know-paths, it means it is safe to
         # delete these withdraws.
-        if not self._known_path_list:
+        if not self._known_path_map:
             LOG.debug('Found %s withdrawals for path(s) that did not get'
                       ' installed.', len(self._withdraw_list))
             del(self._withdraw_list[:])
             return
 
         # If we have some known paths and some withdrawals, we find matches and
-        # delete them first.
-        matches = set()
-        w_matches = set()
-        # Match all withdrawals from destination paths.
+        # delete them first. One withdraw can remove only one path.
+        unmatched = []
         for withdraw in self._withdraw_list:
-            match = None
-            for path in self._known_path_list:
-                # We have a match if the source are same.
-                if path.source == withdraw.source:
-                    match = path
-                    matches.add(path)
-                    w_matches.add(withdraw)
-                    # One withdraw can remove only one path.
-                    break
-            # We do no have any match for this withdraw.
-            if not match:
+            path = self._known_path_map.get(self._path_key(withdraw))
+            if path is None:
+                # We do no have any match for this withdraw.
                 LOG.debug('No matching path for withdraw found, may be path '
                           'was not installed into table: %s',
                           withdraw)
+                unmatched.append(withdraw)
+                continue
+            self._remove_known_path(path)
+
         # If we have partial match.
-        if len(matches) != len(self._withdraw_list):
+        if unmatched:
             LOG.debug('Did not find match for some withdrawals. Number of '
                       'matches(%s), number of withdrawals (%s)',
-                      len(matches), len(self._withdraw_list))
+                      len(self._withdraw_list) - len(unmatched),
+                      len(self._withdraw_list))
 
-        # Clear matching paths and withdrawals.
-        for match in matches:
-            self._known_path_list.remove(match)
-        for w_match in w_matches:
-            self._withdraw_list.remove(w_match)
+        # Clear matching withdrawals.
+        self._withdraw_list[:] = unmatched
 
-    def _remove_old_paths(self):
-        """Identifies which of known paths are old and removes them.
+    def _add_new_paths(self):
+        """Moves new paths to known paths.
 
         Known paths will no longer have paths whose new version is present in
-        new paths.
+        new paths. Returns the new paths added to known paths.
         """
-        new_paths = self._new_path_list
-        known_paths = self._known_path_list
+        new_paths = self._new_path_list[:]
         for new_path in new_paths:
-            old_paths = []
-            for path in known_paths:
-                # Here we just check if source is same and not check if path
-                # version num. as new_paths are implicit withdrawal of old
-                # paths and when doing RouteRefresh (not EnhancedRouteRefresh)
-                # we get same paths again.
-                if new_path.source == path.source:
-                    old_paths.append(path)
-                    break
-
-            for old_path in old_paths:
-                known_paths.remove(old_path)
+            # Here we just check if source is same and not check if path
+            # version num. as new_paths are implicit withdrawal of old
+            # paths and when doing RouteRefresh (not EnhancedRouteRefresh)
+            # we get same paths again.
+            old_path = self._known_path_map.get(self._path_key(new_path))
+            if old_path is not None:
+                self._remove_known_path(old_path)
                 LOG.debug('Implicit withdrawal of old path, since we have'
                           ' learned new path from same source: %s', old_path)
+            self._add_known_path(new_path)
+
+        # Clear new paths as we copied them.
+        del(self._new_path_list[:])
+
+        # A new path might have been replaced by a later one from the same
+        # source.
+        return [new_path for new_path in new_paths
+                if self._known_path_map.get(self._path_key(new_path)) is
+                new_path]
 
     def _compute_best_known_path(self):
         """Computes the best path among known paths.
 
         Returns current best path among `known_paths`.
         """
-        if not self._known_path_list:
+        if not self._known_path_map:
             from ryu.services.protocols.bgp.processor import BgpProcessorError
             raise BgpProcessorError(desc='Need at-least one known path to'
                                     ' compute best path')
@@ -603,9 +681,10 @@ class Destination(object):
         # We pick the first path as current best path. This helps in breaking
         # tie between two new paths learned in one cycle for which best-path
         # calculation steps lead to tie.
-        current_best_path = self._known_path_list[0]
+        paths = iter(self._known_path_map.values())
+        current_best_path = next(paths)
         best_path_reason = BPR_ONLY_PATH
-        for next_path in self._known_path_list[1:]:
+        for next_path in paths:
             from ryu.services.protocols.bgp.processor import compute_best_path
             # Compare next path with current best path.
             new_best_path, reason = \
@@ -617,6 +696,24 @@ class Destination(object):
 
         return current_best_path, best_path_reason
 
+    def _compute_best_new_path(self, best_path, new_paths):
+        """Computes the best path among current best path and new paths.
+
+        Returns `best_path` unless one of `new_paths` is better.
+        """
+        from ryu.services.protocols.bgp.processor import compute_best_path
+        best_path_reason = self._best_path_reason
+        for new_path in new_paths:
+            # Compare new path with current best path.
+            new_best_path, reason = \
+                compute_best_path(self._core_service.asn, best_path,
+                                  new_path)
+            best_path_reason = reason
+            if new_best_path is not None:
+                best_path = new_best_path
+
+        return best_path, best_path_reason
+
     def withdraw_uninteresting_paths(self, interested_rts):
         """Withdraws paths that are no longer interesting.
 
@@ -626,7 +723,7 @@ class Destination(object):
         Returns True if we added any withdraws.
         """
         add_withdraws = False
-        for path in self._known_path_list:
+        for path in self._known_path_map.values():
             if not path.has_rts_in(interested_rts):
                 self.withdraw_path(path)
                 add_withdraws = True
@@ -641,18 +738,18 @@ class Destination(object):
     def to_dict(self):
         return {'table': str(self._table),
                 'nlri': str(self._nlri),
-                'paths': self._known_path_list[:],
+                'paths': self.known_path_list,
                 'withdraws': self._get_num_withdraws()}
 
     def __str__(self):
         return ('Destination(table: %s, nlri: %s, paths: %s, withdraws: %s,'
                 ' new paths: %s)' % (self._table, str(self._nlri),
-                                     len(self._known_path_list),
+                                     len(self._known_path_map),
                                      len(self._withdraw_list),
                                      len(self._new_path_list)))
 
     def _get_num_valid_paths(self):
-        return len(self._known_path_list)
+        return len(self._known_path_map)
 
     def _get_num_withdraws(self):
         return len(self._withdraw_list)
@@ -688,6 +785,103 @@ class Destination(object):
         return str(self) >= str(other)
 
 
+class PathAttrSet(object):
+    """An immutable set of path attributes shared by paths.
+
+    Paths with identical path attributes, e.g. the paths of an UPDATE
+    message or the paths of the same route from several peers, share an
+    interned `PathAttrSet` given by `PathAttrSet.intern`, so that the path
+    attributes are stored only once.  Interned sets with identical path
+    attributes are the same object, so they can be compared by identity
+    and used as keys of dicts cheaply.  An interned set is released when
+    no path refers to it any more.
+
+    Supports read-only dict operations on the path attributes by their
+    types.
+    """
+    __slots__ = ('_map', 'best_path_key', '__weakref__')
+
+    # Interned sets
+    # Key: tuple of (type, flags, serialized value) of the path attributes
+    # Value: PathAttrSet instance
+    _interned = weakref.WeakValueDictionary()
+
+    # Path attributes and set interned last, which the paths of the same
+    # UPDATE message share without serializing the path attributes again.
+    _last = ((), None)
+
+    def __init__(self, items=()):
+        self._map = OrderedDict(items)
+        # Cache of processor.best_path_key() of the paths sharing this set.
+        self.best_path_key = None
+
+    @classmethod
+    def intern(cls, pattrs):
+        """Returns the interned set of given path attributes.
+
+        `pattrs` is a dict of path attributes by their types, or a
+        `PathAttrSet`.
+        """
+        if isinstance(pattrs, PathAttrSet):
+            # Only interned sets are handed out.
+            return pattrs
+        items = tuple(pattrs.items()) if pattrs else ()
+        last_items, last_set = cls._last
+        if (last_set is not None and len(last_items) == len(items) and
+                all(t1 == t2 and a1 is a2
+                    for (t1, a1), (t2, a2) in zip(last_items, items))):
+            return last_set
+
+        attr_set = cls(items)
+        key = attr_set._key()
+        interned = cls._interned.get(key)
+        if interned is None:
+            cls._interned[key] = attr_set
+            interned = attr_set
+        cls._last = (items, interned)
+        return interned
+
+    @classmethod
+    def interned_count(cls):
+        """Returns the number of interned sets in use."""
+        return len(cls._interned)
+
+    def _key(self):
+        return tuple((attr_type, attr.flags, bytes(attr.serialize_value()))
+                     for attr_type, attr in self._map.items())
+
+    def __contains__(self, attr_type):
+        return attr_type in self._map
+
+    def __getitem__(self, attr_type):
+        return self._map[attr_type]
+
+    def __iter__(self):
+        return iter(self._map)
+
+    def __len__(self):
+        return len(self._map)
+
+    def get(self, attr_type, default=None):
+        return self._map.get(attr_type, default)
+
+    def keys(self):
+        return self._map.keys()
+
+    def values(self):
+        return self._map.values()
+
+    def items(self):
+        return self._map.items()
+
+    def copy(self):
+        """Returns a mutable copy of the path attributes."""
+        return OrderedDict(self._map)
+
+    def __repr__(self):
+        return repr(self._map)
+
+
 @six.add_metaclass(ABCMeta)
 class Path(object):
     """Represents a way of reaching an IP destination.
@@ -740,11 +934,9 @@ class Path(object):
         # The entity (peer) that gave us this path.
         self._source = source
 
-        # Path attribute of this path.
-        if pattrs:
-            self._path_attr_map = copy(pattrs)
-        else:
-            self._path_attr_map = OrderedDict()
+        # Path attribute of this path, shared by the paths with identical
+        # path attributes.
+        self._path_attr_map = PathAttrSet.intern(pattrs)
 
         # NLRI that this path represents.
         self._nlri = nlri
@@ -791,7 +983,12 @@ class Path(object):
 
     @property
     def pathattr_map(self):
-        return copy(self._path_attr_map)
+        return self._path_attr_map.copy()
+
+    @property
+    def pathattr_set(self):
+        """The interned `PathAttrSet` of this path."""
+        return self._path_attr_map
 
     @property
     def nexthop(self):
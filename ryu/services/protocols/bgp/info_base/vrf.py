@@ -434,85 +434,10 @@ class VrfDest(Destination):
             LOG.debug('VRF table %s has new best path: %s',
                       self._route_dist, self.best_path)
 
-    def _remove_withdrawals(self):
-        """Removes withdrawn paths.
-
-        Note:
-        We may have disproportionate number of withdraws compared to know paths
-        since not all paths get installed into the table due to bgp policy and
-        we can receive withdraws for such paths and withdrawals may not be
-        stopped by the same policies.
-        """
-
-        LOG.debug('Removing %s withdrawals', len(self._withdraw_list))
-
-        # If we have not withdrawals, we have nothing to do.
-        if not self._withdraw_list:
-            return
-
-        # If we have some withdrawals and no know-paths, it means it is safe to
-        # delete these withdraws.
-        if not self._known_path_list:
-            LOG.debug('Found %s withdrawals for path(s) that did not get'
-                      ' installed.', len(self._withdraw_list))
-            del (self._withdraw_list[:])
-            return
-
-        # If we have some known paths and some withdrawals, we find matches and
-        # delete them first.
-        matches = []
-        w_matches = []
-        # Match all withdrawals from destination paths.
-        for withdraw in self._withdraw_list:
-            match = None
-            for path in self._known_path_list:
-                # We have a match if the source are same.
-                if path.puid == withdraw.puid:
-                    match = path
-                    matches.append(path)
-                    w_matches.append(withdraw)
-                    # One withdraw can remove only one path.
-                    break
-                # We do no have any match for this withdraw.
-            if not match:
-                LOG.debug('No matching path for withdraw found, may be path '
-                          'was not installed into table: %s',
-                          withdraw)
-            # If we have partial match.
-        if len(matches) != len(self._withdraw_list):
-            LOG.debug('Did not find match for some withdrawals. Number of '
-                      'matches(%s), number of withdrawals (%s)',
-                      len(matches), len(self._withdraw_list))
-
-        # Clear matching paths and withdrawals.
-        for match in matches:
-            self._known_path_list.remove(match)
-        for w_match in w_matches:
-            self._withdraw_list.remove(w_match)
-
-    def _remove_old_paths(self):
-        """Identifies which of known paths are old and removes them.
-
-        Known paths will no longer have paths whose new version is present in
-        new paths.
-        """
-        new_paths = self._new_path_list
-        known_paths = self._known_path_list
-        for new_path in new_paths:
-            old_paths = []
-            for path in known_paths:
-                # Here we just check if source is same and not check if path
-                # version num. as new_paths are implicit withdrawal of old
-                # paths and when doing RouteRefresh (not EnhancedRouteRefresh)
-                # we get same paths again.
-                if new_path.puid == path.puid:
-                    old_paths.append(path)
-                    break
-
-            for old_path in old_paths:
-                known_paths.remove(old_path)
-                LOG.debug('Implicit withdrawal of old path, since we have'
-                          ' learned new path from same source: %s', old_path)
+    def _path_key(self, path):
+        # VRF paths imported from the global table share their source, so
+        # they replace or withdraw each other by the path ID instead.
+        return path.puid
 
     def _validate_path(self, path):
         if not path or not hasattr(path, 'label_list'):
@@ -44,6 +44,7 @@ from ryu.services.protocols.bgp.info_base.vpnv6 import Vpnv6Path
 from ryu.services.protocols.bgp.rtconf.vrfs import VRF_RF_IPV4, VRF_RF_IPV6
 from ryu.services.protocols.bgp.utils import bgp as bgp_utils
 from ryu.services.protocols.bgp.utils.evtlet import EventletIOFactory
+from ryu.services.protocols.bgp.utils.packer import update_prefixes
 from ryu.services.protocols.bgp.utils import stats
 from ryu.services.protocols.bgp.utils.validation import is_valid_old_asn
 
@@ -131,6 +132,7 @@ PeerCounterNames = namedtuple(
     ('RECV_PREFIXES',
      'RECV_UPDATES',
      'SENT_UPDATES',
+     'SENT_PREFIXES',
      'RECV_NOTIFICATION',
      'SENT_NOTIFICATION',
      'SENT_REFRESH',
@@ -140,6 +142,7 @@ PeerCounterNames = namedtuple(
     'recv_prefixes',
     'recv_updates',
     'sent_updates',
+    'sent_prefixes',
     'recv_notification',
     'sent_notification',
     'sent_refresh',
@@ -164,6 +167,7 @@ class PeerState(object):
             'recv_prefixes': 0,
             'recv_updates': 0,
             'sent_updates': 0,
+            'sent_prefixes': 0,
             'recv_notification': 0,
             'sent_notification': 0,
             'sent_refresh': 0,
@@ -256,6 +260,16 @@ class PeerState(object):
         return (self.get_count(PeerCounterNames.SENT_REFRESH) +
                 self.get_count(PeerCounterNames.SENT_UPDATES))
 
+    @property
+    def prefixes_per_update_sent(self):
+        """Returns average number of prefixes advertised or withdrawn per
+        UPDATE message sent to this peer.
+        """
+        updates = self.get_count(PeerCounterNames.SENT_UPDATES)
+        if updates == 0:
+            return 0.0
+        return float(self.get_count(PeerCounterNames.SENT_PREFIXES)) / updates
+
     @property
     def total_msg_recv(self):
         """Returns total number of UPDATE, NOTIFICATION and ROUTE_REFRESH
@@ -277,6 +291,7 @@ class PeerState(object):
             stats.UPDATE_MSG_OUT: self.get_count(
                 PeerCounterNames.SENT_UPDATES
             ),
+            stats.PREFIXES_PER_UPDATE_OUT: self.prefixes_per_update_sent,
             stats.TOTAL_MSG_IN: self.total_msg_recv,
             stats.TOTAL_MSG_OUT: self.total_msg_sent,
             stats.FMS_EST_TRANS: self.get_count(
@@ -299,6 +314,9 @@ class Peer(Source, Sink, NeighborConfListener, Activity):
 
     RTC_EOR_TIMER_NAME = 'RTC_EOR_Timer'
 
+    # Maximum number of outgoing routes packed at once.
+    OUTGOING_ROUTE_BATCH = 1000
+
     def __init__(self, common_conf, neigh_conf,
                  core_service, signal_bus, peer_manager):
         peer_activity_name = 'Peer: %s' % neigh_conf.ip_address
@@ -374,6 +392,9 @@ class Peer(Source, Sink, NeighborConfListener, Activity):
         # attribute maps
         self._attribute_maps = {}
 
+        # Update group, see _get_update_group()
+        self._update_group = None
+
     @property
     def remote_as(self):
         return self._neigh_conf.remote_as
@@ -442,6 +463,10 @@ class Peer(Source, Sink, NeighborConfListener, Activity):
     def adj_rib_out(self):
         return self._adj_rib_out
 
+    @property
+    def update_group(self):
+        return self._update_group
+
     @property
     def is_route_server_client(self):
         return self._neigh_conf.is_route_server_client
@@ -706,30 +731,26 @@ class Peer(Source, Sink, NeighborConfListener, Activity):
                               self._enqueue_eor_msg, rr_msg)
             LOG.debug('Enhanced RR max. EOR timer set.')
 
-    def _send_outgoing_route(self, outgoing_route):
-        """Constructs `Update` message from given `outgoing_route` and sends
-        it to peer.
+    def _prepare_outgoing_route(self, outgoing_route):
+        """Constructs `Update` message from given `outgoing_route`.
 
         Also, checks if any policies prevent sending this message.
         Populates Adj-RIB-out with corresponding `SentRoute`.
+        Returns the update message, or None if the route is blocked.
         """
 
         path = outgoing_route.path
-        block, blocked_cause = self._apply_out_filter(path)
+        # The out-filters and update construction run once per update
+        # group for the same path.
+        block, blocked_cause, update_msg = self._update_group.prepare(
+            self, path)
 
         nlri_str = outgoing_route.path.nlri.formatted_nlri_str
         sent_route = SentRoute(outgoing_route.path, self, block)
         self._adj_rib_out[nlri_str] = sent_route
         self._signal_bus.adj_rib_out_changed(self, sent_route)
 
-        # TODO(PH): optimized by sending several prefixes per update.
-        # Construct and send update message.
-        if not block:
-            update_msg = self._construct_update(outgoing_route)
-            self._protocol.send(update_msg)
-            # Collect update statistics.
-            self.state.incr(PeerCounterNames.SENT_UPDATES)
-        else:
+        if block:
             LOG.debug('prefix : %s is not sent by filter : %s',
                       path.nlri, blocked_cause)
 
@@ -741,11 +762,110 @@ class Peer(Source, Sink, NeighborConfListener, Activity):
             tm = self._core_service.table_manager
             tm.remember_sent_route(sent_route)
 
+        return update_msg
+
+    def _update_group_key(self):
+        """Returns the key of the update group of this peer.
+
+        Peers of the same key construct the same update for the same path,
+        so the key covers everything `_apply_out_filter` and
+        `_construct_update` depend on except the path.
+        """
+        neigh_conf = self._neigh_conf
+        common_conf = self._common_conf
+        return (self.local_as,
+                self.is_ebgp_peer(),
+                self.is_route_server_client,
+                self.is_route_reflector_client,
+                self.is_four_octet_as_number_cap_valid(),
+                neigh_conf.next_hop or self.host_bind_ip,
+                neigh_conf.is_next_hop_self,
+                neigh_conf.multi_exit_disc,
+                tuple(neigh_conf.soo_list or ()),
+                common_conf.router_id,
+                common_conf.cluster_id,
+                common_conf.local_pref,
+                repr(self._out_filters),
+                repr(sorted(self._attribute_maps.items())))
+
+    def _outgoing_attrs_key(self, path):
+        """Returns what identifies the path attributes, other than NLRI, of
+        the update `_construct_update` constructs for `path`, or None if it
+        can not be told without serializing them.
+
+        Besides the configuration of the update group, they depend only on
+        the interned path attributes, the next hop and the source of the
+        path, unless attribute maps apply to the prefix.
+        """
+        if path.is_withdraw or self._attribute_maps:
+            return None
+        source = path.source if self.is_route_reflector_client else None
+        return (path.pathattr_set, path.nexthop, path.is_local(), source)
+
+    def _get_update_group(self):
+        # The configuration may change at any time, so the update group is
+        # looked up again for every batch of outgoing routes.
+        key = self._update_group_key()
+        if self._update_group is None or self._update_group.key != key:
+            self._update_group = self._peer_manager.join_update_group(
+                self, key)
+        return self._update_group
+
+    def _send_update(self, update_msg, data=None):
+        self._protocol.send(update_msg, data)
+        # Collect update statistics.
+        self.state.incr(PeerCounterNames.SENT_UPDATES)
+        self.state.incr(PeerCounterNames.SENT_PREFIXES,
+                        update_prefixes(update_msg))
+
+    def _send_outgoing_route(self, outgoing_route):
+        """Constructs `Update` message from given `outgoing_route` and sends
+        it to peer.
+        """
+        self._send_outgoing_routes([outgoing_route])
+
+    def _send_outgoing_routes(self, outgoing_routes):
+        """Constructs `Update` messages from given `outgoing_routes` and sends
+        them to peer.
+
+        Prefixes of the routes with identical path attributes are packed
+        into as few updates as possible, and only the last of the routes
+        for the same prefix is sent.  The peers of the same update group
+        share the updates and their serialized data.
+        """
+        update_group = self._get_update_group()
+        items = []
+        for outgoing_route in outgoing_routes:
+            update_msg = self._prepare_outgoing_route(outgoing_route)
+            if update_msg is not None:
+                path = outgoing_route.path
+                items.append(((path.route_family,
+                               path.nlri.formatted_nlri_str), update_msg,
+                              self._outgoing_attrs_key(path)))
+
+        for update_msg, data in update_group.pack(items):
+            self._send_update(update_msg, data)
+
+    def _pop_outgoing_routes(self, outgoing_route):
+        # Returns the consecutive outgoing routes from the head of the
+        # queue, up to OUTGOING_ROUTE_BATCH, and the message following
+        # them, if any.
+        outgoing_routes = [outgoing_route]
+        while len(outgoing_routes) < self.OUTGOING_ROUTE_BATCH:
+            outgoing_msg = self.outgoing_msg_list.pop_first()
+            if not isinstance(outgoing_msg, OutgoingRoute):
+                return outgoing_routes, outgoing_msg
+            outgoing_routes.append(outgoing_msg)
+        return outgoing_routes, None
+
     def _process_outgoing_msg_list(self):
+        next_msg = None
         while True:
             outgoing_msg = None
 
-            if self._protocol is not None:
+            if next_msg is not None:
+                outgoing_msg, next_msg = next_msg, None
+            elif self._protocol is not None:
                 # We pick the first outgoing msg. available and send it.
                 outgoing_msg = self.outgoing_msg_list.pop_first()
 
@@ -766,14 +886,17 @@ class Peer(Source, Sink, NeighborConfListener, Activity):
             if isinstance(outgoing_msg, BGPRouteRefresh):
                 self._send_outgoing_route_refresh_msg(outgoing_msg)
             elif isinstance(outgoing_msg, OutgoingRoute):
-                self._send_outgoing_route(outgoing_msg)
+                # Routes queued back to back are sent together so that
+                # their prefixes can be packed into fewer updates.
+                outgoing_routes, next_msg = self._pop_outgoing_routes(
+                    outgoing_msg)
+                self._send_outgoing_routes(outgoing_routes)
 
             # EOR are enqueued as plain Update messages.
             elif isinstance(outgoing_msg, BGPUpdate):
-                self._protocol.send(outgoing_msg)
+                self._send_update(outgoing_msg)
                 LOG.debug('Update %s>> %s', self._neigh_conf.ip_address,
                           outgoing_msg)
-                self.state.incr(PeerCounterNames.SENT_UPDATES)
 
     def request_route_refresh(self, *route_families):
         """Request route refresh to peer for given `route_families`.
@@ -911,7 +1034,9 @@ class Peer(Source, Sink, NeighborConfListener, Activity):
         if tmp_list:
             new_as_path_list.insert(0, tmp_list)
 
-        return bgp.BGPPathAttributeAsPath(new_as_path_list)
+        # The constructed AS_PATH may contain Four-Octet AS numbers.
+        return bgp.BGPPathAttributeAsPath(new_as_path_list,
+                                          as_pack_str='!I')
 
     def _trans_as_path(self, as_path_list):
         """Translates Four-Octet AS number to AS_TRANS and separates
@@ -1186,7 +1311,8 @@ class Peer(Source, Sink, NeighborConfListener, Activity):
             if path_extcomm_attr:
                 # SOO list can be configured per VRF and/or per Neighbor.
                 # NeighborConf has this setting we add this to existing list.
-                communities = path_extcomm_attr.communities
+                # Path attributes are shared, so do not modify them.
+                communities = list(path_extcomm_attr.communities)
                 if self._neigh_conf.soo_list:
                     # construct extended community
                     soo_list = self._neigh_conf.soo_list
@@ -176,6 +176,9 @@ BPR_IGP_COST = 'IGP Cost'
 BPR_ROUTER_ID = 'Router ID'
 BPR_CLUSTER_LIST = 'Cluster List'
 
+# Reasons of the steps compared by _cmp_by_path_key, in order.
+_PATH_KEY_REASONS = (BPR_ASPATH, BPR_ORIGIN, BPR_MED)
+
 
 def _compare_by_version(path1, path2):
     """Returns the current/latest learned path.
@@ -228,6 +231,10 @@ def compute_best_path(local_asn, path1, path2):
     best_path = None
     best_path_reason = BPR_UNKNOWN
 
+    # Paths sharing the interned path attributes tie on the steps which
+    # compare only path attributes, so those steps are skipped.
+    same_attrs = path1.pathattr_set is path2.pathattr_set
+
     # Follow best path calculation algorithm steps.
     if best_path is None:
         best_path = _cmp_by_reachable_nh(path1, path2)
@@ -235,21 +242,15 @@ def compute_best_path(local_asn, path1, path2):
     if best_path is None:
         best_path = _cmp_by_highest_wg(path1, path2)
         best_path_reason = BPR_HIGHEST_WEIGHT
-    if best_path is None:
+    if best_path is None and not same_attrs:
         best_path = _cmp_by_local_pref(path1, path2)
         best_path_reason = BPR_LOCAL_PREF
     if best_path is None:
         best_path = _cmp_by_local_origin(path1, path2)
         best_path_reason = BPR_LOCAL_ORIGIN
-    if best_path is None:
-        best_path = _cmp_by_aspath(path1, path2)
-        best_path_reason = BPR_ASPATH
-    if best_path is None:
-        best_path = _cmp_by_origin(path1, path2)
-        best_path_reason = BPR_ORIGIN
-    if best_path is None:
-        best_path = _cmp_by_med(path1, path2)
-        best_path_reason = BPR_MED
+    if best_path is None and not same_attrs:
+        # Steps 5, 6 and 7 at once.
+        best_path, best_path_reason = _cmp_by_path_key(path1, path2)
     if best_path is None:
         best_path = _cmp_by_asn(local_asn, path1, path2)
         best_path_reason = BPR_ASN
@@ -259,7 +260,7 @@ def compute_best_path(local_asn, path1, path2):
     if best_path is None:
         best_path = _cmp_by_router_id(local_asn, path1, path2)
         best_path_reason = BPR_ROUTER_ID
-    if best_path is None:
+    if best_path is None and not same_attrs:
         best_path = _cmp_by_cluster_list(path1, path2)
         best_path_reason = BPR_CLUSTER_LIST
     if best_path is None:
@@ -268,6 +269,58 @@ def compute_best_path(local_asn, path1, path2):
     return best_path, best_path_reason
 
 
+def _get_origin_pref(origin):
+    if origin.value == BGP_ATTR_ORIGIN_IGP:
+        return 3
+    elif origin.value == BGP_ATTR_ORIGIN_EGP:
+        return 2
+    elif origin.value == BGP_ATTR_ORIGIN_INCOMPLETE:
+        return 1
+    else:
+        LOG.error('Invalid origin value encountered %s.', origin)
+        return 0
+
+
+def best_path_key(path):
+    """Returns the key of given path for the best path steps comparing only
+    path attributes.
+
+    The key is a tuple of (local-pref, negated AS-path length, origin
+    preference, negated MED, negated CLUSTER_LIST length), in which the
+    higher value is preferred. Local-pref, AS-path length and origin
+    preference are None if the path does not carry the attribute. The key
+    is cached in the interned path attributes, which are shared by paths.
+    """
+    pattrs = path.pathattr_set
+    key = pattrs.best_path_key
+    if key is not None:
+        return key
+
+    local_pref = pattrs.get(BGP_ATTR_TYPE_LOCAL_PREF)
+    if local_pref:
+        local_pref = local_pref.value
+    else:
+        local_pref = None
+    as_path = pattrs.get(BGP_ATTR_TYPE_AS_PATH)
+    if as_path:
+        as_path = -as_path.get_as_path_len()
+    else:
+        as_path = None
+    origin = pattrs.get(BGP_ATTR_TYPE_ORIGIN)
+    if origin is not None:
+        origin = _get_origin_pref(origin)
+    # By default, a route that arrives with no MED value is treated as if
+    # it had a MED of 0, the most preferred value.
+    med = pattrs.get(BGP_ATTR_TYPE_MULTI_EXIT_DISC)
+    med = -med.value if med else 0
+    cluster_list = pattrs.get(BGP_ATTR_TYPE_CLUSTER_LIST)
+    cluster_list = -len(cluster_list.value) if cluster_list else 0
+
+    key = (local_pref, as_path, origin, med, cluster_list)
+    pattrs.best_path_key = key
+    return key
+
+
 def _cmp_by_reachable_nh(path1, path2):
     """Compares given paths and selects best path based on reachable next-hop.
 
@@ -302,14 +355,12 @@ def _cmp_by_local_pref(path1, path2):
     # TODO(PH): Revisit this when BGPS has concept of policy to be applied to
     # in-bound NLRIs.
     # Default local-pref values is 100
-    lp1 = path1.get_pattr(BGP_ATTR_TYPE_LOCAL_PREF)
-    lp2 = path2.get_pattr(BGP_ATTR_TYPE_LOCAL_PREF)
-    if not (lp1 and lp2):
+    lp1 = best_path_key(path1)[0]
+    lp2 = best_path_key(path2)[0]
+    if lp1 is None or lp2 is None:
         return None
 
     # Highest local-preference value is preferred.
-    lp1 = lp1.value
-    lp2 = lp2.value
     if lp1 > lp2:
         return path1
     elif lp2 > lp1:
@@ -342,84 +393,28 @@ def _cmp_by_local_origin(path1, path2):
     return None
 
 
-def _cmp_by_aspath(path1, path2):
-    """Calculated the best-paths by comparing as-path lengths.
+def _cmp_by_path_key(path1, path2):
+    """Selects the best path by comparing AS-path lengths, then origin
+    attributes, then MED values.
 
-    Shortest as-path length is preferred. If both path have same lengths,
-    we return None.
+    Shortest as-path length is preferred. IGP is preferred over EGP; EGP is
+    preferred over Incomplete. Lower MED is preferred over higher MED value.
+    Returns the best path, or None if both paths are the same in these
+    steps, and the reason of the step deciding it.
     """
-    as_path1 = path1.get_pattr(BGP_ATTR_TYPE_AS_PATH)
-    as_path2 = path2.get_pattr(BGP_ATTR_TYPE_AS_PATH)
-    assert as_path1 and as_path2
-    l1 = as_path1.get_as_path_len()
-    l2 = as_path2.get_as_path_len()
-    assert l1 is not None and l2 is not None
-    if l1 > l2:
-        return path2
-    elif l2 > l1:
-        return path1
-    else:
-        return None
+    key1 = best_path_key(path1)[1:4]
+    key2 = best_path_key(path2)[1:4]
+    assert key1[0] is not None and key2[0] is not None
+    assert key1[1] is not None and key2[1] is not None
+    if key1 == key2:
+        return None, BPR_MED
 
-
-def _cmp_by_origin(path1, path2):
-    """Select the best path based on origin attribute.
-
-    IGP is preferred over EGP; EGP is preferred over Incomplete.
-    If both paths have same origin, we return None.
-    """
-    def get_origin_pref(origin):
-        if origin.value == BGP_ATTR_ORIGIN_IGP:
-            return 3
-        elif origin.value == BGP_ATTR_ORIGIN_EGP:
-            return 2
-        elif origin.value == BGP_ATTR_ORIGIN_INCOMPLETE:
-            return 1
-        else:
-            LOG.error('Invalid origin value encountered %s.', origin)
-            return 0
-
-    origin1 = path1.get_pattr(BGP_ATTR_TYPE_ORIGIN)
-    origin2 = path2.get_pattr(BGP_ATTR_TYPE_ORIGIN)
-    assert origin1 is not None and origin2 is not None
-
-    # If both paths have same origins
-    if origin1.value == origin2.value:
-        return None
-
-    # Translate origin values to preference.
-    origin1 = get_origin_pref(origin1)
-    origin2 = get_origin_pref(origin2)
-    # Return preferred path.
-    if origin1 == origin2:
-        return None
-    elif origin1 > origin2:
-        return path1
-    return path2
-
-
-def _cmp_by_med(path1, path2):
-    """Select the path based with lowest MED value.
-
-    If both paths have same MED, return None.
-    By default, a route that arrives with no MED value is treated as if it
-    had a MED of 0, the most preferred value.
-    RFC says lower MED is preferred over higher MED value.
-    """
-    def get_path_med(path):
-        med = path.get_pattr(BGP_ATTR_TYPE_MULTI_EXIT_DISC)
-        if not med:
-            return 0
-        return med.value
-
-    med1 = get_path_med(path1)
-    med2 = get_path_med(path2)
-
-    if med1 == med2:
-        return None
-    elif med1 < med2:
-        return path1
-    return path2
+    for reason, value1, value2 in zip(_PATH_KEY_REASONS, key1, key2):
+        if value1 != value2:
+            break
+    if key1 > key2:
+        return path1, reason
+    return path2, reason
 
 
 def _cmp_by_asn(local_asn, path1, path2):
@@ -535,18 +530,11 @@ def _cmp_by_cluster_list(path1, path2):
     The CLUSTER_LIST length is evaluated as zero if a route does not
     carry the CLUSTER_LIST attribute.
     """
-    def _get_cluster_list_len(path):
-        c_list = path.get_pattr(BGP_ATTR_TYPE_CLUSTER_LIST)
-        if c_list is None:
-            return 0
-        else:
-            return len(c_list.value)
-
-    c_list_len1 = _get_cluster_list_len(path1)
-    c_list_len2 = _get_cluster_list_len(path2)
-    if c_list_len1 < c_list_len2:
+    c_list_len1 = best_path_key(path1)[4]
+    c_list_len2 = best_path_key(path2)[4]
+    if c_list_len1 > c_list_len2:
         return path1
-    elif c_list_len1 > c_list_len2:
+    elif c_list_len1 < c_list_len2:
         return path2
     else:
         return None
@@ -378,21 +378,27 @@ class BgpProtocol(Protocol, Activity):
                       notification)
         self._socket.close()
 
-    def _send_with_lock(self, msg):
+    def _send_with_lock(self, msg, data=None):
+        if data is None:
+            data = msg.serialize()
         self._sendlock.acquire()
         try:
-            self._socket.sendall(msg.serialize())
+            self._socket.sendall(data)
         except socket.error:
             self.connection_lost('failed to write to socket')
         finally:
             self._sendlock.release()
 
-    def send(self, msg):
+    def send(self, msg, data=None):
+        """Sends `msg` to the peer.
+
+        If given, `data` is sent as the already serialized `msg`.
+        """
         if not self.started:
             raise BgpProtocolException('Tried to send message to peer when '
                                        'this protocol instance is not started'
                                        ' or is no longer is started state.')
-        self._send_with_lock(msg)
+        self._send_with_lock(msg, data)
 
         if msg.type == BGP_MSG_NOTIFICATION:
             LOG.error('Sent notification to %s >> %s', self._remotename, msg)
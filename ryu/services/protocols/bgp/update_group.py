@@ -0,0 +1,174 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+ Update groups of BGP peers.
+
+ Peers with identical outbound configuration (AS, out-filters, attribute
+ maps, capabilities, next-hop settings, etc.) send identical UPDATE messages
+ for the same path.  Such peers share an `UpdateGroup`, so that the
+ out-filters and UPDATE message construction run once per group rather than
+ once per peer, and the serialized message is shared by the members.
+"""
+from collections import OrderedDict
+import logging
+
+from ryu.services.protocols.bgp.model import OutgoingRoute
+from ryu.services.protocols.bgp.utils.packer import UpdatePacker
+
+LOG = logging.getLogger('bgpspeaker.update_group')
+
+# Number of paths whose outbound policy result and update are cached per
+# group.  Members drain their queues at different times, so this should be
+# a few times the number of routes a peer sends at once.
+UPDATE_GROUP_CACHE_SIZE = 8192
+
+# Number of batches of outgoing routes whose packed updates are cached per
+# group.
+UPDATE_GROUP_BATCH_CACHE_SIZE = 16
+
+
+class _Entry(object):
+    __slots__ = ('path', 'block', 'blocked_cause', 'update', 'data',
+                 'packing')
+
+    def __init__(self, path, block, blocked_cause, update):
+        self.path = path
+        self.block = block
+        self.blocked_cause = blocked_cause
+        self.update = update
+        self.data = None
+        self.packing = None
+
+
+class UpdateGroup(object):
+    """A group of peers sending identical updates for the same path.
+
+    Caches the outbound policy result and the UPDATE message of the latest
+    `cache_size` paths prepared by any member, and the packed and
+    serialized UPDATE messages of the latest `batch_cache_size` batches
+    packed by any member.
+    """
+
+    def __init__(self, key, cache_size=UPDATE_GROUP_CACHE_SIZE,
+                 batch_cache_size=UPDATE_GROUP_BATCH_CACHE_SIZE):
+        self.key = key
+        self.members = set()
+        self.cache_size = cache_size
+        self.batch_cache_size = batch_cache_size
+        self._entries = OrderedDict()  # id(path) -> _Entry
+        self._updates = {}  # id(update) -> _Entry
+        # tuple of id(update) -> (updates, packed updates)
+        self._batches = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.batch_hits = 0
+        self.batch_misses = 0
+
+    def __str__(self):
+        return 'UpdateGroup(members: %s, hits: %s, misses: %s)' % (
+            len(self.members), self.hits, self.misses)
+
+    def prepare(self, peer, path):
+        """Applies the out-filters of `peer` to `path` and constructs the
+        update for it, unless done for the group already.
+
+        Returns a tuple of (block, blocked_cause, update), where update is
+        None if `path` is blocked.
+        """
+        entry = self._entries.get(id(path))
+        if entry is not None and entry.path is path:
+            self.hits += 1
+            return entry.block, entry.blocked_cause, entry.update
+
+        self.misses += 1
+        block, blocked_cause = peer._apply_out_filter(path)
+        update = None
+        if not block:
+            update = peer._construct_update(OutgoingRoute(path))
+
+        if entry is not None:
+            self._evict(id(path))
+        entry = _Entry(path, block, blocked_cause, update)
+        self._entries[id(path)] = entry
+        if update is not None:
+            self._updates[id(update)] = entry
+        if len(self._entries) > self.cache_size:
+            self._evict(next(iter(self._entries)))
+        return block, blocked_cause, update
+
+    def _evict(self, path_id):
+        entry = self._entries.pop(path_id)
+        if entry.update is not None:
+            del self._updates[id(entry.update)]
+
+    def _entry(self, update):
+        entry = self._updates.get(id(update))
+        if entry is None or entry.update is not update:
+            return None
+        return entry
+
+    def get_packing(self, update):
+        entry = self._entry(update)
+        if entry is None:
+            return None
+        return entry.packing
+
+    def set_packing(self, update, packing):
+        entry = self._entry(update)
+        if entry is not None:
+            entry.packing = packing
+
+    def serialize(self, update):
+        """Returns the serialized `update`.
+
+        The update prepared for the group is serialized only once.
+        """
+        entry = self._entry(update)
+        if entry is None:
+            return update.serialize()
+        if entry.data is None:
+            entry.data = update.serialize()
+        return entry.data
+
+    def pack(self, items):
+        """Packs the updates of given (key, update, attrs_key) `items` as
+        `UpdatePacker.add` does.
+
+        Returns a list of tuples of (update, serialized update).  The
+        members packing the same updates share the result.
+        """
+        updates = tuple(update for _, update, _ in items)
+        batch_key = tuple(id(update) for update in updates)
+        batch = self._batches.get(batch_key)
+        if batch is not None and all(
+                a is b for a, b in zip(batch[0], updates)):
+            self.batch_hits += 1
+            return batch[1]
+
+        self.batch_misses += 1
+        packer = UpdatePacker(cache=self)
+        for key, update, attrs_key in items:
+            packer.add(update, key=key, attrs_key=attrs_key)
+        packed = [(update, self.serialize(update))
+                  for update in packer.pack()]
+        self._batches[batch_key] = (updates, packed)
+        if len(self._batches) > self.batch_cache_size:
+            self._batches.popitem(last=False)
+        return packed
+
+    def clear(self):
+        self._entries.clear()
+        self._updates.clear()
+        self._batches.clear()
@@ -0,0 +1,241 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+ Packing of the prefixes of UPDATE messages sharing path attributes.
+"""
+import collections
+
+from ryu.lib.packet.bgp import BGPMessage
+from ryu.lib.packet.bgp import BGPPathAttributeMpReachNLRI
+from ryu.lib.packet.bgp import BGPPathAttributeMpUnreachNLRI
+from ryu.lib.packet.bgp import BGPUpdate
+
+# Maximum length of a BGP message (RFC 4271).
+BGP_MAX_MESSAGE_LEN = 4096
+
+# Length of an UPDATE message without withdrawn routes, path attributes
+# and NLRI: the header and the two length fields.
+_UPDATE_BASE_LEN = BGPMessage._HDR_LEN + 4
+
+_WITHDRAW = 'withdraw'
+_REACH = 'reach'
+_MP_UNREACH = 'mp_unreach'
+_MP_REACH = 'mp_reach'
+
+
+class _Group(object):
+    # prefixes to pack into the UPDATE messages of the same attributes
+    def __init__(self, kind, budget, attrs=None, mp_attr=None, mp_index=None):
+        self.kind = kind
+        self.budget = budget  # bytes available for the prefixes
+        self.attrs = attrs
+        self.mp_attr = mp_attr
+        self.mp_index = mp_index
+        self.nlri = collections.OrderedDict()  # key -> (prefix, length)
+        self.update = None  # message of a single prefix added
+
+    def build(self, nlri):
+        if self.kind == _WITHDRAW:
+            return BGPUpdate(withdrawn_routes=nlri)
+        elif self.kind == _REACH:
+            return BGPUpdate(path_attributes=self.attrs, nlri=nlri)
+        elif self.kind == _MP_UNREACH:
+            return BGPUpdate(path_attributes=[BGPPathAttributeMpUnreachNLRI(
+                self.mp_attr.afi, self.mp_attr.safi, nlri)])
+        attrs = list(self.attrs)
+        attrs.insert(self.mp_index, BGPPathAttributeMpReachNLRI(
+            self.mp_attr.afi, self.mp_attr.safi,
+            self.mp_attr.next_hop_list, nlri))
+        return BGPUpdate(path_attributes=attrs)
+
+
+def _attrs_bytes(attrs):
+    return b''.join(bytes(attr.serialize()) for attr in attrs)
+
+
+def _sized(nlri):
+    return [(n, len(n.serialize())) for n in nlri]
+
+
+class UpdatePacker(object):
+    """Packs the prefixes of UPDATE messages into fewer UPDATE messages.
+
+    The UPDATE messages added by `add` usually carry a single prefix, as
+    constructed for an `OutgoingRoute`.  The prefixes of the messages
+    with identical path attributes (except the prefixes in MP_REACH_NLRI
+    or MP_UNREACH_NLRI) are packed into messages of up to `max_len`
+    bytes, IPv4 withdrawn routes and NLRI as well as MP_REACH_NLRI and
+    MP_UNREACH_NLRI.  A prefix added again replaces the one added
+    before, so that only the last advertisement or withdrawal of a
+    prefix is sent.  The messages which can not be packed (e.g. an
+    End-of-RIB marker) and the messages left alone in their group are
+    sent as they are.
+
+    The analysis of a message added is reused from `cache`, if given,
+    which should have `get_packing(update)` returning what was stored
+    by `set_packing(update, packing)` for the same message, or None.
+    """
+
+    def __init__(self, max_len=BGP_MAX_MESSAGE_LEN, cache=None):
+        self.max_len = max_len
+        self.cache = cache
+        self._groups = collections.OrderedDict()  # group key -> _Group
+        self._prefixes = {}  # prefix key -> group key
+        self._count = 0
+
+    def __len__(self):
+        # number of the prefixes and unpacked messages added
+        return sum(len(group.nlri) for group in self._groups.values())
+
+    def _group(self, update, attrs_key):
+        # Returns the group key and the _Group of the update, and its
+        # prefixes with their lengths, or (None, None, None) if it can not
+        # be packed.
+        attrs = update.path_attributes
+        if update.withdrawn_routes:
+            if attrs or update.nlri:
+                return None, None, None
+            key = (_WITHDRAW,)
+            return (key, (_WITHDRAW, (), None, None),
+                    _sized(update.withdrawn_routes))
+        if update.nlri:
+            if attrs_key is None:
+                attrs_key = _attrs_bytes(attrs)
+            key = (_REACH, attrs_key)
+            return key, (_REACH, attrs, None, None), _sized(update.nlri)
+        mp_attrs = [(i, attr) for i, attr in enumerate(attrs)
+                    if isinstance(attr, (BGPPathAttributeMpReachNLRI,
+                                         BGPPathAttributeMpUnreachNLRI))]
+        if len(mp_attrs) != 1:
+            return None, None, None
+        index, mp_attr = mp_attrs[0]
+        if isinstance(mp_attr, BGPPathAttributeMpUnreachNLRI):
+            if len(attrs) != 1 or not mp_attr.withdrawn_routes:
+                # e.g. End-of-RIB marker
+                return None, None, None
+            key = (_MP_UNREACH, mp_attr.afi, mp_attr.safi)
+            return (key, (_MP_UNREACH, (), mp_attr, index),
+                    _sized(mp_attr.withdrawn_routes))
+        if not mp_attr.nlri:
+            return None, None, None
+        others = attrs[:index] + attrs[index + 1:]
+        if attrs_key is None:
+            attrs_key = _attrs_bytes(others)
+        key = (_MP_REACH, mp_attr.afi, mp_attr.safi,
+               tuple(mp_attr.next_hop_list), index, attrs_key)
+        return (key, (_MP_REACH, others, mp_attr, index),
+                _sized(mp_attr.nlri))
+
+    def _budget(self, kind, attrs, mp_attr):
+        budget = self.max_len - _UPDATE_BASE_LEN - len(_attrs_bytes(attrs))
+        if kind == _MP_UNREACH:
+            empty = BGPPathAttributeMpUnreachNLRI(mp_attr.afi, mp_attr.safi,
+                                                  [])
+        elif kind == _MP_REACH:
+            empty = BGPPathAttributeMpReachNLRI(
+                mp_attr.afi, mp_attr.safi, mp_attr.next_hop_list, [])
+        else:
+            return budget
+        # plus a byte of the extended length
+        return budget - len(empty.serialize()) - 1
+
+    def add(self, update, key=None, attrs_key=None):
+        """Adds an UPDATE message.
+
+        `key` identifies the prefix of a single-prefix message, e.g. the
+        route family and the formatted prefix.  The prefix added before
+        with the same key is removed.
+
+        `attrs_key` identifies the path attributes of the message other
+        than the prefixes and the next hop of MP_REACH_NLRI, e.g. by the
+        interned path attributes of the path the message is constructed
+        for.  If not given, the path attributes are serialized to group
+        the messages.
+        """
+        if key is not None:
+            group_key = self._prefixes.pop(key, None)
+            if group_key is not None:
+                group = self._groups[group_key]
+                del group.nlri[key]
+        packing = None
+        if self.cache is not None:
+            packing = self.cache.get_packing(update)
+        if packing is None:
+            packing = self._group(update, attrs_key)
+            if self.cache is not None:
+                self.cache.set_packing(update, packing)
+        group_key, spec, nlri = packing
+        self._count += 1
+        if group_key is None:
+            # sent as it is
+            group_key = ('unpacked', self._count)
+            group = self._groups[group_key] = _Group(None, 0)
+            group.nlri[key or group_key] = update
+        else:
+            group = self._groups.get(group_key)
+            if group is None:
+                kind, attrs, mp_attr, mp_index = spec
+                group = _Group(kind, self._budget(kind, attrs, mp_attr),
+                               attrs, mp_attr, mp_index)
+                self._groups[group_key] = group
+            if key is None or len(nlri) != 1:
+                for n in nlri:
+                    self._count += 1
+                    group.nlri[('prefix', self._count)] = n
+                group.update = None
+            else:
+                group.nlri[key] = nlri[0]
+                group.update = update if len(group.nlri) == 1 else None
+        if key is not None:
+            self._prefixes[key] = group_key
+
+    def pack(self):
+        """Returns the list of the packed UPDATE messages and clears the
+        messages added.
+        """
+        updates = []
+        for group in self._groups.values():
+            if group.kind is None:
+                updates.extend(group.nlri.values())
+                continue
+            if group.update is not None and len(group.nlri) == 1:
+                updates.append(group.update)
+                continue
+            chunk = []
+            size = 0
+            for n, n_len in group.nlri.values():
+                if chunk and size + n_len > group.budget:
+                    updates.append(group.build(chunk))
+                    chunk = []
+                    size = 0
+                chunk.append(n)
+                size += n_len
+            if chunk:
+                updates.append(group.build(chunk))
+        self._groups.clear()
+        self._prefixes.clear()
+        return updates
+
+
+def update_prefixes(update):
+    """Returns the number of the prefixes in the UPDATE message."""
+    count = len(update.withdrawn_routes) + len(update.nlri)
+    for attr in update.path_attributes:
+        if isinstance(attr, BGPPathAttributeMpReachNLRI):
+            count += len(attr.nlri)
+        elif isinstance(attr, BGPPathAttributeMpUnreachNLRI):
+            count += len(attr.withdrawn_routes)
+    return count
@@ -44,6 +44,7 @@ LOCAL_ROUTES = 'local_routes'
 # Peer related stat constant.
 UPDATE_MSG_IN = 'update_message_in'
 UPDATE_MSG_OUT = 'update_message_out'
+PREFIXES_PER_UPDATE_OUT = 'prefixes_per_update_out'
 TOTAL_MSG_IN = 'total_message_in'
 TOTAL_MSG_OUT = 'total_message_out'
 FMS_EST_TRANS = 'fsm_established_transitions'
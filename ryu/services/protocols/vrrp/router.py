@@ -39,33 +39,28 @@ class Timer(object):
 
         super(Timer, self).__init__()
         self._handler = handler_
-        self._event = hub.Event()
-        self._thread = None
+        self._timer = None
 
     def start(self, interval):
         """interval is in seconds"""
-        if self._thread:
-            self.cancel()
-        self._event.clear()
-        self._thread = hub.spawn(self._timer, interval)
+        if self._timer is None:
+            # The handler may block sending an event, so it runs in its
+            # own thread.
+            self._timer = hub.get_timer_wheel().schedule_spawn(
+                interval, self._handler)
+        else:
+            self._timer.reschedule(interval)
 
     def cancel(self):
-        if self._thread is None:
+        if self._timer is None:
             return
-        self._event.set()
-        hub.joinall([self._thread])
-        self._thread = None
+        # Also skips the handler if the timer has fired but the thread has
+        # not run yet.
+        self._timer.cancel()
+        self._timer = None
 
     def is_running(self):
-        return self._thread is not None
-
-    def _timer(self, interval):
-        # Avoid cancellation during execution of self._callable()
-        cancel = self._event.wait(interval)
-        if cancel:
-            return
-
-        self._handler()
+        return self._timer is not None
 
 
 class TimerEventSender(Timer):
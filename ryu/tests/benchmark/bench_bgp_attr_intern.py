@@ -0,0 +1,113 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of the interned path attributes of BGP paths
+(ryu.services.protocols.bgp.info_base.base.PathAttrSet).
+
+Parses a full table of ROUTES IPv4 prefixes from each of PEERS peers,
+received in UPDATE messages of PREFIXES_PER_UPDATE prefixes with
+ATTR_SETS distinct sets of path attributes, into paths as the peer does,
+and reports the number of attribute sets, the time and the growth of the
+maximum RSS with per-path attributes (as before interning) and with
+interned attributes.  Each case runs in its own process.
+
+Usage::
+
+    $ python -m ryu.tests.benchmark.bench_bgp_attr_intern [ROUTES]
+"""
+
+from __future__ import print_function
+
+import resource
+import subprocess
+import sys
+import time
+
+from ryu.lib.packet import bgp
+from ryu.services.protocols.bgp.info_base.base import PathAttrSet
+from ryu.services.protocols.bgp.info_base.ipv4 import Ipv4Path
+
+ROUTES = 100000
+PEERS = 4
+PREFIXES_PER_UPDATE = 4
+ATTR_SETS = 20000
+
+
+class _Source(object):
+    version_num = 1
+
+
+def _updates(peer, routes):
+    msgs = []
+    for i in range(0, routes, PREFIXES_PER_UPDATE):
+        attr = i // PREFIXES_PER_UPDATE % ATTR_SETS
+        attrs = [
+            bgp.BGPPathAttributeOrigin(0),
+            bgp.BGPPathAttributeAsPath(
+                [[65000 + peer, 64512 + attr % 1000, 100 + attr // 1000]]),
+            bgp.BGPPathAttributeNextHop('192.0.2.1'),
+            bgp.BGPPathAttributeMultiExitDisc(attr % 7),
+            bgp.BGPPathAttributeCommunities([65000 << 16 | attr % 50]),
+        ]
+        nlri = [bgp.IPAddrPrefix(24, '%d.%d.%d.0' % (
+            10 + j // 65536, j // 256 % 256, j % 256))
+            for j in range(i, min(i + PREFIXES_PER_UPDATE, routes))]
+        msgs.append(bytes(bgp.BGPUpdate(path_attributes=attrs,
+                                        nlri=nlri).serialize()))
+    return msgs
+
+
+def _per_path(pattrs):
+    return PathAttrSet(pattrs.items() if pattrs else ())
+
+
+def _run(mode, routes):
+    if mode == 'per-path':
+        PathAttrSet.intern = staticmethod(_per_path)
+    msgs = [_updates(peer, routes) for peer in range(PEERS)]
+    source = _Source()
+    start_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.time()
+    paths = []
+    for peer_msgs in msgs:
+        for buf in peer_msgs:
+            msg, _, _ = bgp.BGPMessage.parser(buf)
+            pattrs = msg.pathattr_map
+            for nlri in msg.nlri:
+                paths.append(Ipv4Path(source, nlri, 1, pattrs=pattrs,
+                                      nexthop='192.0.2.1'))
+    elapsed = time.time() - start
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - start_rss
+    sets = len(set(id(path.pathattr_set) for path in paths))
+    print('%-8s %8d paths %7d attribute sets %6.1f sec %7.1f MB RSS' % (
+        mode, len(paths), sets, elapsed, rss / 1024.0))
+
+
+def main():
+    if len(sys.argv) > 2:
+        _run(sys.argv[2], int(sys.argv[1]))
+        return
+    routes = int(sys.argv[1]) if len(sys.argv) > 1 else ROUTES
+    print('%d routes from %d peers, %d prefixes per update' % (
+        routes, PEERS, PREFIXES_PER_UPDATE))
+    for mode in ('per-path', 'interned'):
+        subprocess.check_call([sys.executable, '-W', 'ignore', '-m',
+                               'ryu.tests.benchmark.bench_bgp_attr_intern',
+                               str(routes), mode])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of the BGP best path selection
+(ryu.services.protocols.bgp.info_base.base.Destination).
+
+Learns a full table of ROUTES IPv4 prefixes from each of PEERS peers, one
+peer after another, processing each destination as its paths arrive, and
+reports the time with the best path recomputed among all known paths (as
+before the incremental selection) and with the new paths compared only
+with the current best path.  Each case runs in its own process.
+
+Usage::
+
+    $ python -m ryu.tests.benchmark.bench_bgp_best_path [ROUTES]
+"""
+
+from __future__ import print_function
+
+from collections import OrderedDict
+import subprocess
+import sys
+import time
+
+from ryu.lib.packet import bgp
+from ryu.services.protocols.bgp.info_base.base import Destination
+from ryu.services.protocols.bgp.info_base.ipv4 import Ipv4Path
+from ryu.services.protocols.bgp.info_base.ipv4 import Ipv4Table
+
+ROUTES = 100000
+PEERS = 8
+
+
+class _Peer(object):
+    def __init__(self, remote_as):
+        self.remote_as = remote_as
+        self.version_num = 1
+
+
+class _PeerManager(object):
+    def comm_new_best_to_bgp_peers(self, path):
+        pass
+
+
+class _SignalBus(object):
+    def dest_changed(self, dest):
+        pass
+
+    def best_path_changed(self, path, is_withdraw):
+        pass
+
+
+class _CoreService(object):
+    asn = 65000
+
+    def __init__(self):
+        self.peer_manager = _PeerManager()
+        self._signal_bus = _SignalBus()
+
+
+def _pattrs(peer, i):
+    # The peers' paths tie on LOCAL_PREF and differ in AS_PATH length or
+    # MED, so that the decision goes through several steps.
+    pattrs = OrderedDict()
+    pattrs[bgp.BGP_ATTR_TYPE_ORIGIN] = bgp.BGPPathAttributeOrigin(0)
+    pattrs[bgp.BGP_ATTR_TYPE_AS_PATH] = bgp.BGPPathAttributeAsPath(
+        [[peer.remote_as] + [64512] * ((i + peer.remote_as) % 3)])
+    pattrs[bgp.BGP_ATTR_TYPE_MULTI_EXIT_DISC] = (
+        bgp.BGPPathAttributeMultiExitDisc((i * 7 + peer.remote_as) % 5))
+    pattrs[bgp.BGP_ATTR_TYPE_LOCAL_PREF] = (
+        bgp.BGPPathAttributeLocalPref(100))
+    return pattrs
+
+
+def _full(self, best_path, new_paths):
+    return self._compute_best_known_path()
+
+
+def _run(mode, routes):
+    if mode == 'full':
+        Destination._compute_best_new_path = _full
+    core_service = _CoreService()
+    table = Ipv4Table(core_service, core_service._signal_bus)
+    peers = [_Peer(65001 + i) for i in range(PEERS)]
+    nlris = [bgp.IPAddrPrefix(24, '%d.%d.%d.0' % (
+        10 + i // 65536, i // 256 % 256, i % 256)) for i in range(routes)]
+    paths = [[Ipv4Path(peer, nlri, 1, pattrs=_pattrs(peer, i),
+                       nexthop='192.0.2.1')
+              for i, nlri in enumerate(nlris)] for peer in peers]
+
+    start = time.time()
+    for peer_paths in paths:
+        for path in peer_paths:
+            table.insert(path).process()
+    elapsed = time.time() - start
+    print('%-12s %8d paths %6.1f sec %8.0f paths/sec' % (
+        mode, routes * PEERS, elapsed, routes * PEERS / elapsed))
+
+
+def main():
+    if len(sys.argv) > 2:
+        _run(sys.argv[2], int(sys.argv[1]))
+        return
+    routes = int(sys.argv[1]) if len(sys.argv) > 1 else ROUTES
+    print('%d routes from %d peers' % (routes, PEERS))
+    for mode in ('full', 'incremental'):
+        subprocess.check_call([sys.executable, '-W', 'ignore', '-m',
+                               'ryu.tests.benchmark.bench_bgp_best_path',
+                               str(routes), mode])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of the BGP peer-down cleanup
+(ryu.services.protocols.bgp.info_base.base.Table.cleanup_paths_for_peer).
+
+Builds an IPv4 table of ROUTES prefixes learned from a stable peer, with
+FLAP_ROUTES of them also learned from a flapping peer, then flaps the
+latter: removes its stale paths and reprocesses the changed destinations.
+Reports the time of the cleanup walking every destination of the table
+(as before the per-peer index) and visiting only the peer's destinations.
+
+Usage::
+
+    $ python -m ryu.tests.benchmark.bench_bgp_peer_flap [ROUTES [FLAP_ROUTES]]
+"""
+
+from __future__ import print_function
+
+from collections import OrderedDict
+import sys
+import time
+
+from ryu.lib.packet import bgp
+from ryu.services.protocols.bgp.info_base.base import Table
+from ryu.services.protocols.bgp.info_base.ipv4 import Ipv4Path
+from ryu.services.protocols.bgp.info_base.ipv4 import Ipv4Table
+
+ROUTES = 200000
+FLAP_ROUTES = 1000
+
+
+class _Peer(object):
+    def __init__(self, remote_as):
+        self.remote_as = remote_as
+        self.version_num = 1
+
+
+class _PeerManager(object):
+    def comm_new_best_to_bgp_peers(self, path):
+        pass
+
+
+class _SignalBus(object):
+    def __init__(self):
+        self.changed = []
+
+    def dest_changed(self, dest):
+        self.changed.append(dest)
+
+    def best_path_changed(self, path, is_withdraw):
+        pass
+
+
+class _CoreService(object):
+    asn = 65000
+
+    def __init__(self):
+        self.peer_manager = _PeerManager()
+        self._signal_bus = _SignalBus()
+
+
+def _pattrs(peer):
+    pattrs = OrderedDict()
+    pattrs[bgp.BGP_ATTR_TYPE_ORIGIN] = bgp.BGPPathAttributeOrigin(0)
+    pattrs[bgp.BGP_ATTR_TYPE_AS_PATH] = bgp.BGPPathAttributeAsPath(
+        [[peer.remote_as, 64512]])
+    return pattrs
+
+
+def _learn(table, peer, routes):
+    pattrs = _pattrs(peer)
+    for i in range(routes):
+        nlri = bgp.IPAddrPrefix(24, '%d.%d.%d.0' % (
+            10 + i // 65536, i // 256 % 256, i % 256))
+        path = Ipv4Path(peer, nlri, peer.version_num, pattrs=pattrs,
+                        nexthop='192.0.2.1')
+        table.insert(path).process()
+
+
+def _flap(table, peer):
+    bus = table.core_service._signal_bus
+    del bus.changed[:]
+    start = time.time()
+    peer.version_num += 1
+    table.cleanup_paths_for_peer(peer)
+    for dest in bus.changed:
+        dest.process()
+    return len(bus.changed), time.time() - start
+
+
+def main():
+    routes = int(sys.argv[1]) if len(sys.argv) > 1 else ROUTES
+    flap_routes = int(sys.argv[2]) if len(sys.argv) > 2 else FLAP_ROUTES
+    core_service = _CoreService()
+    table = Ipv4Table(core_service, core_service._signal_bus)
+    stable = _Peer(65001)
+    flapping = _Peer(65002)
+
+    start = time.time()
+    _learn(table, stable, routes)
+    _learn(table, flapping, flap_routes)
+    print('%d routes, %d from the flapping peer: learned in %.1f sec' % (
+        routes, flap_routes, time.time() - start))
+
+    peer_dests = Table._peer_dests
+    for mode in ('all-dests', 'indexed'):
+        if mode == 'all-dests':
+            Table._peer_dests = lambda self, peer: list(self.values())
+        else:
+            Table._peer_dests = peer_dests
+        count, elapsed = _flap(table, flapping)
+        print('%-10s %7d destinations changed %8.3f sec' % (
+            mode, count, elapsed))
+        _learn(table, flapping, flap_routes)
+
+
+if __name__ == '__main__':
+    main()
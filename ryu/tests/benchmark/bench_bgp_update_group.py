@@ -0,0 +1,145 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of ryu.services.protocols.bgp.update_group.
+
+Sends ROUTES IPv4 paths to PEERS eBGP peers of identical outbound
+configuration, as a route server or a transit router does for its
+clients, in batches of Peer.OUTGOING_ROUTE_BATCH routes, and reports the
+number of UPDATE constructions and the time per peer with each peer in its
+own update group (as before update groups) and with the peers sharing an
+update group.
+
+Usage::
+
+    $ python -m ryu.tests.benchmark.bench_bgp_update_group
+"""
+
+from __future__ import print_function
+
+from collections import OrderedDict
+import time
+
+try:
+    import mock  # Python 2
+except ImportError:
+    from unittest import mock  # Python 3
+
+from ryu.lib.packet import bgp
+from ryu.services.protocols.bgp import peer
+from ryu.services.protocols.bgp.core_managers.peer_manager import PeerManager
+from ryu.services.protocols.bgp.info_base.ipv4 import Ipv4Path
+from ryu.services.protocols.bgp.model import OutgoingRoute
+
+ROUTES = 20000
+PEERS = 10
+
+
+class _Protocol(object):
+    def __init__(self):
+        self.sent = 0
+        self.sent_bytes = 0
+
+    def send(self, msg, data=None):
+        if data is None:
+            data = msg.serialize()
+        self.sent += 1
+        self.sent_bytes += len(data)
+
+    def is_four_octet_as_number_cap_valid(self):
+        return True
+
+
+class _SignalBus(object):
+    def adj_rib_out_changed(self, peer, sent_route):
+        pass
+
+
+class _TableManager(object):
+    def remember_sent_route(self, sent_route):
+        pass
+
+
+class _CoreService(object):
+    table_manager = _TableManager()
+
+
+@mock.patch.object(peer.Peer, '__init__', mock.MagicMock(return_value=None))
+def _peer(peer_manager, i):
+    _peer = peer.Peer(None, None, None, None, None)
+    _peer.version_num = 1
+    _peer._neigh_conf = mock.MagicMock(
+        ip_address='192.0.2.%d' % i, remote_as=65100 + i, local_as=65000,
+        next_hop=None, is_next_hop_self=False, multi_exit_disc=None,
+        soo_list=[], is_route_server_client=False,
+        is_route_reflector_client=False)
+    _peer._common_conf = mock.MagicMock(
+        local_as=65000, router_id='10.0.0.1', cluster_id='10.0.0.1',
+        local_pref=100)
+    _peer._host_bind_ip = '10.0.0.1'
+    _peer._out_filters = []
+    _peer._attribute_maps = {}
+    _peer._update_group = None
+    _peer._peer_manager = peer_manager
+    _peer._adj_rib_out = {}
+    _peer._signal_bus = _SignalBus()
+    _peer._core_service = _CoreService()
+    _peer._protocol = _Protocol()
+    _peer.state = peer.PeerState(_peer, mock.MagicMock())
+    return _peer
+
+
+def _routes():
+    routes = []
+    for i in range(ROUTES):
+        pattrs = OrderedDict()
+        pattrs[bgp.BGP_ATTR_TYPE_ORIGIN] = bgp.BGPPathAttributeOrigin(0)
+        pattrs[bgp.BGP_ATTR_TYPE_AS_PATH] = bgp.BGPPathAttributeAsPath(
+            [[64512 + i % 100, 64999]])
+        pattrs[bgp.BGP_ATTR_TYPE_COMMUNITIES] = (
+            bgp.BGPPathAttributeCommunities([65000 << 16 | i % 10]))
+        nlri = bgp.IPAddrPrefix(24, '10.%d.%d.0' % (i // 256, i % 256))
+        path = Ipv4Path(None, nlri, 1, pattrs=pattrs, nexthop='10.0.0.254')
+        routes.append(OutgoingRoute(path))
+    return routes
+
+
+def main():
+    print('%d routes to %d peers' % (ROUTES, PEERS))
+    batch = peer.Peer.OUTGOING_ROUTE_BATCH
+    routes = _routes()
+    for name, shared in (('per-peer', False), ('grouped', True)):
+        peer_manager = PeerManager(mock.MagicMock(), None)
+        peers = [_peer(peer_manager, i) for i in range(PEERS)]
+        if not shared:
+            # Each peer in its own update group
+            for i, _peer_ in enumerate(peers):
+                _peer_._update_group_key = (lambda i=i: i)
+        start = time.time()
+        for i in range(0, len(routes), batch):
+            for _peer_ in peers:
+                _peer_._send_outgoing_routes(routes[i:i + batch])
+        elapsed = time.time() - start
+        misses = sum(g.misses for g in peer_manager.update_groups)
+        sent = sum(p._protocol.sent for p in peers)
+        print('%-8s %2d groups %7d updates constructed %5d sent '
+              '%6.3f sec/peer' % (
+                  name, len(peer_manager.update_groups), misses, sent,
+                  elapsed / PEERS))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of ryu.services.protocols.bgp.utils.packer.
+
+Sends a full table of ROUTES IPv4 prefixes and ROUTES IPv6 prefixes
+(MP_REACH_NLRI), spread over ATTR_SETS distinct path attribute sets, to
+a socket which only counts the bytes, and reports the number of UPDATE
+messages, the prefixes per UPDATE and the full-table send time when
+sending an UPDATE per prefix (as the peer used to) and when packing the
+prefixes into UPDATEs of up to 4096 bytes.
+
+Usage::
+
+    $ python -m ryu.tests.benchmark.bench_bgp_update_packing
+"""
+
+from __future__ import print_function
+
+import time
+
+from ryu.lib.packet import bgp
+from ryu.services.protocols.bgp.utils.packer import UpdatePacker
+
+ROUTES = 20000
+ATTR_SETS = 20
+
+
+class _Socket(object):
+    def __init__(self):
+        self.sent = 0
+        self.sent_bytes = 0
+
+    def sendall(self, data):
+        self.sent += 1
+        self.sent_bytes += len(data)
+
+
+def _updates():
+    updates = []
+    for i in range(ROUTES):
+        attrs = [bgp.BGPPathAttributeOrigin(0),
+                 bgp.BGPPathAttributeAsPath([[65000, 65100 + i % ATTR_SETS]]),
+                 bgp.BGPPathAttributeMultiExitDisc(i % ATTR_SETS)]
+        nlri = bgp.IPAddrPrefix(24, '10.%d.%d.0' % (i // 256, i % 256))
+        updates.append((
+            ('ipv4', i),
+            bgp.BGPUpdate(path_attributes=attrs + [
+                bgp.BGPPathAttributeNextHop('192.0.2.1')], nlri=[nlri])))
+        nlri = bgp.IP6AddrPrefix(48, '2001:db8:%x::' % i)
+        updates.append((
+            ('ipv6', i),
+            bgp.BGPUpdate(path_attributes=attrs + [
+                bgp.BGPPathAttributeMpReachNLRI(
+                    bgp.addr_family.IP6, bgp.subaddr_family.UNICAST,
+                    ['2001:db8::1'], [nlri])])))
+    return updates
+
+
+def _send_each(updates, sock):
+    for _, update in updates:
+        sock.sendall(update.serialize())
+
+
+def _send_packed(updates, sock):
+    packer = UpdatePacker()
+    for key, update in updates:
+        packer.add(update, key=key)
+    for update in packer.pack():
+        sock.sendall(update.serialize())
+
+
+def main():
+    print('%d IPv4 and %d IPv6 prefixes, %d attribute sets' % (
+        ROUTES, ROUTES, ATTR_SETS))
+    for name, send in (('per-route', _send_each),
+                       ('packed', _send_packed)):
+        updates = _updates()
+        sock = _Socket()
+        start = time.time()
+        send(updates, sock)
+        elapsed = time.time() - start
+        print('%-9s %6d updates %6.1f prefixes/update %9d bytes '
+              '%6.3f sec/full table' % (
+                  name, sock.sent, float(len(updates)) / sock.sent,
+                  sock.sent_bytes, elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of ryu.lib.counter_store.
+
+Records a poll of the port counters of SERIES ports and finds the top 10
+ports by the rate of tx_bytes, with CounterStore ("store") and by
+computing the rates from the previous poll and sorting all of them
+("sort"), as a consumer of the raw stats replies does.
+
+Usage::
+
+    $ python -m ryu.tests.benchmark.bench_counter_store
+"""
+
+from __future__ import print_function
+
+import random
+import timeit
+
+from ryu.app.ofctl import poller
+from ryu.lib import counter_store
+
+SERIES = 100000
+NUMBER = 10
+TOP = 10
+
+
+def main():
+    keys = [(dpid, port_no) for dpid in range(1, SERIES // 50 + 1)
+            for port_no in range(1, 51)]
+    samples = [[random.randint(0, 1 << 40) for _i in range(8)]
+               for _key in keys]
+    store = counter_store.CounterStore(
+        poller.PORT_COUNTERS, ranked=poller.RANKED_COUNTERS['port'])
+    prev = {}
+    t = [0]
+
+    def _add():
+        t[0] += 1
+        for key, values in zip(keys, samples):
+            values[3] += random.randint(0, 1 << 20)
+            store.add(key, t[0], values)
+
+    def _raw():
+        t[0] += 1
+        for key, values in zip(keys, samples):
+            values[3] += random.randint(0, 1 << 20)
+            prev[key] = (t[0], list(values), prev.get(key))
+
+    def _store_top():
+        return store.top('tx_bytes', TOP)
+
+    def _sort_top():
+        rates = []
+        for key, (t1, v1, last) in prev.items():
+            t0, v0, _last = last
+            rates.append(((v1[3] - v0[3]) / float(t1 - t0), key))
+        rates.sort(reverse=True)
+        return rates[:TOP]
+
+    _add()
+    _raw()
+    _raw()
+    print('%d ports' % SERIES)
+    elapsed = min(timeit.repeat(_add, number=1, repeat=3))
+    print('store add   %8.2f usec/sample' % (elapsed / SERIES * 1e6))
+    for name, func in (('store', _store_top), ('sort', _sort_top)):
+        elapsed = min(timeit.repeat(func, number=NUMBER, repeat=3))
+        print('%-5s top%d %8.1f usec' % (name, TOP, elapsed / NUMBER * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Micro-benchmark of the PACKET_IN event dispatch.
+
+Compares the per-message handler and observer lookup which used to be
+computed for every received message with the indexed lookup of RyuApp.
+
+Usage::
+
+    $ python -m ryu.tests.benchmark.bench_dispatch
+"""
+
+from __future__ import print_function
+
+import timeit
+
+from ryu.base import app_manager
+from ryu.controller import ofp_event
+from ryu.controller.handler import CONFIG_DISPATCHER
+from ryu.controller.handler import MAIN_DISPATCHER
+from ryu.controller.handler import set_ev_cls
+
+NUMBER = 100000
+
+
+class _Brick(app_manager.RyuApp):
+
+    @set_ev_cls(ofp_event.EventOFPPacketIn, MAIN_DISPATCHER)
+    def packet_in_handler(self, ev):
+        pass
+
+    @set_ev_cls(ofp_event.EventOFPPacketIn, CONFIG_DISPATCHER)
+    def packet_in_config_handler(self, ev):
+        pass
+
+
+def _legacy_dispatch(brick, ev, state):
+    observers = []
+    for k, v in brick.observers.get(ev.__class__, {}).items():
+        if not state or not v or state in v:
+            observers.append(k)
+
+    def dispatchers(x):
+        return x.callers[ev.__class__].dispatchers
+
+    handlers = [handler for handler in brick.event_handlers.get(
+        ev.__class__, []) if state in dispatchers(handler)]
+    return observers, handlers
+
+
+def _indexed_dispatch(brick, ev, state):
+    return brick.get_observers(ev, state), brick.get_handlers(ev, state)
+
+
+def main():
+    brick = _Brick()
+    brick.register_handler(ofp_event.EventOFPPacketIn,
+                           brick.packet_in_handler)
+    brick.register_handler(ofp_event.EventOFPPacketIn,
+                           brick.packet_in_config_handler)
+    for i in range(8):
+        brick.register_observer(ofp_event.EventOFPPacketIn, 'app%d' % i,
+                                [MAIN_DISPATCHER])
+    ev = ofp_event.EventOFPPacketIn(None)
+
+    assert (list(_indexed_dispatch(brick, ev, MAIN_DISPATCHER)[1]) ==
+            _legacy_dispatch(brick, ev, MAIN_DISPATCHER)[1])
+
+    for name, func in (('legacy', _legacy_dispatch),
+                       ('indexed', _indexed_dispatch)):
+        elapsed = timeit.timeit(lambda: func(brick, ev, MAIN_DISPATCHER),
+                                number=NUMBER)
+        print('%-8s %8.3f usec/event' % (name, elapsed / NUMBER * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of ryu.app.ofctl.api.install_flows.
+
+Installs RULES flow-mods to a fake OpenFlow 1.4 switch, which replies
+each barrier after LATENCY seconds, and reports the rules per second:
+
+- one barrier per flow-mod, as ryu.app.ofctl.api.send_msg does,
+- batches of BATCH_SIZE flow-mods with a window of 1 and WINDOW batches,
+- the same, each batch in a bundle.
+
+The flow-mods are serialized as by Datapath.send_msg, but not sent.
+
+Usage::
+
+    $ python -m ryu.tests.benchmark.bench_flow_install
+"""
+
+from __future__ import print_function
+
+from ryu.app.ofctl import api as ofctl_api
+from ryu.app.ofctl import service
+from ryu.controller import ofp_event
+from ryu.lib import hub
+from ryu.ofproto import ofproto_protocol
+from ryu.ofproto import ofproto_v1_4
+
+RULES = 20000
+LATENCY = 0.001
+BATCH_SIZE = 100
+WINDOW = 4
+
+
+class _Switch(ofproto_protocol.ProtocolDesc):
+    def __init__(self, svc):
+        super(_Switch, self).__init__(ofproto_v1_4.OFP_VERSION)
+        self.id = 1
+        self.xid = 0
+        self.svc = svc
+
+    def set_xid(self, msg):
+        self.xid = (self.xid + 1) & 0xffffffff
+        msg.set_xid(self.xid)
+        return self.xid
+
+    def send_msg(self, msg):
+        msg.serialize()
+        if isinstance(msg, self.ofproto_parser.OFPBarrierRequest):
+            rep = self.ofproto_parser.OFPBarrierReply(self)
+            rep.xid = msg.xid
+            hub.spawn_after(LATENCY, self.svc._handle_barrier,
+                            ofp_event.EventOFPBarrierReply(rep))
+        return True
+
+
+class _App(object):
+    def __init__(self, svc):
+        self.svc = svc
+
+    def send_request(self, req):
+        req.src = 'bench'
+        req.sync = True
+        req.reply_q = hub.Queue()
+        self.svc._handle_install_flows(req)
+        return req.reply_q.get()
+
+
+def _flow_mods(dp):
+    ofp = dp.ofproto
+    parser = dp.ofproto_parser
+    msgs = []
+    for i in range(RULES):
+        actions = [parser.OFPActionOutput(i % 48 + 1)]
+        inst = [parser.OFPInstructionActions(ofp.OFPIT_APPLY_ACTIONS,
+                                             actions)]
+        match = parser.OFPMatch(eth_type=0x800, ipv4_dst=i)
+        msgs.append(parser.OFPFlowMod(dp, priority=100, match=match,
+                                      instructions=inst))
+    return msgs
+
+
+def main():
+    svc = service.OfctlService()
+    dp = _Switch(svc)
+    svc._switches[dp.id] = service._SwitchInfo(dp)
+    app = _App(svc)
+
+    print('%d rules, %.1f msec barrier latency' % (RULES, LATENCY * 1e3))
+    for name, kwargs in (
+            ('barrier per rule', dict(batch_size=1, window=1)),
+            ('batch, window 1', dict(batch_size=BATCH_SIZE, window=1)),
+            ('batch, window %d' % WINDOW,
+             dict(batch_size=BATCH_SIZE, window=WINDOW)),
+            ('bundle, window %d' % WINDOW,
+             dict(batch_size=BATCH_SIZE, window=WINDOW, bundle=True))):
+        result = ofctl_api.install_flows(app, _flow_mods(dp), **kwargs)
+        print('%-18s %8.0f rules/sec' % (name, result.rules_per_sec))
+
+
+if __name__ == '__main__':
+    main()
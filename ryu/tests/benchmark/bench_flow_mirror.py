@@ -0,0 +1,131 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of ryu.app.ofctl.flow_mirror.
+
+Installs FLOWS flow entries of COOKIES cookies to the mirror of a fake
+OpenFlow 1.3 switch and reports:
+
+- the cost of mirroring a flow-mod in Datapath.send_msg,
+- the time to look up the entries of a cookie from the mirror and by
+  scanning the entries of a full dump,
+- the number of the flow entries transferred by a reconciling round, in
+  sync and with an entry of a cookie lost on the switch, compared to a
+  full dump of FLOWS entries.
+
+The stats requests are served by replacing ryu.app.ofctl.api.send_msg.
+
+Usage::
+
+    $ python -m ryu.tests.benchmark.bench_flow_mirror
+"""
+
+from __future__ import print_function
+
+import time
+
+from ryu.app.ofctl import api as ofctl_api
+from ryu.app.ofctl import flow_mirror
+from ryu.ofproto import ofproto_protocol
+from ryu.ofproto import ofproto_v1_3
+
+FLOWS = 20000
+COOKIES = 200
+LOOKUPS = 200
+
+
+class _Datapath(ofproto_protocol.ProtocolDesc):
+    def __init__(self, dpid):
+        super(_Datapath, self).__init__(ofproto_v1_3.OFP_VERSION)
+        self.id = dpid
+        self.xid = 0
+
+
+class _Switch(object):
+    def __init__(self, entries):
+        self.entries = entries
+        self.transferred = 0
+
+    def send_msg(self, app, msg, reply_cls=None, reply_multi=False):
+        dp = msg.datapath
+        parser = dp.ofproto_parser
+        if msg.cookie_mask:
+            entries = [e for e in self.entries if e.cookie == msg.cookie]
+        else:
+            entries = self.entries
+        if isinstance(msg, parser.OFPAggregateStatsRequest):
+            body = parser.OFPAggregateStats(0, 0, len(entries))
+            return [reply_cls(dp, body=body)]
+        self.transferred += len(entries)
+        return [reply_cls(dp, body=[parser.OFPFlowStats(
+            table_id=e.table_id, priority=e.priority, idle_timeout=0,
+            hard_timeout=0, flags=0, cookie=e.cookie, match=e.match,
+            instructions=e.instructions) for e in entries])]
+
+
+def _flow_mods(dp):
+    ofp = dp.ofproto
+    parser = dp.ofproto_parser
+    for i in range(FLOWS):
+        actions = [parser.OFPActionOutput(i % 48 + 1)]
+        inst = [parser.OFPInstructionActions(ofp.OFPIT_APPLY_ACTIONS,
+                                             actions)]
+        match = parser.OFPMatch(eth_type=0x800, ipv4_dst=(i, 0xffffffff))
+        msg = parser.OFPFlowMod(dp, cookie=i % COOKIES, priority=100,
+                                match=match, instructions=inst)
+        dp.xid += 1
+        msg.set_xid(dp.xid)
+        yield msg
+
+
+def main():
+    dp = _Datapath(1)
+    app = flow_mirror.FlowMirror()
+    msgs = list(_flow_mods(dp))
+    start = time.time()
+    for msg in msgs:
+        app._msg_sent(msg)
+    elapsed = time.time() - start
+    table = app.get_table(dp.id)
+    print('%d flows of %d cookies' % (len(table), COOKIES))
+    print('mirror a flow-mod    %8.2f usec' % (elapsed / FLOWS * 1e6))
+
+    dump = list(table)
+    start = time.time()
+    for i in range(LOOKUPS):
+        table.lookup(cookie=i % COOKIES)
+    mirror = (time.time() - start) / LOOKUPS
+    start = time.time()
+    for i in range(LOOKUPS):
+        [e for e in dump if e.cookie == i % COOKIES]
+    scan = (time.time() - start) / LOOKUPS
+    print('lookup a cookie      %8.2f usec (mirror) %8.2f usec (scan)' % (
+        mirror * 1e6, scan * 1e6))
+
+    switch = _Switch(dump)
+    ofctl_api.send_msg = switch.send_msg
+    app.reconcile(dp)
+    print('reconcile in sync    %8d entries transferred' % switch.transferred)
+    switch.transferred = 0
+    switch.entries = dump[1:]
+    fixed = app.reconcile(dp)
+    print('reconcile 1 lost     %8d entries transferred (%d fixed)' % (
+        switch.transferred, fixed))
+    print('full dump            %8d entries transferred' % FLOWS)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of ryu.controller.flowmod_coalescer.
+
+Replays the flow-mods of a learning switch under a packet-in storm:
+each of FLOWS flow entries is added DUPLICATES times (once per packet-in
+which raced ahead of the installation) and then modified once, and
+reports the number of the flow-mods sent to the switch and the time
+per send_msg without the coalescer, with the dedup window, and with the
+coalesce delay.
+
+Usage::
+
+    $ python -m ryu.tests.benchmark.bench_flowmod_coalescer
+"""
+
+from __future__ import print_function
+
+import time
+
+from ryu.controller import flowmod_coalescer
+from ryu.ofproto import ofproto_protocol
+from ryu.ofproto import ofproto_v1_3
+
+FLOWS = 2000
+DUPLICATES = 5
+
+
+class _Datapath(ofproto_protocol.ProtocolDesc):
+    def __init__(self):
+        super(_Datapath, self).__init__(ofproto_v1_3.OFP_VERSION)
+        self.xid = 0
+        self.sent = 0
+        self.sent_bytes = 0
+        self.coalescer = None
+
+    def send_msg(self, msg):
+        self.xid += 1
+        msg.set_xid(self.xid)
+        if self.coalescer is not None:
+            return self.coalescer.send_msg(msg)
+        msg.serialize()
+        return self._send_serialized(msg)
+
+    def _send_serialized(self, msg, close_socket=False):
+        self.sent += 1
+        self.sent_bytes += len(msg.buf)
+        return True
+
+
+def _flow_mods(dp):
+    ofp = dp.ofproto
+    parser = dp.ofproto_parser
+
+    def _flow_mod(i, command, port):
+        actions = [parser.OFPActionOutput(port)]
+        inst = [parser.OFPInstructionActions(ofp.OFPIT_APPLY_ACTIONS,
+                                             actions)]
+        match = parser.OFPMatch(in_port=1, eth_dst='00:00:00:00:%02x:%02x' %
+                                (i >> 8, i & 0xff))
+        return parser.OFPFlowMod(dp, command=command, priority=1,
+                                 match=match, instructions=inst)
+
+    msgs = []
+    for i in range(FLOWS):
+        msgs.extend(_flow_mod(i, ofp.OFPFC_ADD, 2)
+                    for _ in range(DUPLICATES))
+        msgs.append(_flow_mod(i, ofp.OFPFC_MODIFY_STRICT, 3))
+    return msgs
+
+
+def main():
+    print('%d flows, %d duplicated adds and a modify each' % (
+        FLOWS, DUPLICATES))
+    for name, kwargs in (('none', None),
+                         ('dedup', dict(dedup_window=1.0)),
+                         ('coalesce', dict(dedup_window=1.0,
+                                           coalesce_delay=1.0))):
+        dp = _Datapath()
+        if kwargs is not None:
+            dp.coalescer = flowmod_coalescer.FlowModCoalescer(dp, **kwargs)
+        msgs = _flow_mods(dp)
+        start = time.time()
+        for msg in msgs:
+            dp.send_msg(msg)
+        if dp.coalescer is not None:
+            dp.coalescer.flush()
+        elapsed = time.time() - start
+        print('%-9s %6d flow-mods sent %8d bytes %6.1f usec/send_msg' % (
+            name, dp.sent, dp.sent_bytes, elapsed / len(msgs) * 1e6))
+
+
+if __name__ == '__main__':
+    main()
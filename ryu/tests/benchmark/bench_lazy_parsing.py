@@ -0,0 +1,82 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of the lazy parsing on PACKET_IN storms.
+
+Parses OpenFlow 1.3 messages from ryu/tests/packet_data with the eager
+and the lazy parsing, where the handler looks only at the fixed part
+(msg.xid), or at the whole message (e.g., msg.match and msg.data).
+
+Usage::
+
+    $ python -m ryu.tests.benchmark.bench_lazy_parsing
+"""
+
+from __future__ import print_function
+
+import os
+import timeit
+
+from ryu.ofproto import ofproto_parser
+from ryu.ofproto import ofproto_protocol
+from ryu.ofproto import ofproto_v1_3
+
+NUMBER = 2000
+
+_MSGS = [
+    '4-4-ofp_packet_in.packet',
+    '4-40-ofp_flow_removed.packet',
+    '4-12-ofp_flow_stats_reply.packet',
+]
+
+
+def _load(name):
+    path = os.path.join(os.path.dirname(__file__), '../packet_data/of13',
+                        name)
+    return open(path, 'rb').read()
+
+
+def _parse(dp, buf):
+    (version, msg_type, msg_len, xid) = ofproto_parser.header(buf)
+    return ofproto_parser.msg(dp, version, msg_type, msg_len, xid, buf)
+
+
+def _fixed_part(msg):
+    return msg.xid
+
+
+def _whole(msg):
+    return [getattr(msg, attr) for attr in msg._LAZY_ATTRIBUTES]
+
+
+def main():
+    dp = ofproto_protocol.ProtocolDesc(version=ofproto_v1_3.OFP_VERSION)
+    for name in _MSGS:
+        buf = _load(name)
+        for access_name, access in (('fixed part', _fixed_part),
+                                    ('whole', _whole)):
+            for lazy in (False, True):
+                ofproto_parser.set_lazy_parsing(lazy)
+                elapsed = timeit.timeit(lambda: access(_parse(dp, buf)),
+                                        number=NUMBER)
+                print('%-36s %-10s %-5s %8.2f usec/msg' % (
+                    name, access_name, 'lazy' if lazy else 'eager',
+                    elapsed / NUMBER * 1e6))
+    ofproto_parser.set_lazy_parsing(False)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of the LLDP transmission of ryu.topology.switches.
+
+Sends LLDP to all the ports of 48-port OpenFlow 1.3 switches one by one
+("per port") and with the --lldp-batch mode ("batch"), and reports the
+CPU time and the number of writes per switch.  In the per port mode,
+lldp_loop also sleeps LLDP_SEND_GUARD between the periodic packets,
+which bounds the time to probe all the ports of a switch.
+
+Usage::
+
+    $ python -m ryu.tests.benchmark.bench_lldp_batch
+"""
+
+from __future__ import print_function
+
+import timeit
+
+from ryu.ofproto import ofproto_protocol
+from ryu.ofproto import ofproto_v1_3
+from ryu.ofproto import ofproto_v1_3_parser
+from ryu.topology import switches
+
+SWITCHES = 10
+PORTS = 48
+NUMBER = 20
+
+
+class _Datapath(ofproto_protocol.ProtocolDesc):
+    def __init__(self, dpid):
+        super(_Datapath, self).__init__(ofproto_v1_3.OFP_VERSION)
+        self.id = dpid
+        self.xid = 0
+        self.writes = 0
+
+    def set_xid(self, msg):
+        self.xid += 1
+        msg.set_xid(self.xid)
+        return self.xid
+
+    def send(self, buf):
+        self.writes += 1
+
+    def send_msg(self, msg):
+        if msg.xid is None:
+            self.set_xid(msg)
+        msg.serialize()
+        self.send(msg.buf)
+
+
+def _setup():
+    app = switches.Switches()
+    ports = []
+    for dpid in range(1, SWITCHES + 1):
+        app.dps[dpid] = _Datapath(dpid)
+        for port_no in range(1, PORTS + 1):
+            ofpport = ofproto_v1_3_parser.OFPPort(
+                port_no=port_no, hw_addr='00:00:00:00:00:01', name=b'eth1',
+                config=0, state=0, curr=0, advertised=0, supported=0,
+                peer=0, curr_speed=0, max_speed=0)
+            port = switches.Port(dpid, ofproto_v1_3, ofpport)
+            app._port_added(port)
+            ports.append(port)
+    return app, ports
+
+
+def main():
+    app, ports = _setup()
+
+    def _per_port():
+        for port in ports:
+            app.send_lldp_packet(port)
+
+    def _batch():
+        app.send_lldp_packets(ports)
+
+    print('%d switches, %d ports each' % (SWITCHES, PORTS))
+    for name, func in (('per port', _per_port), ('batch', _batch)):
+        for dp in app.dps.values():
+            dp.writes = 0
+        elapsed = min(timeit.repeat(func, number=NUMBER, repeat=3))
+        writes = sum(dp.writes for dp in app.dps.values())
+        print('%-8s %8.1f usec/switch %6.1f writes/switch' % (
+            name, elapsed / NUMBER / SWITCHES * 1e6,
+            float(writes) / (3 * NUMBER * SWITCHES)))
+    print('per port guard sleep: %.2f sec/switch' % (
+        PORTS * switches.Switches.LLDP_SEND_GUARD))
+
+
+if __name__ == '__main__':
+    main()
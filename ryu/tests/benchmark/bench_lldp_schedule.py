@@ -0,0 +1,118 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of the LLDP scheduling and link aging of ryu.topology.switches.
+
+With 50k ports and 50k links, measures the work of one wakeup of
+lldp_loop and link_loop when none or 1% of the ports and links are due: a full
+scan of the ports and links ("scan", as before) and the due entries of
+the heap of PortDataState and of the aging order of LinkState ("due").
+
+Usage::
+
+    $ python -m ryu.tests.benchmark.bench_lldp_schedule
+"""
+
+from __future__ import print_function
+
+import time
+import timeit
+
+from ryu.ofproto import ofproto_v1_3
+from ryu.ofproto import ofproto_v1_3_parser
+from ryu.topology import switches
+
+PORTS = 50000
+NUMBER = 20
+PERIOD = .9
+LINK_TIMEOUT = 10.
+
+
+def _port(dpid, port_no):
+    ofpport = ofproto_v1_3_parser.OFPPort(
+        port_no=port_no, hw_addr='00:00:00:00:00:01', name=b'eth1',
+        config=0, state=0, curr=0, advertised=0, supported=0, peer=0,
+        curr_speed=0, max_speed=0)
+    return switches.Port(dpid, ofproto_v1_3, ofpport)
+
+
+def _setup():
+    ports = switches.PortDataState(PERIOD)
+    links = switches.LinkState()
+    all_ports = [_port(i // 50 + 1, i % 50 + 1) for i in range(PORTS)]
+    for i, port in enumerate(all_ports):
+        ports.add_port(port, b'')
+        links.update_link(port, all_ports[i ^ 1])
+    ports.get_due(time.time())
+    for port in all_ports:
+        ports.lldp_sent(port)
+    return ports, links
+
+
+def _scan_lldp(ports, now):
+    # lldp_loop before the heap: the ports are ordered by transmission
+    due = []
+    for (key, data) in list(ports.items()):
+        if data.timestamp + PERIOD <= now:
+            due.append(key)
+            continue
+        break
+    return due
+
+
+def _scan_links(links, now):
+    return [link for (link, timestamp) in links.items()
+            if timestamp + LINK_TIMEOUT < now]
+
+
+def _run(ports, links, count):
+    port_list = list(ports)
+    link_list = list(links)
+    # the time when count ports or links are due
+    lldp_now = ports[port_list[count]].due - 1e-6
+    link_now = links[link_list[count]] + LINK_TIMEOUT
+
+    def _due_lldp():
+        due = ports.get_due(lldp_now)[1]
+        for port in due:
+            # reschedule as lldp_sent() would do
+            ports._schedule(port, ports[port], ports[port].due)
+        return due
+
+    def _due_links():
+        return links.get_expired(link_now - LINK_TIMEOUT)
+
+    cases = [
+        ('lldp_loop', lambda: _scan_lldp(ports, lldp_now), _due_lldp),
+        ('link_loop', lambda: _scan_links(links, link_now), _due_links),
+    ]
+    for name, scan, due in cases:
+        assert len(scan()) == len(due()) == count
+        for kind, func in (('scan', scan), ('due', due)):
+            elapsed = min(timeit.repeat(func, number=NUMBER, repeat=3))
+            print('%5d due  %-10s %-5s %10.1f usec/wakeup' % (
+                count, name, kind, elapsed / NUMBER * 1e6))
+
+
+def main():
+    ports, links = _setup()
+    print('%d ports, %d links' % (len(ports), len(links)))
+    for count in (0, PORTS // 100):
+        _run(ports, links, count)
+
+
+if __name__ == '__main__':
+    main()
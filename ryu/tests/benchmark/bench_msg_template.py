@@ -0,0 +1,83 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of MsgTemplate.
+
+Serializes OpenFlow 1.3 Packet-Out of LLDP and Flow-Mod of a learning
+switch, built from scratch and patched from a template.
+
+Usage::
+
+    $ python -m ryu.tests.benchmark.bench_msg_template
+"""
+
+from __future__ import print_function
+
+import timeit
+
+from ryu.ofproto import ofproto_protocol
+from ryu.ofproto import ofproto_v1_3
+from ryu.ofproto import ofproto_v1_3_parser as parser
+
+NUMBER = 20000
+
+_DP = ofproto_protocol.ProtocolDesc(version=ofproto_v1_3.OFP_VERSION)
+_DATA = b'\x01' * 60
+
+
+def _packet_out(port_no):
+    actions = [parser.OFPActionOutput(port_no)]
+    return parser.OFPPacketOut(_DP, ofproto_v1_3.OFP_NO_BUFFER,
+                               ofproto_v1_3.OFPP_CONTROLLER, actions, _DATA)
+
+
+def _flow_mod(in_port, port_no):
+    match = parser.OFPMatch(in_port=in_port, eth_dst='00:00:00:00:00:01',
+                            eth_src='00:00:00:00:00:02')
+    actions = [parser.OFPActionOutput(port_no)]
+    inst = [parser.OFPInstructionActions(ofproto_v1_3.OFPIT_APPLY_ACTIONS,
+                                         actions)]
+    return parser.OFPFlowMod(_DP, priority=1, match=match,
+                             instructions=inst)
+
+
+def _serialize(msg):
+    msg.set_xid(1)
+    msg.serialize()
+    return msg.buf
+
+
+def main():
+    packet_out = parser.MsgTemplate(_packet_out(0))
+    flow_mod = parser.MsgTemplate(_flow_mod(0, 0))
+    cases = [
+        ('packet_out', 'scratch',
+         lambda: _serialize(_packet_out(2))),
+        ('packet_out', 'template',
+         lambda: _serialize(packet_out.build(output_port=2, data=_DATA))),
+        ('flow_mod', 'scratch',
+         lambda: _serialize(_flow_mod(1, 2))),
+        ('flow_mod', 'template',
+         lambda: _serialize(flow_mod.build(in_port=1, output_port=2))),
+    ]
+    for name, mode, func in cases:
+        elapsed = timeit.timeit(func, number=NUMBER)
+        print('%-12s %-8s %8.2f usec/msg' % (name, mode,
+                                             elapsed / NUMBER * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of the OXM field codecs.
+
+Parses and serializes the OXM TLVs of matches with 1, 5 and 15 fields
+with the generic conversions (oxm_parse/oxm_to_user and
+oxm_from_user/oxm_serialize) and with the compiled codecs
+(oxm_parse_user and oxm_serialize_user), and measures OFPMatch.parser
+and OFPMatch.serialize of OpenFlow 1.3 and 1.4 which use the latter.
+
+Usage::
+
+    $ python -m ryu.tests.benchmark.bench_oxm
+"""
+
+from __future__ import print_function
+
+import timeit
+
+from ryu.ofproto import ofproto_v1_3
+from ryu.ofproto import ofproto_v1_3_parser
+from ryu.ofproto import ofproto_v1_4
+from ryu.ofproto import ofproto_v1_4_parser
+
+NUMBER = 5000
+
+_FIELDS = [
+    ('in_port', 1),
+    ('eth_dst', '00:00:00:00:00:01'),
+    ('eth_src', ('00:00:00:00:00:02', 'ff:ff:ff:00:00:00')),
+    ('eth_type', 0x0800),
+    ('vlan_vid', 0x1000 | 10),
+    ('vlan_pcp', 3),
+    ('ip_dscp', 10),
+    ('ip_ecn', 1),
+    ('ip_proto', 6),
+    ('ipv4_src', '192.168.0.1'),
+    ('ipv4_dst', ('10.0.0.0', '255.0.0.0')),
+    ('tcp_src', 1234),
+    ('tcp_dst', 80),
+    ('metadata', (0x100, 0xff00)),
+    ('tunnel_id', 5),
+]
+
+
+def _generic_serialize(ofproto, fields):
+    buf = bytearray()
+    offset = 0
+    for (n, value, mask) in [ofproto.oxm_from_user(k, uv)
+                             for (k, uv) in fields]:
+        offset += ofproto.oxm_serialize(n, value, mask, buf, offset)
+    return buf
+
+
+def _compiled_serialize(ofproto, fields):
+    buf = bytearray()
+    offset = 0
+    for (k, uv) in fields:
+        offset += ofproto.oxm_serialize_user(k, uv, buf, offset)
+    return buf
+
+
+def _generic_parse(ofproto, buf):
+    fields = []
+    offset = 0
+    while offset < len(buf):
+        n, value, mask, field_len = ofproto.oxm_parse(buf, offset)
+        fields.append(ofproto.oxm_to_user(n, value, mask))
+        offset += field_len
+    return fields
+
+
+def _compiled_parse(ofproto, buf):
+    fields = []
+    offset = 0
+    while offset < len(buf):
+        k, uv, field_len = ofproto.oxm_parse_user(buf, offset)
+        fields.append((k, uv))
+        offset += field_len
+    return fields
+
+
+def _match_serialize(match):
+    buf = bytearray()
+    match.serialize(buf, 0)
+    return buf
+
+
+def _report(name, num, mode, func):
+    elapsed = timeit.timeit(func, number=NUMBER)
+    print('%-24s %2d fields %-9s %8.2f usec' % (
+        name, num, mode, elapsed / NUMBER * 1e6))
+
+
+def main():
+    ofproto = ofproto_v1_3
+    for num in (1, 5, 15):
+        fields = _FIELDS[:num]
+        tlvs = bytes(_compiled_serialize(ofproto, fields))
+        assert tlvs == bytes(_generic_serialize(ofproto, fields))
+        assert (_compiled_parse(ofproto, tlvs) ==
+                _generic_parse(ofproto, tlvs))
+
+        _report('oxm serialize', num, 'generic',
+                lambda: _generic_serialize(ofproto, fields))
+        _report('oxm serialize', num, 'compiled',
+                lambda: _compiled_serialize(ofproto, fields))
+        _report('oxm parse', num, 'generic',
+                lambda: _generic_parse(ofproto, tlvs))
+        _report('oxm parse', num, 'compiled',
+                lambda: _compiled_parse(ofproto, tlvs))
+
+        for parser in (ofproto_v1_3_parser, ofproto_v1_4_parser):
+            match = parser.OFPMatch(**dict(fields))
+            buf = bytes(_match_serialize(match))
+            name = 'OFPMatch v%s' % parser.__name__[-8:-7]
+            _report(name + ' serialize', num, '',
+                    lambda: _match_serialize(match))
+            _report(name + ' parser', num, '',
+                    lambda: parser.OFPMatch.parser(buf, 0))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of decoding packets with ryu.lib.packet.
+
+Decodes 64-byte and 1500-byte ethernet/vlan/ipv4/tcp frames with the
+decoding loop before parse_until was introduced ("legacy"), with the
+current one, and with parse_until=ipv4, from bytes and from memoryview.
+
+Usage::
+
+    $ python -m ryu.tests.benchmark.bench_packet_parse
+"""
+
+from __future__ import print_function
+
+import struct
+import timeit
+
+import six
+
+from ryu.lib.packet import ethernet
+from ryu.lib.packet import ether_types
+from ryu.lib.packet import in_proto
+from ryu.lib.packet import ipv4
+from ryu.lib.packet import packet
+from ryu.lib.packet import tcp
+from ryu.lib.packet import vlan
+
+NUMBER = 10000
+
+
+def _frame(size):
+    # ethernet(14) + vlan(4) + ipv4(20) + tcp(20) + payload
+    pkt = packet.Packet()
+    pkt.add_protocol(ethernet.ethernet(ethertype=ether_types.ETH_TYPE_8021Q))
+    pkt.add_protocol(vlan.vlan(vid=10, ethertype=ether_types.ETH_TYPE_IP))
+    pkt.add_protocol(ipv4.ipv4(proto=in_proto.IPPROTO_TCP))
+    pkt.add_protocol(tcp.tcp(src_port=1234, dst_port=80))
+    pkt.add_protocol(b'\x01' * (size - 58))
+    pkt.serialize()
+    assert len(pkt.data) == size
+    return six.binary_type(pkt.data)
+
+
+def _legacy_parse(data, cls=ethernet.ethernet):
+    protocols = []
+    rest_data = data
+    while cls:
+        if not six.binary_type(rest_data).strip(b'\x00'):
+            break
+        try:
+            proto, cls, rest_data = cls.parser(rest_data)
+        except struct.error:
+            break
+        if proto:
+            protocols.append(proto)
+    if rest_data and six.binary_type(rest_data).strip(b'\x00'):
+        protocols.append(rest_data)
+    return protocols
+
+
+def main():
+    for size in (64, 1500):
+        data = _frame(size)
+        view = memoryview(data)
+        cases = [
+            ('legacy', lambda: _legacy_parse(data)),
+            ('bytes', lambda: packet.Packet(data)),
+            ('memoryview', lambda: packet.Packet(view)),
+            ('bytes, until ipv4',
+             lambda: packet.Packet(data, parse_until=ipv4.ipv4)),
+            ('memoryview, until ipv4',
+             lambda: packet.Packet(view, parse_until=ipv4.ipv4)),
+        ]
+        for name, func in cases:
+            elapsed = min(timeit.repeat(func, number=NUMBER, repeat=3))
+            print('%4d bytes %-24s %8.2f usec/packet' % (
+                size, name, elapsed / NUMBER * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of ryu.app.ofctl.poller.
+
+Polls the port stats of OpenFlow 1.3 switches, which reply after
+LATENCY seconds, one switch after another ("sequential", as a loop of
+synchronous requests does) and with StatsPoller.poll() ("fan-out"),
+and reports the time to collect the stats of all the switches.  The
+switches are faked by replacing the functions of ryu.app.ofctl.api.
+
+Usage::
+
+    $ python -m ryu.tests.benchmark.bench_stats_poller
+"""
+
+from __future__ import print_function
+
+import time
+
+from ryu.app.ofctl import api as ofctl_api
+from ryu.app.ofctl import poller
+from ryu.lib import hub
+from ryu.ofproto import ofproto_protocol
+from ryu.ofproto import ofproto_v1_3
+
+SWITCHES = 200
+LATENCY = 0.01
+
+
+class _Datapath(ofproto_protocol.ProtocolDesc):
+    def __init__(self, dpid):
+        super(_Datapath, self).__init__(ofproto_v1_3.OFP_VERSION)
+        self.id = dpid
+
+
+def _send_msg(app, msg, reply_cls=None, reply_multi=False):
+    hub.sleep(LATENCY)
+    dp = msg.datapath
+    stats = dp.ofproto_parser.OFPPortStats(1, *([0] * 14))
+    return [reply_cls(dp, body=[stats])]
+
+
+def main():
+    datapaths = [_Datapath(dpid) for dpid in range(1, SWITCHES + 1)]
+    ofctl_api.get_datapath = lambda app, dpid=None: datapaths
+    ofctl_api.send_msg = _send_msg
+    app = poller.StatsPoller()
+    app.send_event_to_observers = lambda ev: None
+
+    def _sequential():
+        for dp in datapaths:
+            req, reply_cls = poller.STATS_REQUESTS['port'](dp)
+            _send_msg(app, req, reply_cls, True)
+
+    print('%d switches, %.0f msec reply latency' % (SWITCHES, LATENCY * 1e3))
+    for name, func in (('sequential', _sequential),
+                       ('fan-out', lambda: app.poll('port'))):
+        start = time.time()
+        func()
+        print('%-10s %8.3f sec' % (name, time.time() - start))
+
+
+if __name__ == '__main__':
+    main()
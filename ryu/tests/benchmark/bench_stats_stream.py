@@ -0,0 +1,127 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of the flow stats retrieval of ofctl_rest.
+
+Dumps the flow entries of an OpenFlow 1.3 switch, whose multipart reply
+parts arrive one by one, with ofctl_v1_3.get_flow_stats() and a single
+JSON encoding ("collect"), with iter_flow_stats() and a chunked response
+("stream") and with a page of 1000 entries ("page"), and reports the
+time and the peak memory allocated by each.
+
+Usage::
+
+    $ python -m ryu.tests.benchmark.bench_stats_stream
+"""
+
+from __future__ import print_function
+
+import json
+import time
+import tracemalloc
+
+from ryu.app import ofctl_rest
+from ryu.lib import hub
+from ryu.lib import ofctl_v1_3
+from ryu.ofproto import ofproto_protocol
+from ryu.ofproto import ofproto_v1_3
+from ryu.ofproto import ofproto_v1_3_parser
+
+FLOWS = 20000
+FLOWS_PER_PART = 500
+PAGE = 1000
+
+
+def _flow_stats(i):
+    parser = ofproto_v1_3_parser
+    actions = [parser.OFPActionOutput(i % 48 + 1)]
+    inst = [parser.OFPInstructionActions(
+        ofproto_v1_3.OFPIT_APPLY_ACTIONS, actions)]
+    return parser.OFPFlowStats(
+        table_id=0, duration_sec=1, duration_nsec=2, priority=i % 100,
+        idle_timeout=0, hard_timeout=0, flags=0, cookie=i,
+        packet_count=3, byte_count=4,
+        match=parser.OFPMatch(in_port=1, eth_type=0x800,
+                              ipv4_dst=(i, 0xffffffff)),
+        instructions=inst)
+
+
+class _Datapath(ofproto_protocol.ProtocolDesc):
+    def __init__(self, waiters):
+        super(_Datapath, self).__init__(ofproto_v1_3.OFP_VERSION)
+        self.id = 1
+        self.waiters = waiters
+
+    def set_xid(self, msg):
+        msg.set_xid(1)
+
+    def send_msg(self, msg):
+        hub.spawn(self._reply, msg.xid)
+
+    def _reply(self, xid):
+        # The parts are parsed as they arrive from the switch.
+        for start in range(0, FLOWS, FLOWS_PER_PART):
+            hub.sleep(0)
+            waiters_per_dp = self.waiters.get(self.id, {})
+            if xid not in waiters_per_dp:
+                return
+            lock, msgs = waiters_per_dp[xid]
+            body = [_flow_stats(i) for i in
+                    range(start, min(start + FLOWS_PER_PART, FLOWS))]
+            flags = 0
+            if start + FLOWS_PER_PART < FLOWS:
+                flags = ofproto_v1_3.OFPMPF_REPLY_MORE
+            msgs.append(ofproto_v1_3_parser.OFPFlowStatsReply(
+                self, flags=flags, body=body))
+            if not flags:
+                del waiters_per_dp[xid]
+                lock.set()
+
+
+def _collect(dp, waiters):
+    return len(json.dumps(ofctl_v1_3.get_flow_stats(dp, waiters)))
+
+
+def _stream(dp, waiters):
+    res = ofctl_rest.stream_response(
+        dp, ofctl_v1_3.iter_flow_stats(dp, waiters))
+    return sum(len(chunk) for chunk in res.app_iter)
+
+
+def _page(dp, waiters):
+    res = ofctl_rest.paginated_response(
+        dp, ofctl_v1_3.iter_flow_stats(dp, waiters), PAGE)
+    return len(res.body)
+
+
+def main():
+    print('%d flows, %d flows per reply part' % (FLOWS, FLOWS_PER_PART))
+    for name, func in (('collect', _collect), ('stream', _stream),
+                       ('page', _page)):
+        waiters = {}
+        dp = _Datapath(waiters)
+        tracemalloc.start()
+        start = time.time()
+        size = func(dp, waiters)
+        elapsed = time.time() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print('%-8s %7.2f sec %8.1f MB peak %10d bytes of JSON' % (
+            name, elapsed, peak / 1e6, size))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of the timers of 10k BFD sessions.
+
+Each session has a periodic transmission timer of about 1 second and a
+detection timer of 3 seconds which is restarted on every transmission,
+as the peer would answer.  The timers are run with a pair of sleeping
+threads per session, as bfdlib used to do ("threads"), and with the
+shared hub.TimerWheel ("wheel").  Reports the memory allocated for the
+sessions and the wakeup latency of the transmission timers.
+
+Usage::
+
+    $ python -m ryu.tests.benchmark.bench_timer_wheel
+"""
+
+from __future__ import print_function
+
+import random
+import time
+import tracemalloc
+
+from ryu.lib import hub
+hub.patch()
+
+SESSIONS = 10000
+XMIT_PERIOD = 1.0
+DETECT_TIME = 3.0
+DURATION = 5.0
+
+
+class _ThreadSession(object):
+    def __init__(self, latencies):
+        self.latencies = latencies
+        self.lock = None
+        self.threads = [hub.spawn(self._send_loop),
+                        hub.spawn(self._recv_timeout_loop)]
+
+    def _send_loop(self):
+        due = time.time()
+        while True:
+            period = XMIT_PERIOD * random.uniform(0.75, 1.0)
+            due += period
+            hub.sleep(period)
+            self.latencies.append(time.time() - due)
+            due = time.time()
+            if self.lock is not None:
+                self.lock.set()
+
+    def _recv_timeout_loop(self):
+        while True:
+            self.lock = hub.Event()
+            self.lock.wait(timeout=DETECT_TIME)
+
+    def stop(self):
+        for thread in self.threads:
+            hub.kill(thread)
+
+
+class _WheelSession(object):
+    def __init__(self, latencies):
+        self.latencies = latencies
+        wheel = hub.get_timer_wheel()
+        self.detect_timer = wheel.schedule(DETECT_TIME, self._recv_timeout)
+        self.due = time.time()
+        self.send_timer = wheel.schedule(self._period(), self._send_timeout)
+
+    def _period(self):
+        period = XMIT_PERIOD * random.uniform(0.75, 1.0)
+        self.due += period
+        return period
+
+    def _send_timeout(self):
+        self.latencies.append(time.time() - self.due)
+        self.due = time.time()
+        self.send_timer.reschedule(self._period())
+        self.detect_timer.reschedule(DETECT_TIME)
+
+    def _recv_timeout(self):
+        self.detect_timer.reschedule(DETECT_TIME)
+
+    def stop(self):
+        self.send_timer.cancel()
+        self.detect_timer.cancel()
+
+
+def _run(name, cls):
+    latencies = []
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    sessions = [cls(latencies) for _ in range(SESSIONS)]
+    hub.sleep(0)
+    memory = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+
+    hub.sleep(DURATION)
+    for session in sessions:
+        session.stop()
+    hub.sleep(0.1)
+
+    latencies.sort()
+    print('%-8s %7.0f bytes/session  %6d wakeups  latency '
+          'mean %6.2f p99 %6.2f max %6.2f msec' % (
+              name, float(memory) / SESSIONS, len(latencies),
+              sum(latencies) / len(latencies) * 1e3,
+              latencies[int(len(latencies) * 0.99)] * 1e3,
+              latencies[-1] * 1e3))
+
+
+def main():
+    _run('threads', _ThreadSession)
+    _run('wheel', _WheelSession)
+
+
+if __name__ == '__main__':
+    main()
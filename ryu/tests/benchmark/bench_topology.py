@@ -0,0 +1,108 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of the topology queries of ryu.topology.switches.
+
+Builds a topology of 1k switches, each linked to 4 others in both
+directions, with 20 hosts per switch, and compares the per-dpid link
+and host queries and the edge port check done for each host discovery
+packet with full scans ("scan", as before the indexes were introduced)
+and with the indexes of LinkState and HostState ("index").
+
+Usage::
+
+    $ python -m ryu.tests.benchmark.bench_topology
+"""
+
+from __future__ import print_function
+
+import timeit
+
+from ryu.ofproto import ofproto_v1_3
+from ryu.ofproto import ofproto_v1_3_parser
+from ryu.topology import switches
+
+SWITCHES = 1000
+LINKS_PER_SWITCH = 4
+HOSTS_PER_SWITCH = 20
+NUMBER = 100
+
+
+def _port(dpid, port_no):
+    ofpport = ofproto_v1_3_parser.OFPPort(
+        port_no=port_no, hw_addr='00:00:00:00:00:01', name=b'eth1',
+        config=0, state=0, curr=0, advertised=0, supported=0, peer=0,
+        curr_speed=0, max_speed=0)
+    return switches.Port(dpid, ofproto_v1_3, ofpport)
+
+
+def _topology():
+    links = switches.LinkState()
+    hosts = switches.HostState()
+    for dpid in range(1, SWITCHES + 1):
+        for i in range(1, LINKS_PER_SWITCH // 2 + 1):
+            peer = (dpid + i - 1) % SWITCHES + 1
+            src = _port(dpid, LINKS_PER_SWITCH + i)
+            dst = _port(peer, i)
+            links.update_link(src, dst)
+            links.update_link(dst, src)
+        for i in range(HOSTS_PER_SWITCH):
+            mac = '00:00:%02x:%02x:%02x:%02x' % (
+                dpid >> 8, dpid & 0xff, i >> 8, i & 0xff)
+            hosts.add(switches.Host(mac, _port(dpid, 100 + i)))
+    return links, hosts
+
+
+def _scan_links(links, dpid):
+    return [link for link in links if link.src.dpid == dpid]
+
+
+def _scan_hosts(hosts, dpid):
+    return [host for host in hosts.values() if host.port.dpid == dpid]
+
+
+def _scan_is_edge_port(links, port):
+    for link in links:
+        if port == link.src or port == link.dst:
+            return False
+    return True
+
+
+def main():
+    links, hosts = _topology()
+    print('%d switches, %d links, %d hosts' % (
+        SWITCHES, len(links), len(hosts)))
+
+    dpid = SWITCHES // 2
+    port = _port(dpid, 100)
+    cases = [
+        ('links of a dpid', lambda: _scan_links(links, dpid),
+         lambda: links.get_by_dpid(dpid)),
+        ('hosts of a dpid', lambda: _scan_hosts(hosts, dpid),
+         lambda: hosts.get_by_dpid(dpid)),
+        ('edge port check', lambda: _scan_is_edge_port(links, port),
+         lambda: not links.has_port(port)),
+    ]
+    for name, scan, index in cases:
+        assert scan() == index()
+        for kind, func in (('scan', scan), ('index', index)):
+            elapsed = min(timeit.repeat(func, number=NUMBER, repeat=3))
+            print('%-16s %-6s %10.2f usec/query' % (
+                name, kind, elapsed / NUMBER * 1e6))
+
+
+if __name__ == '__main__':
+    main()
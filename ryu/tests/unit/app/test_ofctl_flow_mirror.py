@@ -0,0 +1,307 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+try:
+    import mock  # Python 2
+except ImportError:
+    from unittest import mock  # Python 3
+
+from nose.tools import eq_, ok_
+
+from ryu.app.ofctl import exception
+from ryu.app.ofctl import flow_mirror
+from ryu.controller import handler
+from ryu.controller import ofp_event
+from ryu.ofproto import ofproto_protocol
+from ryu.ofproto import ofproto_v1_0
+from ryu.ofproto import ofproto_v1_3
+from ryu.ofproto import ofproto_v1_5
+
+
+class _Datapath(ofproto_protocol.ProtocolDesc):
+    def __init__(self, dpid, version=ofproto_v1_3.OFP_VERSION):
+        super(_Datapath, self).__init__(version)
+        self.id = dpid
+        self.send_msg_observers = []
+        self.xid = 0
+
+    def send_msg(self, msg):
+        self.xid += 1
+        msg.set_xid(self.xid)
+        for observer in self.send_msg_observers:
+            observer(msg)
+
+
+class _FlowMirrorTestMixin(object):
+    version = None
+
+    def setUp(self):
+        self.app = flow_mirror.FlowMirror()
+        self.dp = _Datapath(1, self.version)
+        self.ofp = self.dp.ofproto
+        self.parser = self.dp.ofproto_parser
+        ev = ofp_event.EventOFPStateChange(self.dp)
+        ev.state = handler.HANDSHAKE_DISPATCHER
+        self.app._state_change_handler(ev)
+
+    def _flow_mod(self, command=None, table_id=0, priority=10, cookie=0,
+                  cookie_mask=0, port=1, out_port=None, **match):
+        ofp = self.ofp
+        parser = self.parser
+        if command is None:
+            command = ofp.OFPFC_ADD
+        actions = [parser.OFPActionOutput(port)]
+        inst = [parser.OFPInstructionActions(ofp.OFPIT_APPLY_ACTIONS,
+                                             actions)]
+        msg = parser.OFPFlowMod(
+            self.dp, cookie=cookie, cookie_mask=cookie_mask,
+            table_id=table_id, command=command, priority=priority,
+            out_port=ofp.OFPP_ANY if out_port is None else out_port,
+            out_group=ofp.OFPG_ANY, match=parser.OFPMatch(**match),
+            instructions=inst)
+        self.dp.send_msg(msg)
+        return msg
+
+    def _install(self):
+        self._flow_mod(cookie=1, in_port=1, eth_type=0x800)
+        self._flow_mod(cookie=1, in_port=2, eth_type=0x800)
+        self._flow_mod(cookie=2, priority=20, in_port=1, port=3)
+        self._flow_mod(table_id=1, cookie=3, in_port=1)
+        return self.app.get_table(1)
+
+    def _port(self, entry):
+        return entry.instructions[0].actions[0].port
+
+    def test_add(self):
+        table = self._install()
+        eq_(4, len(table))
+        entry = table.get(0, 10, self.parser.OFPMatch(eth_type=0x800,
+                                                      in_port=2))
+        eq_(1, entry.cookie)
+        eq_(None, table.get(0, 11, self.parser.OFPMatch(in_port=2)))
+        eq_(2, len(table.lookup(cookie=1)))
+        eq_(3, len(table.lookup(table_id=0)))
+        eq_(3, len(table.lookup(match={'in_port': 1})))
+        eq_(1, len(table.lookup(table_id=0, priority=20)))
+        eq_(2, len(table.lookup(cookie=0, cookie_mask=2)))
+        eq_(sorted([1, 2, 3]), sorted(table.cookies()))
+
+        # replace
+        self._flow_mod(cookie=4, in_port=1, eth_type=0x800, port=5)
+        eq_(4, len(table))
+        entry = table.get(0, 10, self.parser.OFPMatch(in_port=1,
+                                                      eth_type=0x800))
+        eq_(4, entry.cookie)
+        eq_(5, self._port(entry))
+
+    def test_modify(self):
+        table = self._install()
+        ofp = self.ofp
+        self._flow_mod(ofp.OFPFC_MODIFY, port=9, eth_type=0x800)
+        eq_([9, 9], [self._port(e) for e in table.lookup(cookie=1)])
+        eq_(3, self._port(table.lookup(cookie=2)[0]))
+        self._flow_mod(ofp.OFPFC_MODIFY_STRICT, priority=20, port=8,
+                       in_port=1)
+        eq_(8, self._port(table.lookup(cookie=2)[0]))
+        eq_(2, table.lookup(cookie=2)[0].cookie)
+        # no entry is added
+        self._flow_mod(ofp.OFPFC_MODIFY, priority=30, in_port=4)
+        eq_(4, len(table))
+
+    def test_delete(self):
+        table = self._install()
+        ofp = self.ofp
+        self._flow_mod(ofp.OFPFC_DELETE_STRICT, priority=20, in_port=1)
+        eq_(3, len(table))
+        self._flow_mod(ofp.OFPFC_DELETE, cookie=1, cookie_mask=0xff,
+                       in_port=1)
+        eq_(2, len(table))
+        self._flow_mod(ofp.OFPFC_DELETE, out_port=2)
+        eq_(2, len(table))
+        self._flow_mod(ofp.OFPFC_DELETE, table_id=ofp.OFPTT_ALL,
+                       out_port=1)
+        eq_(0, len(table))
+        eq_([], table.cookies())
+
+    def test_flow_removed(self):
+        table = self._install()
+        msg = self.parser.OFPFlowRemoved(
+            self.dp, table_id=0, priority=20,
+            match=self.parser.OFPMatch(in_port=1), cookie=2)
+        self.app._flow_removed_handler(ofp_event.EventOFPFlowRemoved(msg))
+        eq_(3, len(table))
+        eq_([], table.lookup(cookie=2))
+
+    def test_error(self):
+        table = self._install()
+        ofp = self.ofp
+        mod = self._flow_mod(ofp.OFPFC_DELETE, table_id=ofp.OFPTT_ALL)
+        add = self._flow_mod(cookie=5, in_port=7)
+        eq_(1, len(table))
+        # the entry added later is kept
+        err = self.parser.OFPErrorMsg(self.dp, type_=ofp.OFPET_FLOW_MOD_FAILED)
+        err.xid = mod.xid
+        self.app._error_msg_handler(ofp_event.EventOFPErrorMsg(err))
+        eq_(5, len(table))
+        eq_(1, table.errors_reverted)
+        err.xid = add.xid
+        self.app._error_msg_handler(ofp_event.EventOFPErrorMsg(err))
+        eq_(4, len(table))
+        eq_([], table.lookup(cookie=5))
+        # not a mirrored flow-mod
+        self.app._error_msg_handler(ofp_event.EventOFPErrorMsg(err))
+        eq_(2, table.errors_reverted)
+
+    def test_not_flow_mod(self):
+        self.dp.send_msg(self.parser.OFPBarrierRequest(self.dp))
+        eq_(None, self.app.get_table(1))
+
+    def test_dead(self):
+        self._install()
+        ev = ofp_event.EventOFPStateChange(self.dp)
+        ev.state = handler.DEAD_DISPATCHER
+        self.app._state_change_handler(ev)
+        eq_(None, self.app.get_table(1))
+        eq_([], self.app.lookup(1, cookie=1))
+
+    def _switch_send_msg(self, app, msg, reply_cls=None, reply_multi=False):
+        # serves the stats requests from self.switch, a list of FlowEntry
+        ok_(reply_multi)
+        self.requests.append(msg)
+        parser = self.parser
+        if msg.cookie_mask:
+            entries = [e for e in self.switch if e.cookie == msg.cookie]
+        else:
+            entries = self.switch
+        if isinstance(msg, parser.OFPAggregateStatsRequest):
+            if self.version >= ofproto_v1_5.OFP_VERSION:
+                body = parser.OFPAggregateStats(
+                    stats=parser.OFPStats(flow_count=len(entries)))
+            else:
+                body = parser.OFPAggregateStats(0, 0, len(entries))
+            return [reply_cls(self.dp, body=body)]
+        if self.version >= ofproto_v1_5.OFP_VERSION:
+            stats_cls = parser.OFPFlowDesc
+        else:
+            stats_cls = parser.OFPFlowStats
+        body = [stats_cls(table_id=e.table_id, priority=e.priority,
+                          idle_timeout=0, hard_timeout=0, flags=0,
+                          cookie=e.cookie, match=e.match,
+                          instructions=e.instructions)
+                for e in entries]
+        return [reply_cls(self.dp, body=body[:1]),
+                reply_cls(self.dp, body=body[1:])]
+
+    def _reconcile(self):
+        self.requests = []
+        with mock.patch('ryu.app.ofctl.api.send_msg',
+                        side_effect=self._switch_send_msg):
+            return self.app.reconcile(self.dp)
+
+    def _dumps(self):
+        return [req for req in self.requests
+                if not isinstance(req, self.parser.OFPAggregateStatsRequest)]
+
+    def test_reconcile_in_sync(self):
+        table = self._install()
+        self.switch = list(table)
+        eq_(0, self._reconcile())
+        # the count only and a dump of a cookie in turn
+        eq_(2, len(self.requests))
+        cookies = set()
+        for i in range(3):
+            self._reconcile()
+            cookies.add(self._dumps()[0].cookie)
+        eq_(set([1, 2, 3]), cookies)
+
+    def test_reconcile_stale(self):
+        table = self._install()
+        self.switch = [e for e in table if e.cookie != 2]
+        for port in (5, 6):
+            self.switch.append(flow_mirror.FlowEntry(
+                0, 30, self.parser.OFPMatch(in_port=port), cookie=1))
+        eq_(3, self._reconcile())
+        eq_(5, len(table))
+        eq_([], table.lookup(cookie=2))
+        eq_(4, len(table.lookup(cookie=1)))
+        eq_(3, self.app.reconcile_fixes)
+        # the cookie 3 has the same number of entries and is not dumped
+        ok_(3 not in [d.cookie for d in self._dumps()])
+
+    def test_reconcile_unknown_cookie(self):
+        table = self._install()
+        self.switch = list(table)
+        self.switch.append(flow_mirror.FlowEntry(
+            0, 0, self.parser.OFPMatch(), cookie=9))
+        eq_(1, self._reconcile())
+        eq_(1, len(table.lookup(cookie=9)))
+        ok_(0 in [d.cookie_mask for d in self._dumps()])
+
+    def test_reconcile_changed_instructions(self):
+        table = self._install()
+        self.switch = list(table)
+        entry = table.lookup(cookie=3)[0]
+        self.switch.remove(entry)
+        self.switch.append(flow_mirror.FlowEntry(
+            entry.table_id, entry.priority, entry.match, cookie=3))
+        fixed = sum(self._reconcile() for i in range(3))
+        eq_(1, fixed)
+        eq_([], table.lookup(cookie=3)[0].instructions)
+
+    def test_reconcile_keeps_sent(self):
+        table = self._install()
+        self.switch = list(table)
+
+        def _send_msg(app, msg, reply_cls=None, reply_multi=False):
+            # a flow-mod sent while the round is in progress
+            if not self.requests:
+                self._flow_mod(cookie=1, priority=40, in_port=9)
+            return self._switch_send_msg(app, msg, reply_cls, reply_multi)
+
+        self.requests = []
+        with mock.patch('ryu.app.ofctl.api.send_msg', side_effect=_send_msg):
+            eq_(0, self.app.reconcile(self.dp))
+        eq_(5, len(table))
+
+    def test_reconcile_failed(self):
+        table = self._install()
+        with mock.patch('ryu.app.ofctl.api.send_msg',
+                        side_effect=exception.InvalidDatapath(
+                            result=self.dp.id)):
+            eq_(0, self.app.reconcile(self.dp))
+        eq_(4, len(table))
+        eq_(1, self.app.reconcile_rounds)
+
+
+class Test_FlowMirror_v13(_FlowMirrorTestMixin, unittest.TestCase):
+    version = ofproto_v1_3.OFP_VERSION
+
+
+class Test_FlowMirror_v15(_FlowMirrorTestMixin, unittest.TestCase):
+    version = ofproto_v1_5.OFP_VERSION
+
+
+class Test_FlowMirror_v10(unittest.TestCase):
+
+    def test_not_mirrored(self):
+        app = flow_mirror.FlowMirror()
+        dp = _Datapath(1, ofproto_v1_0.OFP_VERSION)
+        ev = ofp_event.EventOFPStateChange(dp)
+        ev.state = handler.HANDSHAKE_DISPATCHER
+        app._state_change_handler(ev)
+        dp.send_msg(dp.ofproto_parser.OFPFlowMod(
+            dp, dp.ofproto_parser.OFPMatch(), 0, dp.ofproto.OFPFC_ADD))
+        eq_(None, app.get_table(1))
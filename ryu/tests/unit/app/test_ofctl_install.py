@@ -0,0 +1,222 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from nose.tools import eq_, ok_, raises
+
+from ryu.app.ofctl import api as ofctl_api
+from ryu.app.ofctl import exception
+from ryu.app.ofctl import service
+from ryu.controller import ofp_event
+from ryu.lib import hub
+from ryu.ofproto import ofproto_protocol
+from ryu.ofproto import ofproto_v1_3
+from ryu.ofproto import ofproto_v1_4
+
+# flow-mods of this priority fail
+FAIL_PRIORITY = 13
+
+
+class _Switch(ofproto_protocol.ProtocolDesc):
+    # replies the errors and the barrier replies asynchronously in order
+    def __init__(self, svc, version):
+        super(_Switch, self).__init__(version)
+        self.id = 1
+        self.xid = 0
+        self.svc = svc
+        self.sent = []
+        self.replies = []
+        self.bundle_failed = False
+        self.outstanding = 0
+        self.max_outstanding = 0
+        self.alive = True
+
+    def set_xid(self, msg):
+        self.xid += 1
+        msg.set_xid(self.xid)
+        return self.xid
+
+    def _error(self, msg):
+        err = self.ofproto_parser.OFPErrorMsg(
+            self, type_=self.ofproto.OFPET_FLOW_MOD_FAILED)
+        err.xid = msg.xid
+        self.replies.append(ofp_event.EventOFPErrorMsg(err))
+
+    def send_msg(self, msg):
+        if not self.alive:
+            return False
+        msg.serialize()
+        self.sent.append(msg)
+        parser = self.ofproto_parser
+        if isinstance(msg, parser.OFPFlowMod):
+            if msg.priority == FAIL_PRIORITY:
+                self._error(msg)
+        elif isinstance(msg, getattr(parser, 'OFPBundleAddMsg', ())):
+            eq_(msg.xid, msg.message.xid)
+            if msg.message.priority == FAIL_PRIORITY:
+                self.bundle_failed = True
+                self._error(msg)
+        elif isinstance(msg, getattr(parser, 'OFPBundleCtrlMsg', ())):
+            if msg.type == self.ofproto.OFPBCT_COMMIT_REQUEST and \
+                    self.bundle_failed:
+                self.bundle_failed = False
+                self._error(msg)
+        elif isinstance(msg, parser.OFPBarrierRequest):
+            rep = parser.OFPBarrierReply(self)
+            rep.xid = msg.xid
+            self.replies.append(ofp_event.EventOFPBarrierReply(rep))
+            self.outstanding += 1
+            self.max_outstanding = max(self.max_outstanding,
+                                       self.outstanding)
+            replies, self.replies = self.replies, []
+            hub.spawn(self._reply, replies)
+        return True
+
+    def _reply(self, replies):
+        hub.sleep(0.001)
+        for ev in replies:
+            if isinstance(ev, ofp_event.EventOFPBarrierReply):
+                self.outstanding -= 1
+                self.svc._handle_barrier(ev)
+            else:
+                self.svc._handle_reply(ev)
+
+
+class _App(object):
+    def __init__(self, svc):
+        self.svc = svc
+
+    def send_request(self, req):
+        req.src = 'test'
+        req.sync = True
+        req.reply_q = hub.Queue()
+        self.svc._handle_install_flows(req)
+        with hub.Timeout(5):
+            return req.reply_q.get()
+
+
+class _InstallTestMixin(object):
+    version = None
+
+    def setUp(self):
+        self.svc = service.OfctlService()
+        self.dp = _Switch(self.svc, self.version)
+        self.svc._switches[self.dp.id] = service._SwitchInfo(self.dp)
+        self.app = _App(self.svc)
+
+    def _flow_mods(self, num, failing=()):
+        parser = self.dp.ofproto_parser
+        return [parser.OFPFlowMod(
+            self.dp, priority=FAIL_PRIORITY if i in failing else 1,
+            match=parser.OFPMatch(in_port=i)) for i in range(num)]
+
+    def _sent(self, cls_name):
+        cls = getattr(self.dp.ofproto_parser, cls_name)
+        return [msg for msg in self.sent if isinstance(msg, cls)]
+
+    @property
+    def sent(self):
+        return self.dp.sent
+
+    def test_install(self):
+        msgs = self._flow_mods(25)
+        result = ofctl_api.install_flows(self.app, msgs, batch_size=10,
+                                         window=2)
+        ok_(result.ok)
+        eq_(25, result.rules)
+        eq_(3, result.batches)
+        eq_(25, len(self._sent('OFPFlowMod')))
+        eq_(3, len(self._sent('OFPBarrierRequest')))
+        eq_(2, self.dp.max_outstanding)
+        ok_(result.elapsed > 0)
+        ok_(result.rules_per_sec > 0)
+        info = self.svc._switches[self.dp.id]
+        eq_({}, info.install_xids)
+        eq_(set(), info.installs)
+
+    def test_window(self):
+        msgs = self._flow_mods(25)
+        ofctl_api.install_flows(self.app, msgs, batch_size=1, window=4)
+        eq_(4, self.dp.max_outstanding)
+
+    def test_errors(self):
+        msgs = self._flow_mods(25, failing=(3, 17))
+        result = ofctl_api.install_flows(self.app, msgs, batch_size=10)
+        ok_(not result.ok)
+        eq_([3, 17], sorted(result.errors))
+        eq_(msgs[3].xid, result.errors[3].xid)
+        eq_([], result.failed_batches)
+
+    def test_empty(self):
+        result = ofctl_api.install_flows(self.app, [])
+        eq_(0, result.rules)
+        eq_([], self.sent)
+
+    def test_disconnected(self):
+        self.dp.alive = False
+        try:
+            ofctl_api.install_flows(self.app, self._flow_mods(3))
+        except exception.InvalidDatapath:
+            pass
+        else:
+            ok_(False, 'InvalidDatapath not raised')
+
+    def test_dead(self):
+        def _dead(replies):
+            ev = ofp_event.EventOFPStateChange(self.dp)
+            self.svc._handle_dead(ev)
+
+        self.dp._reply = _dead
+        try:
+            ofctl_api.install_flows(self.app, self._flow_mods(3))
+        except exception.InvalidDatapath:
+            pass
+        else:
+            ok_(False, 'InvalidDatapath not raised')
+
+    @raises(ValueError)
+    def test_batch_size(self):
+        ofctl_api.install_flows(self.app, self._flow_mods(3), batch_size=0)
+
+
+class Test_install_flows_v13(_InstallTestMixin, unittest.TestCase):
+    version = ofproto_v1_3.OFP_VERSION
+
+    @raises(ValueError)
+    def test_bundle_v13(self):
+        ofctl_api.install_flows(self.app, self._flow_mods(3), bundle=True)
+
+
+class Test_install_flows_v14(_InstallTestMixin, unittest.TestCase):
+    version = ofproto_v1_4.OFP_VERSION
+
+    def test_bundle(self):
+        msgs = self._flow_mods(25, failing=(12,))
+        result = ofctl_api.install_flows(self.app, msgs, batch_size=10,
+                                         bundle=True)
+        eq_(25, result.rules)
+        eq_([12], list(result.errors))
+        eq_(1, len(result.failed_batches))
+        start, stop, err = result.failed_batches[0]
+        eq_((10, 20), (start, stop))
+        eq_(self.dp.ofproto.OFPBCT_COMMIT_REQUEST,
+            [m for m in self._sent('OFPBundleCtrlMsg')
+             if m.xid == err.xid][0].type)
+        eq_(25, len(self._sent('OFPBundleAddMsg')))
+        eq_(6, len(self._sent('OFPBundleCtrlMsg')))
+        eq_(0, len(self._sent('OFPFlowMod')))
+        bundle_ids = set(m.bundle_id for m in self._sent('OFPBundleAddMsg'))
+        eq_(3, len(bundle_ids))
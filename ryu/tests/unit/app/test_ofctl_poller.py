@@ -0,0 +1,175 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import itertools
+import time
+import unittest
+try:
+    import mock  # Python 2
+except ImportError:
+    from unittest import mock  # Python 3
+
+from nose.tools import eq_, ok_, raises
+
+from ryu.app.ofctl import exception
+from ryu.app.ofctl import poller
+from ryu.lib import hub
+from ryu.ofproto import ofproto_protocol
+from ryu.ofproto import ofproto_v1_0
+from ryu.ofproto import ofproto_v1_3
+
+
+class _Datapath(ofproto_protocol.ProtocolDesc):
+    def __init__(self, dpid, version=ofproto_v1_3.OFP_VERSION):
+        super(_Datapath, self).__init__(version)
+        self.id = dpid
+
+
+class Test_StatsPoller(unittest.TestCase):
+
+    def setUp(self):
+        self.app = poller.StatsPoller()
+        self.app.timeout = 0.5
+        self.datapaths = [_Datapath(1), _Datapath(2),
+                          _Datapath(3, ofproto_v1_0.OFP_VERSION)]
+        self.sent = []
+        self.delay = 0
+        self.events = []
+        self.app.send_event_to_observers = self.events.append
+
+    def _send_msg(self, app, msg, reply_cls=None, reply_multi=False):
+        self.sent.append(msg)
+        hub.sleep(self.delay)
+        dp = msg.datapath
+        eq_(reply_cls, dp.ofproto_parser.OFPPortStatsReply)
+        ok_(reply_multi)
+        stats = dp.ofproto_parser.OFPPortStats(dp.id, *([0] * 14))
+        return [dp.ofproto_parser.OFPPortStatsReply(dp, body=[stats]),
+                dp.ofproto_parser.OFPPortStatsReply(dp, body=[stats])]
+
+    def _patch(self, send_msg=None):
+        get_datapath = mock.patch('ryu.app.ofctl.api.get_datapath',
+                                  return_value=self.datapaths)
+        send_msg = mock.patch('ryu.app.ofctl.api.send_msg',
+                              side_effect=send_msg or self._send_msg)
+        return get_datapath, send_msg
+
+    def test_poll(self):
+        get_datapath, send_msg = self._patch()
+        with get_datapath, send_msg:
+            results = self.app.poll('port')
+        eq_(sorted(results), [1, 2])
+        eq_([s.port_no for s in results[2]], [2, 2])
+        eq_(len(self.sent), 2)
+        eq_(sorted((ev.dpid, ev.kind) for ev in self.events),
+            [(1, 'port'), (2, 'port')])
+
+    def test_poll_concurrent(self):
+        self.delay = 0.2
+        get_datapath, send_msg = self._patch()
+        start = time.time()
+        with get_datapath, send_msg:
+            results = self.app.poll('port')
+        eq_(sorted(results), [1, 2])
+        ok_(time.time() - start < 0.35)
+
+    def test_poll_shared(self):
+        self.delay = 0.1
+        get_datapath, send_msg = self._patch()
+        with get_datapath, send_msg:
+            threads = [hub.spawn(self.app.poll, 'port', [1])
+                       for _i in range(3)]
+            results = [t.wait() for t in threads]
+        eq_(len(self.sent), 1)
+        eq_(self.app.requests_shared, 2)
+        for result in results:
+            eq_(list(result), [1])
+
+    def test_poll_failure(self):
+        def _send_msg(app, msg, reply_cls=None, reply_multi=False):
+            if msg.datapath.id == 1:
+                raise exception.InvalidDatapath(result=1)
+            hub.sleep(1)
+
+        get_datapath, send_msg = self._patch(_send_msg)
+        with get_datapath, send_msg:
+            results = self.app.poll('port')
+        eq_(results, {})
+        eq_(self.app._polls, {})
+        eq_(self.events, [])
+
+    def test_get_stats(self):
+        get_datapath, send_msg = self._patch()
+        with get_datapath, send_msg:
+            self.app.get_stats('port', [1])
+            eq_(len(self.sent), 1)
+
+            # dpid 1 is served from the cache
+            results = self.app.get_stats('port', max_age=10)
+            eq_(sorted(results), [1, 2])
+            eq_(len(self.sent), 2)
+
+            results = self.app.get_stats('port', max_age=0)
+            eq_(sorted(results), [1, 2])
+            eq_(len(self.sent), 4)
+
+    @raises(ValueError)
+    def test_unknown_kind(self):
+        self.app.poll('queue')
+
+    def test_port_counters(self):
+        replies = [[(1, 0), (2, 0)], [(1, 1000)]]
+
+        def _send_msg(app, msg, reply_cls=None, reply_multi=False):
+            parser = msg.datapath.ofproto_parser
+            body = [parser.OFPPortStats(port_no, 0, 0, 0, tx_bytes,
+                                        *([0] * 10))
+                    for port_no, tx_bytes in replies.pop(0)]
+            return [reply_cls(msg.datapath, body=body)]
+
+        self.datapaths = self.datapaths[:1]
+        get_datapath, send_msg = self._patch(_send_msg)
+        store = self.app.port_counters
+        time_ = mock.patch.object(poller, 'time')
+        with get_datapath, send_msg, time_ as mock_time:
+            mock_time.time.side_effect = itertools.count(100)
+            self.app.poll('port')
+            eq_(len(store), 2)
+            self.app.poll('port')
+        # port 2 has gone
+        eq_(list(store.keys()), [(1, 1)])
+        eq_(store.deltas((1, 1))['tx_bytes'], 1000)
+        eq_(store.top('tx_bytes', 1)[0][0], (1, 1))
+
+    def test_flow_counter_key(self):
+        dp = self.datapaths[0]
+        parser = dp.ofproto_parser
+        stats = parser.OFPFlowStats(
+            table_id=1, priority=2, cookie=3, packet_count=4, byte_count=5,
+            match=parser.OFPMatch(in_port=6, eth_dst='00:00:00:00:00:07'))
+        key, values = poller.COUNTERS['flow'](dp.id, stats)
+        eq_(values, [4, 5])
+        eq_(poller.counter_key_to_dict('flow', key),
+            {'dpid': 1, 'table_id': 1, 'priority': 2, 'cookie': 3,
+             'match': {'in_port': 6, 'eth_dst': '00:00:00:00:00:07'}})
+
+    def test_ranked_counters(self):
+        eq_(self.app.get_ranked_counters('port'), ('tx_bytes', 'rx_bytes'))
+        eq_(self.app.counter_key_to_dict('port', (1, 2)),
+            {'dpid': 1, 'port_no': 2})
+
+    @raises(ValueError)
+    def test_ranked_counters_unknown_kind(self):
+        self.app.get_ranked_counters('table')
@@ -25,12 +25,14 @@ try:
     import mock  # Python 2
 except ImportError:
     from unittest import mock  # Python 3
-from nose.tools import eq_
+from nose.tools import eq_, ok_
 
 from ryu.app import ofctl_rest
+from ryu.app.ofctl import poller as stats_poller
 from ryu.app.wsgi import Request
 from ryu.app.wsgi import WSGIApplication
 from ryu.controller.dpset import DPSet
+from ryu.lib import counter_store
 from ryu.ofproto import ofproto_protocol
 from ryu.ofproto import ofproto_v1_0
 from ryu.ofproto import ofproto_v1_2
@@ -87,11 +89,179 @@ class Test_ofctl_rest(unittest.TestCase):
         req.method = method
 
         with mock.patch('ryu.lib.ofctl_utils.send_stats_request'),\
+                mock.patch('ryu.lib.ofctl_utils.iter_stats_reply',
+                           return_value=iter([])),\
                 mock.patch('ryu.lib.ofctl_utils.send_msg'):
             res = req.get_response(wsgi)
         eq_(res.status, '200 OK')
 
 
+class Test_ofctl_rest_stream(unittest.TestCase):
+
+    def setUp(self):
+        self.dp = DummyDatapath(ofproto_v1_3.OFP_VERSION)
+        dpset = DPSet()
+        dpset._register(self.dp)
+        self.wsgi = WSGIApplication()
+        ofctl_rest.RestStatsApi(dpset=dpset, wsgi=self.wsgi)
+        self.flows = [{'priority': i} for i in range(10)]
+
+    def _get(self, path, flows=None):
+        if flows is None:
+            flows = self.flows
+        req = Request.blank(path)
+        with mock.patch('ryu.lib.ofctl_v1_3.iter_flow_stats',
+                        return_value=iter(flows)):
+            return req.get_response(self.wsgi)
+
+    def test_stream(self):
+        with mock.patch.object(ofctl_rest, 'STREAM_CHUNK_SIZE', 30):
+            res = self._get('/stats/flow/1')
+        eq_(res.status, '200 OK')
+        eq_(res.json, {'1': self.flows})
+
+    def test_stream_empty(self):
+        res = self._get('/stats/flow/1', [])
+        eq_(res.status, '200 OK')
+        eq_(res.json, {'1': []})
+
+    def test_pagination(self):
+        res = self._get('/stats/flow/1?limit=4')
+        eq_(res.json, {'1': self.flows[:4]})
+        eq_(res.headers['X-Next-Cursor'], '4')
+
+        res = self._get('/stats/flow/1?limit=4&cursor=4')
+        eq_(res.json, {'1': self.flows[4:8]})
+        eq_(res.headers['X-Next-Cursor'], '8')
+
+        res = self._get('/stats/flow/1?limit=4&cursor=8')
+        eq_(res.json, {'1': self.flows[8:]})
+        ok_('X-Next-Cursor' not in res.headers)
+
+    def test_pagination_closes_reply(self):
+        def _flows():
+            try:
+                for flow in self.flows:
+                    yield flow
+            finally:
+                closed.append(True)
+
+        closed = []
+        res = self._get('/stats/flow/1?limit=2', _flows())
+        eq_(res.json, {'1': self.flows[:2]})
+        eq_(closed, [True])
+
+    def test_pagination_invalid_limit(self):
+        res = self._get('/stats/flow/1?limit=0')
+        eq_(res.status, '400 Bad Request')
+
+
+class Test_ofctl_rest_cached(unittest.TestCase):
+
+    def setUp(self):
+        self.dp = DummyDatapath(ofproto_v1_3.OFP_VERSION)
+        dpset = DPSet()
+        dpset._register(self.dp)
+        self.wsgi = WSGIApplication()
+        ofctl_rest.RestStatsApi(dpset=dpset, wsgi=self.wsgi)
+        self.poller = mock.Mock()
+        parser = self.dp.ofproto_parser
+        self.poller.get_stats.return_value = {
+            1: [parser.OFPTableStats(0, 1, 2, 3)]}
+
+    def _get(self, path, poller):
+        req = Request.blank(path)
+        with mock.patch('ryu.base.app_manager.lookup_service_brick',
+                        return_value=poller):
+            return req.get_response(self.wsgi)
+
+    def test_cached(self):
+        res = self._get('/stats/cached/table', self.poller)
+        eq_(res.status, '200 OK')
+        eq_(res.json, {'1': [{'table_id': 0, 'active_count': 1,
+                              'lookup_count': 2, 'matched_count': 3}]})
+        self.poller.get_stats.assert_called_once_with('table', None, None)
+
+    def test_cached_dpid(self):
+        res = self._get('/stats/cached/table/1?max_age=0.5', self.poller)
+        eq_(res.status, '200 OK')
+        self.poller.get_stats.assert_called_once_with('table', [1], 0.5)
+
+        self.poller.get_stats.return_value = {}
+        res = self._get('/stats/cached/table/2', self.poller)
+        eq_(res.status, '404 Not Found')
+
+    def test_cached_invalid(self):
+        self.poller.get_stats.side_effect = ValueError
+        res = self._get('/stats/cached/queue', self.poller)
+        eq_(res.status, '400 Bad Request')
+
+    def test_cached_no_poller(self):
+        res = self._get('/stats/cached/table', None)
+        eq_(res.status, '501 Not Implemented')
+
+
+class Test_ofctl_rest_rate(unittest.TestCase):
+
+    def setUp(self):
+        dpset = DPSet()
+        self.wsgi = WSGIApplication()
+        ofctl_rest.RestStatsApi(dpset=dpset, wsgi=self.wsgi)
+        store = counter_store.CounterStore(
+            stats_poller.PORT_COUNTERS,
+            ranked=stats_poller.RANKED_COUNTERS['port'])
+        for dpid, port_no, tx_bytes in ((1, 1, 100), (1, 2, 300),
+                                        (2, 1, 200), (2, 2, 0)):
+            store.add((dpid, port_no), 0, [0] * 8)
+            store.add((dpid, port_no), 1, [0, 0, 0, tx_bytes, 0, 0, 0, 0])
+        store.add((2, 3), 0, [0] * 8)  # no rates yet
+        self.poller = mock.Mock()
+        self.poller.get_counters.return_value = store
+        self.poller.get_ranked_counters.side_effect = (
+            lambda kind: stats_poller.RANKED_COUNTERS[kind])
+        self.poller.counter_key_to_dict.side_effect = (
+            stats_poller.counter_key_to_dict)
+
+    def _get(self, path, poller):
+        req = Request.blank(path)
+        with mock.patch('ryu.base.app_manager.lookup_service_brick',
+                        return_value=poller):
+            return req.get_response(self.wsgi)
+
+    def test_rate(self):
+        res = self._get('/stats/rate/port/1', self.poller)
+        eq_(res.status, '200 OK')
+        eq_([(e['dpid'], e['port_no'], e['tx_bytes']) for e in res.json],
+            [(1, 1, 100), (1, 2, 300)])
+        self.poller.get_counters.assert_called_once_with('port')
+
+        res = self._get('/stats/rate/port', self.poller)
+        eq_(len(res.json), 4)
+
+    def test_rate_top(self):
+        res = self._get('/stats/rate/port?top=3', self.poller)
+        eq_(res.status, '200 OK')
+        eq_([(e['dpid'], e['port_no']) for e in res.json],
+            [(1, 2), (2, 1), (1, 1)])
+
+        res = self._get('/stats/rate/port/2?top=1&counter=tx_bytes',
+                        self.poller)
+        eq_([(e['dpid'], e['port_no']) for e in res.json], [(2, 1)])
+
+    def test_rate_invalid(self):
+        res = self._get('/stats/rate/port?top=3&counter=rx_errors',
+                        self.poller)
+        eq_(res.status, '400 Bad Request')
+
+        self.poller.get_counters.side_effect = ValueError
+        res = self._get('/stats/rate/table', self.poller)
+        eq_(res.status, '400 Bad Request')
+
+    def test_rate_no_poller(self):
+        res = self._get('/stats/rate/port', None)
+        eq_(res.status, '501 Not Implemented')
+
+
 def _add_tests():
     _ofp_vers = {
         'of10': ofproto_v1_0.OFP_VERSION,
@@ -0,0 +1,289 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from nose.tools import eq_, raises
+
+from ryu import cfg
+from ryu.base import app_manager
+from ryu.controller import event
+from ryu.controller.handler import CONFIG_DISPATCHER
+from ryu.controller.handler import MAIN_DISPATCHER
+from ryu.controller.handler import set_ev_batch
+from ryu.controller.handler import set_ev_cls
+
+
+class _EventTest(event.EventBase):
+    pass
+
+
+class _EventOtherTest(event.EventBase):
+
+    def __init__(self, key=None):
+        super(_EventOtherTest, self).__init__()
+        self.key = key
+
+
+class _TestApp(app_manager.RyuApp):
+
+    @set_ev_cls(_EventTest, MAIN_DISPATCHER)
+    def main_handler(self, ev):
+        pass
+
+    @set_ev_cls(_EventTest)
+    def any_handler(self, ev):
+        pass
+
+
+class _EventBatchTest(event.EventBase):
+    pass
+
+
+class _BatchTestApp(app_manager.RyuApp):
+
+    def __init__(self, *args, **kwargs):
+        super(_BatchTestApp, self).__init__(*args, **kwargs)
+        self.evs = []
+        self.batches = []
+
+    @set_ev_cls(_EventBatchTest)
+    def handler(self, ev):
+        self.evs.append(ev)
+
+    @set_ev_cls(_EventBatchTest)
+    @set_ev_batch(max_size=2, max_latency=60)
+    def batch_handler(self, evs):
+        self.batches.append(evs)
+
+
+class _NoLatencyBatchTestApp(_BatchTestApp):
+
+    @set_ev_cls(_EventBatchTest)
+    @set_ev_batch(max_size=2, max_latency=0)
+    def batch_handler(self, evs):
+        self.batches.append(evs)
+
+
+class Test_RyuApp(unittest.TestCase):
+    """
+    Test cases for app_manager.RyuApp
+    """
+
+    def setUp(self):
+        self.app = _TestApp()
+        self.app.register_handler(_EventTest, self.app.main_handler)
+        self.app.register_handler(_EventTest, self.app.any_handler)
+
+    def test_get_handlers(self):
+        ev = _EventTest()
+        eq_([self.app.main_handler, self.app.any_handler],
+            list(self.app.get_handlers(ev)))
+        eq_([self.app.main_handler, self.app.any_handler],
+            list(self.app.get_handlers(ev, MAIN_DISPATCHER)))
+        eq_([self.app.any_handler],
+            list(self.app.get_handlers(ev, CONFIG_DISPATCHER)))
+
+    def test_get_handlers_invalidated(self):
+        ev = _EventTest()
+        eq_(2, len(self.app.get_handlers(ev, MAIN_DISPATCHER)))
+
+        self.app.unregister_handler(_EventTest, self.app.any_handler)
+        eq_([self.app.main_handler],
+            list(self.app.get_handlers(ev, MAIN_DISPATCHER)))
+
+        def dynamic_handler(ev):
+            pass
+
+        self.app.register_handler(_EventTest, dynamic_handler)
+        eq_([self.app.main_handler, dynamic_handler],
+            list(self.app.get_handlers(ev, MAIN_DISPATCHER)))
+
+    def test_get_observers(self):
+        ev = _EventTest()
+        self.app.register_observer(_EventTest, 'main', [MAIN_DISPATCHER])
+        self.app.register_observer(_EventTest, 'any')
+        eq_(['any', 'main'],
+            sorted(self.app.get_observers(ev, MAIN_DISPATCHER)))
+        eq_(['any'], list(self.app.get_observers(ev, CONFIG_DISPATCHER)))
+
+        self.app.register_observer(_EventTest, 'config', [CONFIG_DISPATCHER])
+        eq_(['any', 'config'],
+            sorted(self.app.get_observers(ev, CONFIG_DISPATCHER)))
+
+        self.app.unregister_observer(_EventTest, 'any')
+        eq_(['config'], list(self.app.get_observers(ev, CONFIG_DISPATCHER)))
+
+        self.app.unregister_observer_all_event('config')
+        eq_([], list(self.app.get_observers(ev, CONFIG_DISPATCHER)))
+
+    def _run_event_loop(self, app, evs):
+        app.register_handler(_EventBatchTest, app.handler)
+        app.register_handler(_EventBatchTest, app.batch_handler)
+        for ev in evs:
+            app._send_event(ev, None)
+        # Exits when the queue is drained.
+        app.is_active = False
+        app._event_loop()
+
+    def test_event_batch(self):
+        app = _BatchTestApp()
+        evs = [_EventBatchTest() for _ in range(5)]
+        self._run_event_loop(app, evs)
+
+        eq_(evs, app.evs)
+        # The last batch is delivered when the event loop exits.
+        eq_([evs[0:2], evs[2:4], evs[4:5]], app.batches)
+        eq_({}, app._ev_batches)
+
+    def test_event_batch_latency(self):
+        app = _NoLatencyBatchTestApp()
+        ev = _EventBatchTest()
+        app._batch_event(app.batch_handler, app.batch_handler.ev_batch, ev)
+        eq_([], app.batches)
+
+        # The expired batch is delivered while waiting for the next event.
+        app._send_event(_EventBatchTest(), None)
+        app._get_event()
+        eq_([[ev]], app.batches)
+
+
+class Test_RyuApp_event_queue(unittest.TestCase):
+    """
+    Test cases for the event queue overflow policies of RyuApp
+    """
+
+    def tearDown(self):
+        cfg.CONF.clear_override('event_queue_sizes')
+        cfg.CONF.clear_override('event_queue_policies')
+
+    def _create_app(self, sizes, policies):
+        cfg.CONF.set_override('event_queue_sizes', sizes)
+        cfg.CONF.set_override('event_queue_policies', policies)
+        return _TestApp()
+
+    def _drain(self, app):
+        evs = []
+        while not app.events.empty():
+            item = app._get_event()
+            app._events_sem.release()
+            if item.ev is not None:
+                app._event_dequeued(item.ev.__class__, item)
+                evs.append(item.ev)
+        return evs
+
+    def test_default(self):
+        app = _TestApp()
+        eq_(app_manager.DEFAULT_EVENT_QUEUE_SIZE, app.events.maxsize)
+        eq_(app_manager.EVENT_QUEUE_BLOCK, app._events_conf.policy)
+
+    def test_drop_newest(self):
+        app = self._create_app({'_TestApp': '2'},
+                               {'_TestApp': 'drop-newest'})
+        evs = [_EventTest() for _ in range(3)]
+        for ev in evs:
+            app._send_event(ev, None)
+
+        eq_({_EventTest: 1}, app.events_dropped)
+        eq_(evs[:2], self._drain(app))
+
+    def test_drop_oldest(self):
+        app = self._create_app({'_TestApp': '2'},
+                               {'_TestApp': 'drop-oldest'})
+        evs = [_EventTest() for _ in range(3)]
+        for ev in evs:
+            app._send_event(ev, None)
+
+        eq_({_EventTest: 1}, app.events_dropped)
+        eq_(evs[1:], self._drain(app))
+        eq_({}, app._events_queued)
+
+    def test_coalesce(self):
+        app = self._create_app({'_TestApp': '2'}, {'_TestApp': 'coalesce'})
+        app.get_coalesce_key = lambda ev: (ev.__class__,
+                                           getattr(ev, 'key', None))
+        ev1 = _EventOtherTest(key=1)
+        ev2 = _EventOtherTest(key=2)
+        ev3 = _EventOtherTest(key=1)
+        for ev in (ev1, ev2, ev3):
+            app._send_event(ev, None)
+
+        eq_({_EventOtherTest: 1}, app.events_dropped)
+        eq_([ev3, ev2], self._drain(app))
+        eq_({}, app._events_coalesced)
+
+        # Not coalesced with the already dequeued event
+        app._send_event(ev1, None)
+        eq_([ev1], self._drain(app))
+
+        # The oldest is dropped if no queued event has the key
+        ev4 = _EventTest()
+        for ev in (ev1, ev2, ev4):
+            app._send_event(ev, None)
+        eq_({_EventOtherTest: 2}, app.events_dropped)
+        eq_([ev2, ev4], self._drain(app))
+
+    def test_coalesce_not_full(self):
+        app = self._create_app({'_TestApp': '3'}, {'_TestApp': 'coalesce'})
+        evs = [_EventTest() for _ in range(3)]
+        for ev in evs:
+            app._send_event(ev, None)
+
+        eq_({}, app.events_dropped)
+        eq_(evs, self._drain(app))
+
+    def test_coalesce_event_class_limit(self):
+        app = self._create_app({'_TestApp._EventOtherTest': '2'},
+                               {'_TestApp._EventOtherTest': 'coalesce'})
+        ev1 = _EventOtherTest(key=1)
+        ev2 = _EventTest()
+        ev3 = _EventOtherTest(key=2)
+        ev4 = _EventOtherTest(key=3)
+        for ev in (ev1, ev2, ev3, ev4):
+            app._send_event(ev, None)
+
+        # coalesced with the latest event of the default key
+        eq_({_EventOtherTest: 1}, app.events_dropped)
+        eq_([ev1, ev2, ev4], self._drain(app))
+
+    def test_coalesce_same_key(self):
+        app = self._create_app({'_TestApp': '2'}, {'_TestApp': 'coalesce'})
+        app.get_coalesce_key = lambda ev: 'key'
+        ev1 = _EventOtherTest()
+        ev2 = _EventTest()
+        ev3 = _EventTest()
+        for ev in (ev1, ev2, ev3):
+            app._send_event(ev, None)
+
+        eq_({_EventTest: 1}, app.events_dropped)
+        eq_([ev1, ev3], self._drain(app))
+        eq_({}, app._events_coalesced)
+
+    def test_event_class_limit(self):
+        app = self._create_app({'_TestApp._EventOtherTest': '1'},
+                               {'_TestApp._EventOtherTest': 'drop-oldest'})
+        eq_(app_manager.EVENT_QUEUE_BLOCK, app._events_conf.policy)
+        ev1 = _EventOtherTest()
+        ev2 = _EventTest()
+        ev3 = _EventOtherTest()
+        for ev in (ev1, ev2, ev3):
+            app._send_event(ev, None)
+
+        eq_({_EventOtherTest: 1}, app.events_dropped)
+        eq_([ev2, ev3], self._drain(app))
+
+    @raises(ValueError)
+    def test_invalid_policy(self):
+        self._create_app({}, {'_TestApp': 'invalid'})
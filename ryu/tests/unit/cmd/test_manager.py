@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import subprocess
 import sys
 import unittest
 import mock
@@ -29,6 +30,20 @@ except ImportError:
 from ryu.cmd.manager import main
 
 
+# Runs ryu-manager with the given arguments up to loading the applications.
+_LOAD_APPS = '''
+import sys
+from ryu.base import app_manager
+from ryu.cmd import manager
+
+def _instantiate_apps(self, *args, **kwargs):
+    sys.exit(0)
+
+app_manager.AppManager.instantiate_apps = _instantiate_apps
+manager.main(sys.argv[1:])
+'''
+
+
 class Test_Manager(unittest.TestCase):
     """Test ryu-manager command
     """
@@ -75,3 +90,22 @@ class Test_Manager(unittest.TestCase):
         self._reset_globals()
         main()
         self._reset_globals()
+
+    @staticmethod
+    def _load_apps(*apps):
+        # The applications are imported after the command line is parsed,
+        # so load them in a fresh process to catch options registered too
+        # late.
+        subprocess.check_call([sys.executable, '-c', _LOAD_APPS] +
+                              list(apps))
+
+    def test_load_ofctl_poller(self):
+        self._load_apps('--stats-poll-interval', '5',
+                        'ryu.app.ofctl.poller')
+
+    def test_load_ofctl_rest(self):
+        self._load_apps('ryu.app.ofctl_rest')
+
+    def test_load_ofctl_flow_mirror(self):
+        self._load_apps('--flow-mirror-reconcile-interval', '5',
+                        'ryu.app.ofctl.flow_mirror')
@@ -29,7 +29,7 @@ import logging
 import random
 import unittest
 
-from nose.tools import eq_, raises
+from nose.tools import eq_, ok_, raises
 
 from ryu.base import app_manager  # To suppress cyclic import
 from ryu.controller import controller
@@ -153,6 +153,11 @@ class Test_Datapath(unittest.TestCase):
                 self.buf = self.buf[size:]
                 return out
 
+            def recv_into(self, buffer, nbytes=0):
+                out = self.recv(nbytes or len(buffer))
+                buffer[:len(out)] = out
+                return len(out)
+
         # Prepare mock
         ofp_brick_mock = mock.MagicMock(spec=app_manager.RyuApp)
         app_manager_mock.lookup_service_brick.return_value = ofp_brick_mock
@@ -180,6 +185,132 @@ class Test_Datapath(unittest.TestCase):
             self.assertEqual(state, handler.MAIN_DISPATCHER)
             self.assertEqual(kwargs, {})
         self.assertEqual(expected_json, output_json)
+        eq_(len(packet_buf), dp.recv_bytes)
+        # Each message is copied once when handed to the parser, plus the
+        # partial messages moved on compaction which cannot exceed the
+        # received data with the default buffer size.
+        self.assertTrue(len(packet_buf) <= dp.recv_copied_bytes)
+        self.assertTrue(dp.recv_copied_bytes < 2 * len(packet_buf))
+
+    def _test_send_loop(self, send_batch_bytes):
+        with mock.patch('ryu.controller.controller.Datapath.set_state'):
+            sock_mock = mock.MagicMock()
+            dp = controller.Datapath(sock_mock, mock.MagicMock())
+            dp.state = handler.MAIN_DISPATCHER
+            dp.send_batch_bytes = send_batch_bytes
+
+            dp.send(b'\x01' * 8)
+            dp.send(b'\x02' * 8)
+            dp.send(b'\x03' * 8, close_socket=True)
+            dp._send_loop()
+
+        eq_(24, dp.send_bytes)
+        eq_(3, dp.send_msgs)
+        return sock_mock.sendall.call_args_list, dp.send_flushes
+
+    def test_send_loop(self):
+        calls, flushes = self._test_send_loop(0)
+        eq_(3, flushes)
+        eq_([mock.call(b'\x01' * 8), mock.call(b'\x02' * 8),
+             mock.call(b'\x03' * 8)], calls)
+
+    def test_send_loop_batch(self):
+        calls, flushes = self._test_send_loop(4096)
+        eq_(1, flushes)
+        eq_([mock.call(b'\x01' * 8 + b'\x02' * 8 + b'\x03' * 8)], calls)
+
+    def test_send_loop_batch_limit(self):
+        calls, flushes = self._test_send_loop(16)
+        eq_(2, flushes)
+        eq_([mock.call(b'\x01' * 8 + b'\x02' * 8),
+             mock.call(b'\x03' * 8)], calls)
+
+    def test_send_msg_observers(self):
+        with mock.patch('ryu.controller.controller.Datapath.set_state'):
+            dp = controller.Datapath(mock.MagicMock(), mock.MagicMock())
+        sent = []
+        dp.send_msg_observers.append(sent.append)
+        msg = dp.ofproto_parser.OFPBarrierRequest(dp)
+        ok_(dp.send_msg(msg))
+        eq_([msg], sent)
+        ok_(msg.xid is not None)
+
+        # not observed if discarded
+        dp.send_q = None
+        ok_(not dp.send_msg(dp.ofproto_parser.OFPBarrierRequest(dp)))
+        eq_([msg], sent)
+
+    def test_echo_request(self):
+        with mock.patch('ryu.controller.controller.Datapath.close') as close:
+            dp = controller.Datapath(mock.MagicMock(), mock.MagicMock())
+            dp.echo_request_interval = 0.01
+            dp.max_unreplied_echo_requests = 2
+            dp._echo_timer = hub.get_timer_wheel().schedule_spawn(
+                0, dp._echo_request)
+            with hub.Timeout(2):
+                while not close.called:
+                    hub.sleep(0.01)
+
+        eq_(3, len(dp.unreplied_echo_requests))
+        eq_(3, dp.send_q.qsize())
+        ok_(not dp._echo_timer.active)
+
+
+class Test_RecvBuffer(unittest.TestCase):
+    """
+    Test cases for controller._RecvBuffer
+    """
+
+    def _recv(self, buf, data, size):
+        view = buf.reserve(size)
+        view[:len(data)] = data
+        buf.commit(len(data))
+
+    def test_take(self):
+        buf = controller._RecvBuffer(16)
+        self._recv(buf, b'0123456789', 8)
+        eq_(10, len(buf))
+        eq_(b'0123', bytes(buf.peek()[:4]))
+
+        data = buf.take(4)
+        eq_(bytearray(b'0123'), data)
+        eq_(6, len(buf))
+        eq_(4, buf.copied_bytes)
+
+        # The taken buffer must not share memory with the receive buffer.
+        self._recv(buf, b'abcdef', 6)
+        buf.take(len(buf))
+        eq_(0, len(buf))
+        eq_(bytearray(b'0123'), data)
+
+    def test_compaction(self):
+        buf = controller._RecvBuffer(16)
+        self._recv(buf, b'0123456789ab', 8)
+        buf.consume(10)
+
+        # 4 bytes are free at the tail, so the 2 pending bytes are moved.
+        view = buf.reserve(8)
+        eq_(14, len(view))
+        eq_(2, buf.copied_bytes)
+        eq_(b'ab', bytes(buf.peek()))
+
+    def test_grow(self):
+        buf = controller._RecvBuffer(8)
+        self._recv(buf, b'01234567', 8)
+        buf.consume(2)
+
+        view = buf.reserve(24)
+        self.assertTrue(len(view) >= 24)
+        eq_(6, buf.copied_bytes)
+        eq_(b'234567', bytes(buf.peek()))
+
+    def test_consume_all_rewinds(self):
+        buf = controller._RecvBuffer(8)
+        self._recv(buf, b'0123', 4)
+        buf.consume(4)
+
+        eq_(8, len(buf.reserve(8)))
+        eq_(0, buf.copied_bytes)
 
 
 class TestOpenFlowController(unittest.TestCase):
@@ -192,6 +323,7 @@ class TestOpenFlowController(unittest.TestCase):
         conf_mock.ofp_listen_host = "127.0.0.1"
         conf_mock.ca_certs = None
         conf_mock.ciphers = None
+        conf_mock.ofp_lazy_parsing = False
         conf_mock.ctl_cert = os.path.join(this_dir, 'cert.crt')
         conf_mock.ctl_privkey = os.path.join(this_dir, 'cert.key')
         c = controller.OpenFlowController()
@@ -0,0 +1,235 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import itertools
+import unittest
+try:
+    import mock  # Python 2
+except ImportError:
+    from unittest import mock  # Python 3
+
+from nose.tools import eq_, ok_
+
+from ryu.controller import controller
+from ryu.controller import flowmod_coalescer
+from ryu.lib import hub
+from ryu.ofproto import ofproto_protocol
+from ryu.ofproto import ofproto_v1_0
+from ryu.ofproto import ofproto_v1_3
+
+
+class _Datapath(ofproto_protocol.ProtocolDesc):
+    def __init__(self, version=ofproto_v1_3.OFP_VERSION):
+        super(_Datapath, self).__init__(version)
+        self.xid = 0
+        self.sent = []
+
+    def send_msg(self, msg):
+        self.xid += 1
+        msg.set_xid(self.xid)
+        return self.coalescer.send_msg(msg)
+
+    def _send_serialized(self, msg, close_socket=False):
+        self.sent.append(msg)
+        return True
+
+
+class Test_FlowModCoalescer(unittest.TestCase):
+
+    def _setup(self, dedup_window=0.0, coalesce_delay=0.0,
+               version=ofproto_v1_3.OFP_VERSION):
+        self.dp = _Datapath(version)
+        self.ofp = self.dp.ofproto
+        self.parser = self.dp.ofproto_parser
+        self.coalescer = flowmod_coalescer.FlowModCoalescer(
+            self.dp, dedup_window, coalesce_delay)
+        self.dp.coalescer = self.coalescer
+
+    def _flow_mod(self, command=None, port=1, in_port=1, flags=0,
+                  cookie_mask=0):
+        ofp = self.ofp
+        parser = self.parser
+        if command is None:
+            command = ofp.OFPFC_ADD
+        actions = [parser.OFPActionOutput(port)]
+        inst = [parser.OFPInstructionActions(ofp.OFPIT_APPLY_ACTIONS,
+                                             actions)]
+        msg = parser.OFPFlowMod(
+            self.dp, command=command, priority=10, flags=flags,
+            cookie_mask=cookie_mask, out_port=ofp.OFPP_ANY,
+            out_group=ofp.OFPG_ANY, match=parser.OFPMatch(in_port=in_port),
+            instructions=inst)
+        ok_(self.dp.send_msg(msg))
+        return msg
+
+    def _commands(self):
+        return [msg.command for msg in self.dp.sent]
+
+    def _port(self, msg):
+        return msg.instructions[0].actions[0].port
+
+    def test_dedup(self):
+        self._setup(dedup_window=1.0)
+        ofp = self.ofp
+        self._flow_mod()
+        self._flow_mod()
+        self._flow_mod(in_port=2)
+        eq_(2, len(self.dp.sent))
+        eq_(1, self.coalescer.suppressed)
+        eq_(3, self.coalescer.flow_mods)
+        # different instructions
+        self._flow_mod(port=2)
+        eq_(3, len(self.dp.sent))
+        # the entry changed in between
+        self._flow_mod(ofp.OFPFC_DELETE_STRICT)
+        self._flow_mod(port=2)
+        eq_(5, len(self.dp.sent))
+        # a non-strict flow-mod may change any entry
+        self._flow_mod(ofp.OFPFC_DELETE, in_port=3)
+        self._flow_mod(in_port=2)
+        eq_(7, len(self.dp.sent))
+
+    def test_dedup_window(self):
+        self._setup(dedup_window=1.0)
+        now = itertools.count(0, 0.6)
+        with mock.patch.object(flowmod_coalescer.time, 'time',
+                               side_effect=lambda: next(now)):
+            self._flow_mod()
+            self._flow_mod()
+            self._flow_mod()
+        eq_(2, len(self.dp.sent))
+        eq_(1, self.coalescer.suppressed)
+
+    def test_collapse_add_modify(self):
+        self._setup(coalesce_delay=10)
+        ofp = self.ofp
+        add = self._flow_mod(flags=ofp.OFPFF_SEND_FLOW_REM)
+        self._flow_mod(ofp.OFPFC_MODIFY_STRICT, port=2)
+        mod = self._flow_mod(ofp.OFPFC_MODIFY_STRICT, port=3)
+        eq_([], self.dp.sent)
+        ok_(self.coalescer.flush())
+        eq_([ofp.OFPFC_ADD], self._commands())
+        msg = self.dp.sent[0]
+        eq_(3, self._port(msg))
+        eq_(ofp.OFPFF_SEND_FLOW_REM, msg.flags)
+        # an error for the merged flow-mod is for the last modify
+        eq_(mod.xid, msg.xid)
+        eq_(1, self._port(add))
+        eq_(1, add.xid)
+        eq_(2, self.coalescer.collapsed)
+
+    def test_collapse_delete(self):
+        self._setup(coalesce_delay=10)
+        ofp = self.ofp
+        self._flow_mod()
+        self._flow_mod(ofp.OFPFC_DELETE_STRICT)
+        self._flow_mod(ofp.OFPFC_MODIFY_STRICT)
+        # kept, as the entry may exist before the delete
+        self._flow_mod()
+        self._flow_mod(ofp.OFPFC_ADD, in_port=2,
+                       flags=ofp.OFPFF_SEND_FLOW_REM)
+        self._flow_mod(ofp.OFPFC_DELETE_STRICT, in_port=2)
+        self.coalescer.flush()
+        eq_([ofp.OFPFC_DELETE_STRICT, ofp.OFPFC_ADD,
+             ofp.OFPFC_ADD, ofp.OFPFC_DELETE_STRICT], self._commands())
+        eq_(2, self.coalescer.collapsed)
+
+    def test_flush_on_other_messages(self):
+        self._setup(coalesce_delay=10)
+        ofp = self.ofp
+        self._flow_mod()
+        barrier = self.parser.OFPBarrierRequest(self.dp)
+        self.dp.send_msg(barrier)
+        eq_(ofp.OFPFC_ADD, self.dp.sent[0].command)
+        ok_(self.dp.sent[1] is barrier)
+        self._flow_mod()
+        self._flow_mod(ofp.OFPFC_MODIFY, port=2)
+        eq_(4, len(self.dp.sent))
+        self._flow_mod(cookie_mask=1, command=ofp.OFPFC_MODIFY_STRICT)
+        eq_(5, len(self.dp.sent))
+        eq_(0, self.coalescer.collapsed)
+        eq_(2, self.coalescer.flushes)
+
+    def test_flush_timer(self):
+        self._setup(coalesce_delay=0.01)
+        self._flow_mod()
+        self._flow_mod(in_port=2)
+        eq_([], self.dp.sent)
+        with hub.Timeout(2):
+            while not self.dp.sent:
+                hub.sleep(0.01)
+        eq_(2, len(self.dp.sent))
+        eq_(None, self.coalescer._timer)
+
+    def test_flush_serialized(self):
+        self._setup(coalesce_delay=10)
+        self._flow_mod()
+        self._flow_mod(in_port=2)
+        sent = self.dp.sent
+        send_q = hub.Queue()
+        resume = hub.Event()
+
+        def _send_serialized(msg, close_socket=False):
+            send_q.put(msg)
+            resume.wait()
+            sent.append(msg)
+            return True
+
+        self.dp._send_serialized = _send_serialized
+        flusher = hub.spawn(self.coalescer.flush)
+        # the flush blocks in sending the first flow-mod
+        eq_(self.ofp.OFPFC_ADD, send_q.get(timeout=2).command)
+        barrier = self.parser.OFPBarrierRequest(self.dp)
+        sender = hub.spawn(self.dp.send_msg, barrier)
+        hub.sleep(0.01)
+        ok_(send_q.empty())
+        resume.set()
+        with hub.Timeout(2):
+            hub.joinall([flusher, sender])
+        eq_(3, len(sent))
+        ok_(sent[2] is barrier)
+
+    def test_flush_max_pending(self):
+        self._setup(coalesce_delay=10)
+        for i in range(flowmod_coalescer.MAX_PENDING_FLOW_MODS):
+            self._flow_mod(in_port=i)
+        eq_(flowmod_coalescer.MAX_PENDING_FLOW_MODS, len(self.dp.sent))
+
+    def test_of10(self):
+        self._setup(dedup_window=1.0, version=ofproto_v1_0.OFP_VERSION)
+        parser = self.parser
+        for i in range(2):
+            self.dp.send_msg(parser.OFPFlowMod(
+                self.dp, parser.OFPMatch(), 0, self.ofp.OFPFC_ADD))
+        eq_(2, len(self.dp.sent))
+        eq_(0, self.coalescer.flow_mods)
+
+
+class Test_Datapath_coalescer(unittest.TestCase):
+
+    def test_send_msg(self):
+        with mock.patch('ryu.controller.controller.Datapath.set_state'):
+            dp = controller.Datapath(mock.MagicMock(), mock.MagicMock())
+        eq_(None, dp.flow_mod_coalescer)
+        dp.flow_mod_coalescer = flowmod_coalescer.FlowModCoalescer(dp, 1.0)
+        sent = []
+        dp.send_msg_observers.append(sent.append)
+        parser = dp.ofproto_parser
+        for i in range(3):
+            dp.send_msg(parser.OFPFlowMod(dp, match=parser.OFPMatch()))
+        dp.send_msg(parser.OFPBarrierRequest(dp))
+        eq_(2, dp.send_q.qsize())
+        eq_(2, len(sent))
+        eq_(2, dp.flow_mod_coalescer.suppressed)
@@ -0,0 +1,118 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+try:
+    import mock  # Python 2
+except ImportError:
+    from unittest import mock  # Python 3
+
+import pickle
+import socket
+import unittest
+
+from nose.tools import eq_, ok_
+
+from ryu.base import app_manager
+from ryu.controller import event
+from ryu.controller import worker
+from ryu.controller.handler import set_ev_cls
+from ryu.lib import hub
+
+
+class EventWorkerTest(event.EventBase):
+
+    def __init__(self, dpid):
+        super(EventWorkerTest, self).__init__()
+        self.dpid = dpid
+
+
+def _worker_test_app():
+    # Define the application class here rather than at the module level,
+    # as other tests may reload app_manager.
+    class _WorkerTestApp(app_manager.RyuApp):
+
+        @set_ev_cls(EventWorkerTest)
+        def handler(self, ev):
+            pass
+
+    return _WorkerTestApp()
+
+
+class Test_worker(unittest.TestCase):
+    """
+    Test cases for ryu.controller.worker
+    """
+
+    def tearDown(self):
+        worker._channel = None
+        worker._channel_lock = None
+
+    def test_single_process(self):
+        eq_(None, worker.worker_id())
+        # Nothing to do without the channel
+        worker.publish(EventWorkerTest(1))
+        worker.channel_loop()
+
+    def test_frame(self):
+        a, b = socket.socketpair()
+        worker._send_frame(a, b'\x01' * 5)
+        worker._send_frame(a, b'')
+        a.close()
+        eq_(b'\x01' * 5, worker._recv_frame(b))
+        eq_(b'', worker._recv_frame(b))
+        eq_(None, worker._recv_frame(b))
+        b.close()
+
+    def test_publish(self):
+        a, b = socket.socketpair()
+        worker._channel = a
+        worker._channel_lock = hub.Semaphore()
+        worker.publish(EventWorkerTest(1))
+        ev = pickle.loads(worker._recv_frame(b))
+        ok_(isinstance(ev, EventWorkerTest))
+        eq_(1, ev.dpid)
+        a.close()
+        b.close()
+
+    def test_relay_loop(self):
+        pairs = [socket.socketpair() for _ in range(3)]
+        channels = dict((i, parent) for i, (parent, _child)
+                        in enumerate(pairs))
+        worker._send_frame(pairs[0][1], b'data')
+        pairs[0][1].close()
+        worker._relay_loop(pairs[0][0], channels)
+
+        eq_(b'data', worker._recv_frame(pairs[1][1]))
+        eq_(b'data', worker._recv_frame(pairs[2][1]))
+        for parent, child in pairs:
+            parent.close()
+            child.close()
+
+    def test_channel_loop(self):
+        app = _worker_test_app()
+        app.register_handler(EventWorkerTest, app.handler)
+        a, b = socket.socketpair()
+        worker._channel = a
+        worker._send_frame(b, pickle.dumps(EventWorkerTest(2)))
+        worker._send_frame(b, b'invalid')
+        b.close()
+        with mock.patch.dict(app_manager.SERVICE_BRICKS,
+                             {app.name: app}):
+            worker.channel_loop()
+        a.close()
+
+        item = app.events.get(block=False)
+        eq_(2, item.ev.dpid)
+        ok_(app.events.empty())
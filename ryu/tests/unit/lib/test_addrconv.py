@@ -15,7 +15,8 @@
 # limitations under the License.
 
 import unittest
-from nose.tools import eq_
+import netaddr
+from nose.tools import eq_, raises
 
 from ryu.lib import addrconv
 
@@ -54,3 +55,18 @@ class Test_addrconv(unittest.TestCase):
     def test_mac(self):
         self._test_conv(addrconv.mac, 'f2:0b:a4:01:0a:23',
                         b'\xf2\x0b\xa4\x01\x0a\x23')
+
+    def test_ipv4_memoryview(self):
+        eq_(addrconv.ipv4.bin_to_text(memoryview(b'\x7f\x00\x00\x01')),
+            '127.0.0.1')
+
+    def test_mac_notations(self):
+        bin_value = b'\xf2\x0b\xa4\x01\x0a\x23'
+        eq_(addrconv.mac.text_to_bin('F2:0B:A4:01:0A:23'), bin_value)
+        eq_(addrconv.mac.text_to_bin('f2-0b-a4-01-0a-23'), bin_value)
+        eq_(addrconv.mac.bin_to_text(memoryview(bin_value)),
+            'f2:0b:a4:01:0a:23')
+
+    @raises(netaddr.AddrFormatError)
+    def test_mac_invalid(self):
+        addrconv.mac.text_to_bin('f2:0b:a4:01:0a:2z')
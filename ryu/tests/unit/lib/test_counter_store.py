@@ -0,0 +1,96 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from nose.tools import eq_, ok_, raises
+
+from ryu.lib import counter_store
+
+
+class Test_CounterStore(unittest.TestCase):
+
+    def setUp(self):
+        self.store = counter_store.CounterStore(
+            ('packets', 'bytes'), ranked=('bytes',), samples=3)
+
+    def test_rates(self):
+        store = self.store
+        store.add('a', 10, [0, 0])
+        ok_('a' in store)
+        eq_(store.rates('a'), None)
+        eq_(store.deltas('a'), None)
+
+        store.add('a', 12, [10, 1000])
+        eq_(store.rates('a'), {'packets': 5, 'bytes': 500})
+        eq_(store.deltas('a'), {'packets': 10, 'bytes': 1000})
+
+        store.add('a', 13, [30, 1100])
+        eq_(store.rates('a'), {'packets': 10, 'bytes': 1100 / 3.0})
+        eq_(store.deltas('a'), {'packets': 20, 'bytes': 100})
+        eq_(store.values('a'), {'packets': 30, 'bytes': 1100})
+
+    def test_window(self):
+        store = self.store
+        for t, v in enumerate([0, 100, 200, 300, 1300, 2300]):
+            store.add('a', t, [0, v])
+        # the last 3 deltas: 100, 1000, 1000
+        eq_(store.rates('a')['bytes'], 2100 / 3.0)
+
+    def test_old_sample(self):
+        store = self.store
+        store.add('a', 10, [0, 0])
+        store.add('a', 12, [10, 1000])
+        store.add('a', 12, [20, 2000])
+        store.add('a', 11, [20, 2000])
+        eq_(store.rates('a'), {'packets': 5, 'bytes': 500})
+
+    def test_wrap(self):
+        store = counter_store.CounterStore(('bytes',), counter_bits=32)
+        store.add('a', 0, [2 ** 32 - 100])
+        store.add('a', 1, [100])
+        eq_(store.deltas('a'), {'bytes': 200})
+        eq_(store.wraps, 1)
+        eq_(store.resets, 0)
+
+    def test_reset(self):
+        store = self.store
+        store.add('a', 0, [100, 10000])
+        store.add('a', 1, [3, 300])
+        eq_(store.deltas('a'), {'packets': 3, 'bytes': 300})
+        eq_(store.resets, 2)
+        eq_(store.wraps, 0)
+
+    def test_top(self):
+        store = self.store
+        for key, rate in (('a', 10), ('b', 30), ('c', 20), ('d', 40)):
+            store.add(key, 0, [0, 0])
+            store.add(key, 1, [0, rate])
+        eq_(store.top('bytes', 2), [('d', 40), ('b', 30)])
+        eq_(store.top('bytes', 10, lambda key: key in 'ac'),
+            [('c', 20), ('a', 10)])
+
+        # re-ranked as the rates change
+        store.add('a', 2, [0, 110])
+        eq_(store.top('bytes', 2), [('a', 55), ('d', 40)])
+
+        store.discard('a')
+        ok_('a' not in store)
+        eq_(store.top('bytes', 2), [('d', 40), ('b', 30)])
+        eq_(len(store), 3)
+
+    @raises(KeyError)
+    def test_top_not_ranked(self):
+        self.store.top('packets', 1)
@@ -16,7 +16,7 @@
 
 import time
 import unittest
-from nose.tools import raises
+from nose.tools import eq_, ok_, raises
 
 from ryu.lib import hub
 hub.patch()
@@ -237,3 +237,142 @@ class Test_hub(unittest.TestCase):
         # allow multiple sets unlike eventlet Event
         ev.set()
         ev.set()
+
+
+class Test_TimerWheel(unittest.TestCase):
+    """ Test case for ryu.lib.hub.TimerWheel
+    """
+
+    def setUp(self):
+        self.wheel = hub.TimerWheel(tick=0.01, size=8)
+
+    def _wait(self, timeout=2):
+        with hub.Timeout(timeout):
+            while len(self.wheel):
+                hub.sleep(0.01)
+
+    def test_schedule(self):
+        fired = []
+        start = time.time()
+        self.wheel.schedule(0.1, lambda x: fired.append((x, time.time())),
+                            'a')
+        eq_(len(self.wheel), 1)
+        self._wait()
+        eq_(len(fired), 1)
+        eq_(fired[0][0], 'a')
+        ok_(fired[0][1] - start >= 0.1)
+
+    def test_order(self):
+        # Delays longer than a round of the wheel share slots with
+        # shorter ones.
+        fired = []
+        for delay in (0.25, 0.05, 0.13, 0.01):
+            self.wheel.schedule(delay, fired.append, delay)
+        self._wait()
+        eq_(fired, [0.01, 0.05, 0.13, 0.25])
+
+    def test_cancel(self):
+        fired = []
+        timer = self.wheel.schedule(0.05, fired.append, 1)
+        self.wheel.schedule(0.1, fired.append, 2)
+        ok_(timer.active)
+        timer.cancel()
+        ok_(not timer.active)
+        timer.cancel()
+        eq_(len(self.wheel), 1)
+        self._wait()
+        eq_(fired, [2])
+
+    def test_reschedule(self):
+        fired = []
+        timer = self.wheel.schedule(0.05, fired.append, 1)
+        self.wheel.schedule(0.1, fired.append, 2)
+        timer.reschedule(0.2)
+        eq_(len(self.wheel), 2)
+        self._wait()
+        eq_(fired, [2, 1])
+
+        # a fired timer can be scheduled again
+        timer.reschedule(0.01)
+        self._wait()
+        eq_(fired, [2, 1, 1])
+
+    def test_periodic(self):
+        fired = []
+
+        def _periodic():
+            fired.append(1)
+            if len(fired) < 5:
+                timer.reschedule(0.02)
+
+        timer = self.wheel.schedule(0.02, _periodic)
+        self._wait()
+        eq_(len(fired), 5)
+
+    def test_cancel_in_callback(self):
+        fired = []
+        timers = []
+
+        def _cancel_others():
+            fired.append(0)
+            for t in timers:
+                t.cancel()
+
+        self.wheel.schedule(0.05, _cancel_others)
+        timers.append(self.wheel.schedule(0.05, fired.append, 1))
+        timers.append(self.wheel.schedule(0.1, fired.append, 2))
+        self._wait()
+        eq_(fired, [0])
+
+    def test_exception(self):
+        fired = []
+
+        def _raise():
+            raise Exception('hoge')
+
+        self.wheel.schedule(0.01, _raise)
+        self.wheel.schedule(0.01, fired.append, 1)
+        self._wait()
+        eq_(fired, [1])
+
+    def test_spawn(self):
+        # A callback which blocks runs in its own thread so as not to
+        # delay the other timers.
+        fired = []
+        blocker = hub.Event()
+
+        def _block():
+            blocker.wait()
+            fired.append(1)
+
+        self.wheel.schedule_spawn(0.01, _block)
+        self.wheel.schedule(0.05, fired.append, 2)
+        self._wait()
+        eq_(fired, [2])
+        blocker.set()
+        hub.sleep(0)
+        eq_(fired, [2, 1])
+
+    def test_spawn_cancel(self):
+        # A timer cancelled on the tick it fires, i.e., after it fires
+        # but before its thread runs, does not call the function.
+        fired = []
+        timer = self.wheel.schedule_spawn(0.05, fired.append, 1)
+        # fires the timer as the wheel does
+        timer.func(*timer.args, **timer.kwargs)
+        timer.cancel()
+        hub.sleep(0)
+        eq_(fired, [])
+
+        # nor does a timer rescheduled; it is called when it fires again
+        timer.reschedule(0.05)
+        timer.func(*timer.args, **timer.kwargs)
+        timer.reschedule(0.01)
+        hub.sleep(0)
+        eq_(fired, [])
+        self._wait()
+        hub.sleep(0)
+        eq_(fired, [1])
+
+    def test_get_timer_wheel(self):
+        ok_(hub.get_timer_wheel() is hub.get_timer_wheel())
@@ -15,8 +15,16 @@
 
 import logging
 import unittest
+try:
+    import mock  # Python 2
+except ImportError:
+    from unittest import mock  # Python 3
 
+from nose.tools import eq_, ok_
+
+from ryu.lib import hub
 from ryu.lib import ofctl_utils
+from ryu.ofproto import ofproto_protocol
 from ryu.ofproto import ofproto_v1_3
 
 
@@ -140,3 +148,75 @@ class Test_ofctl_utils(unittest.TestCase):
             'ALL',
             self.util.ofp_queue_to_user(ofproto_v1_3.OFPQ_ALL)
         )
+
+
+class _Datapath(ofproto_protocol.ProtocolDesc):
+    def __init__(self, replies, waiters):
+        super(_Datapath, self).__init__(version=ofproto_v1_3.OFP_VERSION)
+        self.id = 1
+        self.replies = replies
+        self.waiters = waiters
+        self.sent = []
+
+    def set_xid(self, msg):
+        msg.set_xid(len(self.sent) + 1)
+
+    def send_msg(self, msg):
+        self.sent.append(msg)
+        hub.spawn(self._reply, msg.xid)
+
+    def _reply(self, xid):
+        # Same as the stats reply handler of ofctl_rest
+        for flags, body in self.replies:
+            hub.sleep(0)
+            waiters_per_dp = self.waiters.get(self.id, {})
+            if xid not in waiters_per_dp:
+                return
+            lock, msgs = waiters_per_dp[xid]
+            msgs.append(self.ofproto_parser.OFPPortStatsReply(
+                self, flags=flags, body=body))
+            if not flags & self.ofproto.OFPMPF_REPLY_MORE:
+                del waiters_per_dp[xid]
+                lock.set()
+
+
+class Test_iter_stats_reply(unittest.TestCase):
+
+    def _request(self, dp):
+        return dp.ofproto_parser.OFPPortStatsRequest(
+            dp, 0, dp.ofproto.OFPP_ANY)
+
+    def test_parts(self):
+        waiters = {}
+        more = ofproto_v1_3.OFPMPF_REPLY_MORE
+        dp = _Datapath([(more, [1, 2]), (more, [3]), (0, [4])], waiters)
+
+        msgs = ofctl_utils.iter_stats_reply(dp, self._request(dp), waiters)
+        msg = next(msgs)
+        eq_(msg.body, [1, 2])
+        # the rest of the reply is not received yet
+        ok_(dp.sent[0].xid in waiters[dp.id])
+
+        eq_([msg.body for msg in msgs], [[3], [4]])
+        eq_(waiters[dp.id], {})
+
+    def test_close(self):
+        waiters = {}
+        more = ofproto_v1_3.OFPMPF_REPLY_MORE
+        dp = _Datapath([(more, [1]), (more, [2]), (0, [3])], waiters)
+
+        msgs = ofctl_utils.iter_stats_reply(dp, self._request(dp), waiters)
+        eq_(next(msgs).body, [1])
+        msgs.close()
+        eq_(waiters[dp.id], {})
+
+    def test_timeout(self):
+        waiters = {}
+        more = ofproto_v1_3.OFPMPF_REPLY_MORE
+        dp = _Datapath([(more, [1])], waiters)
+
+        with mock.patch('ryu.lib.ofctl_utils.DEFAULT_TIMEOUT', 0.01):
+            msgs = list(ofctl_utils.iter_stats_reply(
+                dp, self._request(dp), waiters))
+        eq_([msg.body for msg in msgs], [[1]])
+        eq_(waiters[dp.id], {})
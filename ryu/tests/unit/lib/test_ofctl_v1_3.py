@@ -52,3 +52,54 @@ class Test_ofctl_v1_3(unittest.TestCase):
         act = insts.actions[0]
         ok_(isinstance(act, OFPActionPopMpls))
         eq_(act.ethertype, 0x0800)
+
+    def _flow_stats_dp(self, bodies):
+        dp = ofproto_protocol.ProtocolDesc(version=ofproto_v1_3.OFP_VERSION)
+        dp.id = 1
+        dp.set_xid = lambda msg: msg.set_xid(1)
+        waiters = {}
+
+        def send_msg(msg):
+            # reply with the parts of the multipart reply at once
+            lock, msgs = waiters[dp.id][msg.xid]
+            for i, body in enumerate(bodies):
+                flags = 0
+                if i < len(bodies) - 1:
+                    flags = ofproto_v1_3.OFPMPF_REPLY_MORE
+                msgs.append(ofproto_v1_3_parser.OFPFlowStatsReply(
+                    dp, flags=flags, body=body))
+            del waiters[dp.id][msg.xid]
+            lock.set()
+
+        dp.send_msg = send_msg
+        return dp, waiters
+
+    def _flow_stats(self, priority):
+        parser = ofproto_v1_3_parser
+        actions = [parser.OFPActionOutput(2)]
+        inst = [parser.OFPInstructionActions(
+            ofproto_v1_3.OFPIT_APPLY_ACTIONS, actions)]
+        return parser.OFPFlowStats(
+            table_id=0, duration_sec=1, duration_nsec=2, priority=priority,
+            idle_timeout=0, hard_timeout=0, flags=0, cookie=0,
+            packet_count=3, byte_count=4,
+            match=parser.OFPMatch(in_port=1), instructions=inst)
+
+    def test_iter_flow_stats(self):
+        bodies = [[self._flow_stats(1), self._flow_stats(2)],
+                  [self._flow_stats(3)]]
+        dp, waiters = self._flow_stats_dp(bodies)
+        expected = ofctl_v1_3.get_flow_stats(dp, waiters)
+
+        dp, waiters = self._flow_stats_dp(bodies)
+        flows = list(ofctl_v1_3.iter_flow_stats(dp, waiters))
+        eq_(flows, expected['1'])
+        eq_([f['priority'] for f in flows], [1, 2, 3])
+
+    def test_iter_flow_stats_priority(self):
+        bodies = [[self._flow_stats(1), self._flow_stats(2)],
+                  [self._flow_stats(2)]]
+        dp, waiters = self._flow_stats_dp(bodies)
+        flows = list(ofctl_v1_3.iter_flow_stats(dp, waiters,
+                                                {'priority': 2}))
+        eq_([f['priority'] for f in flows], [2, 2])
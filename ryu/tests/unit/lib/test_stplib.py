@@ -0,0 +1,57 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from nose.tools import eq_, ok_
+
+from ryu.lib import hub
+from ryu.lib import stplib
+
+
+class Test_PortTimer(unittest.TestCase):
+    """ Test case for ryu.lib.stplib.PortTimer
+    """
+
+    def _fire(self, port_timer):
+        # Fires the timer as the wheel does, without running its thread.
+        timer = port_timer.timer
+        timer.func(*timer.args, **timer.kwargs)
+
+    def test_stop_on_fire(self):
+        # A timer whose function starts it again, e.g., the BPDU
+        # transmission timer, is stopped on the tick it fires.
+        calls = []
+
+        def _function():
+            calls.append(1)
+            port_timer.start(0.01)
+
+        port_timer = stplib.PortTimer(_function)
+        port_timer.start(0.01)
+        self._fire(port_timer)
+        port_timer.stop()
+        hub.sleep(0.1)
+        eq_(calls, [])
+        ok_(not port_timer.is_running())
+
+        # can be started again
+        port_timer.start(0.01)
+        with hub.Timeout(2):
+            while not calls:
+                hub.sleep(0.01)
+        port_timer.stop()
+        hub.sleep(0.05)
+        eq_(calls, [1])
@@ -46,9 +46,23 @@ class Test_OXM(unittest.TestCase):
         f = ofp.oxm_to_user_header(n)
         self.assertEqual(user, f)
 
+    def _test_encode_user(self, user, on_wire):
+        (f, uv) = user
+        buf = bytearray()
+        l = ofp.oxm_serialize_user(f, uv, buf, 0)
+        self.assertEqual(len(on_wire), l)
+        self.assertEqual(on_wire, buf)
+
+    def _test_decode_user(self, user, on_wire):
+        (f, uv, l) = ofp.oxm_parse_user(on_wire, 0)
+        self.assertEqual(len(on_wire), l)
+        self.assertEqual(user, (f, uv))
+
     def _test(self, user, on_wire, header_bytes):
         self._test_encode(user, on_wire)
         self._test_decode(user, on_wire)
+        self._test_encode_user(user, on_wire)
+        self._test_decode_user(user, on_wire)
         if isinstance(user[1], tuple):  # has mask?
             return
         user_header = user[0]
@@ -186,3 +200,55 @@ class Test_OXM(unittest.TestCase):
             b'fugafuga'
         )
         self._test(user, on_wire, 4)
+
+    def test_basic_mac_nomask(self):
+        user = ('eth_dst', 'aa:bb:cc:00:00:01')
+        on_wire = (
+            b'\x80\x00\x06\x06'
+            b'\xaa\xbb\xcc\x00\x00\x01'
+        )
+        self._test(user, on_wire, 4)
+
+    def test_basic_mac_mask(self):
+        user = ('eth_dst', ('aa:bb:cc:00:00:01', 'ff:ff:ff:00:00:00'))
+        on_wire = (
+            b'\x80\x00\x07\x0c'
+            b'\xaa\xbb\xcc\x00\x00\x01'
+            b'\xff\xff\xff\x00\x00\x00'
+        )
+        self._test(user, on_wire, 4)
+
+    def test_basic_int_mask(self):
+        user = ('metadata', (0x100, 0xff00))
+        on_wire = (
+            b'\x80\x00\x05\x10'
+            b'\x00\x00\x00\x00\x00\x00\x01\x00'
+            b'\x00\x00\x00\x00\x00\x00\xff\x00'
+        )
+        self._test(user, on_wire, 4)
+
+    def test_encode_user_mac_notation(self):
+        on_wire = (
+            b'\x80\x00\x06\x06'
+            b'\xaa\xbb\xcc\x00\x00\x01'
+        )
+        self._test_encode_user(('eth_dst', 'AA:BB:CC:00:00:01'), on_wire)
+        self._test_encode_user(('eth_dst', 'aa-bb-cc-00-00-01'), on_wire)
+
+    def test_encode_user_cidr(self):
+        # falls back to the generic conversion
+        on_wire = (
+            b'\x80\x00\x17\x08'
+            b'\xc0\x00\x02\x00'
+            b'\xff\xff\xff\x00'
+        )
+        self._test_encode_user(('ipv4_src', '192.0.2.0/24'), on_wire)
+
+    def test_codecs(self):
+        codec = ofp.oxm_codecs[ofp.OXM_OF_IN_PORT]
+        self.assertEqual('in_port', codec.name)
+        self.assertFalse(codec.hasmask)
+        codec = ofp.oxm_codecs[ofp.OXM_OF_IPV6_SRC_W]
+        self.assertEqual('ipv6_src', codec.name)
+        self.assertTrue(codec.hasmask)
+        self.assertEqual(4 + 16 * 2, codec.size)
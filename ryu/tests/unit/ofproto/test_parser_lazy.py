@@ -0,0 +1,111 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import sys
+import unittest
+
+from nose.tools import eq_, ok_
+
+from ryu.ofproto import ofproto_parser
+from ryu.ofproto import ofproto_protocol
+from ryu.ofproto import ofproto_v1_3
+from ryu.ofproto import ofproto_v1_4
+from ryu.ofproto import ofproto_v1_5
+
+
+_LAZY_MSG_TYPES = [
+    ofproto_v1_3.OFPT_PACKET_IN,
+    ofproto_v1_3.OFPT_FLOW_REMOVED,
+    ofproto_v1_3.OFPT_MULTIPART_REPLY,
+]
+
+
+def _packet_data(ver):
+    this_dir = os.path.dirname(sys.modules[__name__].__file__)
+    packet_data_dir = os.path.join(this_dir, '../../packet_data', ver)
+    for file in sorted(os.listdir(packet_data_dir)):
+        if not file.endswith('.packet'):
+            continue
+        buf = open(os.path.join(packet_data_dir, file), 'rb').read()
+        header = ofproto_parser.header(buf)
+        if header[1] in _LAZY_MSG_TYPES:
+            yield file, header, buf
+
+
+class Test_LazyParse(unittest.TestCase):
+    """
+    Test cases for the lazy parsing of OpenFlow messages
+    """
+
+    def tearDown(self):
+        ofproto_parser.set_lazy_parsing(False)
+
+    def _parse(self, header, buf, lazy):
+        (version, msg_type, msg_len, xid) = header
+        ofproto_parser.set_lazy_parsing(lazy)
+        dp = ofproto_protocol.ProtocolDesc(version=version)
+        return ofproto_parser.msg(dp, version, msg_type, msg_len, xid, buf)
+
+    def _test_jsondict(self, ver):
+        n = 0
+        for file, header, buf in _packet_data(ver):
+            msg = self._parse(header, buf, lazy=True)
+            ok_(msg.__dict__.get('_body_pending'), file)
+            eq_(self._parse(header, buf, lazy=False).to_jsondict(),
+                msg.to_jsondict(), file)
+            ok_('_body_pending' not in msg.__dict__, file)
+            n += 1
+        ok_(n > 0)
+
+    def test_jsondict_of13(self):
+        self._test_jsondict('of13')
+
+    def test_jsondict_of14(self):
+        self._test_jsondict('of14')
+
+    def test_jsondict_of15(self):
+        self._test_jsondict('of15')
+
+    def _test_packet_in(self, ver, ofproto):
+        for file, header, buf in _packet_data(ver):
+            if header[1] != ofproto.OFPT_PACKET_IN:
+                continue
+            msg = self._parse(header, buf, lazy=True)
+            # The fixed part is decoded eagerly.
+            ok_(msg.reason is not None)
+            ok_('match' not in msg.__dict__)
+            ok_('data' not in msg.__dict__)
+
+            eager = self._parse(header, buf, lazy=False)
+            eq_(eager.data, msg.data)
+            ok_('match' in msg.__dict__)
+            eq_(eager.match.to_jsondict(), msg.match.to_jsondict())
+
+    def test_packet_in_of13(self):
+        self._test_packet_in('of13', ofproto_v1_3)
+
+    def test_packet_in_of14(self):
+        self._test_packet_in('of14', ofproto_v1_4)
+
+    def test_packet_in_of15(self):
+        self._test_packet_in('of15', ofproto_v1_5)
+
+    def test_unknown_attribute(self):
+        for _file, header, buf in _packet_data('of13'):
+            msg = self._parse(header, buf, lazy=True)
+            self.assertRaises(AttributeError, getattr, msg, 'unknown')
+            # Not decoded by the access to unrelated attributes.
+            ok_(msg.__dict__.get('_body_pending'))
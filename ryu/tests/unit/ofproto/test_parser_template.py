@@ -0,0 +1,140 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from nose.tools import eq_, ok_, raises
+
+from ryu.lib.packet import ethernet
+from ryu.lib.packet import packet
+from ryu.ofproto import ofproto_protocol
+from ryu.ofproto import ofproto_v1_3
+from ryu.ofproto import ofproto_v1_4
+from ryu.ofproto import ofproto_v1_5
+
+
+class _TemplateTestMixin(object):
+    version = None
+
+    def setUp(self):
+        self.dp = ofproto_protocol.ProtocolDesc(version=self.version)
+        self.ofp = self.dp.ofproto
+        self.parser = self.dp.ofproto_parser
+
+    def _packet_out(self, buffer_id, in_port, port, data):
+        actions = [self.parser.OFPActionSetField(eth_src='00:00:00:00:00:01'),
+                   self.parser.OFPActionOutput(port)]
+        if self.version == ofproto_v1_5.OFP_VERSION:
+            match = self.parser.OFPMatch(in_port=in_port)
+            return self.parser.OFPPacketOut(self.dp, buffer_id, match,
+                                            actions, data)
+        return self.parser.OFPPacketOut(self.dp, buffer_id, in_port,
+                                        actions, data)
+
+    def _flow_mod(self, buffer_id, in_port, port):
+        match = self.parser.OFPMatch(in_port=in_port,
+                                     eth_dst='00:00:00:00:00:02')
+        actions = [self.parser.OFPActionOutput(port)]
+        inst = [self.parser.OFPInstructionGotoTable(1),
+                self.parser.OFPInstructionActions(
+                    self.ofp.OFPIT_APPLY_ACTIONS, actions)]
+        return self.parser.OFPFlowMod(self.dp, cookie=1, priority=10,
+                                      buffer_id=buffer_id, match=match,
+                                      instructions=inst)
+
+    def _serialize(self, msg, xid):
+        msg.set_xid(xid)
+        msg.serialize()
+        return bytes(msg.buf)
+
+    def test_packet_out(self):
+        ofp = self.ofp
+        template = self.parser.MsgTemplate(
+            self._packet_out(ofp.OFP_NO_BUFFER, ofp.OFPP_CONTROLLER, 0,
+                             b'\x00' * 60))
+        eq_(self._serialize(template.build(in_port=1, output_port=2,
+                                           data=b'\x01' * 14), 3),
+            self._serialize(self._packet_out(ofp.OFP_NO_BUFFER, 1, 2,
+                                             b'\x01' * 14), 3))
+
+    def test_packet_out_packet_data(self):
+        ofp = self.ofp
+        template = self.parser.MsgTemplate(
+            self._packet_out(ofp.OFP_NO_BUFFER, ofp.OFPP_CONTROLLER, 0,
+                             b''))
+        pkt = packet.Packet()
+        pkt.add_protocol(ethernet.ethernet())
+        pkt.serialize()
+        eq_(self._serialize(template.build(output_port=2, data=pkt), 3),
+            self._serialize(self._packet_out(ofp.OFP_NO_BUFFER,
+                                             ofp.OFPP_CONTROLLER, 2,
+                                             pkt.data), 3))
+
+    def test_packet_out_keeps_template_data(self):
+        ofp = self.ofp
+        template = self.parser.MsgTemplate(
+            self._packet_out(ofp.OFP_NO_BUFFER, ofp.OFPP_CONTROLLER, 0,
+                             b'\x01' * 14))
+        eq_(self._serialize(template.build(output_port=2), 3),
+            self._serialize(self._packet_out(ofp.OFP_NO_BUFFER,
+                                             ofp.OFPP_CONTROLLER, 2,
+                                             b'\x01' * 14), 3))
+
+    def test_flow_mod(self):
+        ofp = self.ofp
+        template = self.parser.MsgTemplate(
+            self._flow_mod(ofp.OFP_NO_BUFFER, 0, 0))
+        eq_(self._serialize(template.build(buffer_id=5, in_port=1,
+                                           output_port=2), 7),
+            self._serialize(self._flow_mod(5, 1, 2), 7))
+
+    def test_build_headers(self):
+        ofp = self.ofp
+        template = self.parser.MsgTemplate(
+            self._flow_mod(ofp.OFP_NO_BUFFER, 0, 0))
+        msg = template.build(in_port=1)
+        msg.set_xid(9)
+        msg.serialize()
+        eq_(msg.version, self.version)
+        eq_(msg.msg_type, ofp.OFPT_FLOW_MOD)
+        eq_(msg.msg_len, len(msg.buf))
+        eq_(msg.xid, 9)
+        ok_(str(msg).endswith('TemplateMsg(in_port=1)'))
+
+    @raises(ValueError)
+    def test_unknown_field(self):
+        ofp = self.ofp
+        template = self.parser.MsgTemplate(
+            self._flow_mod(ofp.OFP_NO_BUFFER, 0, 0))
+        template.serialize(cookie=2)
+
+    @raises(ValueError)
+    def test_flow_mod_data(self):
+        ofp = self.ofp
+        template = self.parser.MsgTemplate(
+            self._flow_mod(ofp.OFP_NO_BUFFER, 0, 0))
+        template.serialize(data=b'\x00')
+
+
+class Test_MsgTemplate_v13(_TemplateTestMixin, unittest.TestCase):
+    version = ofproto_v1_3.OFP_VERSION
+
+
+class Test_MsgTemplate_v14(_TemplateTestMixin, unittest.TestCase):
+    version = ofproto_v1_4.OFP_VERSION
+
+
+class Test_MsgTemplate_v15(_TemplateTestMixin, unittest.TestCase):
+    version = ofproto_v1_5.OFP_VERSION
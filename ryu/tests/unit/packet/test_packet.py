@@ -1551,3 +1551,52 @@ class TestPacket(unittest.TestCase):
         ok_(isinstance(pkt.protocols[0], ethernet.ethernet))
         ok_(isinstance(pkt.protocols[1], ipv4.ipv4))
         ok_(isinstance(pkt.protocols[2], udp.udp))
+
+    def _get_ipv4_tcp_data(self):
+        e = ethernet.ethernet(self.dst_mac, self.src_mac, ether.ETH_TYPE_IP)
+        i = ipv4.ipv4(4, 6, 0, 0, 0, 0, 0, 64, inet.IPPROTO_TCP, 0,
+                      self.src_ip, self.dst_ip, b'\x01\x01\x01\x00')
+        t = tcp.tcp(self.src_port, self.dst_port, 0x1, 0x2, 5, 0x18, 1024,
+                    0, 0)
+        pkt = e / i / t / self.payload
+        pkt.serialize()
+        return six.binary_type(pkt.data)
+
+    def test_parse_until(self):
+        data = self._get_ipv4_tcp_data()
+        pkt = packet.Packet(data, parse_until=ipv4.ipv4)
+        eq_(3, len(pkt.protocols))
+        ok_(isinstance(pkt.protocols[0], ethernet.ethernet))
+        ok_(isinstance(pkt.protocols[1], ipv4.ipv4))
+        # tcp header and payload
+        eq_(data[-(20 + len(self.payload)):], pkt.protocols[2])
+
+    def test_parse_until_tuple(self):
+        data = self._get_ipv4_tcp_data()
+        pkt = packet.Packet(data, parse_until=(arp.arp, tcp.tcp))
+        eq_(4, len(pkt.protocols))
+        ok_(isinstance(pkt.protocols[2], tcp.tcp))
+        eq_(self.payload, pkt.protocols[3])
+
+    def test_parse_until_padding(self):
+        e = ethernet.ethernet(self.dst_mac, self.src_mac, ether.ETH_TYPE_IP)
+        pkt = e / ipv4.ipv4(proto=inet.IPPROTO_TCP)
+        pkt.serialize()
+        data = six.binary_type(pkt.data) + b'\x00' * 26
+        pkt = packet.Packet(data, parse_until=ipv4.ipv4)
+        eq_(2, len(pkt.protocols))
+
+    def test_memoryview(self):
+        data = self._get_ipv4_tcp_data()
+        pkt = packet.Packet(memoryview(data))
+        eq_(str(packet.Packet(data)), str(pkt))
+        i = pkt.get_protocol(ipv4.ipv4)
+        ok_(isinstance(i.option, bytes))
+        ok_(isinstance(pkt.protocols[-1], bytes))
+
+    def test_memoryview_parse_until(self):
+        data = self._get_ipv4_tcp_data()
+        pkt = packet.Packet(memoryview(data), parse_until=ipv4.ipv4)
+        eq_(3, len(pkt.protocols))
+        eq_(data[-(20 + len(self.payload)):], pkt.protocols[2])
+        ok_(isinstance(pkt.protocols[2], bytes))
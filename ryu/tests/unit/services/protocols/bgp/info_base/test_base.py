@@ -0,0 +1,188 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import OrderedDict
+import gc
+import logging
+import unittest
+import weakref
+try:
+    import mock  # Python 2
+except ImportError:
+    from unittest import mock  # Python 3
+
+from nose.tools import eq_, ok_
+
+from ryu.lib.packet import bgp
+from ryu.services.protocols.bgp import processor
+from ryu.services.protocols.bgp.info_base.base import PathAttrSet
+from ryu.services.protocols.bgp.info_base.ipv4 import Ipv4Path
+from ryu.services.protocols.bgp.info_base.ipv4 import Ipv4Table
+
+
+LOG = logging.getLogger(__name__)
+
+
+def _pattrs(as_path=None, med=None):
+    pattrs = OrderedDict()
+    pattrs[bgp.BGP_ATTR_TYPE_ORIGIN] = bgp.BGPPathAttributeOrigin(0)
+    pattrs[bgp.BGP_ATTR_TYPE_AS_PATH] = bgp.BGPPathAttributeAsPath(
+        as_path or [[65001, 65002]])
+    if med is not None:
+        pattrs[bgp.BGP_ATTR_TYPE_MULTI_EXIT_DISC] = (
+            bgp.BGPPathAttributeMultiExitDisc(med))
+    return pattrs
+
+
+def _path(prefix, pattrs, source=None, is_withdraw=False):
+    return Ipv4Path(source, bgp.IPAddrPrefix(24, prefix), 1, pattrs=pattrs,
+                    nexthop='10.0.0.1', is_withdraw=is_withdraw)
+
+
+class Test_PathAttrSet(unittest.TestCase):
+    """
+    Test case for ryu.services.protocols.bgp.info_base.base.PathAttrSet
+    """
+
+    def test_intern(self):
+        attr_set = PathAttrSet.intern(_pattrs())
+        ok_(PathAttrSet.intern(_pattrs()) is attr_set)
+        ok_(PathAttrSet.intern(attr_set) is attr_set)
+        ok_(PathAttrSet.intern(_pattrs(med=10)) is not attr_set)
+        ok_(PathAttrSet.intern(_pattrs(as_path=[[65001]])) is not attr_set)
+        ok_(PathAttrSet.intern(None) is PathAttrSet.intern({}))
+
+    def test_mapping(self):
+        pattrs = _pattrs(med=10)
+        attr_set = PathAttrSet.intern(pattrs)
+        eq_(len(attr_set), 3)
+        eq_(list(attr_set), list(pattrs))
+        eq_(list(attr_set.keys()), list(pattrs.keys()))
+        eq_(attr_set[bgp.BGP_ATTR_TYPE_MULTI_EXIT_DISC].value, 10)
+        ok_(bgp.BGP_ATTR_TYPE_ORIGIN in attr_set)
+        eq_(attr_set.get(bgp.BGP_ATTR_TYPE_LOCAL_PREF), None)
+        eq_(repr(attr_set), repr(pattrs))
+
+        pattrs = attr_set.copy()
+        del pattrs[bgp.BGP_ATTR_TYPE_MULTI_EXIT_DISC]
+        eq_(len(attr_set), 3)
+
+    def test_shared_by_paths(self):
+        path1 = _path('10.0.1.0', _pattrs())
+        path2 = _path('10.0.2.0', _pattrs())
+        path3 = _path('10.0.3.0', _pattrs(med=10))
+        ok_(path1.pathattr_set is path2.pathattr_set)
+        ok_(path1.pathattr_set is not path3.pathattr_set)
+        eq_(path1.get_pattr(bgp.BGP_ATTR_TYPE_AS_PATH).path_seg_list,
+            [[65001, 65002]])
+
+        pattrs = path1.pathattr_map
+        pattrs[bgp.BGP_ATTR_TYPE_MULTI_EXIT_DISC] = (
+            bgp.BGPPathAttributeMultiExitDisc(10))
+        ok_(_path('10.0.1.0', pattrs).pathattr_set is path3.pathattr_set)
+        ok_(path1.clone().pathattr_set is path1.pathattr_set)
+
+    def test_release(self):
+        path = _path('10.0.1.0', _pattrs(as_path=[[64999, 64998, 64997]]))
+        ref = weakref.ref(path.pathattr_set)
+        ok_(PathAttrSet.interned_count() > 0)
+        # Intern another set to release the set interned last.
+        _path('10.0.2.0', _pattrs(as_path=[[64996]]))
+        ok_(ref() is not None)
+        del path
+        gc.collect()
+        ok_(ref() is None)
+
+
+class Test_Destination(unittest.TestCase):
+    """
+    Test case for ryu.services.protocols.bgp.info_base.base.Destination
+    """
+
+    def setUp(self):
+        self.table = Ipv4Table(mock.MagicMock(), mock.MagicMock())
+        self.peer1 = mock.MagicMock(version_num=1)
+        self.peer2 = mock.MagicMock(version_num=1)
+
+    def _learn(self, prefix, source, med=None, is_withdraw=False):
+        dest = self.table.insert(_path(prefix, _pattrs(med=med), source,
+                                       is_withdraw))
+        dest.process()
+        return dest
+
+    def test_withdraw(self):
+        dest = self._learn('10.0.1.0', self.peer1, med=20)
+        self._learn('10.0.1.0', self.peer2, med=10)
+        eq_(len(dest.known_path_list), 2)
+        eq_(dest.best_path.source, self.peer2)
+
+        self._learn('10.0.1.0', self.peer2, is_withdraw=True)
+        eq_([p.source for p in dest.known_path_list], [self.peer1])
+        eq_(dest.best_path.source, self.peer1)
+        eq_(self.table._peer_dests(self.peer2), [])
+
+    def test_implicit_withdraw(self):
+        dest = self._learn('10.0.1.0', self.peer1, med=20)
+        dest.add_new_path(_path('10.0.1.0', _pattrs(med=30), self.peer1))
+        dest.add_new_path(_path('10.0.1.0', _pattrs(med=10), self.peer1))
+        dest.process()
+        eq_(len(dest.known_path_list), 1)
+        eq_(dest.best_path.get_pattr(
+            bgp.BGP_ATTR_TYPE_MULTI_EXIT_DISC).value, 10)
+
+    def test_cleanup_paths_for_peer(self):
+        dest1 = self._learn('10.0.1.0', self.peer1)
+        dest2 = self._learn('10.0.2.0', self.peer2)
+        dest3 = self._learn('10.0.3.0', self.peer2)
+        sent_route = mock.MagicMock(sent_peer=self.peer1,
+                                    path=dest2.best_path)
+        self.table.insert_sent_route(sent_route)
+        eq_(len(self.table._peer_dests(self.peer1)), 2)
+        eq_(len(self.table._peer_dests(self.peer2)), 2)
+
+        self.peer1.version_num = 2
+        with mock.patch.object(dest3, 'remove_old_paths_from_source') as m:
+            self.table.cleanup_paths_for_peer(self.peer1)
+        ok_(not m.called)
+        eq_(dest1.known_path_list, [])
+        ok_(not dest2.was_sent_to(self.peer1))
+        eq_(len(dest2.known_path_list), 1)
+        eq_(self.table._peer_dests(self.peer1), [])
+        self.table._signal_bus.dest_changed.assert_called_once_with(dest1)
+
+    def test_incremental_best_path(self):
+        dest = self._learn('10.0.1.0', self.peer1, med=20)
+        self._learn('10.0.1.0', self.peer2, med=10)
+        eq_(dest.best_path.source, self.peer2)
+        eq_(dest.best_path_reason, processor.BPR_MED)
+
+        peer3 = mock.MagicMock(version_num=1)
+        with mock.patch.object(processor, 'compute_best_path',
+                               wraps=processor.compute_best_path) as m:
+            # New path is compared only with the current best path.
+            self._learn('10.0.1.0', peer3, med=30)
+            eq_(m.call_count, 1)
+            eq_(dest.best_path.source, self.peer2)
+
+            # Withdrawing other than the best path needs no comparison.
+            self._learn('10.0.1.0', peer3, is_withdraw=True)
+            eq_(m.call_count, 1)
+            eq_(dest.best_path.source, self.peer2)
+
+            # Withdrawing the best path compares all the known paths.
+            self._learn('10.0.1.0', peer3, med=30)
+            self._learn('10.0.1.0', self.peer2, is_withdraw=True)
+            eq_(m.call_count, 3)
+            eq_(dest.best_path.source, self.peer1)
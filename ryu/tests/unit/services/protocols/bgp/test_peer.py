@@ -20,10 +20,13 @@ try:
 except ImportError:
     from unittest import mock  # Python 3
 
-from nose.tools import eq_
+from nose.tools import eq_, ok_
 
 from ryu.lib.packet import bgp
 from ryu.services.protocols.bgp import peer
+from ryu.services.protocols.bgp.core_managers.peer_manager import PeerManager
+from ryu.services.protocols.bgp.info_base.base import PrefixFilter
+from ryu.services.protocols.bgp.info_base.ipv4 import Ipv4Path
 
 
 LOG = logging.getLogger(__name__)
@@ -61,6 +64,25 @@ class Test_Peer(unittest.TestCase):
         self._test_construct_as_path_attr(
             input_as_path, input_as4_path, expected_as_path)
 
+    @mock.patch.object(
+        peer.Peer, '__init__', mock.MagicMock(return_value=None))
+    def test_construct_as_path_attr_path(self):
+        input_as_path_attr = bgp.BGPPathAttributeAsPath(
+            [[65000, 4000, 23456, 23456, 40001]])
+        input_as4_path_attr = bgp.BGPPathAttributeAs4Path(
+            [[400000, 300000, 40001]])
+        _peer = peer.Peer(None, None, None, None, None)
+        as_path_attr = _peer._construct_as_path_attr(
+            input_as_path_attr, input_as4_path_attr)
+
+        # The path interns its attributes by their serialized values, so
+        # the Four-Octet AS numbers must be serializable.
+        path = Ipv4Path(None, bgp.IPAddrPrefix(24, '10.0.0.0'), 1,
+                        pattrs={bgp.BGP_ATTR_TYPE_AS_PATH: as_path_attr},
+                        nexthop='10.0.0.1')
+        eq_([[65000, 4000, 400000, 300000, 40001]],
+            path.get_pattr(bgp.BGP_ATTR_TYPE_AS_PATH).path_seg_list)
+
     def test_construct_as_path_attr_aggregated_as_path_1(self):
         # Test Data
         # Input:
@@ -373,3 +395,135 @@ class Test_Peer(unittest.TestCase):
         self._test_extract_and_reconstruct_as_path(
             path_attributes, ex_as_path_value,
             ex_aggregator_as_number, ex_aggregator_addr)
+
+    def _outgoing_route(self, prefix, is_withdraw=False):
+        path = mock.MagicMock()
+        path.route_family = bgp.RF_IPv4_UC
+        path.nlri = bgp.IPAddrPrefix(24, prefix)
+        path.is_withdraw = is_withdraw
+        path.pathattr_set = None
+        path.nexthop = '10.0.0.254'
+        path.source = None
+        path.is_local.return_value = True
+        return peer.OutgoingRoute(path)
+
+    def _construct_update(self, outgoing_route):
+        nlri = outgoing_route.path.nlri
+        if outgoing_route.path.is_withdraw:
+            return bgp.BGPUpdate(withdrawn_routes=[nlri])
+        return bgp.BGPUpdate(
+            path_attributes=[bgp.BGPPathAttributeOrigin(0),
+                             bgp.BGPPathAttributeAsPath([[65000]]),
+                             bgp.BGPPathAttributeNextHop('10.0.0.1')],
+            nlri=[nlri])
+
+    def _sending_peer(self, peer_manager, out_filters=None):
+        _peer = peer.Peer(None, None, None, None, None)
+        _peer.version_num = 1
+        _peer._neigh_conf = mock.MagicMock(
+            remote_as=65001, local_as=65000, next_hop=None,
+            is_next_hop_self=False, multi_exit_disc=None, soo_list=[],
+            is_route_server_client=False, is_route_reflector_client=False)
+        _peer._common_conf = mock.MagicMock(
+            local_as=65000, router_id='10.0.0.1', cluster_id='10.0.0.1',
+            local_pref=100)
+        _peer._host_bind_ip = '10.0.0.1'
+        _peer._out_filters = out_filters or []
+        _peer._attribute_maps = {}
+        _peer._update_group = None
+        _peer._peer_manager = peer_manager
+        _peer._adj_rib_out = {}
+        _peer._signal_bus = mock.MagicMock()
+        _peer._core_service = mock.MagicMock()
+        _peer._protocol = mock.MagicMock()
+        _peer._protocol.is_four_octet_as_number_cap_valid.return_value = True
+        _peer._apply_out_filter = mock.MagicMock(return_value=(False, None))
+        _peer._construct_update = mock.MagicMock(
+            side_effect=self._construct_update)
+        _peer.state = peer.PeerState(_peer, mock.MagicMock())
+        return _peer
+
+    @mock.patch.object(
+        peer.Peer, '__init__', mock.MagicMock(return_value=None))
+    def test_send_outgoing_routes(self):
+        _peer = self._sending_peer(PeerManager(mock.MagicMock(), None))
+
+        routes = [self._outgoing_route('10.0.%d.0' % i) for i in range(5)]
+        routes.append(self._outgoing_route('10.0.1.0', is_withdraw=True))
+        routes.append(self._outgoing_route('10.1.0.0', is_withdraw=True))
+        _peer._send_outgoing_routes(routes)
+
+        sent = [c[0][0] for c in _peer._protocol.send.call_args_list]
+        eq_(len(sent), 2)
+        eq_([n.prefix for n in sent[0].nlri],
+            ['10.0.0.0/24', '10.0.2.0/24', '10.0.3.0/24', '10.0.4.0/24'])
+        eq_([n.prefix for n in sent[1].withdrawn_routes],
+            ['10.0.1.0/24', '10.1.0.0/24'])
+        eq_(len(_peer._adj_rib_out), 6)
+        eq_(_peer.state.get_count(peer.PeerCounterNames.SENT_UPDATES), 2)
+        eq_(_peer.state.get_count(peer.PeerCounterNames.SENT_PREFIXES), 6)
+        eq_(_peer.state.prefixes_per_update_sent, 3.0)
+
+    @mock.patch.object(
+        peer.Peer, '__init__', mock.MagicMock(return_value=None))
+    def test_pop_outgoing_routes(self):
+        _peer = peer.Peer(None, None, None, None, None)
+        routes = [self._outgoing_route('10.0.%d.0' % i) for i in range(4)]
+        refresh = bgp.BGPRouteRefresh(afi=1, safi=1)
+        _peer.outgoing_msg_list = mock.MagicMock()
+        _peer.outgoing_msg_list.pop_first.side_effect = (
+            routes[1:] + [refresh, routes[0], None])
+
+        popped, next_msg = _peer._pop_outgoing_routes(routes[0])
+        eq_(popped, routes)
+        eq_(next_msg, refresh)
+
+        popped, next_msg = _peer._pop_outgoing_routes(routes[1])
+        eq_(popped, routes[1:2] + routes[0:1])
+        eq_(next_msg, None)
+
+        _peer.outgoing_msg_list.pop_first.side_effect = routes
+        with mock.patch.object(peer.Peer, 'OUTGOING_ROUTE_BATCH', 3):
+            popped, next_msg = _peer._pop_outgoing_routes(routes[0])
+        eq_(popped, routes[0:1] + routes[0:2])
+        eq_(next_msg, None)
+
+    @mock.patch.object(
+        peer.Peer, '__init__', mock.MagicMock(return_value=None))
+    def test_update_group(self):
+        peer_manager = PeerManager(mock.MagicMock(), None)
+        peers = [self._sending_peer(peer_manager) for _ in range(3)]
+        peers.append(self._sending_peer(
+            peer_manager,
+            [PrefixFilter('10.0.0.0/8', policy=PrefixFilter.POLICY_PERMIT)]))
+
+        route = self._outgoing_route('10.0.0.0')
+        for _peer in peers:
+            _peer._send_outgoing_routes([route])
+
+        eq_(len(peer_manager.update_groups), 2)
+        group = peers[0].update_group
+        eq_(group.members, set(peers[:3]))
+        ok_(peers[3].update_group is not group)
+        eq_(group.hits, 2)
+        eq_(group.misses, 1)
+
+        # Policy and construction run once per group, and the members send
+        # the same serialized message.
+        eq_(sum(p._construct_update.call_count for p in peers[:3]), 1)
+        eq_(peers[3]._construct_update.call_count, 1)
+        sent = [p._protocol.send.call_args[0] for p in peers]
+        ok_(sent[0][1] is sent[1][1] is sent[2][1])
+        eq_(sent[0][1], sent[3][1])
+        for _peer in peers:
+            eq_(len(_peer.adj_rib_out), 1)
+
+        # Changing the configuration moves the peer to another group.
+        peers[0]._out_filters = peers[3]._out_filters
+        peers[0]._send_outgoing_routes([self._outgoing_route('10.0.1.0')])
+        ok_(peers[0].update_group is peers[3].update_group)
+        eq_(group.members, set(peers[1:3]))
+
+        peer_manager.leave_update_group(peers[1])
+        peer_manager.leave_update_group(peers[2])
+        eq_(len(peer_manager.update_groups), 1)
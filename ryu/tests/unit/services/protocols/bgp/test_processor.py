@@ -0,0 +1,86 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import OrderedDict
+import logging
+import unittest
+try:
+    import mock  # Python 2
+except ImportError:
+    from unittest import mock  # Python 3
+
+from nose.tools import eq_, ok_
+
+from ryu.lib.packet import bgp
+from ryu.services.protocols.bgp import processor
+from ryu.services.protocols.bgp.info_base.ipv4 import Ipv4Path
+
+
+LOG = logging.getLogger(__name__)
+
+
+def _path(med, as_path=None, origin=0):
+    pattrs = OrderedDict()
+    pattrs[bgp.BGP_ATTR_TYPE_ORIGIN] = bgp.BGPPathAttributeOrigin(origin)
+    pattrs[bgp.BGP_ATTR_TYPE_AS_PATH] = bgp.BGPPathAttributeAsPath(
+        as_path or [[65001]])
+    pattrs[bgp.BGP_ATTR_TYPE_MULTI_EXIT_DISC] = (
+        bgp.BGPPathAttributeMultiExitDisc(med))
+    return Ipv4Path(None, bgp.IPAddrPrefix(24, '10.0.0.0'), 1,
+                    pattrs=pattrs, nexthop='10.0.0.1')
+
+
+class Test_Processor(unittest.TestCase):
+    """
+    Test case for ryu.services.protocols.bgp.processor
+    """
+
+    def test_compute_best_path(self):
+        path1 = _path(20)
+        path2 = _path(10)
+        eq_(processor.compute_best_path(65000, path1, path2),
+            (path2, processor.BPR_MED))
+
+    def test_compute_best_path_aspath(self):
+        path1 = _path(10, as_path=[[65001, 65002]])
+        path2 = _path(20)
+        eq_(processor.compute_best_path(65000, path1, path2),
+            (path2, processor.BPR_ASPATH))
+
+    def test_compute_best_path_origin(self):
+        path1 = _path(10, origin=bgp.BGP_ATTR_ORIGIN_INCOMPLETE)
+        path2 = _path(20, origin=bgp.BGP_ATTR_ORIGIN_EGP)
+        eq_(processor.compute_best_path(65000, path1, path2),
+            (path2, processor.BPR_ORIGIN))
+
+    def test_best_path_key(self):
+        path = _path(10, as_path=[[65001, 65002]])
+        key = processor.best_path_key(path)
+        eq_(key, (None, -2, 3, -10, 0))
+        ok_(path.pathattr_set.best_path_key is key)
+        ok_(processor.best_path_key(_path(10, as_path=[[65001, 65002]]))
+            is key)
+
+    @mock.patch.object(processor, '_cmp_by_path_key')
+    @mock.patch.object(processor, '_cmp_by_local_pref')
+    def test_compute_best_path_same_attrs(
+            self, cmp_by_local_pref, cmp_by_path_key):
+        path1 = _path(10)
+        path2 = _path(10)
+        ok_(path1.pathattr_set is path2.pathattr_set)
+        eq_(processor.compute_best_path(65000, path1, path2),
+            (None, processor.BPR_UNKNOWN))
+        ok_(not cmp_by_local_pref.called)
+        ok_(not cmp_by_path_key.called)
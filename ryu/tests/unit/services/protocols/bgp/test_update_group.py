@@ -0,0 +1,109 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import unittest
+try:
+    import mock  # Python 2
+except ImportError:
+    from unittest import mock  # Python 3
+
+from nose.tools import eq_, ok_
+
+from ryu.lib.packet import bgp
+from ryu.services.protocols.bgp.update_group import UpdateGroup
+
+
+LOG = logging.getLogger(__name__)
+
+
+class Test_UpdateGroup(unittest.TestCase):
+    """
+    Test case for ryu.services.protocols.bgp.update_group
+    """
+
+    def _peer(self, block=False):
+        peer = mock.MagicMock()
+        peer._apply_out_filter.return_value = (block, 'cause')
+        peer._construct_update.side_effect = (
+            lambda route: bgp.BGPUpdate(withdrawn_routes=[route.path.nlri]))
+        return peer
+
+    def _path(self, i):
+        path = mock.MagicMock()
+        path.nlri = bgp.IPAddrPrefix(24, '10.0.%d.0' % i)
+        return path
+
+    def test_prepare(self):
+        group = UpdateGroup('key')
+        peer1 = self._peer()
+        peer2 = self._peer()
+        path = self._path(1)
+        block, _, update = group.prepare(peer1, path)
+        ok_(not block)
+        eq_(group.prepare(peer2, path), (False, 'cause', update))
+        eq_(peer1._construct_update.call_count, 1)
+        eq_(peer2._apply_out_filter.call_count, 0)
+        eq_((group.hits, group.misses), (1, 1))
+
+        data = group.serialize(update)
+        ok_(group.serialize(update) is data)
+        eq_(data, update.serialize())
+
+        # Messages not prepared by the group are serialized each time.
+        other = bgp.BGPUpdate(withdrawn_routes=[path.nlri])
+        eq_(group.serialize(other), data)
+
+    def test_prepare_blocked(self):
+        group = UpdateGroup('key')
+        eq_(group.prepare(self._peer(block=True), self._path(1)),
+            (True, 'cause', None))
+        eq_(group.prepare(self._peer(), self._path(1))[0], False)
+
+    def test_cache_size(self):
+        group = UpdateGroup('key', cache_size=2)
+        peer = self._peer()
+        paths = [self._path(i) for i in range(3)]
+        updates = [group.prepare(peer, path)[2] for path in paths]
+        group.prepare(peer, paths[2])
+        group.prepare(peer, paths[0])
+        eq_(peer._construct_update.call_count, 4)
+        eq_((group.hits, group.misses), (1, 4))
+        ok_(group.serialize(updates[0]) is not group.serialize(updates[0]))
+        ok_(group.serialize(updates[2]) is group.serialize(updates[2]))
+
+    def test_pack(self):
+        group = UpdateGroup('key')
+        peer = self._peer()
+        paths = [self._path(i) for i in range(3)]
+        items = [(i, group.prepare(peer, path)[2], None)
+                 for i, path in enumerate(paths)]
+        packed = group.pack(items)
+        eq_(len(packed), 1)
+        update, data = packed[0]
+        eq_(len(update.withdrawn_routes), 3)
+        eq_(data, update.serialize())
+        ok_(group.get_packing(items[0][1]) is not None)
+
+        # The same updates are packed once for the group.
+        ok_(group.pack(list(items)) is packed)
+        eq_((group.batch_hits, group.batch_misses), (1, 1))
+        ok_(group.pack(items[:2]) is not packed)
+        eq_((group.batch_hits, group.batch_misses), (1, 2))
+
+        # A single update is sent as prepared.
+        packed = group.pack(items[:1])
+        ok_(packed[0][0] is items[0][1])
+        ok_(group.pack(items[:1])[0][1] is packed[0][1])
@@ -0,0 +1,186 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import unittest
+
+from nose.tools import eq_, ok_
+
+from ryu.lib.packet import bgp
+from ryu.services.protocols.bgp.utils.packer import UpdatePacker
+from ryu.services.protocols.bgp.utils.packer import update_prefixes
+
+
+LOG = logging.getLogger(__name__)
+
+
+def _attrs(med=0):
+    return [bgp.BGPPathAttributeOrigin(0),
+            bgp.BGPPathAttributeAsPath([[65000]]),
+            bgp.BGPPathAttributeNextHop('10.0.0.1'),
+            bgp.BGPPathAttributeMultiExitDisc(med)]
+
+
+def _prefix(i):
+    return bgp.BGPNLRI(24, '10.%d.%d.0' % (i // 256, i % 256))
+
+
+def _reach(i, med=0):
+    return bgp.BGPUpdate(path_attributes=_attrs(med), nlri=[_prefix(i)])
+
+
+def _withdraw(i):
+    return bgp.BGPUpdate(withdrawn_routes=[_prefix(i)])
+
+
+def _v6_prefix(i):
+    return bgp.IP6AddrPrefix(64, '2001:db8:%x::' % i)
+
+
+def _mp_reach(i, next_hop='2001:db8::1'):
+    return bgp.BGPUpdate(path_attributes=[
+        bgp.BGPPathAttributeOrigin(0),
+        bgp.BGPPathAttributeAsPath([[65000]]),
+        bgp.BGPPathAttributeMpReachNLRI(
+            bgp.addr_family.IP6, bgp.subaddr_family.UNICAST,
+            [next_hop], [_v6_prefix(i)])])
+
+
+def _mp_unreach(i):
+    return bgp.BGPUpdate(path_attributes=[
+        bgp.BGPPathAttributeMpUnreachNLRI(
+            bgp.addr_family.IP6, bgp.subaddr_family.UNICAST,
+            [_v6_prefix(i)])])
+
+
+def _key(i):
+    return ('ipv4', i)
+
+
+class Test_UpdatePacker(unittest.TestCase):
+    """
+    Test case for ryu.services.protocols.bgp.utils.packer
+    """
+
+    def _parse(self, update):
+        buf = update.serialize()
+        msg, _, rest = bgp.BGPMessage.parser(buf)
+        eq_(rest, b'')
+        return msg, len(buf)
+
+    def test_pack_reach(self):
+        packer = UpdatePacker()
+        for i in range(10):
+            packer.add(_reach(i), key=_key(i))
+        updates = packer.pack()
+        eq_(len(updates), 1)
+        msg, _ = self._parse(updates[0])
+        eq_([n.prefix for n in msg.nlri],
+            [_prefix(i).prefix for i in range(10)])
+        eq_(len(msg.path_attributes), 4)
+        eq_(update_prefixes(msg), 10)
+
+    def test_pack_groups_by_attributes(self):
+        packer = UpdatePacker()
+        for i in range(6):
+            packer.add(_reach(i, med=i % 2), key=_key(i))
+        updates = packer.pack()
+        eq_(len(updates), 2)
+        eq_([n.prefix for n in updates[0].nlri],
+            [_prefix(i).prefix for i in (0, 2, 4)])
+        eq_([n.prefix for n in updates[1].nlri],
+            [_prefix(i).prefix for i in (1, 3, 5)])
+
+    def test_pack_max_len(self):
+        packer = UpdatePacker()
+        for i in range(3000):
+            packer.add(_reach(i), key=_key(i))
+            packer.add(_withdraw(i + 3000), key=_key(i + 3000))
+        updates = packer.pack()
+        prefixes = 0
+        for update in updates:
+            msg, length = self._parse(update)
+            ok_(length <= 4096)
+            prefixes += update_prefixes(msg)
+        eq_(prefixes, 6000)
+        # 4 bytes per prefix
+        ok_(len(updates) <= 6)
+
+    def test_pack_mp_max_len(self):
+        packer = UpdatePacker(max_len=512)
+        for i in range(500):
+            packer.add(_mp_reach(i), key=('ipv6', i))
+            packer.add(_mp_unreach(i + 500), key=('ipv6', i + 500))
+        updates = packer.pack()
+        prefixes = 0
+        for update in updates:
+            msg, length = self._parse(update)
+            ok_(length <= 512)
+            prefixes += update_prefixes(msg)
+        eq_(prefixes, 1000)
+        ok_(len(updates) < 100)
+
+    def test_pack_mp_reach_next_hop(self):
+        packer = UpdatePacker()
+        packer.add(_mp_reach(1), key=('ipv6', 1))
+        packer.add(_mp_reach(2, next_hop='2001:db8::2'), key=('ipv6', 2))
+        packer.add(_mp_reach(3), key=('ipv6', 3))
+        updates = packer.pack()
+        eq_(len(updates), 2)
+        eq_(update_prefixes(updates[0]), 2)
+        eq_(update_prefixes(updates[1]), 1)
+        msg, _ = self._parse(updates[0])
+        mp_reach = msg.get_path_attr(bgp.BGP_ATTR_TYPE_MP_REACH_NLRI)
+        eq_(mp_reach.next_hop, '2001:db8::1')
+        eq_([n.prefix for n in mp_reach.nlri],
+            [_v6_prefix(i).prefix for i in (1, 3)])
+
+    def test_last_route_wins(self):
+        packer = UpdatePacker()
+        packer.add(_reach(1), key=_key(1))
+        packer.add(_reach(2), key=_key(2))
+        packer.add(_withdraw(1), key=_key(1))
+        updates = packer.pack()
+        eq_(len(updates), 2)
+        eq_([n.prefix for n in updates[0].nlri], [_prefix(2).prefix])
+        eq_([n.prefix for n in updates[1].withdrawn_routes],
+            [_prefix(1).prefix])
+
+    def test_unpacked(self):
+        eor = bgp.BGPUpdate(path_attributes=[
+            bgp.BGPPathAttributeMpUnreachNLRI(
+                bgp.addr_family.IP6, bgp.subaddr_family.UNICAST, [])])
+        packer = UpdatePacker()
+        packer.add(_reach(1), key=_key(1))
+        packer.add(eor)
+        packer.add(_reach(2), key=_key(2))
+        updates = packer.pack()
+        eq_(len(updates), 2)
+        eq_(len(updates[0].nlri), 2)
+        ok_(updates[1] is eor)
+        eq_(update_prefixes(eor), 0)
+        eq_(packer.pack(), [])
+
+    def test_single_prefix_unchanged(self):
+        update = _reach(1)
+        packer = UpdatePacker()
+        packer.add(_reach(1), key=_key(1))
+        packer.add(update, key=_key(1))
+        packer.add(_withdraw(2), key=_key(2))
+        packer.add(_withdraw(3), key=_key(3))
+        updates = packer.pack()
+        eq_(len(updates), 2)
+        ok_(updates[0] is update)
+        eq_(len(updates[1].withdrawn_routes), 2)
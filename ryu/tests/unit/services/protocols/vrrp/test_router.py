@@ -0,0 +1,56 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from nose.tools import eq_, ok_
+
+from ryu.lib import hub
+from ryu.services.protocols.vrrp import router
+
+
+class Test_Timer(unittest.TestCase):
+    """ Test case for ryu.services.protocols.vrrp.router.Timer
+    """
+
+    def _fire(self, timer):
+        # Fires the timer as the wheel does, without running its thread.
+        wheel_timer = timer._timer
+        wheel_timer.func(*wheel_timer.args, **wheel_timer.kwargs)
+
+    def test_cancel_on_fire(self):
+        calls = []
+        timer = router.Timer(lambda: calls.append(1))
+        timer.start(0.01)
+        self._fire(timer)
+        timer.cancel()
+        ok_(not timer.is_running())
+        hub.sleep(0.05)
+        eq_(calls, [])
+
+    def test_restart_on_fire(self):
+        # The handler runs once for the latest start.
+        calls = []
+        timer = router.Timer(lambda: calls.append(1))
+        timer.start(0.01)
+        self._fire(timer)
+        timer.start(0.05)
+        hub.sleep(0)
+        eq_(calls, [])
+        with hub.Timeout(2):
+            while not calls:
+                hub.sleep(0.01)
+        hub.sleep(0.05)
+        eq_(calls, [1])
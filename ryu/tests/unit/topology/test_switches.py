@@ -0,0 +1,297 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import unittest
+try:
+    import mock  # Python 2
+except ImportError:
+    from unittest import mock  # Python 3
+
+from nose.tools import eq_, ok_
+
+from ryu.base import app_manager
+from ryu.ofproto import ofproto_protocol
+from ryu.ofproto import ofproto_v1_0
+from ryu.ofproto import ofproto_v1_2
+from ryu.ofproto import ofproto_v1_3
+from ryu.ofproto import ofproto_v1_3_parser
+from ryu.ofproto import ofproto_v1_4
+from ryu.topology import switches
+
+
+def _port(dpid, port_no):
+    ofpport = ofproto_v1_3_parser.OFPPort(
+        port_no=port_no, hw_addr='00:00:00:00:00:01', name=b'eth1',
+        config=0, state=0, curr=0, advertised=0, supported=0, peer=0,
+        curr_speed=0, max_speed=0)
+    return switches.Port(dpid, ofproto_v1_3, ofpport)
+
+
+class Test_LinkState(unittest.TestCase):
+    """ Test case for ryu.topology.switches.LinkState
+    """
+
+    def setUp(self):
+        self.links = switches.LinkState()
+        self.p11 = _port(1, 1)
+        self.p12 = _port(1, 2)
+        self.p21 = _port(2, 1)
+        self.p31 = _port(3, 1)
+
+    def test_update_link(self):
+        ok_(not self.links.update_link(self.p11, self.p21))
+        ok_(self.links.update_link(self.p21, self.p11))
+        ok_(not self.links.update_link(self.p12, self.p31))
+        eq_(3, len(self.links))
+
+        eq_([switches.Link(self.p11, self.p21),
+             switches.Link(self.p12, self.p31)],
+            self.links.get_by_dpid(1))
+        eq_([switches.Link(self.p21, self.p11)], self.links.get_by_dpid(2))
+        eq_([], self.links.get_by_dpid(3))
+        ok_(self.links.has_port(self.p31))
+        ok_(not self.links.has_port(_port(3, 2)))
+
+    def test_link_down(self):
+        self.links.update_link(self.p11, self.p21)
+        self.links.update_link(self.p21, self.p11)
+        self.links.link_down(switches.Link(self.p11, self.p21))
+
+        eq_([], self.links.get_by_dpid(1))
+        eq_([switches.Link(self.p21, self.p11)], self.links.get_by_dpid(2))
+        ok_(self.links.has_port(self.p11))
+
+        self.links.link_down(switches.Link(self.p21, self.p11))
+        eq_(0, len(self.links))
+        ok_(not self.links.has_port(self.p11))
+        ok_(not self.links.has_port(self.p21))
+
+    def test_port_deleted(self):
+        self.links.update_link(self.p11, self.p21)
+        self.links.update_link(self.p21, self.p11)
+        self.links.update_link(self.p31, self.p11)
+        self.links.update_link(self.p12, self.p31)
+
+        dsts, rev_link_dsts = self.links.port_deleted(self.p11)
+        eq_([self.p21], dsts)
+        eq_([self.p21, self.p31], rev_link_dsts)
+        eq_([switches.Link(self.p12, self.p31)], list(self.links))
+        eq_([], self.links.get_by_dpid(2))
+        ok_(not self.links.has_port(self.p11))
+
+        eq_(([], []), self.links.port_deleted(self.p11))
+
+
+class Test_HostState(unittest.TestCase):
+    """ Test case for ryu.topology.switches.HostState
+    """
+
+    def setUp(self):
+        self.hosts = switches.HostState()
+        self.p11 = _port(1, 1)
+        self.p21 = _port(2, 1)
+
+    def test_add(self):
+        h1 = switches.Host('00:00:00:00:00:01', self.p11)
+        h2 = switches.Host('00:00:00:00:00:02', self.p11)
+        self.hosts.add(h1)
+        self.hosts.add(h2)
+        self.hosts.add(switches.Host('00:00:00:00:00:01', self.p21))
+
+        eq_([h1, h2], self.hosts.get_by_dpid(1))
+        eq_([h1, h2], self.hosts.get_by_port(self.p11))
+        eq_([], self.hosts.get_by_dpid(2))
+
+    def test_move(self):
+        h1 = switches.Host('00:00:00:00:00:01', self.p11)
+        self.hosts.add(h1)
+        h1_moved = switches.Host('00:00:00:00:00:01', self.p21)
+        self.hosts[h1.mac] = h1_moved
+
+        eq_([], self.hosts.get_by_dpid(1))
+        eq_([], self.hosts.get_by_port(self.p11))
+        eq_([h1_moved], self.hosts.get_by_dpid(2))
+
+    def test_del(self):
+        h1 = switches.Host('00:00:00:00:00:01', self.p11)
+        self.hosts.add(h1)
+        del self.hosts[h1.mac]
+
+        eq_(0, len(self.hosts))
+        eq_([], self.hosts.get_by_dpid(1))
+        eq_([], self.hosts.get_by_port(self.p11))
+
+
+class Test_LinkState_aging(unittest.TestCase):
+    """ Test case for the link aging of ryu.topology.switches.LinkState
+    """
+
+    def setUp(self):
+        self.links = switches.LinkState()
+        self.p11 = _port(1, 1)
+        self.p21 = _port(2, 1)
+        self.link = switches.Link(self.p11, self.p21)
+        self.rev_link = switches.Link(self.p21, self.p11)
+
+    def test_get_expired(self):
+        self.links.update_link(self.p11, self.p21)
+        self.links.update_link(self.p21, self.p11)
+        now = time.time()
+        eq_([], self.links.get_expired(now - 10))
+        eq_([self.link, self.rev_link],
+            sorted(self.links.get_expired(now + 1), key=str))
+
+    def test_refreshed(self):
+        self.links.update_link(self.p11, self.p21)
+        deadline = time.time() + 0.001
+        time.sleep(0.01)
+        self.links.update_link(self.p11, self.p21)
+        eq_([], self.links.get_expired(deadline))
+        eq_([self.link], self.links.get_expired(time.time() + 1))
+
+    def test_rev_link_set_timestamp(self):
+        self.links.update_link(self.p11, self.p21)
+        self.links.update_link(self.p21, self.p11)
+        now = time.time()
+        self.links.rev_link_set_timestamp(self.rev_link, now - 20)
+        eq_([self.rev_link], self.links.get_expired(now - 10))
+
+    def test_link_down(self):
+        self.links.update_link(self.p11, self.p21)
+        self.links.link_down(self.link)
+        eq_([], self.links.get_expired(time.time() + 1))
+
+
+class Test_PortDataState(unittest.TestCase):
+    """ Test case for ryu.topology.switches.PortDataState
+    """
+
+    def setUp(self):
+        self.ports = switches.PortDataState(1., 4.)
+        self.p1 = _port(1, 1)
+        self.p2 = _port(1, 2)
+        self.ports.add_port(self.p1, b'lldp1')
+        self.ports.add_port(self.p2, b'lldp2')
+
+    def test_add_port(self):
+        eq_(([self.p1, self.p2], []), self.ports.get_due(time.time()))
+        eq_(([], []), self.ports.get_due(time.time()))
+        eq_(None, self.ports.next_due())
+
+    def test_lldp_sent(self):
+        self.ports.get_due(time.time())
+        data = self.ports.lldp_sent(self.p1)
+        eq_(data.timestamp + 1., self.ports.next_due())
+        eq_(([], []), self.ports.get_due(time.time()))
+        eq_(([], [self.p1]), self.ports.get_due(data.timestamp + 1.))
+
+    def test_adaptive_period(self):
+        self.ports.get_due(time.time())
+        periods = []
+        for _ in range(4):
+            data = self.ports.lldp_sent(self.p1)
+            periods.append(data.due - data.timestamp)
+        eq_([1., 2., 4., 4.], periods)
+
+        # a change of the port resets the period
+        self.ports.move_front(self.p1)
+        eq_(([self.p1], []), self.ports.get_due(time.time()))
+        data = self.ports.lldp_sent(self.p1)
+        eq_(1., data.due - data.timestamp)
+
+    def test_del_port(self):
+        self.ports.del_port(self.p1)
+        eq_(([self.p2], []), self.ports.get_due(time.time()))
+
+    def test_stale_entries(self):
+        for _ in range(1000):
+            self.ports.move_front(self.p1)
+        ok_(len(self.ports._heap) < 100)
+        eq_(([self.p2, self.p1], []),
+            self.ports.get_due(time.time()))
+
+
+class _Datapath(ofproto_protocol.ProtocolDesc):
+    def __init__(self, dpid, version):
+        super(_Datapath, self).__init__(version)
+        self.id = dpid
+        self.xid = 0
+        self.bufs = []
+
+    def set_xid(self, msg):
+        self.xid += 1
+        msg.set_xid(self.xid)
+        return self.xid
+
+    def send(self, buf):
+        self.bufs.append(bytes(buf))
+
+    def send_msg(self, msg):
+        if msg.xid is None:
+            self.set_xid(msg)
+        msg.serialize()
+        self.send(msg.buf)
+
+
+class Test_Switches_lldp(unittest.TestCase):
+    """ Test case for the LLDP transmission of ryu.topology.switches.Switches
+    """
+
+    def _switches(self, version):
+        # Other tests may reload app_manager, after which RyuApp.__init__
+        # refers to the reloaded RyuApp rather than the base of Switches.
+        ryu_app = [cls for cls in switches.Switches.__mro__
+                   if cls.__name__ == 'RyuApp'][0]
+        with mock.patch.object(app_manager, 'RyuApp', ryu_app):
+            app = switches.Switches()
+        ports = []
+        for dpid in (1, 2):
+            app.dps[dpid] = _Datapath(dpid, version)
+            for port_no in (1, 2, 3):
+                port = _port(dpid, port_no)
+                app._port_added(port)
+                ports.append(port)
+        # a port of a datapath which has already left
+        port = _port(3, 1)
+        app._port_added(port)
+        ports.append(port)
+        return app, ports
+
+    def _test_send_lldp_packets(self, version):
+        app, ports = self._switches(version)
+        for port in ports:
+            app.send_lldp_packet(port)
+        expected = dict((dpid, b''.join(dp.bufs))
+                        for (dpid, dp) in app.dps.items())
+        eq_(3, len(app.dps[1].bufs))
+
+        app, ports = self._switches(version)
+        app.send_lldp_packets(ports)
+        for dpid, dp in app.dps.items():
+            eq_([expected[dpid]], dp.bufs)
+        eq_(6, app.lldp_sent)
+
+    def test_send_lldp_packets_v10(self):
+        self._test_send_lldp_packets(ofproto_v1_0.OFP_VERSION)
+
+    def test_send_lldp_packets_v12(self):
+        self._test_send_lldp_packets(ofproto_v1_2.OFP_VERSION)
+
+    def test_send_lldp_packets_v13(self):
+        self._test_send_lldp_packets(ofproto_v1_3.OFP_VERSION)
+
+    def test_send_lldp_packets_v14(self):
+        self._test_send_lldp_packets(ofproto_v1_4.OFP_VERSION)
@@ -13,6 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import heapq
+import itertools
 import logging
 import six
 import struct
@@ -20,6 +22,7 @@ import time
 from ryu import cfg
 
 from collections import defaultdict
+from collections import OrderedDict
 from ryu.topology import event
 from ryu.base import app_manager
 from ryu.controller import ofp_event
@@ -53,7 +56,10 @@ CONF.register_cli_opts([
                 help='link discovery: explicitly install flow entry '
                      'to send lldp packet to controller'),
     cfg.BoolOpt('explicit-drop', default=True,
-                help='link discovery: explicitly drop lldp packet in')
+                help='link discovery: explicitly drop lldp packet in'),
+    cfg.BoolOpt('lldp-batch', default=False,
+                help='link discovery: send the due lldp packets of a switch '
+                     'in a single write instead of one by one')
 ])
 
 
@@ -192,10 +198,33 @@ class HostState(dict):
     # mac address -> Host class
     def __init__(self):
         super(HostState, self).__init__()
+        # indexes of the hosts: dpid -> {mac: Host}, Port -> {mac: Host}
+        self._dpid_map = defaultdict(dict)
+        self._port_map = defaultdict(dict)
+
+    def __setitem__(self, mac, host):
+        if mac in self:
+            self._del_index(self[mac])
+        super(HostState, self).__setitem__(mac, host)
+        self._dpid_map[host.port.dpid][mac] = host
+        self._port_map[host.port][mac] = host
+
+    def __delitem__(self, mac):
+        self._del_index(self[mac])
+        super(HostState, self).__delitem__(mac)
+
+    def _del_index(self, host):
+        for key, index in ((host.port.dpid, self._dpid_map),
+                           (host.port, self._port_map)):
+            hosts = index[key]
+            del hosts[host.mac]
+            if not hosts:
+                del index[key]
 
     def add(self, host):
         mac = host.mac
-        self.setdefault(mac, host)
+        if mac not in self:
+            self[mac] = host
 
     def update_ip(self, host, ip_v4=None, ip_v6=None):
         mac = host.mac
@@ -217,14 +246,12 @@ class HostState(dict):
             host.ipv6.append(ip_v6)
 
     def get_by_dpid(self, dpid):
-        result = []
-
-        for mac in self:
-            host = self[mac]
-            if host.port.dpid == dpid:
-                result.append(host)
+        hosts = self._dpid_map.get(dpid)
+        return list(hosts.values()) if hosts else []
 
-        return result
+    def get_by_port(self, port):
+        hosts = self._port_map.get(port)
+        return list(hosts.values()) if hosts else []
 
 
 class PortState(dict):
@@ -244,12 +271,15 @@ class PortState(dict):
 
 
 class PortData(object):
-    def __init__(self, is_down, lldp_data):
+    def __init__(self, is_down, lldp_data, period):
         super(PortData, self).__init__()
         self.is_down = is_down
         self.lldp_data = lldp_data
         self.timestamp = None
         self.sent = 0
+        self.period = period  # LLDP transmission period
+        self.due = None       # time when the next LLDP is due
+        self.seq = None       # sequence number of the scheduled entry
 
     def lldp_sent(self):
         self.timestamp = time.time()
@@ -274,53 +304,52 @@ class PortData(object):
 
 class PortDataState(dict):
     # dict: Port class -> PortData class
-    # slimed down version of OrderedDict as python 2.6 doesn't support it.
-    _PREV = 0
-    _NEXT = 1
-    _KEY = 2
-
-    def __init__(self):
+    # The ports are scheduled for LLDP transmission in a heap of
+    # (due time, sequence number, Port) entries.  An entry is stale if its
+    # sequence number is not the one of the PortData; stale entries are
+    # skipped when popped.
+    #
+    # A port is sent LLDP every period seconds right after it is added or
+    # changed, and the period doubles on each transmission up to
+    # max_period while the port is stable.
+
+    def __init__(self, period=.9, max_period=None):
         super(PortDataState, self).__init__()
-        self._root = root = []  # sentinel node
-        root[:] = [root, root, None]  # [_PREV, _NEXT, _KEY] doubly linked list
-        self._map = {}
-
-    def _remove_key(self, key):
-        link_prev, link_next, key = self._map.pop(key)
-        link_prev[self._NEXT] = link_next
-        link_next[self._PREV] = link_prev
-
-    def _append_key(self, key):
-        root = self._root
-        last = root[self._PREV]
-        last[self._NEXT] = root[self._PREV] = self._map[key] = [last, root,
-                                                                key]
-
-    def _prepend_key(self, key):
-        root = self._root
-        first = root[self._NEXT]
-        first[self._PREV] = root[self._NEXT] = self._map[key] = [root, first,
-                                                                 key]
-
-    def _move_last_key(self, key):
-        self._remove_key(key)
-        self._append_key(key)
-
-    def _move_front_key(self, key):
-        self._remove_key(key)
-        self._prepend_key(key)
+        self.period = period
+        self.max_period = max_period or period
+        self._heap = []
+        self._seq = itertools.count()
+
+    def _schedule(self, port, port_data, due):
+        port_data.due = due
+        port_data.seq = next(self._seq)
+        heapq.heappush(self._heap, (due, port_data.seq, port))
+        if len(self._heap) > 2 * len(self) + 64:
+            # too many stale entries
+            self._heap = [(data.due, data.seq, key)
+                          for (key, data) in dict.items(self)
+                          if data.seq is not None]
+            heapq.heapify(self._heap)
+
+    def _schedule_now(self, port, port_data):
+        port_data.clear_timestamp()
+        port_data.period = self.period
+        self._schedule(port, port_data, time.time())
 
     def add_port(self, port, lldp_data):
         if port not in self:
-            self._prepend_key(port)
-            self[port] = PortData(port.is_down(), lldp_data)
+            port_data = PortData(port.is_down(), lldp_data, self.period)
+            self[port] = port_data
+            self._schedule(port, port_data, time.time())
         else:
             self[port].is_down = port.is_down()
 
     def lldp_sent(self, port):
         port_data = self[port]
         port_data.lldp_sent()
-        self._move_last_key(port)
+        self._schedule(port, port_data,
+                       port_data.timestamp + port_data.period)
+        port_data.period = min(port_data.period * 2, self.max_period)
         return port_data
 
     def lldp_received(self, port):
@@ -329,8 +358,7 @@ class PortDataState(dict):
     def move_front(self, port):
         port_data = self.get(port, None)
         if port_data is not None:
-            port_data.clear_timestamp()
-            self._move_front_key(port)
+            self._schedule_now(port, port_data)
 
     def set_down(self, port):
         is_down = port.is_down()
@@ -338,7 +366,7 @@ class PortDataState(dict):
         port_data.set_down(is_down)
         port_data.clear_timestamp()
         if not is_down:
-            self._move_front_key(port)
+            self._schedule_now(port, port_data)
         return is_down
 
     def get_port(self, port):
@@ -346,75 +374,129 @@ class PortDataState(dict):
 
     def del_port(self, port):
         del self[port]
-        self._remove_key(port)
 
-    def __iter__(self):
-        root = self._root
-        curr = root[self._NEXT]
-        while curr is not root:
-            yield curr[self._KEY]
-            curr = curr[self._NEXT]
+    def _is_stale(self, entry):
+        port_data = self.get(entry[2], None)
+        return port_data is None or port_data.seq != entry[1]
+
+    def get_due(self, now):
+        """
+        Pops the ports whose LLDP is due at now.
+
+        Returns a tuple of the list of the ports to be sent LLDP
+        immediately, i.e., added or changed ones, and the list of the
+        ports to be sent LLDP periodically.
+        """
+        ports_now = []
+        ports = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            entry = heapq.heappop(heap)
+            if self._is_stale(entry):
+                continue
+            port = entry[2]
+            port_data = self[port]
+            port_data.seq = None
+            if port_data.timestamp is None:
+                ports_now.append(port)
+            else:
+                ports.append(port)
+        return ports_now, ports
+
+    def next_due(self):
+        """
+        Returns the time when the next LLDP is due, or None.
+        """
+        heap = self._heap
+        while heap and self._is_stale(heap[0]):
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
 
     def clear(self):
-        for node in self._map.values():
-            del node[:]
-        root = self._root
-        root[:] = [root, root, None]
-        self._map.clear()
+        del self._heap[:]
         dict.clear(self)
 
-    def items(self):
-        'od.items() -> list of (key, value) pairs in od'
-        return [(key, self[key]) for key in self]
-
-    def iteritems(self):
-        'od.iteritems -> an iterator over the (key, value) pairs in od'
-        for k in self:
-            yield (k, self[k])
-
 
 class LinkState(dict):
     # dict: Link class -> timestamp
     def __init__(self):
         super(LinkState, self).__init__()
-        self._map = defaultdict(lambda: defaultdict(lambda: None))
+        # indexes of the links: src Port -> {dst Port: Link},
+        # dst Port -> {src Port: Link}, src dpid -> {Link: None}
+        self._map = defaultdict(dict)
+        self._rev_map = defaultdict(dict)
+        self._dpid_map = defaultdict(dict)
+        # the links in the order of their timestamps, oldest first
+        self._aging = OrderedDict()
 
     def get_peers(self, src):
         return self._map[src].keys()
 
+    def get_by_dpid(self, dpid):
+        links = self._dpid_map.get(dpid)
+        return list(links) if links else []
+
+    def has_port(self, port):
+        # return if any link starts or ends at the port
+        return port in self._map or port in self._rev_map
+
     def update_link(self, src, dst):
         link = Link(src, dst)
 
         self[link] = time.time()
+        self._aging[link] = None
+        self._aging.move_to_end(link)
         self._map[src][dst] = link
+        self._rev_map[dst][src] = link
+        self._dpid_map[src.dpid][link] = None
 
         # return if the reverse link is also up or not
         rev_link = Link(dst, src)
         return rev_link in self
 
-    def link_down(self, link):
+    def _del_link(self, link):
         del self[link]
-        del self._map[link.src][link.dst]
+        del self._aging[link]
+        for key, index, peer in ((link.src, self._map, link.dst),
+                                 (link.dst, self._rev_map, link.src),
+                                 (link.src.dpid, self._dpid_map, link)):
+            links = index[key]
+            del links[peer]
+            if not links:
+                del index[key]
+
+    def link_down(self, link):
+        self._del_link(link)
 
     def rev_link_set_timestamp(self, rev_link, timestamp):
         # rev_link may or may not in LinkSet
         if rev_link in self:
             self[rev_link] = timestamp
+            # timestamp is expected to be older than the ones of the other
+            # links in order to keep them sorted
+            self._aging.move_to_end(rev_link, last=False)
+
+    def get_expired(self, deadline):
+        """
+        Returns the links whose timestamp is older than deadline.
+
+        Only the expired links and the oldest live one are examined.
+        """
+        expired = []
+        for link in self._aging:
+            if self[link] >= deadline:
+                break
+            expired.append(link)
+        return expired
 
     def port_deleted(self, src):
-        dsts = self.get_peers(src)
-
-        rev_link_dsts = []
+        dsts = list(self._map.get(src, {}))
+        rev_link_dsts = list(self._rev_map.get(src, {}))
         for dst in dsts:
-            link = Link(src, dst)
-            rev_link = Link(dst, src)
-            del self[link]
-            self.pop(rev_link, None)
-            if src in self._map[dst]:
-                del self._map[dst][src]
-                rev_link_dsts.append(dst)
-
-        del self._map[src]
+            self._del_link(Link(src, dst))
+        for dst in rev_link_dsts:
+            self._del_link(Link(dst, src))
+
         return dsts, rev_link_dsts
 
 
@@ -512,6 +594,10 @@ class Switches(app_manager.RyuApp):
     LLDP_SEND_PERIOD_PER_PORT = .9
     TIMEOUT_CHECK_PERIOD = 5.
     LINK_TIMEOUT = TIMEOUT_CHECK_PERIOD * 2
+    # LLDP is sent less often on stable ports, up to this period.
+    # Keep it short enough for the links not to time out when a few LLDP
+    # packets are lost.
+    LLDP_SEND_PERIOD_MAX = LINK_TIMEOUT / 3
 
     def __init__(self, *args, **kwargs):
         super(Switches, self).__init__(*args, **kwargs)
@@ -519,15 +605,23 @@ class Switches(app_manager.RyuApp):
         self.name = 'switches'
         self.dps = {}                 # datapath_id => Datapath class
         self.port_state = {}          # datapath_id => ports
-        self.ports = PortDataState()  # Port class -> PortData class
+        self.ports = PortDataState(       # Port class -> PortData class
+            self.LLDP_SEND_PERIOD_PER_PORT, self.LLDP_SEND_PERIOD_MAX)
         self.links = LinkState()      # Link class -> timestamp
         self.hosts = HostState()      # mac address -> Host class list
+        self.lldp_templates = {}      # datapath_id => MsgTemplate
         self.is_active = True
 
+        # LLDP counters
+        self.lldp_sent = 0
+        self.lldp_received = 0
+        self.lldp_late = 0  # sent later than LLDP_SEND_PERIOD_PER_PORT
+
         self.link_discovery = self.CONF.observe_links
         if self.link_discovery:
             self.install_flow = self.CONF.install_lldp_flow
             self.explicit_drop = self.CONF.explicit_drop
+            self.lldp_batch = self.CONF.lldp_batch
             self.lldp_event = hub.Event()
             self.link_event = hub.Event()
             self.threads.append(hub.spawn(self.lldp_loop))
@@ -554,6 +648,7 @@ class Switches(app_manager.RyuApp):
             if (self.dps[dp.id] == dp):
                 del self.dps[dp.id]
                 del self.port_state[dp.id]
+                self.lldp_templates.pop(dp.id, None)
 
     def _get_switch(self, dpid):
         if dpid in self.dps:
@@ -592,11 +687,7 @@ class Switches(app_manager.RyuApp):
             self.ports.move_front(rev_link_dst)
 
     def _is_edge_port(self, port):
-        for link in self.links:
-            if port == link.src or port == link.dst:
-                return False
-
-        return True
+        return not self.links.has_port(port)
 
     @set_ev_cls(ofp_event.EventOFPStateChange,
                 [MAIN_DISPATCHER, DEAD_DISPATCHER])
@@ -792,6 +883,7 @@ class Switches(app_manager.RyuApp):
         src = self._get_port(src_dpid, src_port_no)
         if not src or src.dpid == dst_dpid:
             return
+        self.lldp_received += 1
         try:
             self.ports.lldp_received(src)
         except KeyError:
@@ -813,12 +905,10 @@ class Switches(app_manager.RyuApp):
         if link not in self.links:
             self.send_event_to_observers(event.EventLinkAdd(link))
 
-            # remove hosts if it's not attached to edge port
-            host_to_del = []
-            for host in self.hosts.values():
-                if not self._is_edge_port(host.port):
-                    host_to_del.append(host.mac)
-
+            # remove hosts attached to the ports of the link, as they are
+            # no longer edge ports
+            host_to_del = [host.mac for port in (src, dst)
+                           for host in self.hosts.get_by_port(port)]
             for host_mac in host_to_del:
                 del self.hosts[host_mac]
 
@@ -886,66 +976,119 @@ class Switches(app_manager.RyuApp):
             ipv6_pkt, _, _ = pkt_type.parser(pkt_data)
             self.hosts.update_ip(host, ip_v6=ipv6_pkt.src)
 
-    def send_lldp_packet(self, port):
+    def _lldp_sent(self, port):
         try:
+            due = self.ports.get_port(port).due
             port_data = self.ports.lldp_sent(port)
         except KeyError:
             # ports can be modified during our sleep in self.lldp_loop()
             # LOG.debug('send_lld error', exc_info=True)
-            return
+            return None
         if port_data.is_down:
-            return
+            return None
 
-        dp = self.dps.get(port.dpid, None)
-        if dp is None:
-            # datapath was already deleted
-            return
+        if port_data.timestamp - due > self.LLDP_SEND_PERIOD_PER_PORT:
+            self.lldp_late += 1
+        return port_data
 
-        # LOG.debug('lldp sent dpid=%s, port_no=%d', dp.id, port.port_no)
+    def _lldp_packet_out(self, dp, port, port_data):
         # TODO:XXX
         if dp.ofproto.OFP_VERSION == ofproto_v1_0.OFP_VERSION:
             actions = [dp.ofproto_parser.OFPActionOutput(port.port_no)]
-            dp.send_packet_out(actions=actions, data=port_data.lldp_data)
-        elif dp.ofproto.OFP_VERSION >= ofproto_v1_2.OFP_VERSION:
+            return dp.ofproto_parser.OFPPacketOut(
+                dp, 0xffffffff, dp.ofproto.OFPP_NONE, actions,
+                port_data.lldp_data)
+        elif dp.ofproto.OFP_VERSION == ofproto_v1_2.OFP_VERSION:
             actions = [dp.ofproto_parser.OFPActionOutput(port.port_no)]
-            out = dp.ofproto_parser.OFPPacketOut(
+            return dp.ofproto_parser.OFPPacketOut(
                 datapath=dp, in_port=dp.ofproto.OFPP_CONTROLLER,
                 buffer_id=dp.ofproto.OFP_NO_BUFFER, actions=actions,
                 data=port_data.lldp_data)
-            dp.send_msg(out)
+        elif dp.ofproto.OFP_VERSION >= ofproto_v1_3.OFP_VERSION:
+            template = self._get_lldp_template(dp)
+            return template.build(output_port=port.port_no,
+                                  data=port_data.lldp_data)
         else:
             LOG.error('cannot send lldp packet. unsupported version. %x',
                       dp.ofproto.OFP_VERSION)
+            return None
+
+    def send_lldp_packet(self, port):
+        port_data = self._lldp_sent(port)
+        if port_data is None:
+            return
+
+        dp = self.dps.get(port.dpid, None)
+        if dp is None:
+            # datapath was already deleted
+            return
+
+        # LOG.debug('lldp sent dpid=%s, port_no=%d', dp.id, port.port_no)
+        out = self._lldp_packet_out(dp, port, port_data)
+        if out is not None:
+            dp.send_msg(out)
+            self.lldp_sent += 1
+
+    def send_lldp_packets(self, ports):
+        """
+        Sends LLDP packets to the given ports.
+
+        The Packet-Out messages to the ports of a datapath are coalesced
+        into a single write to the datapath.
+        """
+        bufs = {}  # datapath_id -> (Datapath, list of serialized messages)
+        for port in ports:
+            port_data = self._lldp_sent(port)
+            if port_data is None:
+                continue
+
+            dp = self.dps.get(port.dpid, None)
+            if dp is None:
+                # datapath was already deleted
+                continue
+
+            out = self._lldp_packet_out(dp, port, port_data)
+            if out is None:
+                continue
+            dp.set_xid(out)
+            out.serialize()
+            bufs.setdefault(dp.id, (dp, []))[1].append(out.buf)
+            self.lldp_sent += 1
+
+        for dp, msgs in bufs.values():
+            dp.send(b''.join(msgs))
+            hub.sleep(0)
+
+    def _get_lldp_template(self, dp):
+        # Packet-Out of LLDP differs only in the output port and the data.
+        template = self.lldp_templates.get(dp.id)
+        if template is None or template.datapath is not dp:
+            actions = [dp.ofproto_parser.OFPActionOutput(0)]
+            out = dp.ofproto_parser.OFPPacketOut(
+                datapath=dp, in_port=dp.ofproto.OFPP_CONTROLLER,
+                buffer_id=dp.ofproto.OFP_NO_BUFFER, actions=actions,
+                data=b'')
+            template = dp.ofproto_parser.MsgTemplate(out)
+            self.lldp_templates[dp.id] = template
+        return template
 
     def lldp_loop(self):
         while self.is_active:
             self.lldp_event.clear()
 
-            now = time.time()
-            timeout = None
-            ports_now = []
-            ports = []
-            for (key, data) in self.ports.items():
-                if data.timestamp is None:
-                    ports_now.append(key)
-                    continue
-
-                expire = data.timestamp + self.LLDP_SEND_PERIOD_PER_PORT
-                if expire <= now:
-                    ports.append(key)
-                    continue
-
-                timeout = expire - now
-                break
-
-            for port in ports_now:
-                self.send_lldp_packet(port)
-            for port in ports:
-                self.send_lldp_packet(port)
-                hub.sleep(self.LLDP_SEND_GUARD)      # don't burst
-
-            if timeout is not None and ports:
-                timeout = 0     # We have already slept
+            ports_now, ports = self.ports.get_due(time.time())
+            if self.lldp_batch:
+                self.send_lldp_packets(ports_now + ports)
+            else:
+                for port in ports_now:
+                    self.send_lldp_packet(port)
+                for port in ports:
+                    self.send_lldp_packet(port)
+                    hub.sleep(self.LLDP_SEND_GUARD)      # don't burst
+
+            timeout = self.ports.next_due()
+            if timeout is not None:
+                timeout = max(0, timeout - time.time())
             # LOG.debug('lldp sleep %s', timeout)
             self.lldp_event.wait(timeout=timeout)
 
@@ -954,11 +1097,7 @@ class Switches(app_manager.RyuApp):
             self.link_event.clear()
 
             now = time.time()
-            deleted = []
-            for (link, timestamp) in self.links.items():
-                # LOG.debug('%s timestamp %d (now %d)', link, timestamp, now)
-                if timestamp + self.LINK_TIMEOUT < now:
-                    deleted.append(link)
+            deleted = self.links.get_expired(now - self.LINK_TIMEOUT)
 
             for link in deleted:
                 self.links.link_down(link)
@@ -1002,7 +1141,7 @@ class Switches(app_manager.RyuApp):
         if dpid is None:
             links = self.links
         else:
-            links = [link for link in self.links if link.src.dpid == dpid]
+            links = self.links.get_by_dpid(dpid)
         rep = event.EventLinkReply(req.src, dpid, links)
         self.reply_to_request(req, rep)
 